@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Event-loop lag of AsyncOpenAI context injection: inline vs. offloaded to the executor
+
+Runs concurrent ``AsyncOpenAI`` chat completions against a mocked HTTP transport
+with a Memori instance (auto_ingest) enabled, while a heartbeat task measures
+how late the event loop wakes it up. The "inline" run reproduces the previous
+behaviour of running the blocking memory search on the loop; the "offloaded"
+run uses the interceptor's bounded executor.
+
+``--search-delay`` adds a sleep to every database search to model a remote
+database round trip (SQLite on local disk answers in well under a millisecond).
+
+Usage:
+    python benchmarks/async_event_loop_lag.py
+    python benchmarks/async_event_loop_lag.py --requests 200 --concurrency 50 --search-delay 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+HEARTBEAT_INTERVAL = 0.005
+
+
+def completion_payload():
+    return {
+        "id": "chatcmpl-bench",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": "gpt-4o-mini",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": "ok"},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+    }
+
+
+def make_client():
+    import httpx
+    import openai
+
+    async def handler(request):
+        await asyncio.sleep(0.01)  # simulated model latency, yields to the loop
+        return httpx.Response(200, content=json.dumps(completion_payload()))
+
+    return openai.AsyncOpenAI(
+        api_key="sk-bench",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+async def heartbeat(lags, stop):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + HEARTBEAT_INTERVAL
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        lags.append(max(0.0, loop.time() - expected) * 1000)
+
+
+async def run_load(client, requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "green tea"}],
+            )
+
+    lags = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(lags, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    return elapsed, lags
+
+
+def report(label, elapsed, lags, requests):
+    lags = sorted(lags) or [0.0]
+    p99 = lags[int(0.99 * (len(lags) - 1))]
+    print(
+        f"{label:<10} {requests / elapsed:8.1f} req/s   loop lag mean "
+        f"{statistics.mean(lags):7.2f} ms   p99 {p99:7.2f} ms   max {lags[-1]:7.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--search-delay", type=float, default=0.01)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    from memori import Memori
+    from memori.integrations.openai_integration import OpenAIInterceptor
+    from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+    tmp = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+    memori = Memori(
+        database_connect=f"sqlite:///{tmp.name}",
+        auto_ingest=True,
+        api_key="sk-bench",
+        context_cache_size=0,
+    )
+
+    from loguru import logger
+
+    logger.remove()  # Memori configures its own sinks on init
+    memori.db_manager.store_long_term_memory_enhanced(
+        ProcessedLongTermMemory(
+            content="User likes hiking and green tea",
+            summary="User likes hiking and green tea",
+            classification="personal",
+            importance="medium",
+            conversation_id="bench",
+            classification_reason="benchmark seed",
+        ),
+        "bench",
+        memori.namespace,
+    )
+
+    # Only context injection is measured; skip recording and background processing
+    memori._record_openai_conversation = lambda *args, **kwargs: None
+
+    search = memori.db_manager.search_memories
+    search_delay = args.search_delay
+
+    def slow_search(*search_args, **search_kwargs):
+        time.sleep(search_delay)
+        return search(*search_args, **search_kwargs)
+
+    memori.db_manager.search_memories = slow_search
+
+    memori.enable()
+    OpenAIInterceptor.configure_async_executor(args.workers)
+
+    print(
+        f"requests={args.requests} concurrency={args.concurrency} "
+        f"search_delay={args.search_delay * 1000:.0f}ms workers={args.workers}"
+    )
+
+    offloaded = OpenAIInterceptor._run_in_async_executor.__func__
+
+    async def run_inline(cls, func, *func_args):
+        return func(*func_args)
+
+    for label, runner in (("inline", run_inline), ("offloaded", offloaded)):
+        OpenAIInterceptor._run_in_async_executor = classmethod(runner)
+        elapsed, lags = asyncio.run(
+            run_load(make_client(), args.requests, args.concurrency)
+        )
+        report(label, elapsed, lags, args.requests)
+
+    OpenAIInterceptor._run_in_async_executor = classmethod(offloaded)
+    memori.disable()
+    memori.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Per-call overhead of pre-built statements vs. per-call text() and translation
+
+For each hot raw-SQL path registered in ``memori.database.compiled_queries``
+this times two ways of issuing the same statement over one open connection:
+the previous one (build ``text(sql)`` and run the parameters through
+``QueryParameterTranslator`` on every call) and ``execute_compiled``. It
+reports the preparation cost alone (no database round trip) and the full
+execute-and-fetch latency against a small in-memory SQLite database.
+
+Usage:
+    python benchmarks/compiled_queries.py
+    python benchmarks/compiled_queries.py --calls 20000
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+PARAMETERS = {
+    "conscious_memories": {"namespace": "bench"},
+    "unprocessed_conscious_memories": {
+        "namespace": "bench",
+        "conscious_processed": False,
+    },
+    "conscious_context_keys": {"namespace": "bench"},
+    "conscious_context": {"namespace": "bench", "current_time": datetime.now()},
+    "essential_conversations": {"namespace": "bench", "limit": 10},
+    "memories_for_dedup": {
+        "namespace": "bench",
+        "processed_for_duplicates": False,
+        "limit": 20,
+    },
+}
+
+
+def seed(db_manager, count):
+    from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+    memories = [
+        ProcessedLongTermMemory(
+            content=f"User mentioned note {i}",
+            summary=f"note {i}",
+            classification="conscious-info" if i % 4 == 0 else "contextual",
+            importance="medium",
+            conversation_id=f"bench-{i}",
+            classification_reason="benchmark seed",
+        )
+        for i in range(count)
+    ]
+    db_manager.store_long_term_memories_bulk(
+        memories, [f"bench-chat-{i}" for i in range(count)], "bench"
+    )
+
+
+def per_call_us(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def time_query(connection, translator, registry, name, calls):
+    """Return (prepare text(), prepare compiled, execute text(), execute compiled)"""
+    from sqlalchemy import text
+
+    from memori.database.compiled_queries import QUERIES
+
+    sql = QUERIES[name][0]
+    params = PARAMETERS[name]
+    return (
+        per_call_us(
+            lambda: (text(sql), translator.translate_parameters(params)), calls
+        ),
+        per_call_us(lambda: registry.get(name), calls),
+        per_call_us(lambda: connection.execute(text(sql), params).fetchall(), calls),
+        per_call_us(
+            lambda: connection.execute_compiled(name, params).fetchall(), calls
+        ),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--rows", type=int, default=200)
+    args = parser.parse_args()
+
+    from loguru import logger
+
+    from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+    logger.remove()
+
+    db_manager = SQLAlchemyDatabaseManager("sqlite:///:memory:")
+    db_manager.initialize_schema()
+    seed(db_manager, args.rows)
+    registry = db_manager.compiled_queries
+    registry.warm()
+
+    print(f"{args.calls} calls per path, {args.rows} long-term rows")
+    print(
+        f"{'query':<32}{'prepare text()':>16}{'prepare compiled':>18}"
+        f"{'execute text()':>16}{'execute compiled':>18}"
+    )
+    with db_manager._get_connection() as connection:
+        for name in PARAMETERS:
+            timings = time_query(
+                connection, db_manager.query_translator, registry, name, args.calls
+            )
+            print(
+                f"{name:<32}{timings[0]:13.2f} us{timings[1]:15.2f} us"
+                f"{timings[2]:13.2f} us{timings[3]:15.2f} us"
+            )
+
+    db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Cost of debug logging on the search and injection hot paths
+
+Times ``SQLAlchemyDatabaseManager.search_memories`` and auto-ingest context
+retrieval (``Memori._get_auto_ingest_context`` with the retrieval cache
+disabled) with a loguru handler at INFO, as in production, and at DEBUG
+writing to a null sink. It also times a single representative debug message
+built three ways: an eager f-string, guarded by ``debug_enabled()`` and with
+``logger.opt(lazy=True)``. Run it on two commits to compare.
+
+Usage:
+    python benchmarks/debug_logging.py
+    python benchmarks/debug_logging.py --rows 2000 --iterations 2000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+QUERIES = ["python", "database migration", "coffee", "deadline", "w0042"]
+
+
+def per_call_us(fn, iterations):
+    timings = []
+    for i in range(iterations):
+        query = QUERIES[i % len(QUERIES)]
+        start = time.perf_counter()
+        fn(query)
+        timings.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(timings)
+
+
+def message_costs(logger, iterations):
+    """Per-call cost (us) of one debug message with INFO as the lowest level"""
+    from memori.utils import logging as memori_logging
+
+    results = [
+        {"memory_id": str(i), "summary": "s" * 40, "search_score": 0.5}
+        for i in range(5)
+    ]
+
+    def eager():
+        for i, result in enumerate(results[:3]):
+            logger.debug(
+                f"Result {i + 1}: {type(result)} with keys: {list(result.keys())}"
+            )
+
+    def guarded():
+        if memori_logging.debug_enabled():
+            for i, result in enumerate(results[:3]):
+                logger.debug(
+                    f"Result {i + 1}: {type(result)} with keys: {list(result.keys())}"
+                )
+
+    def lazy():
+        for i, result in enumerate(results[:3]):
+            logger.opt(lazy=True).debug(
+                "Result {}: {} with keys: {}",
+                lambda i=i: i + 1,
+                lambda result=result: type(result),
+                lambda result=result: list(result.keys()),
+            )
+
+    costs = {}
+    for label, fn in (("eager f-string", eager), ("guarded", guarded)):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        costs[label] = (time.perf_counter() - start) / iterations * 1e6
+    start = time.perf_counter()
+    for _ in range(iterations):
+        lazy()
+    costs["opt(lazy=True)"] = (time.perf_counter() - start) / iterations * 1e6
+    return costs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    from loguru import logger
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    from suite import create_memori, seed
+
+    workdir = Path(tempfile.mkdtemp(prefix="memori-logging-"))
+    memori = create_memori(
+        workdir / "logging.db",
+        SimpleNamespace(llm_latency=0.0),
+        auto_ingest=True,
+        context_cache_size=0,
+        track_memory_access=False,
+    )
+    seed(memori.db_manager, random.Random(7), "bench", args.rows)
+    db_manager = memori.db_manager
+
+    def search(query):
+        db_manager.search_memories(query, namespace="bench", limit=5)
+
+    def auto_ingest(query):
+        memori._get_auto_ingest_context(query)
+
+    emitted = []
+    null_sink = lambda message: None  # noqa: E731
+    print(f"rows={args.rows} iterations={args.iterations} (median per call)")
+    print(f"{'path':<22}{'INFO handler':>15}{'DEBUG handler':>16}{'debug msgs':>12}")
+    for label, fn in (
+        ("search_memories", search),
+        ("auto-ingest context", auto_ingest),
+    ):
+        fn("warmup")
+        medians = []
+        for level in ("INFO", "DEBUG"):
+            logger.remove()
+            logger.add(null_sink, level=level)
+            medians.append(per_call_us(fn, args.iterations))
+
+        # Messages the DEBUG run formats on every call; INFO runs skip them
+        logger.remove()
+        logger.add(emitted.append, level="DEBUG", filter=lambda r: r["level"].no < 20)
+        emitted.clear()
+        fn(QUERIES[0])
+        print(
+            f"{label:<22}{medians[0]:12.1f} us{medians[1]:13.1f} us{len(emitted):12d}"
+        )
+
+    logger.remove()
+    logger.add(null_sink, level="INFO")
+    print("\nOne debug message over three results, INFO handler:")
+    try:
+        for label, cost in message_costs(logger, args.iterations * 20).items():
+            print(f"  {label:<18}{cost:8.3f} us")
+    except AttributeError:
+        print("  memori.utils.logging.debug_enabled() not available on this commit")
+
+    logger.remove()
+    memori.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Search planning: local heuristic planner vs. LLM planner
+
+Seeds a SQLite database with long-term memories, then plans a fixed set of
+queries with ``planner_mode="local"`` and, when ``OPENAI_API_KEY`` is set,
+with ``planner_mode="llm"``. Reports planning latency per planner and the
+overlap (Jaccard) of the memories each plan retrieves through
+``_execute_planned_search``. In ``hybrid`` mode the share of queries the
+local planner answers on its own is printed as well.
+
+Usage:
+    python benchmarks/search_planner.py
+    OPENAI_API_KEY=... python benchmarks/search_planner.py --model gpt-4o-mini
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+MEMORIES = [
+    ("User prefers Python and FastAPI for backend services", "personal"),
+    ("User likes dark mode in every editor", "personal"),
+    ("User is learning Rust ownership and borrowing", "contextual"),
+    ("User has five years of experience with PostgreSQL tuning", "essential"),
+    ("User is working on the Memori project with a team of four", "contextual"),
+    ("Team rule: always run the test suite before merging", "essential"),
+    ("Company policy requires code review for every change", "reference"),
+    ("User's favorite coffee is a flat white", "personal"),
+    ("User deployed the Next.js dashboard to Vercel last week", "contextual"),
+    ("The staging database runs on SQLite with WAL enabled", "reference"),
+    ("User asked about Docker networking between containers", "conversational"),
+    ("User's deadline for the API migration is next Friday", "essential"),
+]
+
+QUERIES = [
+    "What are my coding preferences?",
+    "What do I know about PostgreSQL?",
+    "Rules for merging code",
+    "What am I working on currently?",
+    "What did I deploy last week?",
+    "Important deadlines",
+    "Do I like dark mode?",
+    "What have I been learning recently about Rust?",
+    "Tell me about Docker",
+    "What should I keep in mind?",
+]
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[int(fraction * (len(values) - 1))]
+
+
+def seed(db_manager, namespace):
+    from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+    for i, (content, classification) in enumerate(MEMORIES):
+        db_manager.store_long_term_memory_enhanced(
+            ProcessedLongTermMemory(
+                content=content,
+                summary=content,
+                classification=classification,
+                importance="high" if classification == "essential" else "medium",
+                conversation_id=f"bench-{i}",
+                classification_reason="benchmark seed",
+            ),
+            f"chat-{i}",
+            namespace,
+        )
+
+
+def run_planner(engine, db_manager, namespace, limit):
+    """Plan and execute every query; returns latencies (ms) and result ids"""
+    latencies, results = [], {}
+    for query in QUERIES:
+        engine.clear_plan_cache()
+        start = time.perf_counter()
+        plan = engine.plan_search(query)
+        latencies.append((time.perf_counter() - start) * 1000)
+        rows = engine._execute_planned_search(plan, db_manager, namespace, limit)
+        results[query] = {row.get("memory_id") for row in rows}
+    return latencies, results
+
+
+def report(label, latencies):
+    print(
+        f"{label:<8} mean {sum(latencies) / len(latencies):9.3f} ms   "
+        f"p95 {percentile(latencies, 0.95):9.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.6)
+    args = parser.parse_args()
+
+    from loguru import logger
+
+    from memori.agents.retrieval_agent import MemorySearchEngine
+    from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+    logger.remove()
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db_manager = SQLAlchemyDatabaseManager(f"sqlite:///{path}", share_engine=False)
+    db_manager.initialize_schema()
+    namespace = "bench"
+    seed(db_manager, namespace)
+
+    api_key = os.environ.get("OPENAI_API_KEY")
+    # The local planner never calls the client; any key satisfies the constructor
+    local = MemorySearchEngine(
+        api_key=api_key or "unused", model=args.model, planner_mode="local"
+    )
+    local_latencies, local_results = run_planner(
+        local, db_manager, namespace, args.limit
+    )
+    report("local", local_latencies)
+
+    if api_key:
+        llm = MemorySearchEngine(api_key=api_key, model=args.model, planner_mode="llm")
+        llm_latencies, llm_results = run_planner(llm, db_manager, namespace, args.limit)
+        report("llm", llm_latencies)
+
+        overlaps = []
+        for query in QUERIES:
+            a, b = local_results[query], llm_results[query]
+            overlap = len(a & b) / len(a | b) if a | b else 1.0
+            overlaps.append(overlap)
+            print(f"  {overlap:4.2f}  {query}")
+        print(f"mean result overlap (Jaccard): {sum(overlaps) / len(overlaps):.2f}")
+    else:
+        print("OPENAI_API_KEY not set; skipping the LLM planner comparison")
+
+    hybrid = MemorySearchEngine(
+        api_key=api_key or "unused",
+        model=args.model,
+        planner_mode="hybrid",
+        local_confidence_threshold=args.threshold,
+    )
+    for query in QUERIES:
+        plan, confidence = hybrid._local_planner.plan(query)
+        tier = "local" if confidence >= args.threshold else "llm"
+        print(f"  {confidence:4.2f} -> {tier:<5} {query}")
+    local_share = sum(
+        hybrid._local_planner.plan(query)[1] >= args.threshold for query in QUERIES
+    )
+    print(
+        f"hybrid (threshold {args.threshold}): {local_share}/{len(QUERIES)} "
+        "queries planned without an LLM call"
+    )
+
+    db_manager.close()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Recall and latency of SQL-side composite ranking for full-text search
+
+Compares, on a seeded SQLite database with spread-out importance scores and
+creation dates:
+
+- legacy: the previous FTS5 query, ``ORDER BY rank LIMIT k``, whose rows were
+  then re-ranked in Python by importance and recency
+- legacy xN: the same query over-fetching ``N * k`` rows before re-ranking
+- composite: the current query, which orders every match by the composite
+  score in SQL and returns the top k directly
+
+Recall@k is measured against the composite score computed in Python by
+``RankingEngine`` over every matching row (ties at the k-th score count as
+hits). Latency is the median of the database call alone.
+
+Usage:
+    python benchmarks/sql_ranking.py
+    python benchmarks/sql_ranking.py --rows 100000 --limit 10 --overfetch 5 20
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+COMMON_QUERIES = ["python", "database migration", "deadline", "japan", "user"]
+
+# The FTS5 query used before ranking moved into SQL
+LEGACY_QUERY = """
+    SELECT
+        fts.memory_id,
+        fts.memory_type,
+        fts.category_primary,
+        COALESCE(
+            CASE
+                WHEN fts.memory_type = 'short_term' THEN st.processed_data
+                WHEN fts.memory_type = 'long_term' THEN lt.processed_data
+            END,
+            '{}'
+        ) as processed_data,
+        COALESCE(
+            CASE
+                WHEN fts.memory_type = 'short_term' THEN st.importance_score
+                WHEN fts.memory_type = 'long_term' THEN lt.importance_score
+                ELSE 0.5
+            END,
+            0.5
+        ) as importance_score,
+        COALESCE(
+            CASE
+                WHEN fts.memory_type = 'short_term' THEN st.created_at
+                WHEN fts.memory_type = 'long_term' THEN lt.created_at
+            END,
+            datetime('now')
+        ) as created_at,
+        COALESCE(fts.summary, '') as summary,
+        COALESCE(rank, 0.0) as search_score,
+        'sqlite_fts5' as search_strategy
+    FROM memory_search_fts fts
+    LEFT JOIN short_term_memory st ON fts.memory_id = st.memory_id AND fts.memory_type = 'short_term'
+    LEFT JOIN long_term_memory lt ON fts.memory_id = lt.memory_id AND fts.memory_type = 'long_term'
+    WHERE memory_search_fts MATCH :fts_query AND fts.namespace = :namespace
+    ORDER BY search_score, importance_score DESC
+    LIMIT :limit
+"""
+
+ALL_MATCHES_QUERY = """
+    SELECT fts.memory_id, COALESCE(rank, 0.0) as rank,
+           lt.importance_score, lt.created_at
+    FROM memory_search_fts fts
+    JOIN long_term_memory lt ON fts.memory_id = lt.memory_id AND fts.memory_type = 'long_term'
+    WHERE memory_search_fts MATCH ? AND fts.namespace = ?
+"""
+
+
+def spread_rows(path, rng, days=120):
+    """Give seeded memories varied importance scores and creation dates"""
+    now = datetime.now()
+    with sqlite3.connect(path) as conn:
+        ids = [row[0] for row in conn.execute("SELECT memory_id FROM long_term_memory")]
+        conn.executemany(
+            "UPDATE long_term_memory SET importance_score = ?, created_at = ? "
+            "WHERE memory_id = ?",
+            [
+                (
+                    round(rng.random(), 3),
+                    (now - timedelta(days=rng.random() * days)).isoformat(sep=" "),
+                    memory_id,
+                )
+                for memory_id in ids
+            ],
+        )
+
+
+def true_top(path, ranking, query, limit):
+    """Composite scores of every match, and the score a top-k row must reach"""
+    with sqlite3.connect(path) as conn:
+        rows = conn.execute(ALL_MATCHES_QUERY, (f'"{query}"', "bench")).fetchall()
+    results = [
+        {
+            "memory_id": memory_id,
+            "search_score": -rank / (1.0 - rank),
+            "importance_score": importance,
+            "created_at": created_at,
+        }
+        for memory_id, rank, importance, created_at in rows
+    ]
+    scores = dict(
+        zip((r["memory_id"] for r in results), ranking.score(results, time.time()))
+    )
+    if not scores:
+        return scores, None
+    kth = sorted(scores.values(), reverse=True)[min(limit, len(scores)) - 1]
+    return scores, kth
+
+
+def recall(returned_ids, scores, kth, limit):
+    if kth is None:
+        return 1.0
+    hits = sum(1 for memory_id in returned_ids if scores[memory_id] >= kth - 1e-9)
+    return hits / min(limit, len(scores))
+
+
+def median_us(fn, rounds):
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--overfetch", type=int, nargs="*", default=[4])
+    parser.add_argument("--rare-queries", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    from sqlalchemy import text
+
+    sys.path.insert(0, str(Path(__file__).parent))
+    from suite import create_memori, seed
+
+    rng = random.Random(args.seed)
+    path = Path(tempfile.mkdtemp(prefix="memori-ranking-")) / "ranking.db"
+    memori = create_memori(path, SimpleNamespace(llm_latency=0.0))
+    seed(memori.db_manager, rng, "bench", args.rows)
+    spread_rows(path, rng)
+
+    with sqlite3.connect(path) as conn:
+        summaries = conn.execute(
+            "SELECT summary FROM long_term_memory ORDER BY random() LIMIT ?",
+            (args.rare_queries,),
+        ).fetchall()
+    rare_queries = [summary.split()[-1] for (summary,) in summaries]
+
+    service = memori.db_manager._get_search_service()
+    ranking = service.ranking_engine
+    legacy_statement = text(LEGACY_QUERY)
+    limit = args.limit
+
+    def legacy(query, fetch):
+        params = {"fts_query": f'"{query}"', "namespace": "bench", "limit": fetch}
+        rows = service.session.execute(legacy_statement, params).fetchall()
+        service.session.close()
+        return [row.memory_id for row in rows]
+
+    def composite(query):
+        rows = service._search_sqlite_fts(query, "bench", None, limit, True, True)
+        service.session.close()
+        return [row["memory_id"] for row in rows]
+
+    approaches = [("legacy", lambda q: legacy(q, limit))]
+    for factor in args.overfetch:
+        approaches.append(
+            (f"legacy x{factor}", lambda q, f=factor: legacy(q, f * limit))
+        )
+    approaches.append(("composite", composite))
+
+    print(f"rows={args.rows} k={limit} rounds={args.rounds}")
+    print(f"{'queries':<10}{'approach':<14}{'recall@k':>10}{'median':>14}")
+    for label, queries in (("common", COMMON_QUERIES), ("rare", rare_queries)):
+        truths = {query: true_top(path, ranking, query, limit) for query in queries}
+        for name, fn in approaches:
+            recalls = []
+            latencies = []
+            for query in queries:
+                returned = fn(query)
+                if name.startswith("legacy x"):
+                    # Keep the k best of the over-fetched rows, as a re-rank would
+                    scores = truths[query][0]
+                    returned = sorted(returned, key=scores.get, reverse=True)[:limit]
+                recalls.append(recall(returned, *truths[query], limit))
+                latencies.append(
+                    median_us(lambda fn=fn, query=query: fn(query), args.rounds)
+                )
+            print(
+                f"{label:<10}{name:<14}{statistics.mean(recalls):10.2f}"
+                f"{statistics.median(latencies):11.0f} us"
+            )
+
+    memori.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+SQLite write concurrency: SQLite defaults vs. WAL profile with a single-writer queue
+
+Runs writer threads (chat history and long-term memory inserts) alongside
+reader threads (``search_memories``) against a file-backed SQLite database,
+once with ``sqlite_profile="default"`` and unserialized writes (the previous
+behaviour) and once per requested profile with the single-writer queue. Each
+configuration gets its own database file and a private engine.
+
+Usage:
+    python benchmarks/sqlite_concurrency.py
+    python benchmarks/sqlite_concurrency.py --writers 8 --readers 4 --duration 10
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+QUERIES = ["python", "coffee", "deadline", "travel"]
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[int(fraction * (len(values) - 1))]
+
+
+def make_memory(i: int):
+    from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+    topic = QUERIES[i % len(QUERIES)]
+    return ProcessedLongTermMemory(
+        content=f"User mentioned {topic} in note {i}",
+        summary=f"User mentioned {topic}",
+        classification="conversational",
+        importance="medium",
+        conversation_id=f"bench-{i}",
+        classification_reason="benchmark seed",
+    )
+
+
+def run_config(label, profile, single_writer, args):
+    from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    db_manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{path}",
+        share_engine=False,
+        sqlite_profile=profile,
+        sqlite_single_writer=single_writer,
+    )
+    db_manager.initialize_schema()
+
+    stop = threading.Event()
+    lock = threading.Lock()
+    write_latencies, read_latencies = [], []
+    errors = {"locked": 0, "other": 0}
+
+    def record_error(e):
+        with lock:
+            errors["locked" if "locked" in str(e) else "other"] += 1
+
+    def writer(worker: int):
+        i = 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                if i % 2:
+                    db_manager.store_long_term_memory_enhanced(
+                        make_memory(i), f"chat-{worker}-{i}", "bench"
+                    )
+                else:
+                    db_manager.store_chat_history(
+                        chat_id=str(uuid.uuid4()),
+                        user_input=f"question {i}",
+                        ai_output=f"answer {i}",
+                        model="bench",
+                        timestamp=datetime.now(),
+                        session_id=f"session-{worker}",
+                        namespace="bench",
+                    )
+            except Exception as e:
+                record_error(e)
+            else:
+                with lock:
+                    write_latencies.append((time.perf_counter() - start) * 1000)
+            i += 1
+
+    def reader():
+        i = 0
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                db_manager.search_memories(
+                    QUERIES[i % len(QUERIES)], namespace="bench", limit=5
+                )
+            except Exception as e:
+                record_error(e)
+            else:
+                with lock:
+                    read_latencies.append((time.perf_counter() - start) * 1000)
+            i += 1
+
+    threads = [
+        threading.Thread(target=writer, args=(w,)) for w in range(args.writers)
+    ] + [threading.Thread(target=reader) for _ in range(args.readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    db_manager.close()
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    print(
+        f"{label:<26} writes {len(write_latencies) / args.duration:7.1f}/s "
+        f"(p95 {percentile(write_latencies, 0.95):7.2f} ms)   "
+        f"reads {len(read_latencies) / args.duration:7.1f}/s "
+        f"(p95 {percentile(read_latencies, 0.95):7.2f} ms)   "
+        f"locked {errors['locked']:4d}   other errors {errors['other']}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        default=["balanced", "performance"],
+        help="Profiles to run with the single-writer queue",
+    )
+    args = parser.parse_args()
+
+    from loguru import logger
+
+    logger.remove()  # Lock errors are counted, not logged
+
+    print(f"writers={args.writers} readers={args.readers} duration={args.duration}s")
+    run_config("default, concurrent writes", "default", False, args)
+    for profile in args.profiles:
+        run_config(f"{profile}, single writer", profile, True, args)
+
+
+if __name__ == "__main__":
+    main()
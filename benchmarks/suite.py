@@ -0,0 +1,601 @@
+#!/usr/bin/env python3
+"""
+Offline regression benchmarks for ingestion and retrieval
+
+Runs entirely on temporary SQLite databases. The memory agent and search
+engine keep their real code paths but talk to ``StubLLMClient``, which
+answers structured-output calls deterministically (optionally after a fixed
+delay), so results only reflect Memori's own overhead and are comparable
+across commits. Benchmarks:
+
+- record_conversation: call latency (chat history insert + enqueue) and
+  end-to-end ingestion throughput, per ingestion batch size
+- store_long_term: ``store_long_term_memory_enhanced`` per memory
+- search: ``SearchService.search_memories`` on databases of each size
+- auto_ingest: ``_inject_openai_context`` with a cold and a warm context cache
+- conscious_promotion: ``run_conscious_ingest`` over freshly stored
+  conscious-info memories
+
+Results are written in a pytest-benchmark-like JSON layout (machine and
+commit info, per-benchmark stats in seconds) for tracking across commits;
+``--compare`` diffs a run against an earlier JSON file.
+
+Usage:
+    python benchmarks/suite.py --profile quick
+    python benchmarks/suite.py --json results/$(git rev-parse --short HEAD).json
+    python benchmarks/suite.py --profile full --compare results/baseline.json --fail-threshold 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import re
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+PROFILES = {
+    "quick": {"sizes": [1000], "rounds": 50},
+    "standard": {"sizes": [1000, 100_000], "rounds": 200},
+    "full": {"sizes": [1000, 100_000, 1_000_000], "rounds": 200},
+}
+
+BENCHMARKS = (
+    "record_conversation",
+    "store_long_term",
+    "search",
+    "auto_ingest",
+    "conscious_promotion",
+)
+
+TOPICS = [
+    "User prefers Python and FastAPI for backend services",
+    "User drinks a flat white every morning",
+    "Database migration to PostgreSQL is planned for next sprint",
+    "User is learning Rust ownership and borrowing",
+    "Team rule: run the test suite before merging",
+    "User likes to travel to Japan in spring",
+    "The staging cluster runs on Kubernetes with three nodes",
+    "User's deadline for the API redesign is Friday",
+    "User reads science fiction novels on weekends",
+    "Dashboard frontend is written in TypeScript with React",
+    "User's dog is called Pixel",
+    "Nightly backups are stored in an S3 bucket",
+]
+
+# Common words hit a large share of rows, the w#### tokens only a few
+QUERIES = [
+    "python",
+    "database migration",
+    "coffee",
+    "deadline",
+    "kubernetes cluster",
+    "w0042",
+    "w1234 japan",
+    "what does the user like to read?",
+]
+
+CLASSIFICATIONS = [
+    "contextual",
+    "personal",
+    "essential",
+    "conversational",
+    "reference",
+    "conscious-info",
+]
+
+RARE_TOKENS = 5000
+
+
+def make_memory(rng, i, classification=None):
+    from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+    topic = TOPICS[rng.randrange(len(TOPICS))]
+    token = f"w{rng.randrange(RARE_TOKENS):04d}"
+    return ProcessedLongTermMemory(
+        content=f"{topic} (note {i}, {token})",
+        summary=f"{topic} {token}",
+        classification=classification or rng.choice(CLASSIFICATIONS[:-1]),
+        importance=rng.choice(["low", "medium", "medium", "high"]),
+        conversation_id=f"bench-{i}",
+        classification_reason="benchmark seed",
+    )
+
+
+def seed(db_manager, rng, namespace, rows, chunk=20000, classification=None):
+    for start in range(0, rows, chunk):
+        count = min(chunk, rows - start)
+        memories = [make_memory(rng, start + i, classification) for i in range(count)]
+        db_manager.store_long_term_memories_bulk(
+            memories, [f"bench-chat-{start + i}" for i in range(count)], namespace
+        )
+
+
+class StubLLMClient:
+    """
+    Offline stand-in for the OpenAI client used by the memory and search agents
+
+    Only ``beta.chat.completions.parse`` is implemented. Memories are derived
+    from the conversation text with a stable hash, search plans come from the
+    local heuristic planner.
+    """
+
+    def __init__(self, latency: float = 0.0, is_async: bool = False):
+        self.latency = latency
+        self.calls = 0
+        parse = self._parse_async if is_async else self._parse
+        self.beta = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(parse=parse))
+        )
+
+    def _parse(self, model, messages, response_format, **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(messages, response_format)
+
+    async def _parse_async(self, model, messages, response_format, **kwargs):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(messages, response_format)
+
+    def _respond(self, messages, response_format):
+        from memori.agents.local_planner import LocalSearchPlanner
+        from memori.utils.pydantic_models import (
+            MemorySearchQuery,
+            ProcessedLongTermMemory,
+            ProcessedLongTermMemoryBatch,
+        )
+
+        self.calls += 1
+        prompt = messages[-1]["content"]
+        if response_format is MemorySearchQuery:
+            query = prompt.split("\n", 1)[0][len("User query: ") :]
+            parsed = LocalSearchPlanner().plan(query)[0]
+        elif response_format is ProcessedLongTermMemoryBatch:
+            parsed = ProcessedLongTermMemoryBatch(
+                memories=[
+                    self.memory(user_input, chat_id)
+                    for chat_id, user_input in re.findall(
+                        r"=== CONVERSATION (\S+) ===\nUser: (.*)", prompt
+                    )
+                ]
+            )
+        elif response_format is ProcessedLongTermMemory:
+            match = re.search(r"User: (.*)", prompt)
+            parsed = self.memory(match.group(1) if match else prompt, "pending")
+        else:
+            raise ValueError(f"Unsupported response format {response_format}")
+        message = SimpleNamespace(parsed=parsed, refusal=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    @staticmethod
+    def memory(user_input, chat_id):
+        from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+        digest = zlib.crc32(user_input.encode())
+        classification = CLASSIFICATIONS[digest % len(CLASSIFICATIONS)]
+        return ProcessedLongTermMemory(
+            content=user_input,
+            summary=user_input[:120],
+            classification=classification,
+            importance="high" if digest % 3 == 0 else "medium",
+            conversation_id=chat_id,
+            is_user_context=classification == "conscious-info",
+            classification_reason="stub classification",
+        )
+
+
+def summarize(timings):
+    """pytest-benchmark style statistics (seconds) for a list of timings"""
+    timings = sorted(timings)
+    n = len(timings)
+    mean = statistics.fmean(timings)
+    q1 = timings[int(0.25 * (n - 1))]
+    q3 = timings[int(0.75 * (n - 1))]
+    return {
+        "min": timings[0],
+        "max": timings[-1],
+        "mean": mean,
+        "stddev": statistics.stdev(timings) if n > 1 else 0.0,
+        "median": statistics.median(timings),
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "p95": timings[int(0.95 * (n - 1))],
+        "rounds": n,
+        "total": sum(timings),
+        "ops": 1 / mean if mean else 0.0,
+    }
+
+
+def measure(fn, rounds, warmup=5, setup=None, max_time=None):
+    """
+    Time ``fn(setup())`` (or ``fn()``) ``rounds`` times after a warmup
+
+    With ``max_time``, slow calls get fewer rounds (at least 5) so that the
+    timed part takes about ``max_time`` seconds.
+    """
+
+    def call():
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        fn(argument) if setup else fn()
+        return time.perf_counter() - start
+
+    warmup_timings = [call() for _ in range(warmup)]
+    if max_time and warmup_timings:
+        estimate = max(statistics.median(warmup_timings), 1e-9)
+        rounds = max(5, min(rounds, int(max_time / estimate)))
+    return [call() for _ in range(rounds)]
+
+
+def result(group, params, timings, **extra_info):
+    label = ",".join(f"{key}={value}" for key, value in params.items())
+    return {
+        "name": f"{group}[{label}]" if label else group,
+        "group": group,
+        "params": params,
+        "stats": summarize(timings),
+        "extra_info": extra_info,
+    }
+
+
+def create_memori(path, args, **options):
+    from loguru import logger
+
+    from memori import Memori
+
+    memori = Memori(
+        database_connect=f"sqlite:///{path}",
+        openai_api_key="sk-offline-benchmark",
+        namespace="bench",
+        share_engine=False,
+        **options,
+    )
+    logger.remove()  # Memori installs its own handler on first use
+    if memori.memory_agent is not None:
+        memori.memory_agent.async_client = StubLLMClient(args.llm_latency, True)
+        memori.memory_agent.client = StubLLMClient(args.llm_latency)
+    if memori.search_engine is not None:
+        memori.search_engine.client = StubLLMClient(args.llm_latency)
+    return memori
+
+
+def wait_for_ingestion(memori, timeout=600.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        stats = memori.get_ingestion_stats()
+        done = stats["completed"] + stats["failed"] + stats["dropped"]
+        if stats.get("batching", {}).get("pending"):
+            memori._ingestion_batcher.flush()
+        elif done >= stats["submitted"] and not stats["in_flight"]:
+            return stats
+        time.sleep(0.01)
+    raise TimeoutError("Ingestion did not drain in time")
+
+
+def bench_record_conversation(workdir, args, rng):
+    results = []
+    for batch_size in (1, 8):
+        memori = create_memori(
+            workdir / f"record_{batch_size}.db",
+            args,
+            ingestion_batch_size=batch_size,
+            ingestion_queue_size=args.rounds * 2 + 20,
+        )
+        memori.enable()
+        conversations = [
+            (f"{TOPICS[rng.randrange(len(TOPICS))]} #{i}", f"Noted ({i}).")
+            for i in range(args.rounds + 5)
+        ]
+        calls = iter(conversations)
+
+        start = time.perf_counter()
+        timings = measure(
+            lambda memori=memori, calls=calls: memori.record_conversation(
+                *next(calls), model="stub"
+            ),
+            args.rounds,
+        )
+        stats = wait_for_ingestion(memori)
+        elapsed = time.perf_counter() - start
+        results.append(
+            result(
+                "record_conversation",
+                {"batch_size": batch_size},
+                timings,
+                conversations_per_second=round(len(conversations) / elapsed, 1),
+                memories_stored=memori.db_manager.get_memory_stats("bench").get(
+                    "long_term_count"
+                ),
+                failed_jobs=stats["failed"],
+            )
+        )
+        memori.cleanup()
+    return results
+
+
+def bench_store_long_term(workdir, args, rng):
+    from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+    db_manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{workdir / 'store.db'}", share_engine=False
+    )
+    db_manager.initialize_schema()
+    counter = iter(range(10**9))
+    timings = measure(
+        lambda memory: db_manager.store_long_term_memory_enhanced(
+            memory, memory.conversation_id, "bench"
+        ),
+        args.rounds,
+        setup=lambda: make_memory(rng, next(counter)),
+    )
+    db_manager.close()
+    return [result("store_long_term", {}, timings)]
+
+
+def bench_search(workdir, args, rng):
+    from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+    results = []
+    for size in args.sizes:
+        db_manager = SQLAlchemyDatabaseManager(
+            f"sqlite:///{workdir / f'search_{size}.db'}", share_engine=False
+        )
+        db_manager.initialize_schema()
+        start = time.perf_counter()
+        seed(db_manager, rng, "bench", size)
+        seed_seconds = time.perf_counter() - start
+
+        service = db_manager._get_search_service()
+        for query in QUERIES:
+            timings = measure(
+                lambda service=service, query=query: service.search_memories(
+                    query, "bench", None, 5
+                ),
+                args.rounds,
+                warmup=3,
+                max_time=args.max_time,
+            )
+            results.append(
+                result(
+                    "search",
+                    {"rows": size, "query": query},
+                    timings,
+                    seed_seconds=round(seed_seconds, 2),
+                )
+            )
+        service.session.close()
+        db_manager.close()
+    return results
+
+
+def bench_auto_ingest(workdir, args, rng):
+    results = []
+    rows = args.sizes[0]
+    for label, cache_size in (("cold", 0), ("warm", 256)):
+        memori = create_memori(
+            workdir / f"auto_ingest_{label}.db",
+            args,
+            auto_ingest=True,
+            context_cache_size=cache_size,
+            track_memory_access=False,
+        )
+        memori.enable()
+        seed(memori.db_manager, rng, "bench", rows)
+        prompts = iter(QUERIES[i % len(QUERIES)] for i in range(10**9))
+        timings = measure(
+            lambda memori=memori, prompts=prompts: memori._inject_openai_context(
+                {"messages": [{"role": "user", "content": next(prompts)}]}
+            ),
+            args.rounds,
+        )
+        results.append(result("auto_ingest", {"rows": rows, "cache": label}, timings))
+        memori.cleanup()
+    return results
+
+
+def bench_conscious_promotion(workdir, args, rng):
+    from memori.agents.conscious_agent import ConsciouscAgent
+    from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+    db_manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{workdir / 'conscious.db'}", share_engine=False
+    )
+    db_manager.initialize_schema()
+    batch = 500
+    rounds = max(3, args.rounds // 20)
+    namespaces = iter(f"conscious_{i}" for i in range(10**9))
+
+    def setup():
+        namespace = next(namespaces)
+        seed(db_manager, rng, namespace, batch, classification="conscious-info")
+        return namespace
+
+    timings = measure(
+        lambda namespace: asyncio.run(
+            ConsciouscAgent().run_conscious_ingest(db_manager, namespace)
+        ),
+        rounds,
+        warmup=1,
+        setup=setup,
+    )
+    db_manager.close()
+    return [result("conscious_promotion", {"memories": batch}, timings)]
+
+
+def machine_info():
+    import sqlalchemy
+
+    return {
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "sqlite_version": sqlite3.sqlite_version,
+        "sqlalchemy_version": sqlalchemy.__version__,
+    }
+
+
+def commit_info():
+    root = Path(__file__).parent.parent
+
+    def git(*command):
+        try:
+            return subprocess.run(
+                ["git", *command], cwd=root, capture_output=True, text=True
+            ).stdout.strip()
+        except OSError:
+            return ""
+
+    return {
+        "id": git("rev-parse", "HEAD"),
+        "branch": git("rev-parse", "--abbrev-ref", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+    }
+
+
+def print_results(benchmarks):
+    print(
+        f"{'benchmark':<56}{'min ms':>10}{'median ms':>11}{'mean ms':>10}"
+        f"{'p95 ms':>10}{'rounds':>8}"
+    )
+    for bench in benchmarks:
+        stats = bench["stats"]
+        print(
+            f"{bench['name'][:55]:<56}{stats['min'] * 1000:10.3f}"
+            f"{stats['median'] * 1000:11.3f}{stats['mean'] * 1000:10.3f}"
+            f"{stats['p95'] * 1000:10.3f}{stats['rounds']:8d}"
+        )
+        if bench["extra_info"]:
+            details = ", ".join(f"{k}={v}" for k, v in bench["extra_info"].items())
+            print(f"    {details}")
+
+
+def compare(benchmarks, baseline_path, threshold):
+    """Print median changes against a previous run; returns regressed names"""
+    with open(baseline_path) as f:
+        baseline = {bench["name"]: bench for bench in json.load(f)["benchmarks"]}
+
+    regressions = []
+    print(f"\nCompared with {baseline_path} (regression threshold {threshold:.0%})")
+    for bench in benchmarks:
+        previous = baseline.get(bench["name"])
+        if previous is None:
+            print(f"  {bench['name'][:55]:<56} new")
+            continue
+        before = previous["stats"]["median"]
+        after = bench["stats"]["median"]
+        change = (after - before) / before if before else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(bench["name"])
+        print(f"  {bench['name'][:55]:<56} {change:+8.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profile", choices=PROFILES, default="standard")
+    parser.add_argument(
+        "--sizes", help="Comma-separated row counts for search (overrides profile)"
+    )
+    parser.add_argument("--rounds", type=int, help="Timed calls per benchmark")
+    parser.add_argument(
+        "--max-time",
+        type=float,
+        default=5.0,
+        help="Seconds per search benchmark; slow queries get fewer rounds",
+    )
+    parser.add_argument(
+        "--only", help=f"Comma-separated subset of: {', '.join(BENCHMARKS)}"
+    )
+    parser.add_argument(
+        "--llm-latency",
+        type=float,
+        default=0.0,
+        help="Seconds the stub LLM client waits per call",
+    )
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--json", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Earlier JSON results to compare with")
+    parser.add_argument(
+        "--fail-threshold",
+        type=float,
+        help="Exit with status 1 if a median regresses by more than this fraction",
+    )
+    args = parser.parse_args()
+
+    profile = PROFILES[args.profile]
+    args.sizes = (
+        [int(size) for size in args.sizes.split(",")]
+        if args.sizes
+        else profile["sizes"]
+    )
+    args.rounds = args.rounds or profile["rounds"]
+    selected = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = set(selected) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    from loguru import logger
+
+    logger.remove()
+
+    benchmarks = []
+    started = datetime.now(timezone.utc)
+    with tempfile.TemporaryDirectory(prefix="memori-bench-") as workdir:
+        for name in BENCHMARKS:
+            if name not in selected:
+                continue
+            print(f"running {name}...", file=sys.stderr)
+            # Own generator per benchmark so --only does not change the data
+            rng = random.Random(f"{args.seed}:{name}")
+            benchmarks.extend(globals()[f"bench_{name}"](Path(workdir), args, rng))
+
+    print_results(benchmarks)
+    output = {
+        "machine_info": machine_info(),
+        "commit_info": commit_info(),
+        "datetime": started.isoformat(),
+        "options": {
+            "profile": args.profile,
+            "sizes": args.sizes,
+            "rounds": args.rounds,
+            "max_time": args.max_time,
+            "llm_latency": args.llm_latency,
+            "seed": args.seed,
+        },
+        "benchmarks": benchmarks,
+    }
+    if args.json:
+        Path(args.json).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, "w") as f:
+            json.dump(output, f, indent=2)
+        print(f"\nresults written to {args.json}")
+
+    if args.compare:
+        threshold = args.fail_threshold if args.fail_threshold is not None else 0.1
+        regressions = compare(benchmarks, args.compare, threshold)
+        if regressions and args.fail_threshold is not None:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,83 +9,107 @@ __version__ = "2.0.1"
 __author__ = "Harshal More"
 __email__ = "harshalmore2468@gmail.com"
 
-from typing import Any, Optional
+import importlib
+from typing import Any
 
-# Configuration system
-from .config import (
-    AgentSettings,
-    ConfigManager,
-    DatabaseSettings,
-    LoggingSettings,
-    MemoriSettings,
-)
-from .core.database import DatabaseManager
+# Public names and the submodules defining them. Nothing is imported until an
+# attribute is first accessed (PEP 562), so ``import memori`` stays cheap and
+# optional SDKs (openai, litellm, anthropic) load only when actually used.
+_LAZY_ATTRIBUTES = {
+    # Configuration system
+    "AgentSettings": ".config",
+    "ConfigManager": ".config",
+    "DatabaseSettings": ".config",
+    "LoggingSettings": ".config",
+    "MemoriSettings": ".config",
+    # Core components
+    "DatabaseManager": ".core.database",
+    "Memori": ".core.memory",
+    # Database system
+    "MySQLConnector": ".database.connectors",
+    "PostgreSQLConnector": ".database.connectors",
+    "SQLiteConnector": ".database.connectors",
+    "BaseQueries": ".database.queries",
+    "ChatQueries": ".database.queries",
+    "EntityQueries": ".database.queries",
+    "MemoryQueries": ".database.queries",
+    # Wrapper integrations
+    "MemoriAnthropic": ".integrations",
+    "MemoriOpenAI": ".integrations",
+    # Tools and integrations
+    "MemoryTool": ".tools.memory_tool",
+    "create_memory_search_tool": ".tools.memory_tool",
+    "create_memory_tool": ".tools.memory_tool",
+    # Memory agents
+    "MemoryAgent": ".agents.memory_agent",
+    "MemorySearchEngine": ".agents.retrieval_agent",
+}
 
-# Core components
-from .core.memory import Memori
+# Utils and models: Pydantic models, exceptions, validators, helpers, logging
+for _name in (
+    "AgentError",
+    "AsyncUtils",
+    "AuthenticationError",
+    "ConfigurationError",
+    "ConversationContext",
+    "DatabaseError",
+    "DataValidator",
+    "DateTimeUtils",
+    "EntityType",
+    "ExceptionHandler",
+    "ExtractedEntities",
+    "FileUtils",
+    "IntegrationError",
+    "JsonUtils",
+    "LoggingManager",
+    "MemoriError",
+    "MemoryCategory",
+    "MemoryCategoryType",
+    "MemoryImportance",
+    "MemoryNotFoundError",
+    "MemoryValidator",
+    "PerformanceUtils",
+    "ProcessedMemory",
+    "ProcessingError",
+    "RateLimitError",
+    "ResourceExhaustedError",
+    "RetentionType",
+    "RetryUtils",
+    "StringUtils",
+    "TimeoutError",
+    "ValidationError",
+    "get_logger",
+):
+    _LAZY_ATTRIBUTES[_name] = ".utils"
+del _name
+
+# Agents are optional: a failed import yields None instead of an error
+_OPTIONAL_ATTRIBUTES = {"MemoryAgent", "MemorySearchEngine"}
 
-# Database system
-from .database.connectors import MySQLConnector, PostgreSQLConnector, SQLiteConnector
-from .database.queries import BaseQueries, ChatQueries, EntityQueries, MemoryQueries
 
-# Wrapper integrations
-from .integrations import MemoriAnthropic, MemoriOpenAI
+def __getattr__(name: str) -> Any:
+    if name == "_AGENTS_AVAILABLE":
+        return all(__getattr__(agent) is not None for agent in _OPTIONAL_ATTRIBUTES)
 
-# Tools and integrations
-from .tools.memory_tool import MemoryTool, create_memory_search_tool, create_memory_tool
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Utils and models
-from .utils import (  # Pydantic models; Enhanced exceptions; Validators and helpers; Logging
-    AgentError,
-    AsyncUtils,
-    AuthenticationError,
-    ConfigurationError,
-    ConversationContext,
-    DatabaseError,
-    DataValidator,
-    DateTimeUtils,
-    EntityType,
-    ExceptionHandler,
-    ExtractedEntities,
-    FileUtils,
-    IntegrationError,
-    JsonUtils,
-    LoggingManager,
-    MemoriError,
-    MemoryCategory,
-    MemoryCategoryType,
-    MemoryImportance,
-    MemoryNotFoundError,
-    MemoryValidator,
-    PerformanceUtils,
-    ProcessedMemory,
-    ProcessingError,
-    RateLimitError,
-    ResourceExhaustedError,
-    RetentionType,
-    RetryUtils,
-    StringUtils,
-    TimeoutError,
-    ValidationError,
-    get_logger,
-)
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except ImportError:
+        if name not in _OPTIONAL_ATTRIBUTES:
+            raise
+        value = None
+    globals()[name] = value  # Later lookups bypass __getattr__
+    return value
 
-# Memory agents (dynamically imported to avoid import errors)
-MemoryAgent: Optional[Any] = None
-MemorySearchEngine: Optional[Any] = None
-_AGENTS_AVAILABLE = False
 
-try:
-    from .agents.memory_agent import MemoryAgent
-    from .agents.retrieval_agent import MemorySearchEngine
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-    _AGENTS_AVAILABLE = True
-except ImportError:
-    # Agents are not available, use placeholder None values
-    pass
 
-# Build __all__ list dynamically based on available components
-_all_components = [
+__all__ = [
     # Core
     "Memori",
     "DatabaseManager",
@@ -147,10 +171,7 @@ _all_components = [
     # Logging
     "LoggingManager",
     "get_logger",
+    # Agents
+    "MemoryAgent",
+    "MemorySearchEngine",
 ]
-
-# Add agents only if available
-if _AGENTS_AVAILABLE:
-    _all_components.extend(["MemoryAgent", "MemorySearchEngine"])
-
-__all__ = _all_components
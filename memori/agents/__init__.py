@@ -1,7 +1,28 @@
 """Intelligent agents for memory processing and retrieval"""
 
-from .conscious_agent import ConsciouscAgent
-from .memory_agent import MemoryAgent
-from .retrieval_agent import MemorySearchEngine
+import importlib
+from typing import Any
+
+# Loaded on first access (PEP 562): MemoryAgent and MemorySearchEngine import
+# the OpenAI SDK, which ConsciouscAgent users do not need
+_LAZY_ATTRIBUTES = {
+    "ConsciouscAgent": ".conscious_agent",
+    "MemoryAgent": ".memory_agent",
+    "MemorySearchEngine": ".retrieval_agent",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = ["MemoryAgent", "MemorySearchEngine", "ConsciouscAgent"]
@@ -11,6 +11,9 @@ from typing import List
 
 from loguru import logger
 
+# memory_ids per UPDATE ... IN (...) statement when marking rows processed
+PROCESSED_UPDATE_CHUNK = 500
+
 
 class ConsciouscAgent:
     """
@@ -20,9 +23,16 @@ class ConsciouscAgent:
     Runs once at program startup when conscious_ingest=True.
     """
 
-    def __init__(self):
-        """Initialize the conscious agent"""
+    def __init__(self, context_snapshots=None):
+        """
+        Initialize the conscious agent
+
+        Args:
+            context_snapshots: Optional ConsciousContextSnapshots kept current
+                with the rows this agent copies into short-term memory
+        """
         self.context_initialized = False
+        self.context_snapshots = context_snapshots
 
     async def run_conscious_ingest(
         self, db_manager, namespace: str = "default"
@@ -50,20 +60,10 @@ class ConsciouscAgent:
                 logger.info("ConsciouscAgent: No conscious-info memories found")
                 return False
 
-            # Copy each conscious-info memory directly to short-term memory
-            copied_count = 0
-            for memory_row in conscious_memories:
-                success = await self._copy_memory_to_short_term(
-                    db_manager, namespace, memory_row
-                )
-                if success:
-                    copied_count += 1
-
-            # Mark memories as processed
-            memory_ids = [
-                row[0] for row in conscious_memories
-            ]  # memory_id is first column
-            await self._mark_memories_processed(db_manager, memory_ids, namespace)
+            # Copy to short-term memory and mark processed in one transaction
+            copied_count = self.promote_memories(
+                db_manager, namespace, conscious_memories, mark_processed=True
+            )
 
             self.context_initialized = True
             logger.info(
@@ -92,19 +92,10 @@ class ConsciouscAgent:
             True if memories were processed, False otherwise
         """
         try:
-            from sqlalchemy import text
-
             with db_manager._get_connection() as connection:
                 # Get ALL conscious-info labeled memories from long-term memory
-                cursor = connection.execute(
-                    text(
-                        """SELECT memory_id, processed_data, summary, searchable_content,
-                              importance_score, created_at
-                       FROM long_term_memory
-                       WHERE namespace = :namespace AND classification = 'conscious-info'
-                       ORDER BY importance_score DESC, created_at DESC"""
-                    ),
-                    {"namespace": namespace},
+                cursor = connection.execute_compiled(
+                    "conscious_memories", {"namespace": namespace}
                 )
                 existing_conscious_memories = cursor.fetchall()
 
@@ -114,13 +105,9 @@ class ConsciouscAgent:
                 )
                 return False
 
-            copied_count = 0
-            for memory_row in existing_conscious_memories:
-                success = await self._copy_memory_to_short_term(
-                    db_manager, namespace, memory_row
-                )
-                if success:
-                    copied_count += 1
+            copied_count = self.promote_memories(
+                db_manager, namespace, existing_conscious_memories
+            )
 
             if copied_count > 0:
                 logger.info(
@@ -161,18 +148,10 @@ class ConsciouscAgent:
             if not new_memories:
                 return False
 
-            # Copy each new memory directly to short-term memory
-            copied_count = 0
-            for memory_row in new_memories:
-                success = await self._copy_memory_to_short_term(
-                    db_manager, namespace, memory_row
-                )
-                if success:
-                    copied_count += 1
-
-            # Mark new memories as processed
-            memory_ids = [row[0] for row in new_memories]  # memory_id is first column
-            await self._mark_memories_processed(db_manager, memory_ids, namespace)
+            # Copy to short-term memory and mark processed in one transaction
+            copied_count = self.promote_memories(
+                db_manager, namespace, new_memories, mark_processed=True
+            )
 
             logger.info(
                 f"ConsciouscAgent: Copied {copied_count} new conscious-info memories to short-term memory"
@@ -186,18 +165,9 @@ class ConsciouscAgent:
     async def _get_conscious_memories(self, db_manager, namespace: str) -> List[tuple]:
         """Get all conscious-info labeled memories from long-term memory"""
         try:
-            from sqlalchemy import text
-
             with db_manager._get_connection() as connection:
-                cursor = connection.execute(
-                    text(
-                        """SELECT memory_id, processed_data, summary, searchable_content,
-                              importance_score, created_at
-                       FROM long_term_memory
-                       WHERE namespace = :namespace AND classification = 'conscious-info'
-                       ORDER BY importance_score DESC, created_at DESC"""
-                    ),
-                    {"namespace": namespace},
+                cursor = connection.execute_compiled(
+                    "conscious_memories", {"namespace": namespace}
                 )
                 return cursor.fetchall()
 
@@ -210,18 +180,9 @@ class ConsciouscAgent:
     ) -> List[tuple]:
         """Get unprocessed conscious-info labeled memories from long-term memory"""
         try:
-            from sqlalchemy import text
-
             with db_manager._get_connection() as connection:
-                cursor = connection.execute(
-                    text(
-                        """SELECT memory_id, processed_data, summary, searchable_content,
-                              importance_score, created_at
-                       FROM long_term_memory
-                       WHERE namespace = :namespace AND classification = 'conscious-info'
-                       AND conscious_processed = :conscious_processed
-                       ORDER BY importance_score DESC, created_at DESC"""
-                    ),
+                cursor = connection.execute_compiled(
+                    "unprocessed_conscious_memories",
                     {"namespace": namespace, "conscious_processed": False},
                 )
                 return cursor.fetchall()
@@ -230,115 +191,121 @@ class ConsciouscAgent:
             logger.error(f"ConsciouscAgent: Failed to get unprocessed memories: {e}")
             return []
 
-    async def _copy_memory_to_short_term(
-        self, db_manager, namespace: str, memory_row: tuple
-    ) -> bool:
-        """Copy a conscious memory directly to short-term memory with duplicate filtering"""
-        try:
-            (
-                memory_id,
-                processed_data,
-                summary,
-                searchable_content,
-                importance_score,
-                _,
-            ) = memory_row
+    def promote_memories(
+        self,
+        db_manager,
+        namespace: str,
+        memory_rows: List[tuple],
+        mark_processed: bool = False,
+    ) -> int:
+        """
+        Copy conscious-info rows to short-term memory in one transaction
 
-            from sqlalchemy import text
+        Rows whose searchable_content or summary already exists as conscious
+        context (or earlier in the same batch) are skipped. The remaining
+        rows are inserted with a single executemany, and with mark_processed
+        every row in ``memory_rows`` is flagged conscious_processed with
+        chunked ``memory_id IN (...)`` updates.
 
-            with db_manager._get_connection() as connection:
-                # Check if similar content already exists in short-term memory
-                existing_check = connection.execute(
-                    text(
-                        """SELECT COUNT(*) FROM short_term_memory
-                           WHERE namespace = :namespace
-                           AND category_primary = 'conscious_context'
-                           AND (searchable_content = :searchable_content
-                                OR summary = :summary)"""
-                    ),
-                    {
-                        "namespace": namespace,
-                        "searchable_content": searchable_content,
-                        "summary": summary,
-                    },
-                )
+        Args:
+            db_manager: Database manager instance
+            namespace: Memory namespace
+            memory_rows: (memory_id, processed_data, summary,
+                searchable_content, importance_score, created_at) rows
+            mark_processed: Also mark the rows as processed
 
-                existing_count = existing_check.scalar()
-                if existing_count > 0:
-                    logger.debug(
-                        f"ConsciouscAgent: Skipping duplicate memory {memory_id} - similar content already exists in short-term memory"
-                    )
-                    return False
+        Returns:
+            Number of memories copied
+        """
+        if not memory_rows:
+            return 0
 
-                # Create short-term memory ID
-                short_term_id = (
-                    f"conscious_{memory_id}_{int(datetime.now().timestamp())}"
-                )
+        def promote():
+            with db_manager._get_connection() as connection:
+                existing = connection.execute_compiled(
+                    "conscious_context_keys", {"namespace": namespace}
+                ).fetchall()
+                seen_content = {row[0] for row in existing if row[0] is not None}
+                seen_summary = {row[1] for row in existing if row[1] is not None}
+
+                created_at = datetime.now().isoformat()
+                timestamp = int(datetime.now().timestamp())
+                promoted = []
+                for (
+                    memory_id,
+                    processed_data,
+                    summary,
+                    searchable_content,
+                    importance_score,
+                    _,
+                ) in memory_rows:
+                    if searchable_content in seen_content or summary in seen_summary:
+                        logger.debug(
+                            f"ConsciouscAgent: Skipping duplicate memory {memory_id} - similar content already exists in short-term memory"
+                        )
+                        continue
+                    if searchable_content is not None:
+                        seen_content.add(searchable_content)
+                    if summary is not None:
+                        seen_summary.add(summary)
+                    if isinstance(processed_data, dict):
+                        processed_data = json.dumps(processed_data)
+                    promoted.append(
+                        {
+                            "memory_id": f"conscious_{memory_id}_{timestamp}",
+                            "processed_data": processed_data,
+                            "importance_score": importance_score,
+                            "category_primary": "conscious_context",
+                            "retention_type": "permanent",
+                            "namespace": namespace,
+                            "created_at": created_at,
+                            "expires_at": None,  # No expiration (permanent)
+                            "searchable_content": searchable_content,
+                            "summary": summary,
+                            "is_permanent_context": True,
+                        }
+                    )
 
-                # Insert directly into short-term memory with conscious_context category
-                connection.execute(
-                    text(
-                        """INSERT INTO short_term_memory (
-                        memory_id, processed_data, importance_score, category_primary,
-                        retention_type, namespace, created_at, expires_at,
-                        searchable_content, summary, is_permanent_context
-                    ) VALUES (:memory_id, :processed_data, :importance_score, :category_primary,
-                        :retention_type, :namespace, :created_at, :expires_at,
-                        :searchable_content, :summary, :is_permanent_context)"""
-                    ),
-                    {
-                        "memory_id": short_term_id,
-                        "processed_data": (
-                            json.dumps(processed_data)
-                            if isinstance(processed_data, dict)
-                            else processed_data
-                        ),
-                        "importance_score": importance_score,
-                        "category_primary": "conscious_context",  # Use conscious_context category
-                        "retention_type": "permanent",
-                        "namespace": namespace,
-                        "created_at": datetime.now().isoformat(),
-                        "expires_at": None,  # No expiration (permanent)
-                        "searchable_content": searchable_content,  # Copy exact searchable_content
-                        "summary": summary,  # Copy exact summary
-                        "is_permanent_context": True,  # is_permanent_context = True
-                    },
-                )
+                if promoted:
+                    connection.execute_compiled("insert_conscious_short_term", promoted)
+                if mark_processed:
+                    memory_ids = [row[0] for row in memory_rows]
+                    for start in range(0, len(memory_ids), PROCESSED_UPDATE_CHUNK):
+                        connection.execute_compiled(
+                            "mark_conscious_processed",
+                            {
+                                "memory_ids": memory_ids[
+                                    start : start + PROCESSED_UPDATE_CHUNK
+                                ],
+                                "namespace": namespace,
+                                "conscious_processed": True,
+                            },
+                        )
                 connection.commit()
+                return promoted
 
-            logger.debug(
-                f"ConsciouscAgent: Copied memory {memory_id} to short-term as {short_term_id}"
-            )
-            return True
-
-        except Exception as e:
-            logger.error(
-                f"ConsciouscAgent: Failed to copy memory {memory_row[0]} to short-term: {e}"
-            )
-            return False
-
-    async def _mark_memories_processed(
-        self, db_manager, memory_ids: List[str], namespace: str
-    ):
-        """Mark memories as processed for conscious context"""
-        try:
-            from sqlalchemy import text
+        promoted = db_manager.run_write(promote)
 
-            with db_manager._get_connection() as connection:
-                for memory_id in memory_ids:
-                    connection.execute(
-                        text(
-                            """UPDATE long_term_memory
-                           SET conscious_processed = :conscious_processed
-                           WHERE memory_id = :memory_id AND namespace = :namespace"""
-                        ),
+        if promoted:
+            if self.context_snapshots is not None:
+                for params in promoted:
+                    self.context_snapshots.add(
+                        namespace,
                         {
-                            "memory_id": memory_id,
-                            "namespace": namespace,
-                            "conscious_processed": True,
+                            "memory_id": params["memory_id"],
+                            "processed_data": params["processed_data"],
+                            "importance_score": params["importance_score"],
+                            "category_primary": "conscious_context",
+                            "summary": params["summary"],
+                            "searchable_content": params["searchable_content"],
+                            "created_at": params["created_at"],
+                            "expires_at": None,
+                            "access_count": 0,
+                            "memory_type": "short_term",
                         },
                     )
-                connection.commit()
-
-        except Exception as e:
-            logger.error(f"ConsciouscAgent: Failed to mark memories processed: {e}")
+            db_manager.notify_write(namespace, "conscious_context")
+            logger.debug(
+                f"ConsciouscAgent: Copied {len(promoted)} memories to short-term memory"
+            )
+        return len(promoted)
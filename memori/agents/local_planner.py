@@ -0,0 +1,292 @@
+"""
+Local (LLM-free) search planner
+
+Turns a user query into a ``MemorySearchQuery`` with keyword extraction, a
+small category lexicon and time-expression parsing. It answers in
+microseconds instead of an LLM round trip and reports a confidence score so
+``MemorySearchEngine`` can escalate ambiguous queries to the LLM planner.
+"""
+
+import re
+from typing import List, Tuple
+
+from ..utils.helpers import StringUtils
+from ..utils.pydantic_models import MemoryCategoryType, MemorySearchQuery
+
+# Words and phrases that point a query at a memory category. Generic verbs
+# ("know", "like", "must") are left out: "what do I know about postgres" asks
+# about postgres, not about skills
+CATEGORY_LEXICON = {
+    MemoryCategoryType.preference: (
+        "prefer",
+        "preference",
+        "preferences",
+        "favorite",
+        "favourite",
+        "likes",
+        "love",
+        "enjoy",
+        "dislike",
+        "hate",
+        "opinion",
+        "taste",
+        "setting",
+    ),
+    MemoryCategoryType.skill: (
+        "skill",
+        "skills",
+        "learn",
+        "learned",
+        "learning",
+        "experience",
+        "expert",
+        "expertise",
+        "proficient",
+        "good at",
+        "studied",
+    ),
+    MemoryCategoryType.context: (
+        "project",
+        "projects",
+        "working on",
+        "work on",
+        "current",
+        "currently",
+        "team",
+        "job",
+        "company",
+        "environment",
+        "situation",
+    ),
+    MemoryCategoryType.rule: (
+        "rule",
+        "rules",
+        "policy",
+        "policies",
+        "guideline",
+        "guidelines",
+        "always",
+        "never",
+        "constraint",
+        "procedure",
+    ),
+    MemoryCategoryType.fact: (
+        "what is",
+        "who is",
+        "define",
+        "definition",
+        "fact",
+        "facts",
+        "detail",
+        "details",
+        "name",
+        "number",
+    ),
+}
+
+IMPORTANCE_WORDS = ("important", "critical", "crucial", "essential", "key", "urgent")
+
+_TIME_PATTERN = re.compile(
+    r"\b(?:(?P<day>today|yesterday)"
+    r"|(?P<recent>recent|recently|lately)"
+    r"|(?:last|past|this|previous)\s+(?:(?P<count>\d+)\s+)?"
+    r"(?P<unit>hours?|days?|weeks?|months?|years?))\b"
+)
+
+# Leftover question words that say nothing about the memory being looked for
+_QUERY_STOPWORDS = {
+    "what",
+    "when",
+    "where",
+    "which",
+    "who",
+    "whom",
+    "why",
+    "how",
+    "tell",
+    "remember",
+    "recall",
+    "know",
+    "like",
+    "about",
+    "my",
+    "me",
+    "our",
+    "your",
+    "any",
+    "some",
+    "there",
+    "again",
+    "something",
+    "anything",
+    "thing",
+    "things",
+    "stuff",
+}
+
+
+class LocalSearchPlanner:
+    """Heuristic planner producing ``MemorySearchQuery`` plans without an LLM"""
+
+    def __init__(self, max_keywords: int = 8):
+        self.max_keywords = max_keywords
+
+    def plan(self, query: str) -> Tuple[MemorySearchQuery, float]:
+        """
+        Plan a search for ``query``
+
+        Returns:
+            (search plan, confidence between 0 and 1)
+        """
+        text = query.strip()
+        lowered = text.lower()
+
+        categories = self._match_categories(lowered)
+        time_range = self._match_time_range(lowered)
+        wants_important = any(
+            re.search(rf"\b{word}\b", lowered) for word in IMPORTANCE_WORDS
+        )
+        entities, named = self._extract_entities(text, lowered, categories, time_range)
+
+        strategies = []
+        if entities:
+            strategies.append("keyword_search")
+        if categories:
+            strategies.append("category_filter")
+        if wants_important:
+            strategies.append("importance_filter")
+        if time_range:
+            strategies.append("temporal_filter")
+        if not strategies:
+            strategies.append("general_search")
+
+        plan = MemorySearchQuery(
+            query_text=text,
+            intent=self._describe_intent(entities, categories, time_range),
+            entity_filters=entities,
+            category_filters=categories,
+            time_range=time_range,
+            min_importance=0.7 if wants_important else 0.0,
+            search_strategy=strategies,
+            expected_result_types=[c.value for c in categories] or ["any"],
+        )
+        confidence = self._confidence(
+            text, entities, named, categories, time_range, wants_important
+        )
+        return plan, confidence
+
+    @staticmethod
+    def _match_categories(lowered: str) -> List[MemoryCategoryType]:
+        return [
+            category
+            for category, words in CATEGORY_LEXICON.items()
+            if any(re.search(rf"\b{re.escape(word)}\b", lowered) for word in words)
+        ]
+
+    @staticmethod
+    def _match_time_range(lowered: str):
+        match = _TIME_PATTERN.search(lowered)
+        if not match:
+            return None
+        if match.group("day"):
+            return match.group("day")
+        if match.group("recent"):
+            return "recent"
+        unit = match.group("unit").rstrip("s")
+        count = match.group("count")
+        return f"last_{count}_{unit}s" if count else f"last_{unit}"
+
+    def _extract_entities(
+        self, text, lowered, categories, time_range
+    ) -> Tuple[List[str], bool]:
+        """Return search terms and whether any of them is a named entity"""
+        # Quoted phrases and identifiers (Next.js, gpt-4o, C++) are kept intact
+        phrases = re.findall(r'"([^"]+)"|\'([^\']+)\'', text)
+        entities = [a or b for a, b in phrases]
+        entities.extend(
+            token
+            for token in re.findall(r"\b\w+(?:[.\-+#]\w*)+", text)
+            if any(ch.isalpha() for ch in token)
+        )
+        # Capitalized words after the first position are likely names
+        words = text.split()
+        entities.extend(
+            word.strip(".,!?;:")
+            for word in words[1:]
+            if word[:1].isupper() and len(word.strip(".,!?;:")) > 1
+        )
+
+        lexicon_words = {
+            word
+            for category in categories
+            for word in CATEGORY_LEXICON[category]
+            if " " not in word
+        }
+        time_match = _TIME_PATTERN.search(lowered) if time_range else None
+        time_words = set(time_match.group(0).split()) if time_match else set()
+        keywords = [
+            keyword
+            for keyword in StringUtils.extract_keywords(lowered, self.max_keywords * 2)
+            if keyword not in _QUERY_STOPWORDS
+            and keyword not in lexicon_words
+            and keyword not in time_words
+            and keyword not in IMPORTANCE_WORDS
+        ]
+
+        seen = set()
+        result = []
+        for entity in entities:
+            key = entity.lower()
+            if key and key not in seen and key not in _QUERY_STOPWORDS:
+                seen.add(key)
+                result.append(entity)
+        named = bool(result)
+        for keyword in keywords:
+            # Skip fragments of identifiers already captured ("next" of Next.js)
+            if keyword not in seen and not any(keyword in key for key in seen):
+                seen.add(keyword)
+                result.append(keyword)
+        return result[: self.max_keywords], named
+
+    @staticmethod
+    def _describe_intent(entities, categories, time_range) -> str:
+        parts = []
+        if entities:
+            parts.append(f"memories about {', '.join(entities[:3])}")
+        if categories:
+            parts.append(f"{'/'.join(c.value for c in categories)} memories")
+        if time_range:
+            parts.append(f"from {time_range.replace('_', ' ')}")
+        return "Find " + (" ".join(parts) if parts else "relevant memories")
+
+    @staticmethod
+    def _confidence(
+        text, entities, named, categories, time_range, wants_important
+    ) -> float:
+        """
+        How likely the heuristic plan is as good as an LLM plan
+
+        Named entities and category hits score high; long, open-ended or
+        keyword-free questions score low and are escalated.
+        """
+        if not entities and not categories:
+            return 0.1
+        confidence = 0.35
+        if named:
+            confidence += 0.35
+        elif entities:
+            confidence += 0.2
+        if categories:
+            confidence += 0.15
+        if time_range:
+            confidence += 0.05
+        if wants_important:
+            confidence += 0.1
+        word_count = len(text.split())
+        if word_count > 20:
+            confidence -= 0.3
+        elif word_count > 12:
+            confidence -= 0.15
+        if len(categories) > 2:
+            confidence -= 0.1  # Lexicon hits everywhere, intent unclear
+        return max(0.0, min(1.0, confidence))
@@ -20,7 +20,9 @@ from ..utils.pydantic_models import (
     MemoryClassification,
     MemoryImportanceLevel,
     ProcessedLongTermMemory,
+    ProcessedLongTermMemoryBatch,
 )
+from ..utils.tracing import get_tracer
 
 
 class MemoryAgent:
@@ -168,16 +170,7 @@ Focus on extracting information that would genuinely help provide better context
                 system_prompt += dedup_context
 
             # Prepare context information
-            context_info = ""
-            if context:
-                context_info = f"""
-CONVERSATION CONTEXT:
-- Session: {context.session_id}
-- Model: {context.model_used}
-- User Projects: {', '.join(context.current_projects) if context.current_projects else 'None specified'}
-- Relevant Skills: {', '.join(context.relevant_skills) if context.relevant_skills else 'None specified'}
-- Topic Thread: {context.topic_thread or 'General conversation'}
-"""
+            context_info = self._build_context_info(context)
 
             # Try structured outputs first, fall back to manual parsing
             processed_memory = None
@@ -185,18 +178,19 @@ CONVERSATION CONTEXT:
             if self._supports_structured_outputs:
                 try:
                     # Call OpenAI Structured Outputs (async)
-                    completion = await self.async_client.beta.chat.completions.parse(
-                        model=self.model,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {
-                                "role": "user",
-                                "content": f"Process this conversation for enhanced memory storage:\n\n{conversation_text}\n{context_info}",
-                            },
-                        ],
-                        response_format=ProcessedLongTermMemory,
-                        temperature=0.1,  # Low temperature for consistent processing
-                    )
+                    with get_tracer().span("llm.memory_agent", model=self.model):
+                        completion = await self.async_client.beta.chat.completions.parse(
+                            model=self.model,
+                            messages=[
+                                {"role": "system", "content": system_prompt},
+                                {
+                                    "role": "user",
+                                    "content": f"Process this conversation for enhanced memory storage:\n\n{conversation_text}\n{context_info}",
+                                },
+                            ],
+                            response_format=ProcessedLongTermMemory,
+                            temperature=0.1,  # Low temperature for consistent processing
+                        )
 
                     # Handle potential refusal
                     if completion.choices[0].message.refusal:
@@ -242,6 +236,139 @@ CONVERSATION CONTEXT:
                 chat_id, f"Processing failed: {str(e)}"
             )
 
+    async def process_conversations_batch_async(
+        self,
+        conversations: List[Dict[str, Any]],
+        existing_memories: Optional[List[str]] = None,
+    ) -> List[ProcessedLongTermMemory]:
+        """
+        Process several conversations with a single structured-output call
+
+        Each conversation dict carries ``chat_id``, ``user_input``, ``ai_output``
+        and optionally ``context``. Items the batched response does not cover,
+        or every item when the batched call fails, are processed individually
+        through process_conversation_async.
+
+        Args:
+            conversations: Conversations to process
+            existing_memories: List of existing memory summaries for deduplication
+
+        Returns:
+            Processed memories in the same order as ``conversations``
+        """
+        if not conversations:
+            return []
+
+        if len(conversations) == 1 or not self._supports_structured_outputs:
+            return await self._process_batch_individually(
+                conversations, existing_memories
+            )
+
+        results: Dict[str, ProcessedLongTermMemory] = {}
+        try:
+            system_prompt = self.SYSTEM_PROMPT
+            if existing_memories:
+                system_prompt += (
+                    "\n\nEXISTING MEMORIES (for deduplication):\n"
+                    + "\n".join(existing_memories[:10])
+                )
+            system_prompt += (
+                "\n\nYou will receive several independent conversations. Return exactly one "
+                "memory per conversation, in the same order, and copy each conversation's "
+                "id into conversation_id."
+            )
+
+            sections = []
+            for item in conversations:
+                sections.append(
+                    f"=== CONVERSATION {item['chat_id']} ===\n"
+                    f"User: {item['user_input']}\nAssistant: {item['ai_output']}\n"
+                    f"{self._build_context_info(item.get('context'))}"
+                )
+
+            with get_tracer().span(
+                "llm.memory_agent", model=self.model, batch_size=len(conversations)
+            ):
+                completion = await self.async_client.beta.chat.completions.parse(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {
+                            "role": "user",
+                            "content": "Process these conversations for enhanced memory storage:\n\n"
+                            + "\n".join(sections),
+                        },
+                    ],
+                    response_format=ProcessedLongTermMemoryBatch,
+                    temperature=0.1,
+                )
+
+            message = completion.choices[0].message
+            if message.refusal:
+                logger.warning(f"Batched memory processing refused: {message.refusal}")
+            elif message.parsed:
+                expected_ids = {item["chat_id"] for item in conversations}
+                for processed_memory in message.parsed.memories:
+                    chat_id = processed_memory.conversation_id
+                    if chat_id in expected_ids and chat_id not in results:
+                        processed_memory.extraction_timestamp = datetime.now()
+                        results[chat_id] = processed_memory
+
+        except Exception as e:
+            logger.warning(
+                f"Batched memory processing failed for {len(conversations)} conversations, "
+                f"falling back to per-conversation processing: {e}"
+            )
+
+        missing = [item for item in conversations if item["chat_id"] not in results]
+        if missing:
+            logger.debug(
+                f"Processing {len(missing)} of {len(conversations)} conversations individually"
+            )
+            fallback = await self._process_batch_individually(
+                missing, existing_memories
+            )
+            for item, processed_memory in zip(missing, fallback):
+                results[item["chat_id"]] = processed_memory
+
+        logger.debug(
+            f"Processed batch of {len(conversations)} conversations "
+            f"({len(conversations) - len(missing)} from the batched call)"
+        )
+        return [results[item["chat_id"]] for item in conversations]
+
+    async def _process_batch_individually(
+        self,
+        conversations: List[Dict[str, Any]],
+        existing_memories: Optional[List[str]] = None,
+    ) -> List[ProcessedLongTermMemory]:
+        """Run the single-conversation path for each item of a batch"""
+        processed = []
+        for item in conversations:
+            processed.append(
+                await self.process_conversation_async(
+                    chat_id=item["chat_id"],
+                    user_input=item["user_input"],
+                    ai_output=item["ai_output"],
+                    context=item.get("context"),
+                    existing_memories=existing_memories,
+                )
+            )
+        return processed
+
+    def _build_context_info(self, context: Optional[ConversationContext]) -> str:
+        """Format conversation context for the processing prompt"""
+        if not context:
+            return ""
+        return f"""
+CONVERSATION CONTEXT:
+- Session: {context.session_id}
+- Model: {context.model_used}
+- User Projects: {', '.join(context.current_projects) if context.current_projects else 'None specified'}
+- Relevant Skills: {', '.join(context.relevant_skills) if context.relevant_skills else 'None specified'}
+- Topic Thread: {context.topic_thread or 'General conversation'}
+"""
+
     def _create_empty_long_term_memory(
         self, chat_id: str, reason: str
     ) -> ProcessedLongTermMemory:
@@ -396,18 +523,19 @@ CONVERSATION CONTEXT:
             json_system_prompt += "\n\nRespond ONLY with the JSON object, no additional text or formatting."
 
             # Call regular chat completions
-            completion = await self.async_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": json_system_prompt},
-                    {
-                        "role": "user",
-                        "content": f"Process this conversation for enhanced memory storage:\n\n{conversation_text}\n{context_info}",
-                    },
-                ],
-                temperature=0.1,  # Low temperature for consistent processing
-                max_tokens=2000,  # Ensure enough tokens for full response
-            )
+            with get_tracer().span("llm.memory_agent", model=self.model):
+                completion = await self.async_client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": json_system_prompt},
+                        {
+                            "role": "user",
+                            "content": f"Process this conversation for enhanced memory storage:\n\n{conversation_text}\n{context_info}",
+                        },
+                    ],
+                    temperature=0.1,  # Low temperature for consistent processing
+                    max_tokens=2000,  # Ensure enough tokens for full response
+                )
 
             # Extract and parse JSON response
             response_text = completion.choices[0].message.content
@@ -3,9 +3,9 @@ Memory Search Engine - Intelligent memory retrieval using Pydantic models
 """
 
 import asyncio
+import functools
 import json
 import threading
-import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
@@ -15,7 +15,14 @@ from loguru import logger
 if TYPE_CHECKING:
     from ..core.providers import ProviderConfig
 
+from ..utils.cache import TTLLRUCache, get_shared_cache, normalize_query_key
+from ..utils.helpers import DateTimeUtils
+from ..utils.logging import debug_enabled
 from ..utils.pydantic_models import MemorySearchQuery
+from ..utils.tracing import get_tracer
+from .local_planner import LocalSearchPlanner
+
+PLANNER_MODES = ("local", "hybrid", "llm")
 
 
 class MemorySearchEngine:
@@ -61,6 +68,12 @@ Be strategic and comprehensive in your search planning."""
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         provider_config: Optional["ProviderConfig"] = None,
+        planner_mode: str = "hybrid",
+        local_confidence_threshold: float = 0.6,
+        plan_cache_size: int = 512,
+        plan_cache_ttl: float = 300.0,
+        share_plan_cache: bool = True,
+        hash_cache_keys: bool = False,
     ):
         """
         Initialize Memory Search Engine with LLM provider configuration
@@ -69,7 +82,21 @@ Be strategic and comprehensive in your search planning."""
             api_key: API key (deprecated, use provider_config)
             model: Model to use for query understanding (defaults to 'gpt-4o' if not specified)
             provider_config: Provider configuration for LLM client
+            planner_mode: 'local' plans every query heuristically, 'llm' always
+                calls the model, 'hybrid' uses the local plan unless its
+                confidence is below local_confidence_threshold
+            local_confidence_threshold: Minimum local plan confidence in hybrid mode
+            plan_cache_size: Maximum number of cached search plans (LRU)
+            plan_cache_ttl: Seconds a cached search plan stays valid
+            share_plan_cache: Share one plan cache with every other search
+                engine in the process (entries are keyed by model and planner
+                mode, so engines never see each other's incompatible plans)
+            hash_cache_keys: Store normalized queries as fixed-size digests
         """
+        if planner_mode not in PLANNER_MODES:
+            raise ValueError(
+                f"planner_mode must be one of {PLANNER_MODES}, got '{planner_mode}'"
+            )
         if provider_config:
             # Use provider configuration to create client
             self.client = provider_config.create_client()
@@ -86,10 +113,22 @@ Be strategic and comprehensive in your search planning."""
         # Determine if we're using a local/custom endpoint that might not support structured outputs
         self._supports_structured_outputs = self._detect_structured_output_support()
 
-        # Performance improvements
-        self._query_cache = {}  # Cache for search plans
-        self._cache_ttl = 300  # 5 minutes cache TTL
-        self._cache_lock = threading.Lock()
+        # Search plan cache keyed on normalized query text
+        if share_plan_cache:
+            self._plan_cache = get_shared_cache(
+                "search_plans", max_size=plan_cache_size, ttl=plan_cache_ttl
+            )
+        else:
+            self._plan_cache = TTLLRUCache(max_size=plan_cache_size, ttl=plan_cache_ttl)
+        self._hash_cache_keys = hash_cache_keys
+
+        # Local planner answers confident queries without an LLM round trip
+        self.planner_mode = planner_mode
+        self.local_confidence_threshold = local_confidence_threshold
+        self._local_planner = LocalSearchPlanner()
+        self._planner_stats = {"local": 0, "llm": 0, "cached": 0}
+        # Counters are bumped from search threads; guarded by the plan cache lock
+        self._stats_lock = self._plan_cache._lock
 
         # Background processing
         self._background_executor = None
@@ -108,16 +147,27 @@ Be strategic and comprehensive in your search planning."""
             Structured search query plan
         """
         try:
-            # Create cache key
-            cache_key = f"{query}|{context or ''}"
-
             # Check cache first
-            with self._cache_lock:
-                if cache_key in self._query_cache:
-                    cached_result, timestamp = self._query_cache[cache_key]
-                    if time.time() - timestamp < self._cache_ttl:
-                        logger.debug(f"Using cached search plan for: {query}")
-                        return cached_result
+            cache_key = self._plan_cache_key(query, context)
+            cached_result = self._plan_cache.get(cache_key)
+            if cached_result is not None:
+                logger.debug(f"Using cached search plan for: {query}")
+                self._count_plan("cached")
+                return cached_result
+
+            if self.planner_mode != "llm":
+                local_plan, confidence = self._local_planner.plan(query)
+                if (
+                    self.planner_mode == "local"
+                    or confidence >= self.local_confidence_threshold
+                ):
+                    logger.debug(
+                        f"Planned search locally for query '{query}' "
+                        f"(confidence {confidence:.2f}): strategies={local_plan.search_strategy}"
+                    )
+                    self._count_plan("local")
+                    self._plan_cache.set(cache_key, local_plan)
+                    return local_plan
 
             # Prepare the prompt
             prompt = f"User query: {query}"
@@ -130,18 +180,19 @@ Be strategic and comprehensive in your search planning."""
             if self._supports_structured_outputs:
                 try:
                     # Call OpenAI Structured Outputs
-                    completion = self.client.beta.chat.completions.parse(
-                        model=self.model,
-                        messages=[
-                            {"role": "system", "content": self.SYSTEM_PROMPT},
-                            {
-                                "role": "user",
-                                "content": prompt,
-                            },
-                        ],
-                        response_format=MemorySearchQuery,
-                        temperature=0.1,
-                    )
+                    with get_tracer().span("llm.search_planner", model=self.model):
+                        completion = self.client.beta.chat.completions.parse(
+                            model=self.model,
+                            messages=[
+                                {"role": "system", "content": self.SYSTEM_PROMPT},
+                                {
+                                    "role": "user",
+                                    "content": prompt,
+                                },
+                            ],
+                            response_format=MemorySearchQuery,
+                            temperature=0.1,
+                        )
 
                     # Handle potential refusal
                     if completion.choices[0].message.refusal:
@@ -164,12 +215,10 @@ Be strategic and comprehensive in your search planning."""
             # Fallback to manual parsing if structured outputs failed or not supported
             if search_query is None:
                 search_query = self._plan_search_with_fallback_parsing(query)
+            self._count_plan("llm")
 
             # Cache the result
-            with self._cache_lock:
-                self._query_cache[cache_key] = (search_query, time.time())
-                # Clean old cache entries
-                self._cleanup_cache()
+            self._plan_cache.set(cache_key, search_query)
 
             logger.debug(
                 f"Planned search for query '{query}': intent='{search_query.intent}', strategies={search_query.search_strategy}"
@@ -195,104 +244,35 @@ Be strategic and comprehensive in your search planning."""
         Returns:
             List of relevant memory items with search metadata
         """
+        debug = debug_enabled()
         try:
             # Plan the search
             search_plan = self.plan_search(query)
-            logger.debug(
-                f"Search plan for '{query}': strategies={search_plan.search_strategy}, entities={search_plan.entity_filters}"
-            )
-
-            all_results = []
-            seen_memory_ids = set()
-
-            # Execute keyword search (primary strategy)
-            if (
-                search_plan.entity_filters
-                or "keyword_search" in search_plan.search_strategy
-            ):
+            if debug:
                 logger.debug(
-                    f"Executing keyword search for: {search_plan.entity_filters}"
-                )
-                keyword_results = self._execute_keyword_search(
-                    search_plan, db_manager, namespace, limit
+                    f"Search plan for '{query}': strategies={search_plan.search_strategy}, entities={search_plan.entity_filters}"
                 )
-                logger.debug(f"Keyword search returned {len(keyword_results)} results")
-
-                for result in keyword_results:
-                    if (
-                        isinstance(result, dict)
-                        and result.get("memory_id") not in seen_memory_ids
-                    ):
-                        seen_memory_ids.add(result["memory_id"])
-                        result["search_strategy"] = "keyword_search"
-                        result["search_reasoning"] = (
-                            f"Keyword match for: {', '.join(search_plan.entity_filters)}"
-                        )
-                        all_results.append(result)
-
-            # Execute category-based search
-            if (
-                search_plan.category_filters
-                or "category_filter" in search_plan.search_strategy
-            ):
-                logger.debug(
-                    f"Executing category search for: {[c.value for c in search_plan.category_filters]}"
-                )
-                category_results = self._execute_category_search(
-                    search_plan, db_manager, namespace, limit - len(all_results)
-                )
-                logger.debug(
-                    f"Category search returned {len(category_results)} results"
-                )
-
-                for result in category_results:
-                    if (
-                        isinstance(result, dict)
-                        and result.get("memory_id") not in seen_memory_ids
-                    ):
-                        seen_memory_ids.add(result["memory_id"])
-                        result["search_strategy"] = "category_filter"
-                        result["search_reasoning"] = (
-                            f"Category match: {', '.join([c.value for c in search_plan.category_filters])}"
-                        )
-                        all_results.append(result)
 
-            # Execute importance-based search
-            if (
-                search_plan.min_importance > 0.0
-                or "importance_filter" in search_plan.search_strategy
-            ):
-                logger.debug(
-                    f"Executing importance search with min_importance: {search_plan.min_importance}"
-                )
-                importance_results = self._execute_importance_search(
-                    search_plan, db_manager, namespace, limit - len(all_results)
-                )
-                logger.debug(
-                    f"Importance search returned {len(importance_results)} results"
-                )
-
-                for result in importance_results:
-                    if (
-                        isinstance(result, dict)
-                        and result.get("memory_id") not in seen_memory_ids
-                    ):
-                        seen_memory_ids.add(result["memory_id"])
-                        result["search_strategy"] = "importance_filter"
-                        result["search_reasoning"] = (
-                            f"High importance (≥{search_plan.min_importance})"
-                        )
-                        all_results.append(result)
+            # Keyword, category and importance strategies in one query
+            all_results = self._execute_planned_search(
+                search_plan, db_manager, namespace, limit
+            )
+            if debug:
+                logger.debug(f"Planned search returned {len(all_results)} results")
 
             # If no specific strategies worked, do a general search
             if not all_results:
-                logger.debug(
-                    "No results from specific strategies, executing general search"
-                )
+                if debug:
+                    logger.debug(
+                        "No results from specific strategies, executing general search"
+                    )
                 general_results = db_manager.search_memories(
                     query=search_plan.query_text, namespace=namespace, limit=limit
                 )
-                logger.debug(f"General search returned {len(general_results)} results")
+                if debug:
+                    logger.debug(
+                        f"General search returned {len(general_results)} results"
+                    )
 
                 for result in general_results:
                     if isinstance(result, dict):
@@ -351,157 +331,76 @@ Be strategic and comprehensive in your search planning."""
                         "search_timestamp": datetime.now().isoformat(),
                     }
 
-            logger.debug(
-                f"Search executed for '{query}': {len(all_results)} results found"
-            )
+            if debug:
+                logger.debug(
+                    f"Search executed for '{query}': {len(all_results)} results found"
+                )
             return all_results[:limit]
 
         except Exception as e:
             logger.error(f"Search execution failed: {e}")
             return []
 
-    def _execute_keyword_search(
-        self, search_plan: MemorySearchQuery, db_manager, namespace: str, limit: int
-    ) -> List[Dict[str, Any]]:
-        """Execute keyword-based search"""
-        keywords = search_plan.entity_filters
-        if not keywords:
-            # Extract keywords from query text
-            keywords = [
+    def _compile_search_plan(self, search_plan: MemorySearchQuery) -> Dict[str, Any]:
+        """Translate a search plan into db_manager.search_structured arguments"""
+        keywords = []
+        if (
+            search_plan.entity_filters
+            or "keyword_search" in search_plan.search_strategy
+        ):
+            keywords = search_plan.entity_filters or [
                 word.strip()
                 for word in search_plan.query_text.split()
                 if len(word.strip()) > 2
             ]
 
-        search_terms = " ".join(keywords)
-        try:
-            results = db_manager.search_memories(
-                query=search_terms, namespace=namespace, limit=limit
-            )
-            # Ensure results is a list of dictionaries
-            if not isinstance(results, list):
-                logger.warning(f"Search returned non-list result: {type(results)}")
-                return []
-
-            # Filter out any non-dictionary items
-            valid_results = []
-            for result in results:
-                if isinstance(result, dict):
-                    valid_results.append(result)
-                else:
-                    logger.warning(f"Search returned non-dict item: {type(result)}")
-
-            return valid_results
-        except Exception as e:
-            logger.error(f"Keyword search failed: {e}")
-            return []
-
-    def _execute_category_search(
+        importance_threshold = None
+        if (
+            search_plan.min_importance > 0.0
+            or "importance_filter" in search_plan.search_strategy
+        ):
+            # Default to high importance
+            importance_threshold = max(search_plan.min_importance, 0.7)
+
+        return {
+            "keywords": keywords,
+            "categories": [category.value for category in search_plan.category_filters],
+            "importance_threshold": importance_threshold,
+            "since": DateTimeUtils.parse_time_range(search_plan.time_range),
+        }
+
+    def _execute_planned_search(
         self, search_plan: MemorySearchQuery, db_manager, namespace: str, limit: int
     ) -> List[Dict[str, Any]]:
-        """Execute category-based search"""
-        categories = (
-            [cat.value for cat in search_plan.category_filters]
-            if search_plan.category_filters
-            else []
-        )
-
-        if not categories:
+        """Run every planned strategy as a single database query"""
+        compiled = self._compile_search_plan(search_plan)
+        if not (
+            compiled["keywords"]
+            or compiled["categories"]
+            or compiled["importance_threshold"] is not None
+        ):
+            if compiled["since"] is not None and debug_enabled():
+                logger.debug(
+                    "Search plan has only a time range, leaving it to the general search"
+                )
             return []
 
-        # This would need to be implemented in the database manager
-        # For now, get all memories and filter by category
-        logger.debug(
-            f"Searching memories by categories: {categories} in namespace: {namespace}"
-        )
-        all_results = db_manager.search_memories(
-            query="", namespace=namespace, limit=limit * 3
-        )
-
-        logger.debug(
-            f"Retrieved {len(all_results)} total results for category filtering"
-        )
-
-        filtered_results = []
-        for i, result in enumerate(all_results):
-            logger.debug(f"Processing result {i+1}/{len(all_results)}: {type(result)}")
-
-            # Extract category from processed_data if it's stored as JSON
-            try:
-                memory_category = None
-
-                # Check processed_data field first
-                if "processed_data" in result and result["processed_data"]:
-                    processed_data = result["processed_data"]
-                    logger.debug(
-                        f"Found processed_data: {type(processed_data)} - {str(processed_data)[:100]}..."
-                    )
-
-                    # Handle both dict and JSON string formats
-                    if isinstance(processed_data, str):
-                        try:
-                            processed_data = json.loads(processed_data)
-                        except json.JSONDecodeError as je:
-                            logger.debug(f"JSON decode error for processed_data: {je}")
-                            continue
-
-                    if isinstance(processed_data, dict):
-                        # Try multiple possible category locations
-                        category_paths = [
-                            ["category", "primary_category"],
-                            ["category"],
-                            ["primary_category"],
-                            ["metadata", "category"],
-                            ["classification", "category"],
-                        ]
-
-                        for path in category_paths:
-                            temp_data = processed_data
-                            try:
-                                for key in path:
-                                    temp_data = temp_data.get(key, {})
-                                if isinstance(temp_data, str) and temp_data:
-                                    memory_category = temp_data
-                                    logger.debug(
-                                        f"Found category via path {path}: {memory_category}"
-                                    )
-                                    break
-                            except (AttributeError, TypeError):
-                                continue
-                    else:
-                        logger.debug(
-                            f"processed_data is not a dict after parsing: {type(processed_data)}"
-                        )
-                        continue
-
-                # Fallback: check direct category field
-                if not memory_category and "category" in result and result["category"]:
-                    memory_category = result["category"]
-                    logger.debug(f"Found category via direct field: {memory_category}")
-
-                # Check if the found category matches any of our target categories
-                if memory_category:
-                    logger.debug(
-                        f"Comparing memory category '{memory_category}' against target categories {categories}"
-                    )
-                    if memory_category in categories:
-                        filtered_results.append(result)
-                        logger.debug(f"✓ Category match found: {memory_category}")
-                    else:
-                        logger.debug(
-                            f"✗ Category mismatch: {memory_category} not in {categories}"
-                        )
-                else:
-                    logger.debug("No category found in result")
-
-            except Exception as e:
-                logger.debug(f"Error processing result {i+1}: {e}")
-                continue
+        try:
+            results = db_manager.search_structured(
+                namespace=namespace, limit=limit, **compiled
+            )
+        except Exception as e:
+            logger.error(f"Planned search failed: {e}")
+            return []
 
-        logger.debug(
-            f"Category filtering complete: {len(filtered_results)} results match categories {categories}"
-        )
-        return filtered_results[:limit]
+        reasoning = {
+            "keyword_search": f"Keyword match for: {', '.join(compiled['keywords'])}",
+            "category_filter": f"Category match: {', '.join(compiled['categories'])}",
+            "importance_filter": f"High importance (≥{compiled['importance_threshold']})",
+        }
+        for result in results:
+            result["search_reasoning"] = reasoning[result["search_strategy"]]
+        return results
 
     def _detect_structured_output_support(self) -> bool:
         """
@@ -611,18 +510,19 @@ Be strategic and comprehensive in your search planning."""
             json_system_prompt += "\n\nRespond ONLY with the JSON object, no additional text or formatting."
 
             # Call regular chat completions
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": json_system_prompt},
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    },
-                ],
-                temperature=0.1,
-                max_tokens=1000,  # Ensure enough tokens for full response
-            )
+            with get_tracer().span("llm.search_planner", model=self.model):
+                completion = self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": json_system_prompt},
+                        {
+                            "role": "user",
+                            "content": prompt,
+                        },
+                    ],
+                    temperature=0.1,
+                    max_tokens=1000,  # Ensure enough tokens for full response
+                )
 
             # Extract and parse JSON response
             response_text = completion.choices[0].message.content
@@ -743,16 +643,35 @@ Be strategic and comprehensive in your search planning."""
             expected_result_types=["any"],
         )
 
-    def _cleanup_cache(self):
-        """Clean up expired cache entries"""
-        current_time = time.time()
-        expired_keys = [
-            key
-            for key, (_, timestamp) in self._query_cache.items()
-            if current_time - timestamp >= self._cache_ttl
-        ]
-        for key in expired_keys:
-            del self._query_cache[key]
+    def _plan_cache_key(self, query: str, context: Optional[str]) -> tuple:
+        """Cache key for a plan; plans depend on the model and planner mode too"""
+        return (
+            self.model,
+            self.planner_mode,
+            normalize_query_key(query, hashed=self._hash_cache_keys),
+            normalize_query_key(context or "", hashed=self._hash_cache_keys),
+        )
+
+    def clear_plan_cache(self):
+        """Drop all cached search plans (shared with other engines when sharing)"""
+        self._plan_cache.clear()
+
+    def _count_plan(self, source: str):
+        with self._stats_lock:
+            self._planner_stats[source] += 1
+
+    def get_planner_stats(self) -> Dict[str, Any]:
+        """How many plans came from the local planner, the LLM and the cache"""
+        with self._stats_lock:
+            counts = dict(self._planner_stats)
+        planned = counts["local"] + counts["llm"]
+        return {
+            "mode": self.planner_mode,
+            "confidence_threshold": self.local_confidence_threshold,
+            **counts,
+            "local_ratio": (counts["local"] / planned if planned else 0.0),
+            "plan_cache": self._plan_cache.get_stats(),
+        }
 
     async def execute_search_async(
         self, query: str, db_manager, namespace: str = "default", limit: int = 10
@@ -767,67 +686,32 @@ Be strategic and comprehensive in your search planning."""
                 self._background_executor, self.plan_search, query
             )
 
-            # Execute searches concurrently
-            search_tasks = []
-
-            # Keyword search task
-            if (
-                search_plan.entity_filters
-                or "keyword_search" in search_plan.search_strategy
-            ):
-                search_tasks.append(
-                    loop.run_in_executor(
-                        self._background_executor,
-                        self._execute_keyword_search,
-                        search_plan,
-                        db_manager,
-                        namespace,
-                        limit,
-                    )
-                )
-
-            # Category search task
-            if (
-                search_plan.category_filters
-                or "category_filter" in search_plan.search_strategy
-            ):
-                search_tasks.append(
-                    loop.run_in_executor(
-                        self._background_executor,
-                        self._execute_category_search,
-                        search_plan,
-                        db_manager,
-                        namespace,
-                        limit,
-                    )
-                )
-
-            # Execute all searches concurrently
-            if search_tasks:
-                results_lists = await asyncio.gather(
-                    *search_tasks, return_exceptions=True
-                )
-
-                all_results = []
-                seen_memory_ids = set()
-
-                for i, results in enumerate(results_lists):
-                    if isinstance(results, Exception):
-                        logger.warning(f"Search task {i} failed: {results}")
-                        continue
-
-                    for result in results:
-                        if (
-                            isinstance(result, dict)
-                            and result.get("memory_id") not in seen_memory_ids
-                        ):
-                            seen_memory_ids.add(result["memory_id"])
-                            all_results.append(result)
-
-                return all_results[:limit]
-
-            # Fallback to sync execution
-            return self.execute_search(query, db_manager, namespace, limit)
+            # All planned strategies run as one query off the event loop
+            results = await loop.run_in_executor(
+                self._background_executor,
+                self._execute_planned_search,
+                search_plan,
+                db_manager,
+                namespace,
+                limit,
+            )
+            if results:
+                return results[:limit]
+
+            # Nothing matched the planned strategies: general content search
+            general_results = await loop.run_in_executor(
+                self._background_executor,
+                functools.partial(
+                    db_manager.search_memories,
+                    query=search_plan.query_text,
+                    namespace=namespace,
+                    limit=limit,
+                ),
+            )
+            for result in general_results:
+                result["search_strategy"] = "general_search"
+                result["search_reasoning"] = "General content search"
+            return general_results
 
         except Exception as e:
             logger.error(f"Async search execution failed: {e}")
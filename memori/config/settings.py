@@ -47,6 +47,15 @@ class DatabaseSettings(BaseModel):
     )
     template: str = Field(default="basic", description="Database template to use")
     pool_size: int = Field(default=10, ge=1, le=100, description="Connection pool size")
+    max_overflow: int = Field(
+        default=10, ge=0, description="Connections allowed beyond pool_size"
+    )
+    pool_timeout: float = Field(
+        default=30.0, gt=0, description="Seconds to wait for a pooled connection"
+    )
+    pool_recycle: int = Field(
+        default=3600, ge=-1, description="Seconds before a connection is recycled"
+    )
     echo_sql: bool = Field(default=False, description="Echo SQL statements to logs")
     migration_auto: bool = Field(
         default=True, description="Automatically run migrations"
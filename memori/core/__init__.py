@@ -1,6 +1,27 @@
 """Core memory functionality for Memoriai v1.0"""
 
-from .database import DatabaseManager
-from .memory import Memori
+import importlib
+from typing import Any
+
+# Loaded on first access (PEP 562) so importing one core submodule does not
+# pull in the others
+_LAZY_ATTRIBUTES = {
+    "DatabaseManager": ".database",
+    "Memori": ".memory",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = ["Memori", "DatabaseManager"]
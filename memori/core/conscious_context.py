@@ -0,0 +1,183 @@
+"""
+In-memory conscious-context snapshots
+
+Conscious mode injects the whole short-term "working memory" of a namespace
+into every request. Instead of re-selecting every short-term row and
+re-rendering the prompt per request, ``ConsciousContextSnapshots`` keeps a
+versioned snapshot per namespace together with the rendered prompt block.
+Rows copied in by the conscious agent are merged into the snapshot directly;
+any other short-term write invalidates it so the next request reloads.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _created_at(memory: Dict[str, Any]) -> datetime:
+    # Rows loaded from the database and rows merged in by the conscious agent
+    # carry datetimes or ISO strings in different formats ("T" or " "
+    # separator, with or without microseconds or an offset), so compare
+    # parsed naive local times; missing values sort last, as NULLs do
+    created = _parse_timestamp(memory.get("created_at"))
+    if created is None:
+        return datetime.min
+    if created.tzinfo is not None:
+        created = created.astimezone().replace(tzinfo=None)
+    return created
+
+
+def _ranks_before(memory: Dict[str, Any], other: Dict[str, Any]) -> bool:
+    """Ordering of the short-term query: importance DESC, created_at DESC"""
+    importance = memory.get("importance_score") or 0.0
+    other_importance = other.get("importance_score") or 0.0
+    if importance != other_importance:
+        return importance > other_importance
+    return _created_at(memory) > _created_at(other)
+
+
+class ConsciousContextSnapshot:
+    """Immutable-by-convention view of one namespace's conscious context"""
+
+    __slots__ = ("version", "memories", "next_expiry", "loaded_at", "rendered")
+
+    def __init__(self, memories: Tuple[Dict[str, Any], ...], version: int = 1):
+        self.version = version
+        self.memories = memories
+        self.loaded_at = time.monotonic()
+        self.rendered: Optional[str] = None
+        self.next_expiry = self._earliest_expiry(memories)
+
+    @staticmethod
+    def _earliest_expiry(memories) -> Optional[datetime]:
+        expiries = [
+            expires_at
+            for expires_at in (
+                _parse_timestamp(memory.get("expires_at")) for memory in memories
+            )
+            if expires_at is not None
+        ]
+        return min(expiries) if expiries else None
+
+    def is_stale(self, max_age: float) -> bool:
+        if time.monotonic() - self.loaded_at > max_age:
+            return True
+        return self.next_expiry is not None and datetime.now() >= self.next_expiry
+
+
+class ConsciousContextSnapshots:
+    """
+    Per-namespace conscious-context snapshots
+
+    Args:
+        max_age: Seconds before a snapshot is reloaded from the database even
+            without local writes (picks up writes from other processes)
+    """
+
+    def __init__(self, max_age: float = 300.0):
+        self.max_age = max_age
+        self._snapshots: Dict[str, ConsciousContextSnapshot] = {}
+        self._lock = threading.RLock()
+        self.loads = 0
+        self.renders = 0
+        self.hits = 0
+
+    def get(
+        self, namespace: str, loader: Callable[[], List[Dict[str, Any]]]
+    ) -> ConsciousContextSnapshot:
+        """Return the current snapshot, loading it with ``loader`` when needed"""
+        with self._lock:
+            snapshot = self._snapshots.get(namespace)
+            if snapshot is not None and not snapshot.is_stale(self.max_age):
+                self.hits += 1
+                return snapshot
+
+            version = snapshot.version + 1 if snapshot is not None else 1
+            snapshot = ConsciousContextSnapshot(tuple(loader()), version)
+            self._snapshots[namespace] = snapshot
+            self.loads += 1
+            logger.debug(
+                f"Loaded conscious context snapshot v{version} for namespace "
+                f"'{namespace}' ({len(snapshot.memories)} memories)"
+            )
+            return snapshot
+
+    def render(
+        self,
+        namespace: str,
+        loader: Callable[[], List[Dict[str, Any]]],
+        renderer: Callable[[List[Dict[str, Any]]], str],
+    ) -> Tuple[str, int]:
+        """
+        Return the rendered prompt block and memory count for a namespace
+
+        The prompt is rendered once per snapshot version and reused until the
+        snapshot changes.
+        """
+        with self._lock:
+            snapshot = self.get(namespace, loader)
+            if snapshot.rendered is None:
+                snapshot.rendered = (
+                    renderer(list(snapshot.memories)) if snapshot.memories else ""
+                )
+                self.renders += 1
+            return snapshot.rendered, len(snapshot.memories)
+
+    def add(self, namespace: str, memory: Dict[str, Any]):
+        """
+        Merge a newly inserted short-term row into a loaded snapshot
+
+        Namespaces without a loaded snapshot are left alone; they load the
+        row from the database on first use.
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(namespace)
+            if snapshot is None:
+                return
+
+            memories = snapshot.memories
+            position = len(memories)
+            for index, existing in enumerate(memories):
+                if _ranks_before(memory, existing):
+                    position = index
+                    break
+
+            updated = ConsciousContextSnapshot(
+                memories[:position] + (memory,) + memories[position:],
+                snapshot.version + 1,
+            )
+            updated.loaded_at = snapshot.loaded_at
+            self._snapshots[namespace] = updated
+
+    def invalidate(self, namespace: Optional[str] = None):
+        """Drop the snapshot of a namespace (or of all namespaces)"""
+        with self._lock:
+            if namespace is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(namespace, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "namespaces": len(self._snapshots),
+                "versions": {
+                    namespace: snapshot.version
+                    for namespace, snapshot in self._snapshots.items()
+                },
+                "hits": self.hits,
+                "loads": self.loads,
+                "renders": self.renders,
+            }
@@ -13,6 +13,8 @@ from typing import Any, Dict, List
 
 from loguru import logger
 
+from ..utils.tracing import traced
+
 
 @dataclass
 class ConversationMessage:
@@ -158,6 +160,7 @@ class ConversationManager:
         session = self.get_or_create_session(session_id)
         session.add_message("assistant", content, metadata)
 
+    @traced("inject_context_with_history")
     def inject_context_with_history(
         self,
         session_id: str,
@@ -197,11 +200,15 @@ class ConversationManager:
             if mode == "conscious":
                 # Conscious mode: Always inject short-term memory context
                 # (Not just once - this fixes the original bug)
-                context = memori_instance._get_conscious_context()
-                if context:
-                    context_prompt = self._build_conscious_context_prompt(context)
+                # The rendered block is cached per snapshot version
+                context_prompt, context_count = (
+                    memori_instance._get_conscious_context_prompt(
+                        self._build_conscious_context_prompt
+                    )
+                )
+                if context_prompt:
                     logger.debug(
-                        f"Injected conscious context with {len(context)} items for session {session_id}"
+                        f"Injected conscious context with {context_count} items for session {session_id}"
                     )
 
             elif mode == "auto":
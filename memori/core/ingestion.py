@@ -0,0 +1,451 @@
+"""
+Bounded ingestion executor for background memory processing
+
+Replaces the thread-plus-event-loop-per-conversation approach with a fixed pool
+of long-lived worker threads, each owning a persistent asyncio event loop, fed
+from a bounded queue with a configurable back-pressure policy.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+
+def _in_event_loop() -> bool:
+    """Whether the calling thread is running an asyncio event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class _IngestionJob:
+    """A queued unit of ingestion work"""
+
+    __slots__ = ("name", "factory", "submitted_at")
+
+    def __init__(self, name: str, factory: Callable[[], Awaitable[Any]]):
+        self.name = name
+        self.factory = factory
+        self.submitted_at = time.perf_counter()
+
+
+class IngestionExecutor:
+    """
+    Fixed-size worker pool that runs memory ingestion coroutines.
+
+    Each worker thread keeps one event loop for its whole lifetime, so a burst
+    of recorded conversations never creates more than ``max_workers`` threads
+    or loops. Jobs wait in a queue of at most ``max_queue_size`` entries; when
+    the queue is full the ``overflow_policy`` decides what happens:
+
+    - ``block``: wait up to ``block_timeout`` seconds for a free slot, then drop.
+      Submissions from a thread running an event loop never wait; they evict
+      the oldest queued job instead, as ``drop_oldest`` does
+    - ``drop_newest``: reject the job being submitted
+    - ``drop_oldest``: evict the oldest queued job to make room
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_queue_size: int = 1000,
+        overflow_policy: str = "block",
+        block_timeout: float = 5.0,
+        name: str = "memori-ingest",
+        latency_window: int = 1000,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unsupported overflow policy '{overflow_policy}', "
+                f"expected one of {OVERFLOW_POLICIES}"
+            )
+
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.name = name
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._workers = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+        self._abandon = False
+
+        # Metrics
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._dropped = 0
+        self._in_flight = 0
+        self._latencies = deque(maxlen=latency_window)
+        self._queue_waits = deque(maxlen=latency_window)
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def submit(self, factory: Callable[[], Awaitable[Any]], name: str = "job") -> bool:
+        """
+        Queue a coroutine factory for execution on a worker loop.
+
+        Args:
+            factory: Zero-argument callable returning the coroutine to run
+            name: Label used in log messages
+
+        Returns:
+            True if the job was queued, False if it was dropped
+        """
+        if self._shutdown:
+            logger.warning(f"Ingestion executor is shut down, dropping {name}")
+            self._record_drop()
+            return False
+
+        self._ensure_workers()
+        job = _IngestionJob(name, factory)
+
+        # Blocking an event loop thread would stall every task on it
+        blocking = self.overflow_policy == "block" and not _in_event_loop()
+        try:
+            if blocking:
+                self._queue.put(job, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(job)
+        except queue.Full:
+            if not blocking and self.overflow_policy != "drop_newest":
+                return self._replace_oldest(job)
+
+            logger.warning(
+                f"Ingestion queue full ({self.max_queue_size}), dropping {name}"
+            )
+            self._record_drop()
+            return False
+
+        with self._lock:
+            self._submitted += 1
+        return True
+
+    def _replace_oldest(self, job: _IngestionJob) -> bool:
+        """Evict the oldest queued job and enqueue ``job`` in its place"""
+        try:
+            evicted = self._queue.get_nowait()
+            self._queue.task_done()
+            logger.warning(
+                f"Ingestion queue full ({self.max_queue_size}), dropping oldest job {evicted.name}"
+            )
+            self._record_drop()
+        except queue.Empty:
+            pass
+
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            # Another producer won the race for the freed slot
+            logger.warning(f"Ingestion queue still full, dropping {job.name}")
+            self._record_drop()
+            return False
+
+        with self._lock:
+            self._submitted += 1
+        return True
+
+    def _record_drop(self):
+        with self._lock:
+            self._dropped += 1
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    def _ensure_workers(self):
+        """Start worker threads lazily on first submission"""
+        if self._workers:
+            return
+        with self._lock:
+            if self._workers or self._shutdown:
+                return
+            for index in range(self.max_workers):
+                worker = threading.Thread(
+                    target=self._worker_main,
+                    name=f"{self.name}-{index}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+        logger.debug(
+            f"Ingestion executor started {self.max_workers} workers "
+            f"(queue size {self.max_queue_size}, policy {self.overflow_policy})"
+        )
+
+    def _worker_main(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            while True:
+                try:
+                    job = self._queue.get(timeout=0.25)
+                except queue.Empty:
+                    if self._shutdown:
+                        break
+                    continue
+
+                try:
+                    if job is None:
+                        break
+                    if self._abandon:
+                        self._record_drop()
+                        continue
+                    self._run_job(loop, job)
+                finally:
+                    self._queue.task_done()
+        finally:
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            except Exception:
+                pass
+            loop.close()
+
+    def _run_job(self, loop: asyncio.AbstractEventLoop, job: _IngestionJob):
+        started_at = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+        failed = False
+        try:
+            loop.run_until_complete(job.factory())
+        except Exception as e:
+            failed = True
+            logger.error(f"Ingestion job {job.name} failed: {e}")
+        finally:
+            finished_at = time.perf_counter()
+            with self._lock:
+                self._in_flight -= 1
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+                self._queue_waits.append(started_at - job.submitted_at)
+                self._latencies.append(finished_at - job.submitted_at)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def shutdown(self, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Stop accepting work and stop the workers.
+
+        Args:
+            wait: Drain queued jobs before stopping. If False, queued jobs
+                are discarded, the jobs currently running finish in the
+                background and the call returns without waiting for them.
+            timeout: Maximum seconds to wait for the workers (None = no limit)
+
+        Returns:
+            True if all workers exited within the timeout; always False when
+            ``wait`` is False and workers were running
+        """
+        self._shutdown = True
+        if not wait:
+            self._abandon = True
+            for _ in self._workers:
+                try:
+                    self._queue.put_nowait(None)
+                except queue.Full:
+                    # Workers also exit once the discarded backlog is empty
+                    break
+            return not self._workers
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for worker in list(self._workers):
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+            worker.join(remaining)
+
+        alive = [worker for worker in self._workers if worker.is_alive()]
+        if alive:
+            logger.warning(
+                f"Ingestion executor shutdown timed out with {self._queue.qsize()} "
+                f"jobs still queued"
+            )
+            return False
+
+        self._workers = []
+        return True
+
+    @property
+    def is_shutdown(self) -> bool:
+        return self._shutdown
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return queue depth, throughput counters and job latency in milliseconds"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            waits = list(self._queue_waits)
+            stats = {
+                "workers": self.max_workers,
+                "workers_alive": sum(1 for w in self._workers if w.is_alive()),
+                "max_queue_size": self.max_queue_size,
+                "overflow_policy": self.overflow_policy,
+                "queue_depth": self._queue.qsize(),
+                "in_flight": self._in_flight,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "dropped": self._dropped,
+                "shutdown": self._shutdown,
+            }
+
+        if latencies:
+            p95_index = min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))
+            stats["latency_ms"] = {
+                "avg": sum(latencies) / len(latencies) * 1000,
+                "p95": latencies[p95_index] * 1000,
+                "max": latencies[-1] * 1000,
+            }
+            stats["queue_wait_ms"] = {"avg": sum(waits) / len(waits) * 1000}
+        else:
+            stats["latency_ms"] = {"avg": 0.0, "p95": 0.0, "max": 0.0}
+            stats["queue_wait_ms"] = {"avg": 0.0}
+
+        return stats
+
+
+class IngestionBatcher:
+    """
+    Groups submitted items into micro-batches for an IngestionExecutor.
+
+    A batch is handed to the executor as soon as it holds ``batch_size`` items
+    or when its oldest item has waited ``max_wait`` seconds, whichever comes
+    first. A single flusher thread enforces the wait window.
+    """
+
+    def __init__(
+        self,
+        executor: IngestionExecutor,
+        handler: Callable[[list], Awaitable[Any]],
+        batch_size: int = 8,
+        max_wait: float = 2.0,
+        name: str = "memori-ingest-batcher",
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if max_wait <= 0:
+            raise ValueError("max_wait must be positive")
+
+        self.executor = executor
+        self.handler = handler
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self.name = name
+
+        self._pending = []
+        self._oldest_at: Optional[float] = None
+        self._condition = threading.Condition()
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
+        self._batches = 0
+
+    def add(self, item: Any) -> bool:
+        """Add an item, submitting the current batch if it is full"""
+        batch = None
+        with self._condition:
+            if self._closed:
+                logger.warning("Ingestion batcher is closed, dropping item")
+                return False
+
+            self._ensure_flusher()
+            if not self._pending:
+                self._oldest_at = time.monotonic()
+            self._pending.append(item)
+
+            if len(self._pending) >= self.batch_size:
+                batch = self._take_pending()
+            else:
+                self._condition.notify()
+
+        if batch:
+            return self._submit(batch)
+        return True
+
+    def flush(self) -> bool:
+        """Submit whatever is pending right away"""
+        with self._condition:
+            batch = self._take_pending()
+        if batch:
+            return self._submit(batch)
+        return True
+
+    def close(self, flush: bool = True):
+        """Stop the flusher thread, optionally submitting the pending batch"""
+        with self._condition:
+            self._closed = True
+            batch = self._take_pending()
+            self._condition.notify()
+
+        if batch and flush:
+            self._submit(batch)
+
+        if self._flusher and self._flusher is not threading.current_thread():
+            self._flusher.join(timeout=1.0)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _take_pending(self) -> list:
+        batch = self._pending
+        self._pending = []
+        self._oldest_at = None
+        return batch
+
+    def _submit(self, batch: list) -> bool:
+        self._batches += 1
+        return self.executor.submit(
+            lambda: self.handler(batch),
+            name=f"batch of {len(batch)} items",
+        )
+
+    def _ensure_flusher(self):
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._flusher_main, name=self.name, daemon=True
+            )
+            self._flusher.start()
+
+    def _flusher_main(self):
+        while True:
+            batch = None
+            with self._condition:
+                if self._closed:
+                    return
+                if self._oldest_at is None:
+                    self._condition.wait()
+                    continue
+
+                remaining = self._oldest_at + self.max_wait - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+
+                batch = self._take_pending()
+
+            if batch:
+                self._submit(batch)
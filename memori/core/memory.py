@@ -3,6 +3,8 @@ Main Memori class - Pydantic-based memory interface v1.0
 """
 
 import asyncio
+import importlib.util
+import threading
 import time
 import uuid
 from datetime import datetime
@@ -10,23 +12,32 @@ from typing import Any, Dict, List, Optional
 
 from loguru import logger
 
-try:
-    import litellm  # noqa: F401
-    from litellm import success_callback  # noqa: F401
-
-    LITELLM_AVAILABLE = True
-except ImportError:
-    LITELLM_AVAILABLE = False
-    logger.warning("LiteLLM not available - native callback system disabled")
-
 from ..agents.conscious_agent import ConsciouscAgent
 from ..config.memory_manager import MemoryManager
 from ..config.settings import LoggingSettings, LogLevel
 from ..database.sqlalchemy_manager import SQLAlchemyDatabaseManager as DatabaseManager
+from ..utils.cache import TTLLRUCache, normalize_cache_text
+from ..utils.embeddings import create_embedder
 from ..utils.exceptions import DatabaseError, MemoriError
-from ..utils.logging import LoggingManager
+from ..utils.logging import LoggingManager, debug_enabled
 from ..utils.pydantic_models import ConversationContext
+from ..utils.tracing import (
+    CONTEXT_CACHE,
+    create_tracer,
+    get_tracer,
+    set_tracer,
+    traced,
+)
+from .conscious_context import ConsciousContextSnapshots
 from .conversation import ConversationManager
+from .ingestion import IngestionBatcher, IngestionExecutor
+from .retention import RetentionSweeper, retention_days
+
+# Checked without importing: litellm is large and only needed once callbacks
+# are registered (see memori.integrations.litellm_integration)
+LITELLM_AVAILABLE = importlib.util.find_spec("litellm") is not None
+if not LITELLM_AVAILABLE:
+    logger.warning("LiteLLM not available - native callback system disabled")
 
 
 class Memori:
@@ -65,6 +76,31 @@ class Memori:
         schema_init: bool = True,  # Initialize database schema and create tables
         database_prefix: Optional[str] = None,  # Database name prefix
         database_suffix: Optional[str] = None,  # Database name suffix
+        ingestion_workers: int = 2,  # Background memory processing workers
+        ingestion_queue_size: int = 1000,  # Max conversations waiting for processing
+        ingestion_overflow_policy: str = "block",  # block, drop_newest, drop_oldest
+        ingestion_drain_timeout: float = 30.0,  # Seconds to drain queue on cleanup
+        ingestion_batch_size: int = 1,  # Conversations per memory agent call (1 = no batching)
+        ingestion_batch_max_wait: float = 2.0,  # Max seconds a conversation waits for its batch
+        embedder: Optional[Any] = None,  # "local", "openai[:model]" or an Embedder
+        context_cache_size: int = 256,  # Cached auto-ingest retrievals (0 = disabled)
+        context_cache_ttl: float = 30.0,  # Seconds a cached retrieval stays valid
+        pool_size: Optional[int] = None,  # Connections kept in the pool
+        max_overflow: Optional[int] = None,  # Extra connections above pool_size
+        pool_timeout: Optional[float] = None,  # Seconds to wait for a connection
+        pool_recycle: Optional[int] = None,  # Seconds before recycling a connection
+        share_engine: bool = True,  # Share one engine/pool per database URL
+        sqlite_profile: str = "balanced",  # SQLite PRAGMA profile (WAL by default)
+        sqlite_single_writer: bool = True,  # Serialize SQLite writes on one thread
+        auto_cleanup: Optional[bool] = None,  # Sweep expired rows in the background
+        retention_policy: Optional[str] = None,  # '7_days', '30_days', '90_days', 'permanent'
+        cleanup_interval_hours: Optional[float] = None,  # Hours between sweeps
+        search_planner_mode: str = "hybrid",  # 'local', 'hybrid' or 'llm'
+        defer_database_init: bool = False,  # Connect and create schema on first use
+        track_memory_access: bool = True,  # Count reads of retrieved memories
+        access_flush_interval: float = 5.0,  # Seconds between access-count flushes
+        tracer: Optional[Any] = None,  # 'recording', 'opentelemetry' or 'prometheus'
+        ranking: Optional[Any] = None,  # RankingEngine or a dict of its options
     ):
         """
         Initialize Memori memory system v1.0.
@@ -95,6 +131,70 @@ class Memori:
             enable_auto_creation: Enable automatic database creation if database doesn't exist
             database_prefix: Optional prefix for database name (for multi-tenant setups)
             database_suffix: Optional suffix for database name (e.g., 'dev', 'prod', 'test')
+            ingestion_workers: Number of long-lived threads processing recorded conversations
+            ingestion_queue_size: Maximum number of conversations queued for processing
+            ingestion_overflow_policy: What to do when the queue is full
+                ('block', 'drop_newest' or 'drop_oldest')
+            ingestion_drain_timeout: Seconds cleanup() waits for queued conversations
+            ingestion_batch_size: Number of conversations classified per memory agent
+                LLM call; 1 disables micro-batching
+            ingestion_batch_max_wait: Seconds a conversation may wait for its batch
+                to fill before the partial batch is processed
+            embedder: Enable hybrid full-text + vector retrieval. "local" uses an
+                offline hashing embedder, "openai" or "openai:<model>" the provider's
+                embeddings endpoint; an Embedder instance is used as-is
+            context_cache_size: Maximum number of auto-ingest retrievals cached per
+                instance, keyed on namespace and normalized user input; 0 disables
+                the cache
+            context_cache_ttl: Seconds before a cached retrieval is refreshed. Entries
+                for a namespace are also dropped whenever memories are written to it
+            pool_size: Connection pool size. When None, the value from a loaded
+                ConfigManager (database.pool_size) is used, else SQLAlchemy's default
+            max_overflow: Connections allowed beyond pool_size (same fallback)
+            pool_timeout: Seconds to wait for a free connection (same fallback)
+            pool_recycle: Seconds before pooled connections are recycled (same fallback)
+            share_engine: Share one engine and connection pool between all
+                instances using the same database URL, and initialize its schema
+                only once per process
+            sqlite_profile: PRAGMA profile for SQLite connections: 'default'
+                (SQLite defaults), 'balanced' (WAL, synchronous=NORMAL),
+                'performance' (balanced plus mmap and a larger cache) or
+                'durable' (WAL, synchronous=FULL)
+            sqlite_single_writer: Route SQLite writes through a single writer
+                thread per database so concurrent ingestion never hits
+                "database is locked"
+            auto_cleanup: Periodically delete expired short-term memories and
+                rows past the retention policy on a background thread. When
+                None, a loaded ConfigManager (memory.auto_cleanup) decides,
+                else disabled
+            retention_policy: How long chat history and non-permanent
+                short-term memories are kept (same fallback, else '30_days')
+            cleanup_interval_hours: Hours between sweeps (same fallback, else 24)
+            search_planner_mode: How search queries are planned: 'local' uses
+                keyword/category/time heuristics only, 'llm' always asks the
+                model, 'hybrid' asks the model only when the heuristic plan
+                has low confidence
+            defer_database_init: Skip creating the database, engine and schema
+                in the constructor; they are set up by the first operation that
+                touches the database. Shortens cold starts for short-lived
+                workers that may never read or write memory
+            track_memory_access: Update access_count and last_accessed for
+                memories returned by searches and auto-ingest retrieval. Reads
+                are buffered and written in batches off the request path
+            access_flush_interval: Seconds between batched access-count writes
+            tracer: Install a process-wide tracer timing each hot-path stage,
+                database round trip and LLM call: "recording" (in-process
+                histograms, reported by get_memory_stats), "opentelemetry",
+                "prometheus" or a memori.utils.tracing.Tracer instance. None
+                leaves the current tracer (no-op by default) in place. The
+                tracer is shared by every Memori instance in the process: a
+                name matching the installed tracer's kind reuses it, anything
+                else replaces it for all instances (logged as a warning)
+            ranking: How search results are scored: a
+                memori.database.ranking.RankingEngine or a dict of its options
+                (search_weight, importance_weight, recency_weight,
+                recency_half_life_days, decay). Defaults to weights 0.5/0.3/0.2
+                with recency halving every 15 days
         """
         self.database_connect = database_connect
         self.template = template
@@ -109,6 +209,33 @@ class Memori:
         self.schema_init = schema_init
         self.database_prefix = database_prefix
         self.database_suffix = database_suffix
+        self.ingestion_drain_timeout = ingestion_drain_timeout
+
+        if tracer is not None:
+            self._install_tracer(tracer)
+
+        # Bounded pool for background memory processing
+        self._ingestion_executor = IngestionExecutor(
+            max_workers=ingestion_workers,
+            max_queue_size=ingestion_queue_size,
+            overflow_policy=ingestion_overflow_policy,
+        )
+        self._ingestion_batcher = None
+        if ingestion_batch_size > 1:
+            self._ingestion_batcher = IngestionBatcher(
+                self._ingestion_executor,
+                handler=self._process_memory_batch_async,
+                batch_size=ingestion_batch_size,
+                max_wait=ingestion_batch_max_wait,
+            )
+
+        # Auto-ingest retrieval cache, invalidated on memory writes
+        self._context_cache = None
+        self._context_cache_generation = 0
+        if context_cache_size > 0:
+            self._context_cache = TTLLRUCache(
+                max_size=context_cache_size, ttl=context_cache_ttl
+            )
 
         # Configure provider based on explicit settings ONLY - no auto-detection
         if provider_config:
@@ -186,7 +313,24 @@ class Memori:
         self._setup_logging()
 
         # Initialize database manager
-        self.db_manager = DatabaseManager(database_connect, template, schema_init)
+        self.db_manager = DatabaseManager(
+            database_connect,
+            template,
+            schema_init,
+            share_engine=share_engine,
+            sqlite_profile=sqlite_profile,
+            sqlite_single_writer=sqlite_single_writer,
+            defer_init=defer_database_init,
+            **self._resolve_pool_options(
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+            ),
+        )
+
+        # Conscious-context snapshots, kept current by the conscious agent
+        self._conscious_snapshots = ConsciousContextSnapshots()
 
         # Initialize Pydantic-based agents
         self.memory_agent = None
@@ -216,7 +360,9 @@ class Memori:
                     provider_config=self.provider_config, model=effective_model
                 )
                 self.search_engine = MemorySearchEngine(
-                    provider_config=self.provider_config, model=effective_model
+                    provider_config=self.provider_config,
+                    model=effective_model,
+                    planner_mode=search_planner_mode,
                 )
             else:
                 # Fallback to using API key directly
@@ -224,12 +370,16 @@ class Memori:
                     api_key=self.openai_api_key, model=effective_model
                 )
                 self.search_engine = MemorySearchEngine(
-                    api_key=self.openai_api_key, model=effective_model
+                    api_key=self.openai_api_key,
+                    model=effective_model,
+                    planner_mode=search_planner_mode,
                 )
 
             # Only initialize conscious_agent if conscious_ingest or auto_ingest is enabled
             if conscious_ingest or auto_ingest:
-                self.conscious_agent = ConsciouscAgent()
+                self.conscious_agent = ConsciouscAgent(
+                    context_snapshots=self._conscious_snapshots
+                )
 
             logger.info(
                 f"Agents initialized successfully with model: {effective_model}"
@@ -259,7 +409,9 @@ class Memori:
         self._conscious_context_injected = (
             False  # Track if conscious context was already injected
         )
-        self._in_context_retrieval = False  # Recursion guard for context retrieval
+        # Per-thread recursion guard for context retrieval (async clients retrieve
+        # context concurrently on executor threads)
+        self._retrieval_state = threading.local()
 
         # Initialize conversation manager for stateless LLM integration
         self.conversation_manager = ConversationManager(
@@ -275,6 +427,39 @@ class Memori:
 
         # Initialize database
         self._setup_database()
+        self.db_manager.add_write_listener(self._on_memory_write)
+        if track_memory_access:
+            self.db_manager.enable_access_tracking(flush_interval=access_flush_interval)
+        if isinstance(ranking, dict):
+            self.db_manager.set_ranking(**ranking)
+        elif ranking is not None:
+            self.db_manager.set_ranking(ranking)
+
+        # Optional background deletion of expired and out-of-retention rows
+        self._retention_sweeper = None
+        retention = self._resolve_retention_options(
+            auto_cleanup=auto_cleanup,
+            retention_policy=retention_policy,
+            cleanup_interval_hours=cleanup_interval_hours,
+        )
+        if retention["auto_cleanup"]:
+            self._retention_sweeper = RetentionSweeper(
+                self.db_manager,
+                namespace=self.namespace,
+                retention_policy=retention["retention_policy"],
+                interval_hours=retention["cleanup_interval_hours"],
+            )
+            self._retention_sweeper.start()
+
+        # Optional embedding-based retrieval
+        if embedder is not None:
+            self.db_manager.enable_vector_search(
+                create_embedder(
+                    embedder,
+                    api_key=self.openai_api_key or None,
+                    provider_config=self.provider_config,
+                )
+            )
 
         # Initialize the new modular memory manager
         self.memory_manager = MemoryManager(
@@ -319,11 +504,77 @@ class Memori:
                     "Verbose logging enabled - only loguru logs will be displayed"
                 )
 
+    @staticmethod
+    def _install_tracer(spec):
+        """Install the configured tracer process-wide unless an equal one is active"""
+        current = get_tracer()
+        candidate = create_tracer(spec)
+        # A tracer name reuses an installed tracer of that kind, so a second
+        # Memori(tracer="recording") keeps the histograms collected so far
+        if candidate is current or (
+            isinstance(spec, str) and type(candidate) is type(current)
+        ):
+            return
+
+        if current.enabled:
+            logger.warning(
+                f"Replacing process-wide {type(current).__name__} with "
+                f"{type(candidate).__name__}; this affects every Memori instance"
+            )
+        set_tracer(candidate)
+
+    @staticmethod
+    def _resolve_pool_options(**options) -> Dict[str, Any]:
+        """Fill unset pool options from the loaded ConfigManager, if any"""
+        from ..config.manager import ConfigManager
+
+        if ConfigManager._instance is not None and any(
+            value is None for value in options.values()
+        ):
+            try:
+                database_settings = ConfigManager.get_instance().get_settings().database
+                for key, value in options.items():
+                    if value is None:
+                        options[key] = getattr(database_settings, key, None)
+            except Exception as e:
+                logger.debug(f"Could not read pool settings from ConfigManager: {e}")
+
+        return options
+
+    @staticmethod
+    def _resolve_retention_options(**options) -> Dict[str, Any]:
+        """Fill unset retention options from the loaded ConfigManager, then defaults"""
+        from ..config.manager import ConfigManager
+
+        if ConfigManager._instance is not None and any(
+            value is None for value in options.values()
+        ):
+            try:
+                memory_settings = ConfigManager.get_instance().get_settings().memory
+                for key, value in options.items():
+                    if value is None:
+                        options[key] = getattr(memory_settings, key, None)
+            except Exception as e:
+                logger.debug(f"Could not read retention settings from ConfigManager: {e}")
+
+        defaults = {
+            "auto_cleanup": False,
+            "retention_policy": "30_days",
+            "cleanup_interval_hours": 24,
+        }
+        return {
+            key: defaults[key] if value is None else value
+            for key, value in options.items()
+        }
+
     def _setup_database(self):
         """Setup database tables based on template"""
         if not self.schema_init:
             logger.info("Schema initialization disabled (schema_init=False)")
             return
+        if not self.db_manager._connected:
+            logger.debug("Database initialization deferred until first use")
+            return
 
         try:
             self.db_manager.initialize_schema()
@@ -444,19 +695,10 @@ class Memori:
     def _initialize_existing_conscious_memories_sync(self):
         """Synchronously initialize existing conscious-info memories"""
         try:
-            from sqlalchemy import text
-
             with self.db_manager._get_connection() as connection:
                 # Get ALL conscious-info labeled memories from long-term memory
-                cursor = connection.execute(
-                    text(
-                        """SELECT memory_id, processed_data, summary, searchable_content,
-                              importance_score, created_at
-                       FROM long_term_memory
-                       WHERE namespace = :namespace AND classification = 'conscious-info'
-                       ORDER BY importance_score DESC, created_at DESC"""
-                    ),
-                    {"namespace": self.namespace or "default"},
+                cursor = connection.execute_compiled(
+                    "conscious_memories", {"namespace": self.namespace or "default"}
                 )
                 existing_conscious_memories = cursor.fetchall()
 
@@ -466,11 +708,9 @@ class Memori:
                 )
                 return False
 
-            copied_count = 0
-            for memory_row in existing_conscious_memories:
-                success = self._copy_memory_to_short_term_sync(memory_row)
-                if success:
-                    copied_count += 1
+            copied_count = self.conscious_agent.promote_memories(
+                self.db_manager, self.namespace or "default", existing_conscious_memories
+            )
 
             if copied_count > 0:
                 logger.info(
@@ -489,89 +729,6 @@ class Memori:
             )
             return False
 
-    def _copy_memory_to_short_term_sync(self, memory_row: tuple) -> bool:
-        """Synchronously copy a conscious memory to short-term memory with duplicate filtering"""
-        try:
-            (
-                memory_id,
-                processed_data,
-                summary,
-                searchable_content,
-                importance_score,
-                _,
-            ) = memory_row
-
-            from datetime import datetime
-
-            from sqlalchemy import text
-
-            with self.db_manager._get_connection() as connection:
-                # Check if similar content already exists in short-term memory
-                existing_check = connection.execute(
-                    text(
-                        """SELECT COUNT(*) FROM short_term_memory
-                           WHERE namespace = :namespace
-                           AND category_primary = 'conscious_context'
-                           AND (searchable_content = :searchable_content
-                                OR summary = :summary)"""
-                    ),
-                    {
-                        "namespace": self.namespace or "default",
-                        "searchable_content": searchable_content,
-                        "summary": summary,
-                    },
-                )
-
-                existing_count = existing_check.scalar()
-                if existing_count > 0:
-                    logger.debug(
-                        f"Conscious-ingest: Skipping duplicate memory {memory_id} - similar content already exists in short-term memory"
-                    )
-                    return False
-
-                # Create short-term memory ID
-                short_term_id = (
-                    f"conscious_{memory_id}_{int(datetime.now().timestamp())}"
-                )
-
-                # Insert directly into short-term memory with conscious_context category
-                connection.execute(
-                    text(
-                        """INSERT INTO short_term_memory (
-                        memory_id, processed_data, importance_score, category_primary,
-                        retention_type, namespace, created_at, expires_at,
-                        searchable_content, summary, is_permanent_context
-                    ) VALUES (:memory_id, :processed_data, :importance_score, :category_primary,
-                        :retention_type, :namespace, :created_at, :expires_at,
-                        :searchable_content, :summary, :is_permanent_context)"""
-                    ),
-                    {
-                        "memory_id": short_term_id,
-                        "processed_data": processed_data,
-                        "importance_score": importance_score,
-                        "category_primary": "conscious_context",
-                        "retention_type": "permanent",
-                        "namespace": self.namespace or "default",
-                        "created_at": datetime.now().isoformat(),
-                        "expires_at": None,
-                        "searchable_content": searchable_content,
-                        "summary": summary,
-                        "is_permanent_context": True,
-                    },
-                )
-                connection.commit()
-
-            logger.debug(
-                f"Conscious-ingest: Copied memory {memory_id} to short-term as {short_term_id}"
-            )
-            return True
-
-        except Exception as e:
-            logger.error(
-                f"Conscious-ingest: Failed to copy memory {memory_row[0]} to short-term: {e}"
-            )
-            return False
-
     def enable(self, interceptors: Optional[List[str]] = None):
         """
         Enable universal memory recording using LiteLLM's native callback system.
@@ -685,6 +842,7 @@ class Memori:
         results = self.memory_manager.disable()
         return results.get("success", False)
 
+    @traced("inject_context", provider="openai")
     def _inject_openai_context(self, kwargs):
         """Inject context for OpenAI calls based on ingest mode using ConversationManager"""
         try:
@@ -724,6 +882,7 @@ class Memori:
             logger.error(f"OpenAI context injection failed: {e}")
         return kwargs
 
+    @traced("inject_context", provider="anthropic")
     def _inject_anthropic_context(self, kwargs):
         """Inject context for Anthropic calls based on ingest mode"""
         try:
@@ -828,6 +987,7 @@ class Memori:
             logger.error(f"Anthropic context injection failed: {e}")
         return kwargs
 
+    @traced("inject_context", provider="litellm")
     def _inject_litellm_context(self, params, mode="auto"):
         """
         Inject context for LiteLLM calls based on mode
@@ -959,104 +1119,191 @@ class Memori:
         """
         Get conscious context from ALL short-term memory summaries.
         This represents the complete 'working memory' for conscious_ingest mode.
-        Used only at program startup when conscious_ingest=True.
+        Served from the namespace's in-memory snapshot; the database is only
+        queried when the snapshot is missing, invalidated or expired.
         """
         try:
-            from sqlalchemy import text
-
-            with self.db_manager._get_connection() as conn:
-                # Get ALL short-term memories (no limit) ordered by importance and recency
-                # This gives the complete conscious context as single initial injection
-                result = conn.execute(
-                    text(
-                        """
-                    SELECT memory_id, processed_data, importance_score,
-                           category_primary, summary, searchable_content,
-                           created_at, access_count
-                    FROM short_term_memory
-                    WHERE namespace = :namespace AND (expires_at IS NULL OR expires_at > :current_time)
-                    ORDER BY importance_score DESC, created_at DESC
-                    """
-                    ),
-                    {"namespace": self.namespace, "current_time": datetime.now()},
+            snapshot = self._conscious_snapshots.get(
+                self.namespace, self._load_conscious_context
+            )
+            return [dict(memory) for memory in snapshot.memories]
+        except Exception as e:
+            logger.error(f"Failed to get conscious context: {e}")
+            return []
+
+    def _get_conscious_context_prompt(self, renderer) -> tuple:
+        """
+        Get the rendered conscious-context prompt block and its memory count.
+
+        The prompt is rendered by ``renderer`` once per snapshot version, so
+        repeated requests reuse the same string.
+        """
+        try:
+            return self._conscious_snapshots.render(
+                self.namespace, self._load_conscious_context, renderer
+            )
+        except Exception as e:
+            logger.error(f"Failed to get conscious context prompt: {e}")
+            return "", 0
+
+    def _load_conscious_context(self) -> List[Dict[str, Any]]:
+        """Load all non-expired short-term memories for the namespace"""
+        with self.db_manager._get_connection() as conn:
+            # Get ALL short-term memories (no limit) ordered by importance and recency
+            result = conn.execute_compiled(
+                "conscious_context",
+                {"namespace": self.namespace, "current_time": datetime.now()},
+            )
+
+            memories = []
+            for row in result:
+                memories.append(
+                    {
+                        "memory_id": row[0],
+                        "processed_data": row[1],
+                        "importance_score": row[2],
+                        "category_primary": row[3],
+                        "summary": row[4],
+                        "searchable_content": row[5],
+                        "created_at": row[6],
+                        "access_count": row[7],
+                        "expires_at": row[8],
+                        "memory_type": "short_term",
+                    }
                 )
 
-                memories = []
-                for row in result:
-                    memories.append(
-                        {
-                            "memory_id": row[0],
-                            "processed_data": row[1],
-                            "importance_score": row[2],
-                            "category_primary": row[3],
-                            "summary": row[4],
-                            "searchable_content": row[5],
-                            "created_at": row[6],
-                            "access_count": row[7],
-                            "memory_type": "short_term",
-                        }
-                    )
+            logger.debug(
+                f"Retrieved {len(memories)} conscious memories from short-term storage"
+            )
+            return memories
+
+    @traced("auto_ingest_context")
+    def _get_auto_ingest_context(self, user_input: str) -> List[Dict[str, Any]]:
+        """
+        Get auto-ingest context, served from the retrieval cache when possible.
+        Repeated prompts in the same namespace (retries, agent loops, tool-call
+        rounds) reuse the previous retrieval until it expires or a memory write
+        to the namespace invalidates it.
+        """
+        if self._context_cache is None or not user_input or not user_input.strip():
+            return self._retrieve_auto_ingest_context(user_input)
 
+        cache_key = (self.namespace, normalize_cache_text(user_input))
+        cached = self._context_cache.get(cache_key)
+        get_tracer().increment(
+            CONTEXT_CACHE, result="miss" if cached is None else "hit"
+        )
+        if cached is not None:
+            if debug_enabled():
                 logger.debug(
-                    f"Retrieved {len(memories)} conscious memories from short-term storage"
+                    f"Auto-ingest: Cache hit for query: '{user_input[:50]}...'"
                 )
-                return memories
+            # Misses are counted by the search itself
+            if self.db_manager.access_tracker is not None:
+                self.db_manager.access_tracker.record(cached)
+            return self._copy_context_results(cached, user_input)
+
+        generation = self._context_cache_generation
+        results = self._retrieve_auto_ingest_context(user_input)
+
+        # Skip caching if a write landed while we were searching
+        if generation == self._context_cache_generation:
+            self._context_cache.set(cache_key, self._copy_context_results(results))
+        return results
+
+    @staticmethod
+    def _copy_context_results(
+        results: List[Dict[str, Any]], user_input: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Shallow-copy cached results so callers cannot mutate the cache"""
+        copies = []
+        for result in results:
+            if isinstance(result, dict):
+                result = dict(result)
+                if user_input is not None and "retrieval_query" in result:
+                    result["retrieval_query"] = user_input
+            copies.append(result)
+        return copies
+
+    def _on_memory_write(self, namespace: str, memory_type: str):
+        """
+        Drop caches derived from a namespace's memories after a write
 
-        except Exception as e:
-            logger.error(f"Failed to get conscious context: {e}")
-            return []
+        Called for writes through any Memori instance using the same database
+        in this process. Writes from other processes are only picked up when
+        cached retrievals expire (context_cache_ttl) and snapshots are reloaded.
+        """
+        # Conscious-agent copies are merged into the snapshot directly
+        if memory_type in ("short_term", "all"):
+            self._conscious_snapshots.invalidate(namespace)
 
-    def _get_auto_ingest_context(self, user_input: str) -> List[Dict[str, Any]]:
+        if self._context_cache is None:
+            return
+        self._context_cache_generation += 1
+        removed = self._context_cache.invalidate_where(lambda key: key[0] == namespace)
+        if removed:
+            logger.debug(
+                f"Auto-ingest: Invalidated {removed} cached retrievals for namespace "
+                f"'{namespace}' after {memory_type} write"
+            )
+
+    def _retrieve_auto_ingest_context(self, user_input: str) -> List[Dict[str, Any]]:
         """
         Get auto-ingest context using retrieval agent for intelligent search.
         Searches through entire database for relevant memories.
         """
+        debug = debug_enabled()
         try:
             # Early validation
             if not user_input or not user_input.strip():
-                logger.debug(
-                    "Auto-ingest: No user input provided, returning empty context"
-                )
+                if debug:
+                    logger.debug(
+                        "Auto-ingest: No user input provided, returning empty context"
+                    )
                 return []
 
             # Check for recursion guard to prevent infinite loops
-            if hasattr(self, "_in_context_retrieval") and self._in_context_retrieval:
-                logger.debug(
-                    "Auto-ingest: Recursion detected, using direct database search"
-                )
+            if getattr(self._retrieval_state, "active", False):
+                if debug:
+                    logger.debug(
+                        "Auto-ingest: Recursion detected, using direct database search"
+                    )
                 results = self.db_manager.search_memories(
                     query=user_input, namespace=self.namespace, limit=5
                 )
-                logger.debug(
-                    f"Auto-ingest: Recursion fallback returned {len(results)} results"
-                )
+                if debug:
+                    logger.debug(
+                        f"Auto-ingest: Recursion fallback returned {len(results)} results"
+                    )
                 return results
 
             # Set recursion guard
-            self._in_context_retrieval = True
+            self._retrieval_state.active = True
 
-            logger.debug(
-                f"Auto-ingest: Starting context retrieval for query: '{user_input[:50]}...' in namespace: '{self.namespace}'"
-            )
+            if debug:
+                logger.debug(
+                    f"Auto-ingest: Starting context retrieval for query: '{user_input[:50]}...' in namespace: '{self.namespace}'"
+                )
 
-            # Always try direct database search first as it's more reliable
-            logger.debug("Auto-ingest: Using direct database search (primary method)")
-            logger.debug(
-                f"Auto-ingest: Database manager type: {type(self.db_manager).__name__}"
-            )
+                # Always try direct database search first as it's more reliable
+                logger.debug(
+                    "Auto-ingest: Using direct database search (primary method)"
+                )
+                logger.debug(
+                    f"Auto-ingest: Database manager type: {type(self.db_manager).__name__}"
+                )
 
             try:
                 results = self.db_manager.search_memories(
                     query=user_input, namespace=self.namespace, limit=5
                 )
-                logger.debug(
-                    f"Auto-ingest: Database search returned {len(results) if results else 0} results"
-                )
+                if debug:
+                    logger.debug(
+                        f"Auto-ingest: Database search returned {len(results) if results else 0} results"
+                    )
 
-                if results:
-                    for i, result in enumerate(
-                        results[:3]
-                    ):  # Log first 3 results for debugging
+                    # Log first 3 results for debugging
+                    for i, result in enumerate(results[:3] if results else ()):
                         logger.debug(
                             f"Auto-ingest: Result {i+1}: {type(result)} with keys: {list(result.keys()) if isinstance(result, dict) else 'N/A'}"
                         )
@@ -1069,9 +1316,10 @@ class Memori:
                 results = []
 
             if results:
-                logger.debug(
-                    f"Auto-ingest: Direct database search returned {len(results)} results"
-                )
+                if debug:
+                    logger.debug(
+                        f"Auto-ingest: Direct database search returned {len(results)} results"
+                    )
                 # Add search metadata to results
                 for result in results:
                     if isinstance(result, dict):
@@ -1081,9 +1329,10 @@ class Memori:
 
             # If direct search fails, try search engine as backup
             if self.search_engine:
-                logger.debug(
-                    "Auto-ingest: Direct search returned 0 results, trying search engine"
-                )
+                if debug:
+                    logger.debug(
+                        "Auto-ingest: Direct search returned 0 results, trying search engine"
+                    )
                 try:
                     engine_results = self.search_engine.execute_search(
                         query=user_input,
@@ -1093,16 +1342,17 @@ class Memori:
                     )
 
                     if engine_results:
-                        logger.debug(
-                            f"Auto-ingest: Search engine returned {len(engine_results)} results"
-                        )
+                        if debug:
+                            logger.debug(
+                                f"Auto-ingest: Search engine returned {len(engine_results)} results"
+                            )
                         # Add search metadata to results
                         for result in engine_results:
                             if isinstance(result, dict):
                                 result["retrieval_method"] = "search_engine"
                                 result["retrieval_query"] = user_input
                         return engine_results
-                    else:
+                    elif debug:
                         logger.debug(
                             "Auto-ingest: Search engine also returned 0 results"
                         )
@@ -1115,16 +1365,17 @@ class Memori:
                         f"Auto-ingest: Search engine error details: {type(search_error).__name__}: {str(search_error)}",
                         exc_info=True,
                     )
-            else:
+            elif debug:
                 logger.debug("Auto-ingest: No search engine available")
 
             # Final fallback: get recent memories from the same namespace
-            logger.debug(
-                "Auto-ingest: All search methods returned 0 results, using recent memories fallback"
-            )
-            logger.debug(
-                f"Auto-ingest: Attempting fallback search in namespace '{self.namespace}'"
-            )
+            if debug:
+                logger.debug(
+                    "Auto-ingest: All search methods returned 0 results, using recent memories fallback"
+                )
+                logger.debug(
+                    f"Auto-ingest: Attempting fallback search in namespace '{self.namespace}'"
+                )
 
             try:
                 fallback_results = self.db_manager.search_memories(
@@ -1132,21 +1383,23 @@ class Memori:
                     namespace=self.namespace,
                     limit=3,
                 )
-                logger.debug(
-                    f"Auto-ingest: Fallback search returned {len(fallback_results) if fallback_results else 0} results"
-                )
-
-                if fallback_results:
+                if debug:
                     logger.debug(
-                        f"Auto-ingest: Fallback returned {len(fallback_results)} recent memories"
+                        f"Auto-ingest: Fallback search returned {len(fallback_results) if fallback_results else 0} results"
                     )
+
+                if fallback_results:
+                    if debug:
+                        logger.debug(
+                            f"Auto-ingest: Fallback returned {len(fallback_results)} recent memories"
+                        )
                     # Add search metadata to fallback results
                     for result in fallback_results:
                         if isinstance(result, dict):
                             result["retrieval_method"] = "recent_memories_fallback"
                             result["retrieval_query"] = user_input
                     return fallback_results
-                else:
+                elif debug:
                     logger.debug("Auto-ingest: Fallback search returned no results")
 
             except Exception as fallback_e:
@@ -1156,9 +1409,10 @@ class Memori:
                     exc_info=True,
                 )
 
-            logger.debug(
-                "Auto-ingest: All retrieval methods failed, returning empty context"
-            )
+            if debug:
+                logger.debug(
+                    "Auto-ingest: All retrieval methods failed, returning empty context"
+                )
             return []
 
         except Exception as e:
@@ -1168,8 +1422,7 @@ class Memori:
             return []
         finally:
             # Always clear recursion guard
-            if hasattr(self, "_in_context_retrieval"):
-                self._in_context_retrieval = False
+            self._retrieval_state.active = False
 
     def _record_openai_conversation(self, kwargs, response):
         """Record OpenAI conversation with enhanced content parsing"""
@@ -1610,38 +1863,27 @@ class Memori:
     def _process_memory_sync(
         self, chat_id: str, user_input: str, ai_output: str, model: str = "unknown"
     ):
-        """Synchronous memory processing fallback"""
+        """Queue memory processing on the bounded ingestion executor"""
         if not self.memory_agent:
             logger.warning("Memory agent not available, skipping memory ingestion")
             return
 
         try:
-            # Run async processing in new event loop
-            import threading
+            if self._ingestion_batcher:
+                self._ingestion_batcher.add((chat_id, user_input, ai_output, model))
+                return
 
-            def run_memory_processing():
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    new_loop.run_until_complete(
-                        self._process_memory_async(
-                            chat_id, user_input, ai_output, model
-                        )
-                    )
-                except Exception as e:
-                    logger.error(f"Synchronous memory processing failed: {e}")
-                finally:
-                    new_loop.close()
-
-            # Run in background thread to avoid blocking
-            thread = threading.Thread(target=run_memory_processing, daemon=True)
-            thread.start()
-            logger.debug(
-                f"Memory processing started in background thread for {chat_id}"
+            queued = self._ingestion_executor.submit(
+                lambda: self._process_memory_async(
+                    chat_id, user_input, ai_output, model
+                ),
+                name=f"memory processing for {chat_id}",
             )
+            if queued:
+                logger.debug(f"Memory processing queued for {chat_id}")
 
         except Exception as e:
-            logger.error(f"Failed to start synchronous memory processing: {e}")
+            logger.error(f"Failed to queue memory processing: {e}")
 
     def _parse_llm_response(self, response) -> tuple[str, str]:
         """Extract text and model from various LLM response formats."""
@@ -1680,6 +1922,7 @@ class Memori:
         # Fallback
         return str(response), "unknown"
 
+    @traced("record_conversation")
     def record_conversation(
         self,
         user_input: str,
@@ -1734,23 +1977,26 @@ class Memori:
     def _schedule_memory_processing(
         self, chat_id: str, user_input: str, ai_output: str, model: str
     ):
-        """Schedule memory processing (async if possible, sync fallback)."""
-        try:
-            loop = asyncio.get_running_loop()
-            task = loop.create_task(
-                self._process_memory_async(chat_id, user_input, ai_output, model)
-            )
+        """Schedule memory processing on the ingestion executor.
 
-            # Prevent garbage collection
-            if not hasattr(self, "_memory_tasks"):
-                self._memory_tasks = set()
-            self._memory_tasks.add(task)
-            task.add_done_callback(self._memory_tasks.discard)
-        except RuntimeError:
-            # No event loop, use sync fallback
-            logger.debug("No event loop, using synchronous memory processing")
-            self._process_memory_sync(chat_id, user_input, ai_output, model)
+        Processing always runs on the executor's worker loops, also when the
+        caller has a running event loop, so the number of in-flight ingestion
+        jobs stays bounded regardless of request rate.
+        """
+        self._process_memory_sync(chat_id, user_input, ai_output, model)
+
+    def get_ingestion_stats(self) -> Dict[str, Any]:
+        """Get queue depth, throughput and latency of background memory processing"""
+        stats = self._ingestion_executor.get_stats()
+        if self._ingestion_batcher:
+            stats["batching"] = {
+                "batch_size": self._ingestion_batcher.batch_size,
+                "max_wait": self._ingestion_batcher.max_wait,
+                "pending": self._ingestion_batcher.pending,
+            }
+        return stats
 
+    @traced("process_memory")
     async def _process_memory_async(
         self, chat_id: str, user_input: str, ai_output: str, model: str = "unknown"
     ):
@@ -1761,15 +2007,7 @@ class Memori:
 
         try:
             # Create conversation context
-            context = ConversationContext(
-                user_id=self.user_id,
-                session_id=self._session_id,
-                conversation_id=chat_id,
-                model_used=model,
-                user_preferences=self._user_context.get("user_preferences", []),
-                current_projects=self._user_context.get("current_projects", []),
-                relevant_skills=self._user_context.get("relevant_skills", []),
-            )
+            context = self._build_conversation_context(chat_id, model)
 
             # Get recent memories for deduplication
             existing_memories = await self._get_recent_memories_for_dedup()
@@ -1787,56 +2025,117 @@ class Memori:
                 ),
             )
 
-            # Check for duplicates
-            duplicate_id = await self.memory_agent.detect_duplicates(
-                processed_memory, existing_memories
+            await self._store_processed_memory(
+                chat_id, processed_memory, existing_memories
             )
 
-            if duplicate_id:
-                processed_memory.duplicate_of = duplicate_id
-                logger.info(f"Memory marked as duplicate of {duplicate_id}")
+        except Exception as e:
+            logger.error(f"Memory ingestion failed for {chat_id}: {e}")
 
-            # Apply filters
-            if self.memory_agent.should_filter_memory(
-                processed_memory, self.memory_filters
-            ):
-                logger.debug(f"Memory filtered out for chat {chat_id}")
-                return
+    @traced("process_memory_batch")
+    async def _process_memory_batch_async(self, items: List[tuple]):
+        """Process a micro-batch of (chat_id, user_input, ai_output, model) tuples"""
+        if not self.memory_agent:
+            logger.warning("Memory agent not available, skipping memory ingestion")
+            return
+
+        try:
+            existing_memories = await self._get_recent_memories_for_dedup()
+            conversations = [
+                {
+                    "chat_id": chat_id,
+                    "user_input": user_input,
+                    "ai_output": ai_output,
+                    "context": self._build_conversation_context(chat_id, model),
+                }
+                for chat_id, user_input, ai_output, model in items
+            ]
 
-            # Store processed memory with new schema
-            memory_id = self.db_manager.store_long_term_memory_enhanced(
-                processed_memory, chat_id, self.namespace
+            processed_memories = (
+                await self.memory_agent.process_conversations_batch_async(
+                    conversations,
+                    existing_memories=(
+                        [mem.summary for mem in existing_memories[:10]]
+                        if existing_memories
+                        else []
+                    ),
+                )
             )
+        except Exception as e:
+            logger.error(f"Batched memory ingestion failed for {len(items)} chats: {e}")
+            return
 
-            if memory_id:
-                logger.debug(f"Stored processed memory {memory_id} for chat {chat_id}")
+        for conversation, processed_memory in zip(conversations, processed_memories):
+            chat_id = conversation["chat_id"]
+            try:
+                await self._store_processed_memory(
+                    chat_id, processed_memory, existing_memories
+                )
+            except Exception as e:
+                logger.error(f"Memory ingestion failed for {chat_id}: {e}")
+
+    def _build_conversation_context(
+        self, chat_id: str, model: str
+    ) -> ConversationContext:
+        """Build the conversation context passed to the memory agent"""
+        return ConversationContext(
+            user_id=self.user_id,
+            session_id=self._session_id,
+            conversation_id=chat_id,
+            model_used=model,
+            user_preferences=self._user_context.get("user_preferences", []),
+            current_projects=self._user_context.get("current_projects", []),
+            relevant_skills=self._user_context.get("relevant_skills", []),
+        )
 
-                # Check for conscious context updates if promotion eligible and conscious_ingest enabled
-                if (
-                    processed_memory.promotion_eligible
-                    and self.conscious_agent
-                    and self.conscious_ingest
-                ):
-                    await self.conscious_agent.check_for_context_updates(
-                        self.db_manager, self.namespace
-                    )
-            else:
-                logger.warning(f"Failed to store memory for chat {chat_id}")
+    async def _store_processed_memory(
+        self, chat_id: str, processed_memory, existing_memories: List
+    ):
+        """Deduplicate, filter and store a processed memory, then update conscious context"""
+        # Check for duplicates
+        duplicate_id = await self.memory_agent.detect_duplicates(
+            processed_memory, existing_memories
+        )
 
-        except Exception as e:
-            logger.error(f"Memory ingestion failed for {chat_id}: {e}")
+        if duplicate_id:
+            processed_memory.duplicate_of = duplicate_id
+            logger.info(f"Memory marked as duplicate of {duplicate_id}")
+
+        # Apply filters
+        if self.memory_agent.should_filter_memory(
+            processed_memory, self.memory_filters
+        ):
+            logger.debug(f"Memory filtered out for chat {chat_id}")
+            return
+
+        # Store processed memory with new schema
+        memory_id = self.db_manager.store_long_term_memory_enhanced(
+            processed_memory, chat_id, self.namespace
+        )
+
+        if memory_id:
+            logger.debug(f"Stored processed memory {memory_id} for chat {chat_id}")
+
+            # Check for conscious context updates if promotion eligible and conscious_ingest enabled
+            if (
+                processed_memory.promotion_eligible
+                and self.conscious_agent
+                and self.conscious_ingest
+            ):
+                await self.conscious_agent.check_for_context_updates(
+                    self.db_manager, self.namespace
+                )
+        else:
+            logger.warning(f"Failed to store memory for chat {chat_id}")
 
     async def _get_recent_memories_for_dedup(self) -> List:
         """Get recent memories for deduplication check"""
         try:
-            from sqlalchemy import text
-
-            from ..database.queries.memory_queries import MemoryQueries
             from ..utils.pydantic_models import ProcessedLongTermMemory
 
             with self.db_manager._get_connection() as connection:
-                result = connection.execute(
-                    text(MemoryQueries.SELECT_MEMORIES_FOR_DEDUPLICATION),
+                result = connection.execute_compiled(
+                    "memories_for_dedup",
                     {
                         "namespace": self.namespace,
                         "processed_for_duplicates": False,
@@ -1956,13 +2255,87 @@ class Memori:
         except Exception as e:
             raise MemoriError(f"Failed to clear memory: {e}")
 
+    def cleanup_expired_memories(
+        self, retention_policy: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Delete expired short-term memories and rows past the retention policy now
+
+        Args:
+            retention_policy: Policy to apply; defaults to the sweeper's policy,
+                or only expired rows when auto_cleanup is disabled
+
+        Returns:
+            Number of deleted rows per table
+        """
+        if retention_policy is not None:
+            days = retention_days(retention_policy)
+        elif self._retention_sweeper is not None:
+            days = self._retention_sweeper.retention_days
+        else:
+            days = None
+
+        try:
+            return self.db_manager.delete_expired_memories(
+                namespace=self.namespace, retention_days=days
+            )
+        except Exception as e:
+            raise MemoriError(f"Failed to clean up expired memories: {e}")
+
+    def rebuild_search_index(
+        self, all_namespaces: bool = False, batch_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Rebuild the full-text search index in small batches
+
+        Args:
+            all_namespaces: Rebuild every namespace instead of only this instance's
+            batch_size: Rows per transaction (database manager default when None)
+
+        Returns:
+            Counts of removed and indexed entries
+        """
+        try:
+            stats = self.db_manager.rebuild_search_index(
+                namespace=None if all_namespaces else self.namespace,
+                batch_size=batch_size,
+            )
+        except Exception as e:
+            raise MemoriError(f"Failed to rebuild search index: {e}")
+
+        self.clear_context_cache()
+        return stats
+
     def get_memory_stats(self) -> Dict[str, Any]:
-        """Get memory statistics"""
+        """Get memory statistics, including cache hit/miss counters"""
         try:
-            return self.db_manager.get_memory_stats(self.namespace)
+            stats = self.db_manager.get_memory_stats(self.namespace)
         except Exception as e:
             logger.error(f"Failed to get memory stats: {e}")
-            return {}
+            stats = {}
+
+        stats["context_cache"] = self.get_context_cache_stats()
+        stats["conscious_snapshots"] = self._conscious_snapshots.get_stats()
+        if self.search_engine is not None:
+            stats["search_planner"] = self.search_engine.get_planner_stats()
+        if self._retention_sweeper is not None:
+            stats["retention"] = self._retention_sweeper.get_stats()
+        if self.db_manager.access_tracker is not None:
+            stats["access_tracking"] = self.db_manager.access_tracker.get_stats()
+        if hasattr(get_tracer(), "get_stats"):
+            stats["tracing"] = get_tracer().get_stats()
+        return stats
+
+    def get_context_cache_stats(self) -> Dict[str, Any]:
+        """Get auto-ingest retrieval cache statistics"""
+        if self._context_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._context_cache.get_stats()}
+
+    def clear_context_cache(self):
+        """Drop all cached auto-ingest retrievals"""
+        if self._context_cache is not None:
+            self._context_cache.clear()
 
     @property
     def is_enabled(self) -> bool:
@@ -2156,18 +2529,33 @@ class Memori:
         except Exception as e:
             logger.error(f"Failed to stop background analysis: {e}")
 
-    def cleanup(self):
-        """Clean up all async tasks and resources"""
+    def cleanup(self, wait: bool = True):
+        """
+        Clean up all async tasks and resources
+
+        Args:
+            wait: Drain queued memory processing (up to ingestion_drain_timeout
+                seconds) before returning. If False, queued work is discarded.
+        """
         try:
             # Cancel background tasks
             self._stop_background_analysis()
-
-            # Clean up memory processing tasks
-            if hasattr(self, "_memory_tasks"):
-                for task in self._memory_tasks.copy():
-                    if not task.done():
-                        task.cancel()
-                self._memory_tasks.clear()
+            sweeper = getattr(self, "_retention_sweeper", None)
+            if sweeper:
+                sweeper.stop()
+
+            # Drain or discard queued memory processing
+            batcher = getattr(self, "_ingestion_batcher", None)
+            if batcher:
+                batcher.close(flush=wait)
+            executor = getattr(self, "_ingestion_executor", None)
+            if executor and not executor.is_shutdown:
+                executor.shutdown(wait=wait, timeout=self.ingestion_drain_timeout)
+
+            # Release this instance's reference to the shared connection pool
+            db_manager = getattr(self, "db_manager", None)
+            if db_manager:
+                db_manager.close()
 
             logger.debug("Memori cleanup completed")
         except Exception as e:
@@ -2176,7 +2564,8 @@ class Memori:
     def __del__(self):
         """Destructor to ensure cleanup"""
         try:
-            self.cleanup()
+            # Never block garbage collection waiting for queued ingestion
+            self.cleanup(wait=False)
         except:
             pass  # Ignore errors during destruction
 
@@ -2394,21 +2783,11 @@ class Memori:
     def get_essential_conversations(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get essential conversations from short-term memory"""
         try:
-            from sqlalchemy import text
-
             # Get all conversations marked as essential
             with self.db_manager._get_connection() as connection:
-                query = """
-                SELECT memory_id, summary, category_primary, importance_score,
-                       created_at, searchable_content, processed_data
-                FROM short_term_memory
-                WHERE namespace = :namespace AND category_primary LIKE 'essential_%'
-                ORDER BY importance_score DESC, created_at DESC
-                LIMIT :limit
-                """
-
-                result = connection.execute(
-                    text(query), {"namespace": self.namespace, "limit": limit}
+                result = connection.execute_compiled(
+                    "essential_conversations",
+                    {"namespace": self.namespace, "limit": limit},
                 )
 
                 essential_conversations = []
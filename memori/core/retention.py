@@ -0,0 +1,150 @@
+"""
+Background retention sweeper
+
+Short-term memories carry an ``expires_at`` and chat history grows with every
+recorded conversation, but reads only filter expired rows out. The sweeper
+periodically deletes expired short-term memories and, depending on the
+retention policy, chat history and non-permanent short-term memories older
+than the retention window. Deletes run in bounded batches through
+``delete_expired_memories`` on a dedicated daemon thread.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from ..config.settings import RetentionPolicy
+
+RETENTION_DAYS = {
+    RetentionPolicy.DAYS_7: 7,
+    RetentionPolicy.DAYS_30: 30,
+    RetentionPolicy.DAYS_90: 90,
+    RetentionPolicy.PERMANENT: None,
+}
+
+
+def retention_days(policy) -> Optional[int]:
+    """Days kept by a retention policy (None = keep forever)"""
+    return RETENTION_DAYS[RetentionPolicy(policy)]
+
+
+class RetentionSweeper:
+    """
+    Periodically deletes expired and out-of-retention rows
+
+    Args:
+        db_manager: Database manager providing ``delete_expired_memories``
+        namespace: Namespace to sweep
+        retention_policy: RetentionPolicy value ('7_days', '30_days',
+            '90_days' or 'permanent')
+        interval_hours: Hours between sweeps
+        batch_size: Rows deleted per transaction
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        namespace: str = "default",
+        retention_policy: str = RetentionPolicy.DAYS_30,
+        interval_hours: float = 24,
+        batch_size: Optional[int] = None,
+    ):
+        if interval_hours <= 0:
+            raise ValueError("interval_hours must be positive")
+        self.db_manager = db_manager
+        self.namespace = namespace
+        self.retention_days = retention_days(retention_policy)
+        self.interval = interval_hours * 3600
+        self.batch_size = batch_size
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self.runs = 0
+        self.rows_deleted = 0
+        self.last_run: Optional[float] = None
+        self.last_result: Dict[str, Any] = {}
+
+    def start(self):
+        """Start sweeping in the background; the first sweep runs immediately"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="memori-retention-sweeper", daemon=True
+            )
+            self._thread.start()
+        logger.info(
+            f"Retention sweeper started for namespace '{self.namespace}' "
+            f"(every {self.interval / 3600:g}h, retention "
+            f"{self.retention_days if self.retention_days is not None else 'permanent'} days)"
+        )
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Retention sweep failed: {e}")
+            self._stop.wait(self.interval)
+
+    def sweep(self) -> Dict[str, Any]:
+        """Run one sweep now and return what it deleted"""
+        start = time.perf_counter()
+        deleted = self.db_manager.delete_expired_memories(
+            namespace=self.namespace,
+            retention_days=self.retention_days,
+            batch_size=self.batch_size,
+        )
+        elapsed = time.perf_counter() - start
+        total = sum(deleted.values())
+        rate = total / elapsed if elapsed > 0 else 0.0
+
+        self.runs += 1
+        self.rows_deleted += total
+        self.last_run = time.time()
+        self.last_result = {
+            **deleted,
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(rate, 1),
+        }
+
+        if total:
+            logger.info(
+                f"Retention sweep for namespace '{self.namespace}': deleted "
+                f"{deleted['short_term']} short-term memories and "
+                f"{deleted['chat_history']} chat messages in {elapsed:.2f}s "
+                f"({rate:.0f} rows/s)"
+            )
+        else:
+            logger.debug(
+                f"Retention sweep for namespace '{self.namespace}': nothing to delete"
+            )
+        return self.last_result
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.is_running,
+            "namespace": self.namespace,
+            "retention_days": self.retention_days,
+            "interval_hours": self.interval / 3600,
+            "runs": self.runs,
+            "rows_deleted": self.rows_deleted,
+            "last_run": self.last_run,
+            "last_result": self.last_result,
+        }
@@ -0,0 +1,177 @@
+"""
+Write-behind tracking of memory reads
+
+``access_count`` and ``last_accessed`` let ranking favour popular memories
+and make cold ones easy to find, but bumping them inline would turn every
+search into a write. The tracker only buffers which memories were returned;
+a daemon thread folds repeated reads of the same memory into one row update
+and flushes the buffer as a single batched UPDATE per table through
+``update_access_counts``, every ``flush_interval`` seconds or as soon as
+``max_pending`` distinct memories are waiting.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from loguru import logger
+
+TRACKED_MEMORY_TYPES = ("short_term", "long_term")
+
+
+class AccessTracker:
+    """
+    Buffers memory reads and flushes them as batched access-count updates
+
+    Args:
+        db_manager: Database manager providing ``update_access_counts``
+        flush_interval: Seconds between flushes
+        max_pending: Distinct memories buffered before an early flush
+        background: Flush on a daemon thread; when False, pending reads are
+            only written by ``flush()`` and ``stop()``
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        flush_interval: float = 5.0,
+        max_pending: int = 1000,
+        background: bool = True,
+    ):
+        if flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+        self.db_manager = db_manager
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.background = background
+
+        # (memory_type, memory_id) -> [hits, last access time]
+        self._pending: Dict[Tuple[str, str], list] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.reads_recorded = 0
+        self.rows_flushed = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.last_flush: Optional[float] = None
+
+    def record(self, results: Iterable[Any]) -> int:
+        """Buffer one read of every memory in ``results``; never touches the database"""
+        now = datetime.now()
+        recorded = 0
+        with self._lock:
+            for result in results or ():
+                if not isinstance(result, dict):
+                    continue
+                memory_id = result.get("memory_id")
+                memory_type = result.get("memory_type")
+                if not memory_id or memory_type not in TRACKED_MEMORY_TYPES:
+                    continue
+                entry = self._pending.get((memory_type, memory_id))
+                if entry is None:
+                    self._pending[(memory_type, memory_id)] = [1, now]
+                else:
+                    entry[0] += 1
+                    entry[1] = now
+                recorded += 1
+            self.reads_recorded += recorded
+            full = len(self._pending) >= self.max_pending
+
+        if recorded and self.background:
+            self._ensure_thread()
+            if full:
+                self._wake.set()
+        return recorded
+
+    def flush(self) -> int:
+        """Write all buffered reads now; returns the number of rows updated"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            try:
+                updated = self.db_manager.update_access_counts(
+                    {key: tuple(value) for key, value in batch.items()}
+                )
+            except Exception as e:
+                self.failed_flushes += 1
+                self._restore(batch)
+                logger.warning(
+                    f"Access tracking flush of {len(batch)} memories failed, "
+                    f"retrying on the next flush: {e}"
+                )
+                return 0
+
+            self.flushes += 1
+            self.rows_flushed += len(batch)
+            self.last_flush = time.time()
+            logger.debug(f"Flushed access counts for {len(batch)} memories")
+            return updated
+
+    def _restore(self, batch: Dict[Tuple[str, str], list]):
+        """Merge a batch that failed to flush back into the buffer"""
+        with self._lock:
+            for key, (hits, accessed_at) in batch.items():
+                entry = self._pending.get(key)
+                if entry is None:
+                    self._pending[key] = [hits, accessed_at]
+                else:
+                    entry[0] += hits
+                    entry[1] = max(entry[1], accessed_at)
+
+    def _ensure_thread(self):
+        if self._thread is not None or self._stop.is_set():
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="memori-access-tracker", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Access tracking flush failed: {e}")
+
+    def stop(self, flush: bool = True, timeout: Optional[float] = 5.0):
+        """Stop the flusher thread, writing pending reads first by default"""
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        if flush:
+            self.flush()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "flush_interval": self.flush_interval,
+            "pending": self.pending,
+            "reads_recorded": self.reads_recorded,
+            "rows_flushed": self.rows_flushed,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "last_flush": self.last_flush,
+        }
@@ -0,0 +1,150 @@
+"""
+Pre-built statements for the hot raw-SQL paths
+
+Conscious-context loading, essential-conversation lookups, deduplication
+candidates and conscious-memory promotion used to build a fresh ``text()``
+object on every call and send their parameters through
+``QueryParameterTranslator``, which guesses booleans from parameter names and
+value (so ``LIMIT 1`` became ``LIMIT true`` on PostgreSQL). Here each
+statement is built once per dialect with typed bind parameters: booleans are
+``Boolean`` binds that SQLAlchemy renders natively for the backend, limits are
+``Integer`` binds, and SQLAlchemy's compiled cache keeps reusing the same
+statement object. Batched access-count updates are registered here too.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import Boolean, Integer, bindparam, text
+from sqlalchemy.sql.elements import TextClause
+
+from .queries.memory_queries import MemoryQueries
+
+_CONSCIOUS_MEMORY_COLUMNS = """SELECT memory_id, processed_data, summary, searchable_content,
+       importance_score, created_at
+FROM long_term_memory
+WHERE namespace = :namespace AND classification = 'conscious-info'"""
+
+# name -> (SQL, {bind parameter: type}); untyped parameters bind as-is and a
+# None type marks an expanding (list) parameter
+QUERIES: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "conscious_memories": (
+        f"""{_CONSCIOUS_MEMORY_COLUMNS}
+ORDER BY importance_score DESC, created_at DESC""",
+        {},
+    ),
+    "unprocessed_conscious_memories": (
+        f"""{_CONSCIOUS_MEMORY_COLUMNS}
+AND conscious_processed = :conscious_processed
+ORDER BY importance_score DESC, created_at DESC""",
+        {"conscious_processed": Boolean},
+    ),
+    "conscious_context_keys": (
+        """SELECT searchable_content, summary FROM short_term_memory
+WHERE namespace = :namespace AND category_primary = 'conscious_context'""",
+        {},
+    ),
+    "insert_conscious_short_term": (
+        """INSERT INTO short_term_memory (
+    memory_id, processed_data, importance_score, category_primary,
+    retention_type, namespace, created_at, expires_at,
+    searchable_content, summary, is_permanent_context
+) VALUES (:memory_id, :processed_data, :importance_score, :category_primary,
+    :retention_type, :namespace, :created_at, :expires_at,
+    :searchable_content, :summary, :is_permanent_context)""",
+        {"is_permanent_context": Boolean},
+    ),
+    "mark_conscious_processed": (
+        """UPDATE long_term_memory
+SET conscious_processed = :conscious_processed
+WHERE namespace = :namespace AND memory_id IN :memory_ids""",
+        {"conscious_processed": Boolean, "memory_ids": None},
+    ),
+    "conscious_context": (
+        """SELECT memory_id, processed_data, importance_score,
+       category_primary, summary, searchable_content,
+       created_at, access_count, expires_at
+FROM short_term_memory
+WHERE namespace = :namespace AND (expires_at IS NULL OR expires_at > :current_time)
+ORDER BY importance_score DESC, created_at DESC""",
+        {},
+    ),
+    "essential_conversations": (
+        """SELECT memory_id, summary, category_primary, importance_score,
+       created_at, searchable_content, processed_data
+FROM short_term_memory
+WHERE namespace = :namespace AND category_primary LIKE 'essential_%'
+ORDER BY importance_score DESC, created_at DESC
+LIMIT :limit""",
+        {"limit": Integer},
+    ),
+    "memories_for_dedup": (
+        MemoryQueries.SELECT_MEMORIES_FOR_DEDUPLICATION,
+        {"processed_for_duplicates": Boolean, "limit": Integer},
+    ),
+    "record_short_term_access": (
+        """UPDATE short_term_memory
+SET access_count = COALESCE(access_count, 0) + :hits, last_accessed = :last_accessed
+WHERE memory_id = :memory_id""",
+        {"hits": Integer},
+    ),
+    "record_long_term_access": (
+        """UPDATE long_term_memory
+SET access_count = COALESCE(access_count, 0) + :hits, last_accessed = :last_accessed
+WHERE memory_id = :memory_id""",
+        {"hits": Integer},
+    ),
+}
+
+
+class CompiledQueryRegistry:
+    """
+    Builds each registered statement once and hands out the shared object
+
+    Args:
+        database_type: SQLAlchemy dialect name the statements are built for
+    """
+
+    def __init__(self, database_type: str, queries: Optional[Dict] = None):
+        self.database_type = database_type
+        self._queries = QUERIES if queries is None else queries
+        self._statements: Dict[str, TextClause] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> TextClause:
+        statement = self._statements.get(name)
+        if statement is None:
+            with self._lock:
+                statement = self._statements.get(name)
+                if statement is None:
+                    statement = self._build(name)
+                    self._statements[name] = statement
+        return statement
+
+    def _build(self, name: str) -> TextClause:
+        try:
+            sql, types = self._queries[name]
+        except KeyError:
+            raise KeyError(f"No compiled query registered as '{name}'") from None
+        statement = text(sql)
+        if types:
+            statement = statement.bindparams(
+                *(
+                    (
+                        bindparam(param, expanding=True)
+                        if type_ is None
+                        else bindparam(param, type_=type_)
+                    )
+                    for param, type_ in types.items()
+                )
+            )
+        return statement
+
+    def execute(self, connection, name: str, parameters: Optional[Dict] = None):
+        """Execute a registered statement on a SQLAlchemy connection"""
+        return connection.execute(self.get(name), parameters or {})
+
+    def warm(self):
+        """Build every registered statement up front"""
+        for name in self._queries:
+            self.get(name)
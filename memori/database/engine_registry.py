@@ -0,0 +1,184 @@
+"""
+Process-wide SQLAlchemy engine registry
+
+Every ``SQLAlchemyDatabaseManager`` used to build its own engine, so an
+application creating one ``Memori`` per user ended up with one connection
+pool, one connectivity check and one schema initialization per user. The
+registry hands out a single engine per connection URL, reference-counts its
+users and remembers which URLs already had their schema initialized.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+
+class _EngineEntry:
+    __slots__ = (
+        "engine",
+        "options",
+        "refcount",
+        "schema_initialized",
+        "lock",
+        "ready",
+    )
+
+    def __init__(self, options: Dict[str, Any]):
+        # None until the creating thread's factory returns
+        self.engine = None
+        self.options = options
+        self.refcount = 0
+        self.schema_initialized = False
+        # Serializes schema initialization for this URL
+        self.lock = threading.Lock()
+        # Set once the engine is built (or its creation failed)
+        self.ready = threading.Event()
+
+
+class EngineRegistry:
+    """Shares one engine (and connection pool) per database URL"""
+
+    def __init__(self):
+        self._entries: Dict[str, _EngineEntry] = {}
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        url: str,
+        factory: Callable[[], Any],
+        options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Return the engine registered for ``url``, creating it with ``factory``
+
+        The factory runs outside the registry lock, so building an engine (and
+        its connectivity check) for one URL never delays other URLs; callers
+        asking for the same URL meanwhile wait for that one engine.
+
+        Args:
+            url: Database connection URL used as the registry key
+            factory: Zero-argument callable that builds a new engine
+            options: Engine options the caller asked for (pool sizing, SQLite
+                profile, single writer); a mismatch with the options of an
+                existing engine is logged, the existing engine wins
+
+        Returns:
+            Shared SQLAlchemy engine
+        """
+        options = options or {}
+        while True:
+            with self._lock:
+                entry = self._entries.get(url)
+                if entry is None:
+                    entry = self._entries[url] = _EngineEntry(options)
+                    break
+                if entry.engine is not None:
+                    if options and options != entry.options:
+                        logger.warning(
+                            f"Engine registry: reusing existing engine for "
+                            f"{_redact(url)}; options {options} ignored in favour "
+                            f"of {entry.options}"
+                        )
+                    entry.refcount += 1
+                    return entry.engine
+            # Another thread is building this URL's engine; if that fails the
+            # entry is gone and the next iteration tries again
+            entry.ready.wait()
+
+        try:
+            engine = factory()
+        except BaseException:
+            with self._lock:
+                del self._entries[url]
+            entry.ready.set()
+            raise
+
+        with self._lock:
+            entry.engine = engine
+            entry.refcount += 1
+        entry.ready.set()
+        logger.debug(f"Engine registry: created engine for {_redact(url)}")
+        return engine
+
+    def release(self, url: str) -> bool:
+        """
+        Drop one reference to the engine for ``url``
+
+        Returns:
+            True if this was the last reference and the engine was disposed
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None or entry.engine is None:
+                return False
+            entry.refcount -= 1
+            if entry.refcount > 0:
+                return False
+            del self._entries[url]
+
+        entry.engine.dispose()
+        logger.debug(f"Engine registry: disposed engine for {_redact(url)}")
+        return True
+
+    def contains(self, url: str) -> bool:
+        with self._lock:
+            return url in self._entries
+
+    def initialize_schema_once(self, url: str, initializer: Callable[[], None]) -> bool:
+        """
+        Run ``initializer`` for ``url`` unless it already succeeded in this process
+
+        Returns:
+            True if the initializer ran, False if it was skipped
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None:
+            initializer()
+            return True
+
+        with entry.lock:
+            if entry.schema_initialized:
+                return False
+            initializer()
+            entry.schema_initialized = True
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return per-URL reference counts and pool status"""
+        with self._lock:
+            entries = [
+                (url, entry)
+                for url, entry in self._entries.items()
+                if entry.engine is not None
+            ]
+        return {
+            "engines": len(entries),
+            "entries": {
+                _redact(url): {
+                    "refcount": entry.refcount,
+                    "schema_initialized": entry.schema_initialized,
+                    "pool": entry.engine.pool.status(),
+                }
+                for url, entry in entries
+            },
+        }
+
+
+def _redact(url: str) -> str:
+    """Hide the password part of a connection URL for logging"""
+    if "@" not in url or "://" not in url:
+        return url
+    scheme, rest = url.split("://", 1)
+    credentials, host = rest.rsplit("@", 1)
+    user = credentials.split(":", 1)[0]
+    return f"{scheme}://{user}:***@{host}"
+
+
+_registry = EngineRegistry()
+
+
+def get_engine_registry() -> EngineRegistry:
+    """Return the process-wide engine registry"""
+    return _registry
@@ -0,0 +1,275 @@
+"""
+Composite ranking of search results
+
+Every result gets ``composite_score = search * w_search + importance *
+w_importance + recency * w_recency``. Recency decays smoothly with age
+(exponential with a configurable half-life by default; ``linear`` reproduces
+the former 30-day ramp), measured against one reference timestamp taken per
+ranking call. Scores are computed in one pass, with NumPy arrays for large
+candidate sets when it is installed, and only the top ``limit`` results are
+selected and sorted (``heapq.nlargest`` / ``numpy.argpartition``) instead of
+sorting every candidate.
+
+``sql_composite`` compiles the same score for SQLite, MySQL and PostgreSQL
+so full-text searches can order every match in the database and return the
+true top ``limit`` rows.
+"""
+
+import functools
+import heapq
+import math
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+SECONDS_PER_DAY = 86400.0
+DECAY_FUNCTIONS = ("exponential", "linear")
+
+# Age in days of a created_at column at the :rank_now bind parameter
+_SQL_AGE_DAYS = {
+    "sqlite": "(:rank_now - julianday({created_at}))",
+    "postgresql": (
+        "(EXTRACT(EPOCH FROM (CAST(:rank_now AS TIMESTAMP) - {created_at})) / 86400.0)"
+    ),
+    "mysql": "(TIMESTAMPDIFF(SECOND, {created_at}, :rank_now) / 86400.0)",
+}
+
+
+def to_timestamp(value) -> Optional[float]:
+    """POSIX timestamp of a datetime or ISO 8601 string; None if unparseable"""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return _parse_timestamp(value)
+    try:
+        # Naive values are local time, as written by datetime.now()
+        return value.timestamp()
+    except (AttributeError, TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+@functools.lru_cache(maxsize=16384)
+def _parse_timestamp(value: str) -> Optional[float]:
+    # Backends without a datetime type return created_at as text; the same
+    # memories come back search after search, so parses are cached
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (ValueError, OverflowError, OSError):
+        return None
+
+
+def _julian_day(value: datetime) -> float:
+    """Julian day number of a naive datetime, as SQLite's julianday() computes it"""
+    return (value - _UNIX_EPOCH).total_seconds() / SECONDS_PER_DAY + 2440587.5
+
+
+_UNIX_EPOCH = datetime(1970, 1, 1)
+
+
+class RankingEngine:
+    """
+    Scores and selects the top search results
+
+    Args:
+        search_weight: Weight of the full-text / vector ``search_score``
+        importance_weight: Weight of ``importance_score``
+        recency_weight: Weight of the recency score
+        recency_half_life_days: Age at which the recency score drops to 0.5
+        decay: "exponential" (halves every half-life, never reaches zero) or
+            "linear" (reaches zero at twice the half-life)
+        default_search_score: Score for results without a ``search_score``
+        default_importance: Importance for results without an ``importance_score``
+        vectorize_threshold: Candidate count from which NumPy is used; below
+            it array conversion costs more than it saves
+    """
+
+    def __init__(
+        self,
+        search_weight: float = 0.5,
+        importance_weight: float = 0.3,
+        recency_weight: float = 0.2,
+        recency_half_life_days: float = 15.0,
+        decay: str = "exponential",
+        default_search_score: float = 0.4,
+        default_importance: float = 0.5,
+        vectorize_threshold: int = 128,
+    ):
+        if recency_half_life_days <= 0:
+            raise ValueError("recency_half_life_days must be positive")
+        if decay not in DECAY_FUNCTIONS:
+            raise ValueError(
+                f"Unknown decay {decay!r}, expected one of {', '.join(DECAY_FUNCTIONS)}"
+            )
+        self.search_weight = search_weight
+        self.importance_weight = importance_weight
+        self.recency_weight = recency_weight
+        self.recency_half_life_days = recency_half_life_days
+        self.decay = decay
+        self.default_search_score = default_search_score
+        self.default_importance = default_importance
+        self.vectorize_threshold = vectorize_threshold
+
+    def recency_score(self, created_at, now: Optional[float] = None) -> float:
+        """Recency score (0-1, newer = higher) of one creation time"""
+        created = to_timestamp(created_at)
+        if created is None:
+            return 0.0
+        age_days = max(0.0, ((now or time.time()) - created) / SECONDS_PER_DAY)
+        if self.decay == "linear":
+            return max(0.0, 1.0 - age_days / (2 * self.recency_half_life_days))
+        return math.pow(0.5, age_days / self.recency_half_life_days)
+
+    def score(
+        self, results: List[Dict[str, Any]], now: Optional[float] = None
+    ) -> List[float]:
+        """Set and return ``composite_score`` for every result"""
+        scores = self._composite_scores(results, now or time.time())
+        if NUMPY_AVAILABLE and isinstance(scores, np.ndarray):
+            scores = scores.tolist()
+        for result, composite in zip(results, scores):
+            result["composite_score"] = composite
+        return scores
+
+    def rank(
+        self, results: List[Dict[str, Any]], limit: int, now: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Score ``results`` and return the best ``limit`` of them, best first"""
+        if not results or limit <= 0:
+            return []
+        scores = self._composite_scores(results, now or time.time())
+
+        if NUMPY_AVAILABLE and isinstance(scores, np.ndarray):
+            if limit >= len(results):
+                order = np.argsort(-scores, kind="stable")
+            else:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+                # Best first; ties keep their input order
+                order = top[np.lexsort((top, -scores[top]))]
+            order = order.tolist()
+            scores = scores.tolist()
+        elif limit >= len(results):
+            order = sorted(range(len(results)), key=scores.__getitem__, reverse=True)
+        else:
+            order = heapq.nlargest(limit, range(len(results)), key=scores.__getitem__)
+
+        for result, composite in zip(results, scores):
+            result["composite_score"] = composite
+        return [results[i] for i in order]
+
+    def _composite_scores(self, results: List[Dict[str, Any]], now: float):
+        """Composite scores as a NumPy array for large inputs, else a list"""
+        if NUMPY_AVAILABLE and len(results) >= self.vectorize_threshold:
+            return self._score_arrays(results, now)
+        return self._score_python(results, now)
+
+    def _inputs(self, results: List[Dict[str, Any]]):
+        """Search scores, importance scores and creation timestamps as lists"""
+        search_scores = [result.get("search_score") for result in results]
+        if None in search_scores:
+            default = self.default_search_score
+            search_scores = [default if v is None else v for v in search_scores]
+        importance_scores = [result.get("importance_score") for result in results]
+        if None in importance_scores:
+            default = self.default_importance
+            importance_scores = [default if v is None else v for v in importance_scores]
+        created = [to_timestamp(result.get("created_at")) for result in results]
+        return search_scores, importance_scores, created
+
+    def _score_python(self, results: List[Dict[str, Any]], now: float) -> List[float]:
+        search_scores, importance_scores, created = self._inputs(results)
+        half_life = self.recency_half_life_days * SECONDS_PER_DAY
+        linear = self.decay == "linear"
+        w_search = self.search_weight
+        w_importance = self.importance_weight
+        w_recency = self.recency_weight
+
+        scores = []
+        for search, importance, timestamp in zip(
+            search_scores, importance_scores, created
+        ):
+            if timestamp is None:
+                recency = 0.0
+            else:
+                age = max(0.0, now - timestamp) / half_life
+                recency = max(0.0, 1.0 - age / 2) if linear else 0.5**age
+            scores.append(
+                search * w_search + importance * w_importance + recency * w_recency
+            )
+        return scores
+
+    def _score_arrays(self, results: List[Dict[str, Any]], now: float):
+        search_scores, importance_scores, created = self._inputs(results)
+        # Missing creation times become NaN and score zero recency
+        timestamps = np.array(
+            [math.nan if value is None else value for value in created], dtype=float
+        )
+        ages = np.maximum(now - timestamps, 0.0) / (
+            self.recency_half_life_days * SECONDS_PER_DAY
+        )
+        if self.decay == "linear":
+            recency = np.maximum(1.0 - ages / 2, 0.0)
+        else:
+            recency = np.exp2(-ages)
+        recency = np.nan_to_num(recency, nan=0.0)
+
+        return (
+            np.asarray(search_scores, dtype=float) * self.search_weight
+            + np.asarray(importance_scores, dtype=float) * self.importance_weight
+            + recency * self.recency_weight
+        )
+
+    def sql_composite(
+        self, dialect: str, search_score: str, importance_score: str, created_at: str
+    ) -> str:
+        """
+        The composite score as a SQL expression over the given column expressions
+
+        Weights and the half-life are bind parameters (see ``sql_params``), so
+        the SQL text only changes with the dialect and the decay function and
+        compiled statements stay cached when weights change.
+        """
+        if dialect not in _SQL_AGE_DAYS:
+            raise ValueError(f"SQL ranking is not supported for {dialect}")
+        greatest = "MAX" if dialect == "sqlite" else "GREATEST"
+        age = f"{greatest}({_SQL_AGE_DAYS[dialect].format(created_at=created_at)}, 0.0)"
+        if self.decay == "linear":
+            recency = f"{greatest}(1.0 - {age} / (2 * :rank_half_life_days), 0.0)"
+        else:
+            recency = f"POWER(0.5, {age} / :rank_half_life_days)"
+        return (
+            f":rank_search_weight * COALESCE({search_score}, :rank_default_search_score)"
+            f" + :rank_importance_weight * COALESCE({importance_score}, :rank_default_importance)"
+            f" + :rank_recency_weight * COALESCE({recency}, 0.0)"
+        )
+
+    def sql_params(
+        self, dialect: str, now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Bind parameters for ``sql_composite``"""
+        now = now or datetime.now()
+        return {
+            "rank_now": _julian_day(now) if dialect == "sqlite" else now,
+            "rank_search_weight": self.search_weight,
+            "rank_importance_weight": self.importance_weight,
+            "rank_recency_weight": self.recency_weight,
+            "rank_half_life_days": self.recency_half_life_days,
+            "rank_default_search_score": self.default_search_score,
+            "rank_default_importance": self.default_importance,
+        }
+
+    def get_config(self) -> Dict[str, Any]:
+        return {
+            "search_weight": self.search_weight,
+            "importance_weight": self.importance_weight,
+            "recency_weight": self.recency_weight,
+            "recency_half_life_days": self.recency_half_life_days,
+            "decay": self.decay,
+        }
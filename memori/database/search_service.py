@@ -3,22 +3,168 @@ SQLAlchemy-based search service for Memori v2.0
 Provides cross-database full-text search capabilities
 """
 
+import functools
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
-from sqlalchemy import and_, desc, or_, text
+from sqlalchemy import (
+    Float,
+    and_,
+    bindparam,
+    case,
+    column,
+    desc,
+    false,
+    literal,
+    or_,
+    select,
+    text,
+    type_coerce,
+    union_all,
+)
 from sqlalchemy.orm import Session
 
+from ..utils.logging import debug_enabled
+from ..utils.tracing import ROWS, get_tracer, traced
 from .models import LongTermMemory, ShortTermMemory
+from .ranking import RankingEngine
+
+_SQLITE_FTS_QUERY = """
+            SELECT
+                memory_id,
+                memory_type,
+                category_primary,
+                processed_data,
+                importance_score,
+                created_at,
+                summary,
+                search_score,
+                search_strategy,
+                {composite} as composite_score
+            FROM (
+                SELECT
+                    fts.memory_id,
+                    fts.memory_type,
+                    fts.category_primary,
+                    COALESCE(
+                        CASE
+                            WHEN fts.memory_type = 'short_term' THEN st.processed_data
+                            WHEN fts.memory_type = 'long_term' THEN lt.processed_data
+                        END,
+                        '{{}}'
+                    ) as processed_data,
+                    COALESCE(
+                        CASE
+                            WHEN fts.memory_type = 'short_term' THEN st.importance_score
+                            WHEN fts.memory_type = 'long_term' THEN lt.importance_score
+                            ELSE 0.5
+                        END,
+                        0.5
+                    ) as importance_score,
+                    COALESCE(
+                        CASE
+                            WHEN fts.memory_type = 'short_term' THEN st.created_at
+                            WHEN fts.memory_type = 'long_term' THEN lt.created_at
+                        END,
+                        datetime('now')
+                    ) as created_at,
+                    COALESCE(fts.summary, '') as summary,
+                    {search_score} as search_score,
+                    'sqlite_fts5' as search_strategy
+                FROM memory_search_fts fts
+                LEFT JOIN short_term_memory st ON fts.memory_id = st.memory_id AND fts.memory_type = 'short_term'
+                LEFT JOIN long_term_memory lt ON fts.memory_id = lt.memory_id AND fts.memory_type = 'long_term'
+                WHERE memory_search_fts MATCH :fts_query AND fts.namespace = :namespace
+                {category_clause}
+            ) AS matches
+            ORDER BY composite_score DESC
+            LIMIT :limit
+        """
+
+# Full-text scores mapped onto [0, 1) by score / (1 + score), higher is better.
+# FTS5's bm25 rank is negative (lower is better); ts_rank's normalization flag
+# 32 applies the same mapping.
+SQLITE_FTS_SCORE = "-COALESCE(rank, 0.0) / (1.0 - COALESCE(rank, 0.0))"
+MYSQL_FULLTEXT_SCORE = "({match} / (1.0 + {match}))"
+POSTGRESQL_FTS_SCORE = "ts_rank(search_vector, to_tsquery('english', :query), 32)"
+
+
+@functools.lru_cache(maxsize=16)
+def _sqlite_fts_statement(composite: str, with_categories: bool):
+    """FTS5 search ordered by ``composite``; cached so SQLAlchemy's compiled-statement cache is reused"""
+    statement = text(
+        _SQLITE_FTS_QUERY.format(
+            composite=composite,
+            search_score=SQLITE_FTS_SCORE,
+            category_clause=(
+                "AND fts.category_primary IN :categories" if with_categories else ""
+            ),
+        )
+    )
+    if with_categories:
+        statement = statement.bindparams(bindparam("categories", expanding=True))
+    return statement
+
+
+# Structured-search categories that long-term memories also flag with a column
+LONG_TERM_CATEGORY_FLAGS = {
+    "preference": "is_preference",
+    "skill": "is_skill_knowledge",
+    "context": "is_current_project",
+}
+
+# Structured-search strategies in fill order; lower rank wins the LIMIT
+STRUCTURED_STRATEGIES = ("keyword_search", "category_filter", "importance_filter")
+
+
+def _memory_columns(model) -> list:
+    """Columns returned by search queries (avoids loading full ORM entities)"""
+    return [
+        model.memory_id,
+        model.processed_data,
+        model.importance_score,
+        model.created_at,
+        model.summary,
+        model.category_primary,
+    ]
 
 
 class SearchService:
-    """Cross-database search service using SQLAlchemy"""
+    """Cross-database search service using SQLAlchemy
+
+    A SearchService is cheap to keep around: SQLAlchemyDatabaseManager holds one
+    per thread, bound to a thread-local scoped session that is closed (returning
+    its connection to the pool) after every search.
+    """
+
+    # Reciprocal rank fusion constant and vector candidate over-fetch factor
+    RRF_K = 60
+    HYBRID_CANDIDATE_MULTIPLIER = 4
+    # Nearest neighbours below this cosine similarity are not fused; unrelated
+    # text scores roughly -0.2..0.2 with both the hashing and OpenAI embedders
+    MIN_VECTOR_SIMILARITY = 0.25
 
-    def __init__(self, session: Session, database_type: str):
+    def __init__(
+        self,
+        session: Session,
+        database_type: str,
+        embedder=None,
+        vector_index=None,
+        ranking_engine: Optional[RankingEngine] = None,
+        min_vector_similarity: Optional[float] = None,
+    ):
         self.session = session
         self.database_type = database_type
+        self.embedder = embedder
+        self.vector_index = vector_index
+        self.ranking_engine = ranking_engine or RankingEngine()
+        self.min_vector_similarity = (
+            self.MIN_VECTOR_SIMILARITY
+            if min_vector_similarity is None
+            else min_vector_similarity
+        )
 
     def search_memories(
         self,
@@ -27,6 +173,7 @@ class SearchService:
         category_filter: Optional[List[str]] = None,
         limit: int = 10,
         memory_types: Optional[List[str]] = None,
+        search_mode: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Search memories across different database backends
@@ -37,16 +184,23 @@ class SearchService:
             category_filter: List of categories to filter by
             limit: Maximum number of results
             memory_types: Types of memory to search ('short_term', 'long_term', or both)
+            search_mode: 'lexical' (full-text only) or 'hybrid' (full-text fused with
+                vector similarity); defaults to hybrid when a vector index is set.
+                Vector neighbours below ``min_vector_similarity`` are ignored, so
+                a query nothing matches still returns no results
 
         Returns:
             List of memory dictionaries with search metadata
         """
-        logger.debug(
-            f"SearchService.search_memories called - query: '{query}', namespace: '{namespace}', database: {self.database_type}, limit: {limit}"
-        )
+        debug = debug_enabled()
+        if debug:
+            logger.debug(
+                f"SearchService.search_memories called - query: '{query}', namespace: '{namespace}', database: {self.database_type}, limit: {limit}"
+            )
 
         if not query or not query.strip():
-            logger.debug("Empty query provided, returning recent memories")
+            if debug:
+                logger.debug("Empty query provided, returning recent memories")
             return self._get_recent_memories(
                 namespace, category_filter, limit, memory_types
             )
@@ -57,14 +211,16 @@ class SearchService:
         search_short_term = not memory_types or "short_term" in memory_types
         search_long_term = not memory_types or "long_term" in memory_types
 
-        logger.debug(
-            f"Memory types to search - short_term: {search_short_term}, long_term: {search_long_term}, categories: {category_filter}"
-        )
+        if debug:
+            logger.debug(
+                f"Memory types to search - short_term: {search_short_term}, long_term: {search_long_term}, categories: {category_filter}"
+            )
 
         try:
             # Try database-specific full-text search first
             if self.database_type == "sqlite":
-                logger.debug("Using SQLite FTS5 search strategy")
+                if debug:
+                    logger.debug("Using SQLite FTS5 search strategy")
                 results = self._search_sqlite_fts(
                     query,
                     namespace,
@@ -74,7 +230,8 @@ class SearchService:
                     search_long_term,
                 )
             elif self.database_type == "mysql":
-                logger.debug("Using MySQL FULLTEXT search strategy")
+                if debug:
+                    logger.debug("Using MySQL FULLTEXT search strategy")
                 results = self._search_mysql_fulltext(
                     query,
                     namespace,
@@ -84,7 +241,8 @@ class SearchService:
                     search_long_term,
                 )
             elif self.database_type == "postgresql":
-                logger.debug("Using PostgreSQL FTS search strategy")
+                if debug:
+                    logger.debug("Using PostgreSQL FTS search strategy")
                 results = self._search_postgresql_fts(
                     query,
                     namespace,
@@ -94,13 +252,15 @@ class SearchService:
                     search_long_term,
                 )
 
-            logger.debug(f"Primary search strategy returned {len(results)} results")
+            if debug:
+                logger.debug(f"Primary search strategy returned {len(results)} results")
 
             # If no results or full-text search failed, fall back to LIKE search
             if not results:
-                logger.debug(
-                    "Primary search returned no results, falling back to LIKE search"
-                )
+                if debug:
+                    logger.debug(
+                        "Primary search returned no results, falling back to LIKE search"
+                    )
                 results = self._search_like_fallback(
                     query,
                     namespace,
@@ -135,18 +295,218 @@ class SearchService:
                 )
                 results = []
 
+        if search_mode is None:
+            search_mode = "hybrid" if self.vector_index and self.embedder else "lexical"
+
+        if search_mode == "hybrid" and search_long_term:
+            try:
+                results = self._fuse_with_vector_results(
+                    results, query, namespace, category_filter, limit
+                )
+            except Exception as e:
+                logger.warning(f"Vector retrieval failed, using full-text results: {e}")
+
         final_results = self._rank_and_limit_results(results, limit)
-        logger.debug(
-            f"SearchService completed - returning {len(final_results)} final results after ranking and limiting"
-        )
+        if debug:
+            logger.debug(
+                f"SearchService completed - returning {len(final_results)} final results after ranking and limiting"
+            )
 
-        if final_results:
+        if debug and final_results:
             logger.debug(
                 f"Top result: memory_id={final_results[0].get('memory_id')}, score={final_results[0].get('composite_score', 0):.3f}, strategy={final_results[0].get('search_strategy')}"
             )
 
         return final_results
 
+    def search_structured(
+        self,
+        namespace: str = "default",
+        keywords: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        importance_threshold: Optional[float] = None,
+        since: Optional[datetime] = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Multi-strategy retrieval in a single query
+
+        Returns memories that match any of the given strategies, keyword
+        matches first, then category matches, then memories at or above
+        ``importance_threshold``. Short- and long-term memories are combined
+        with UNION ALL; every predicate (namespace, categories, importance,
+        ``since``) is evaluated by the database, which also orders and limits
+        the rows.
+
+        Keywords use the backend's full-text index (SQLite FTS5 with prefix
+        terms, PostgreSQL tsquery, MySQL FULLTEXT). If that query fails, for
+        example because the index is missing, it is retried with LIKE.
+
+        ``since`` only narrows the other strategies: without keywords,
+        categories or an importance threshold nothing is selected and the
+        result is empty.
+
+        Returns:
+            Memory dicts with ``memory_type`` and ``search_strategy`` set
+        """
+        keywords = [k.strip() for k in keywords or [] if k and k.strip()]
+        categories = [c for c in categories or [] if c]
+        if not keywords and not categories and importance_threshold is None:
+            if since is not None and debug_enabled():
+                logger.debug("Structured search with only a time range selects nothing")
+            return []
+
+        params: Dict[str, Any] = {}
+        use_fulltext = bool(keywords) and self._fulltext_params(keywords, params)
+        try:
+            statement = self._build_structured_select(
+                namespace,
+                keywords,
+                categories,
+                importance_threshold,
+                since,
+                limit,
+                use_fulltext,
+            )
+            rows = self.session.execute(statement, params).fetchall()
+        except Exception as e:
+            if not use_fulltext:
+                raise
+            logger.debug(f"Full-text structured search failed, retrying with LIKE: {e}")
+            self.session.rollback()
+            statement = self._build_structured_select(
+                namespace,
+                keywords,
+                categories,
+                importance_threshold,
+                since,
+                limit,
+                False,
+            )
+            rows = self.session.execute(statement).fetchall()
+
+        results = []
+        seen = set()
+        for row in rows:
+            memory = dict(row._mapping)
+            if memory["memory_id"] in seen:
+                continue
+            seen.add(memory["memory_id"])
+            memory["search_strategy"] = STRUCTURED_STRATEGIES[
+                memory.pop("strategy_rank")
+            ]
+            results.append(memory)
+        return results
+
+    def _fulltext_params(self, keywords: List[str], params: Dict[str, Any]) -> bool:
+        """Fill full-text query parameters; False when the backend has none"""
+        terms = [term for keyword in keywords for term in re.findall(r"\w+", keyword)]
+        if not terms:
+            return False
+        if self.database_type == "sqlite":
+            # Prefix match on every term, any term may match
+            params["fts_query"] = " OR ".join(f'"{term}"*' for term in terms)
+        elif self.database_type == "postgresql":
+            params["ts_query"] = " | ".join(f"{term}:*" for term in terms)
+        elif self.database_type == "mysql":
+            params["ft_query"] = " ".join(terms)
+        else:
+            return False
+        return True
+
+    def _keyword_predicate(self, model, memory_type: str, keywords, use_fulltext):
+        if not keywords:
+            return None
+        if not use_fulltext:
+            return or_(
+                *(
+                    field.icontains(keyword, autoescape=True)
+                    for keyword in keywords
+                    for field in (model.searchable_content, model.summary)
+                )
+            )
+        if self.database_type == "sqlite":
+            return model.memory_id.in_(
+                text(
+                    "SELECT memory_id FROM memory_search_fts "
+                    "WHERE memory_search_fts MATCH :fts_query "
+                    f"AND memory_type = '{memory_type}'"
+                ).columns(column("memory_id"))
+            )
+        if self.database_type == "postgresql":
+            return text("search_vector @@ to_tsquery('english', :ts_query)")
+        return text(
+            "MATCH(searchable_content, summary) AGAINST(:ft_query IN NATURAL LANGUAGE MODE)"
+        )
+
+    def _build_structured_select(
+        self,
+        namespace: str,
+        keywords: List[str],
+        categories: List[str],
+        importance_threshold: Optional[float],
+        since: Optional[datetime],
+        limit: int,
+        use_fulltext: bool,
+    ):
+        branches = []
+        for model, memory_type in (
+            (ShortTermMemory, "short_term"),
+            (LongTermMemory, "long_term"),
+        ):
+            keyword_match = self._keyword_predicate(
+                model, memory_type, keywords, use_fulltext
+            )
+
+            category_match = None
+            if categories:
+                category_terms = [model.category_primary.in_(categories)]
+                if model is LongTermMemory:
+                    category_terms.extend(
+                        getattr(model, LONG_TERM_CATEGORY_FLAGS[category]).is_(True)
+                        for category in categories
+                        if category in LONG_TERM_CATEGORY_FLAGS
+                    )
+                category_match = or_(*category_terms)
+
+            importance_match = None
+            if importance_threshold is not None:
+                importance_match = model.importance_score >= importance_threshold
+
+            ranked = [
+                (predicate, rank)
+                for rank, predicate in enumerate(
+                    (keyword_match, category_match, importance_match)
+                )
+                if predicate is not None
+            ]
+            statement = select(
+                *_memory_columns(model),
+                literal(memory_type).label("memory_type"),
+                (
+                    case(*ranked[:-1], else_=ranked[-1][1]).label("strategy_rank")
+                    if len(ranked) > 1
+                    else literal(ranked[0][1]).label("strategy_rank")
+                ),
+            ).where(
+                model.namespace == namespace,
+                or_(false(), *(predicate for predicate, _ in ranked)),
+            )
+            if since is not None:
+                statement = statement.where(model.created_at >= since)
+            branches.append(statement)
+
+        combined = union_all(*branches).subquery("structured")
+        return (
+            select(combined)
+            .order_by(
+                combined.c.strategy_rank,
+                desc(combined.c.importance_score),
+                desc(combined.c.created_at),
+            )
+            .limit(limit)
+        )
+
     def _search_sqlite_fts(
         self,
         query: str,
@@ -157,89 +517,52 @@ class SearchService:
         search_long_term: bool,
     ) -> List[Dict[str, Any]]:
         """Search using SQLite FTS5"""
+        debug = debug_enabled()
         try:
-            logger.debug(
-                f"SQLite FTS search starting for query: '{query}' in namespace: '{namespace}'"
-            )
+            if debug:
+                logger.debug(
+                    f"SQLite FTS search starting for query: '{query}' in namespace: '{namespace}'"
+                )
 
             # Use parameters to validate search scope
             if not search_short_term and not search_long_term:
-                logger.debug("No memory types specified for search, defaulting to both")
+                if debug:
+                    logger.debug(
+                        "No memory types specified for search, defaulting to both"
+                    )
                 search_short_term = search_long_term = True
 
-            logger.debug(
-                f"Search scope - short_term: {search_short_term}, long_term: {search_long_term}"
-            )
+            if debug:
+                logger.debug(
+                    f"Search scope - short_term: {search_short_term}, long_term: {search_long_term}"
+                )
 
             # Build FTS query
             fts_query = f'"{query.strip()}"'
-            logger.debug(f"FTS query built: {fts_query}")
 
-            # Build category filter
-            category_clause = ""
-            params = {"fts_query": fts_query, "namespace": namespace}
+            # Rank every match by composite score in SQL, keep the top ``limit``
+            params = {"fts_query": fts_query, "namespace": namespace, "limit": limit}
+            params.update(self.ranking_engine.sql_params("sqlite"))
+            statement = _sqlite_fts_statement(
+                self._sql_composite("search_score"), bool(category_filter)
+            )
 
+            # Build category filter
             if category_filter:
-                category_placeholders = ",".join(
-                    [f":cat_{i}" for i in range(len(category_filter))]
-                )
-                category_clause = (
-                    f"AND fts.category_primary IN ({category_placeholders})"
-                )
-                for i, cat in enumerate(category_filter):
-                    params[f"cat_{i}"] = cat
-                logger.debug(f"Category filter applied: {category_filter}")
-
-            # SQLite FTS5 search query with COALESCE to handle NULL values
-            sql_query = f"""
-                SELECT
-                    fts.memory_id,
-                    fts.memory_type,
-                    fts.category_primary,
-                    COALESCE(
-                        CASE
-                            WHEN fts.memory_type = 'short_term' THEN st.processed_data
-                            WHEN fts.memory_type = 'long_term' THEN lt.processed_data
-                        END,
-                        '{{}}'
-                    ) as processed_data,
-                    COALESCE(
-                        CASE
-                            WHEN fts.memory_type = 'short_term' THEN st.importance_score
-                            WHEN fts.memory_type = 'long_term' THEN lt.importance_score
-                            ELSE 0.5
-                        END,
-                        0.5
-                    ) as importance_score,
-                    COALESCE(
-                        CASE
-                            WHEN fts.memory_type = 'short_term' THEN st.created_at
-                            WHEN fts.memory_type = 'long_term' THEN lt.created_at
-                        END,
-                        datetime('now')
-                    ) as created_at,
-                    COALESCE(fts.summary, '') as summary,
-                    COALESCE(rank, 0.0) as search_score,
-                    'sqlite_fts5' as search_strategy
-                FROM memory_search_fts fts
-                LEFT JOIN short_term_memory st ON fts.memory_id = st.memory_id AND fts.memory_type = 'short_term'
-                LEFT JOIN long_term_memory lt ON fts.memory_id = lt.memory_id AND fts.memory_type = 'long_term'
-                WHERE memory_search_fts MATCH :fts_query AND fts.namespace = :namespace
-                {category_clause}
-                ORDER BY search_score, importance_score DESC
-                LIMIT {limit}
-            """
+                params["categories"] = list(category_filter)
 
-            logger.debug(f"Executing SQLite FTS query with params: {params}")
-            result = self.session.execute(text(sql_query), params)
-            rows = [dict(row) for row in result]
-            logger.debug(f"SQLite FTS search returned {len(rows)} results")
+            if debug:
+                logger.debug(f"Executing SQLite FTS query with params: {params}")
+            result = self.session.execute(statement, params)
+            rows = [dict(row._mapping) for row in result]
 
             # Log details of first result for debugging
-            if rows:
-                logger.debug(
-                    f"Sample result: memory_id={rows[0].get('memory_id')}, type={rows[0].get('memory_type')}, score={rows[0].get('search_score')}"
-                )
+            if debug:
+                logger.debug(f"SQLite FTS search returned {len(rows)} results")
+                if rows:
+                    logger.debug(
+                        f"Sample result: memory_id={rows[0].get('memory_id')}, type={rows[0].get('memory_type')}, score={rows[0].get('search_score')}"
+                    )
 
             return rows
 
@@ -265,81 +588,23 @@ class SearchService:
         search_long_term: bool,
     ) -> List[Dict[str, Any]]:
         """Search using MySQL FULLTEXT"""
-        results = []
-
         try:
-            # Apply limit proportionally between memory types
-            short_limit = (
-                limit // 2 if search_short_term and search_long_term else limit
+            match_sql = (
+                "MATCH(searchable_content, summary) "
+                "AGAINST(:query IN NATURAL LANGUAGE MODE)"
             )
-            long_limit = (
-                limit - short_limit if search_short_term and search_long_term else limit
+            return self._search_fulltext(
+                "mysql_fulltext",
+                text(match_sql),
+                MYSQL_FULLTEXT_SCORE.format(match=match_sql),
+                {"query": query},
+                namespace,
+                category_filter,
+                limit,
+                search_short_term,
+                search_long_term,
             )
 
-            # Search short-term memory if requested
-            if search_short_term:
-                short_query = self.session.query(ShortTermMemory).filter(
-                    ShortTermMemory.namespace == namespace
-                )
-
-                # Add FULLTEXT search
-                fulltext_condition = text(
-                    "MATCH(searchable_content, summary) AGAINST(:query IN NATURAL LANGUAGE MODE)"
-                ).params(query=query)
-                short_query = short_query.filter(fulltext_condition)
-
-                # Add category filter
-                if category_filter:
-                    short_query = short_query.filter(
-                        ShortTermMemory.category_primary.in_(category_filter)
-                    )
-
-                # Add relevance score and limit
-                short_results = self.session.execute(
-                    short_query.statement.add_columns(
-                        text(
-                            "MATCH(searchable_content, summary) AGAINST(:query IN NATURAL LANGUAGE MODE) as search_score"
-                        ).params(query=query),
-                        text("'short_term' as memory_type"),
-                        text("'mysql_fulltext' as search_strategy"),
-                    ).limit(short_limit)
-                ).fetchall()
-
-                results.extend([dict(row) for row in short_results])
-
-            # Search long-term memory if requested
-            if search_long_term:
-                long_query = self.session.query(LongTermMemory).filter(
-                    LongTermMemory.namespace == namespace
-                )
-
-                # Add FULLTEXT search
-                fulltext_condition = text(
-                    "MATCH(searchable_content, summary) AGAINST(:query IN NATURAL LANGUAGE MODE)"
-                ).params(query=query)
-                long_query = long_query.filter(fulltext_condition)
-
-                # Add category filter
-                if category_filter:
-                    long_query = long_query.filter(
-                        LongTermMemory.category_primary.in_(category_filter)
-                    )
-
-                # Add relevance score and limit
-                long_results = self.session.execute(
-                    long_query.statement.add_columns(
-                        text(
-                            "MATCH(searchable_content, summary) AGAINST(:query IN NATURAL LANGUAGE MODE) as search_score"
-                        ).params(query=query),
-                        text("'long_term' as memory_type"),
-                        text("'mysql_fulltext' as search_strategy"),
-                    ).limit(long_limit)
-                ).fetchall()
-
-                results.extend([dict(row) for row in long_results])
-
-            return results
-
         except Exception as e:
             logger.error(
                 f"MySQL FULLTEXT search failed for query '{query}' in namespace '{namespace}': {e}"
@@ -362,88 +627,22 @@ class SearchService:
         search_long_term: bool,
     ) -> List[Dict[str, Any]]:
         """Search using PostgreSQL tsvector"""
-        results = []
-
         try:
-            # Apply limit proportionally between memory types
-            short_limit = (
-                limit // 2 if search_short_term and search_long_term else limit
-            )
-            long_limit = (
-                limit - short_limit if search_short_term and search_long_term else limit
-            )
-
             # Prepare query for tsquery - handle spaces and special characters
             # Convert simple query to tsquery format (join words with &)
             tsquery_text = " & ".join(query.split())
 
-            # Search short-term memory if requested
-            if search_short_term:
-                short_query = self.session.query(ShortTermMemory).filter(
-                    ShortTermMemory.namespace == namespace
-                )
-
-                # Add tsvector search
-                ts_query = text(
-                    "search_vector @@ to_tsquery('english', :query)"
-                ).params(query=tsquery_text)
-                short_query = short_query.filter(ts_query)
-
-                # Add category filter
-                if category_filter:
-                    short_query = short_query.filter(
-                        ShortTermMemory.category_primary.in_(category_filter)
-                    )
-
-                # Add relevance score and limit
-                short_results = self.session.execute(
-                    short_query.statement.add_columns(
-                        text(
-                            "ts_rank(search_vector, to_tsquery('english', :query)) as search_score"
-                        ).params(query=tsquery_text),
-                        text("'short_term' as memory_type"),
-                        text("'postgresql_fts' as search_strategy"),
-                    )
-                    .order_by(text("search_score DESC"))
-                    .limit(short_limit)
-                ).fetchall()
-
-                results.extend([dict(row) for row in short_results])
-
-            # Search long-term memory if requested
-            if search_long_term:
-                long_query = self.session.query(LongTermMemory).filter(
-                    LongTermMemory.namespace == namespace
-                )
-
-                # Add tsvector search
-                ts_query = text(
-                    "search_vector @@ to_tsquery('english', :query)"
-                ).params(query=tsquery_text)
-                long_query = long_query.filter(ts_query)
-
-                # Add category filter
-                if category_filter:
-                    long_query = long_query.filter(
-                        LongTermMemory.category_primary.in_(category_filter)
-                    )
-
-                # Add relevance score and limit
-                long_results = self.session.execute(
-                    long_query.statement.add_columns(
-                        text(
-                            "ts_rank(search_vector, to_tsquery('english', :query)) as search_score"
-                        ).params(query=tsquery_text),
-                        text("'long_term' as memory_type"),
-                        text("'postgresql_fts' as search_strategy"),
-                    )
-                    .order_by(text("search_score DESC"))
-                    .limit(long_limit)
-                ).fetchall()
-
-                results.extend([dict(row) for row in long_results])
-
-            return results
+            return self._search_fulltext(
+                "postgresql_fts",
+                text("search_vector @@ to_tsquery('english', :query)"),
+                POSTGRESQL_FTS_SCORE,
+                {"query": tsquery_text},
+                namespace,
+                category_filter,
+                limit,
+                search_short_term,
+                search_long_term,
+            )
 
         except Exception as e:
             logger.error(
@@ -457,6 +656,84 @@ class SearchService:
             self.session.rollback()
             return []
 
+    def _search_fulltext(
+        self,
+        strategy: str,
+        match_clause,
+        score_sql: str,
+        params: Dict[str, Any],
+        namespace: str,
+        category_filter: Optional[List[str]],
+        limit: int,
+        search_short_term: bool,
+        search_long_term: bool,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a backend full-text match over the selected memory tables
+
+        Both tables are ranked together by composite score in SQL, so the
+        database returns the overall top ``limit`` rather than a fixed share
+        per memory type ordered by text relevance alone.
+        """
+        selects = [
+            self._build_fulltext_select(
+                model,
+                memory_type,
+                strategy,
+                match_clause,
+                score_sql,
+                namespace,
+                category_filter,
+            )
+            for model, memory_type, enabled in (
+                (ShortTermMemory, "short_term", search_short_term),
+                (LongTermMemory, "long_term", search_long_term),
+            )
+            if enabled
+        ]
+        if not selects:
+            return []
+
+        combined = (selects[0] if len(selects) == 1 else union_all(*selects)).subquery()
+        statement = (
+            select(combined).order_by(desc(combined.c.composite_score)).limit(limit)
+        )
+        params = dict(params, **self.ranking_engine.sql_params(self.database_type))
+        return [dict(row._mapping) for row in self.session.execute(statement, params)]
+
+    def _build_fulltext_select(
+        self,
+        model,
+        memory_type: str,
+        strategy: str,
+        match_clause,
+        score_sql: str,
+        namespace: str,
+        category_filter: Optional[List[str]],
+    ):
+        """Build a Core SELECT for a backend full-text match on one memory table"""
+        statement = select(
+            *_memory_columns(model),
+            literal(memory_type).label("memory_type"),
+            literal(strategy).label("search_strategy"),
+        ).where(model.namespace == namespace, match_clause)
+
+        if category_filter:
+            statement = statement.where(model.category_primary.in_(category_filter))
+
+        return statement.add_columns(
+            type_coerce(text(score_sql), Float).label("search_score"),
+            type_coerce(text(self._sql_composite(score_sql)), Float).label(
+                "composite_score"
+            ),
+        )
+
+    def _sql_composite(self, search_score: str) -> str:
+        """Composite score over the current row's columns, see RankingEngine"""
+        return self.ranking_engine.sql_composite(
+            self.database_type, search_score, "importance_score", "created_at"
+        )
+
     def _search_like_fallback(
         self,
         query: str,
@@ -467,9 +744,11 @@ class SearchService:
         search_long_term: bool,
     ) -> List[Dict[str, Any]]:
         """Fallback LIKE-based search with improved flexibility"""
-        logger.debug(
-            f"Starting LIKE fallback search for query: '{query}' in namespace: '{namespace}'"
-        )
+        debug = debug_enabled()
+        if debug:
+            logger.debug(
+                f"Starting LIKE fallback search for query: '{query}' in namespace: '{namespace}'"
+            )
         results = []
 
         # Create multiple search patterns for better matching
@@ -484,109 +763,58 @@ class SearchService:
                 if len(word) > 2:  # Skip very short words
                     search_patterns.append(f"%{word}%")
 
-        logger.debug(f"LIKE search patterns: {search_patterns}")
-
-        # Search short-term memory
-        if search_short_term:
-            # Build OR conditions for all search patterns
-            search_conditions = []
-            for pattern in search_patterns:
-                search_conditions.extend(
-                    [
-                        ShortTermMemory.searchable_content.like(pattern),
-                        ShortTermMemory.summary.like(pattern),
-                    ]
-                )
-
-            short_query = self.session.query(ShortTermMemory).filter(
-                and_(
-                    ShortTermMemory.namespace == namespace,
-                    or_(*search_conditions),
-                )
-            )
+        if debug:
+            logger.debug(f"LIKE search patterns: {search_patterns}")
 
-            if category_filter:
-                short_query = short_query.filter(
-                    ShortTermMemory.category_primary.in_(category_filter)
-                )
-
-            short_results = (
-                short_query.order_by(
-                    desc(ShortTermMemory.importance_score),
-                    desc(ShortTermMemory.created_at),
-                )
-                .limit(limit)
-                .all()
-            )
-
-            logger.debug(f"LIKE fallback found {len(short_results)} short-term results")
-
-            for result in short_results:
-                memory_dict = {
-                    "memory_id": result.memory_id,
-                    "memory_type": "short_term",
-                    "processed_data": result.processed_data,
-                    "importance_score": result.importance_score,
-                    "created_at": result.created_at,
-                    "summary": result.summary,
-                    "category_primary": result.category_primary,
-                    "search_score": 0.4,  # Fixed score for LIKE search
-                    "search_strategy": f"{self.database_type}_like_fallback",
-                }
-                results.append(memory_dict)
+        # Search short-term and long-term memory
+        for model, memory_type, enabled in (
+            (ShortTermMemory, "short_term", search_short_term),
+            (LongTermMemory, "long_term", search_long_term),
+        ):
+            if not enabled:
+                continue
 
-        # Search long-term memory
-        if search_long_term:
             # Build OR conditions for all search patterns
             search_conditions = []
             for pattern in search_patterns:
                 search_conditions.extend(
                     [
-                        LongTermMemory.searchable_content.like(pattern),
-                        LongTermMemory.summary.like(pattern),
+                        model.searchable_content.like(pattern),
+                        model.summary.like(pattern),
                     ]
                 )
 
-            long_query = self.session.query(LongTermMemory).filter(
+            statement = select(*_memory_columns(model)).where(
                 and_(
-                    LongTermMemory.namespace == namespace,
+                    model.namespace == namespace,
                     or_(*search_conditions),
                 )
             )
 
             if category_filter:
-                long_query = long_query.filter(
-                    LongTermMemory.category_primary.in_(category_filter)
-                )
-
-            long_results = (
-                long_query.order_by(
-                    desc(LongTermMemory.importance_score),
-                    desc(LongTermMemory.created_at),
-                )
-                .limit(limit)
-                .all()
-            )
-
-            logger.debug(f"LIKE fallback found {len(long_results)} long-term results")
-
-            for result in long_results:
-                memory_dict = {
-                    "memory_id": result.memory_id,
-                    "memory_type": "long_term",
-                    "processed_data": result.processed_data,
-                    "importance_score": result.importance_score,
-                    "created_at": result.created_at,
-                    "summary": result.summary,
-                    "category_primary": result.category_primary,
-                    "search_score": 0.4,  # Fixed score for LIKE search
-                    "search_strategy": f"{self.database_type}_like_fallback",
-                }
+                statement = statement.where(model.category_primary.in_(category_filter))
+
+            rows = self.session.execute(
+                statement.order_by(
+                    desc(model.importance_score),
+                    desc(model.created_at),
+                ).limit(limit)
+            ).fetchall()
+
+            if debug:
+                logger.debug(f"LIKE fallback found {len(rows)} {memory_type} results")
+
+            for row in rows:
+                memory_dict = dict(row._mapping)
+                memory_dict["memory_type"] = memory_type
+                memory_dict["search_score"] = 0.4  # Fixed score for LIKE search
+                memory_dict["search_strategy"] = f"{self.database_type}_like_fallback"
                 results.append(memory_dict)
 
-        logger.debug(
-            f"LIKE fallback search completed, returning {len(results)} total results"
-        )
+        if debug:
+            logger.debug(
+                f"LIKE fallback search completed, returning {len(results)} total results"
+            )
         return results
 
     def _get_recent_memories(
@@ -602,99 +830,129 @@ class SearchService:
         search_short_term = not memory_types or "short_term" in memory_types
         search_long_term = not memory_types or "long_term" in memory_types
 
-        # Get recent short-term memories
-        if search_short_term:
-            short_query = self.session.query(ShortTermMemory).filter(
-                ShortTermMemory.namespace == namespace
+        # Get recent short-term and long-term memories
+        for model, memory_type, enabled in (
+            (ShortTermMemory, "short_term", search_short_term),
+            (LongTermMemory, "long_term", search_long_term),
+        ):
+            if not enabled:
+                continue
+
+            statement = select(*_memory_columns(model)).where(
+                model.namespace == namespace
             )
 
             if category_filter:
-                short_query = short_query.filter(
-                    ShortTermMemory.category_primary.in_(category_filter)
-                )
+                statement = statement.where(model.category_primary.in_(category_filter))
 
-            short_results = (
-                short_query.order_by(desc(ShortTermMemory.created_at))
-                .limit(limit // 2)
-                .all()
-            )
-
-            for result in short_results:
-                memory_dict = {
-                    "memory_id": result.memory_id,
-                    "memory_type": "short_term",
-                    "processed_data": result.processed_data,
-                    "importance_score": result.importance_score,
-                    "created_at": result.created_at,
-                    "summary": result.summary,
-                    "category_primary": result.category_primary,
-                    "search_score": 1.0,
-                    "search_strategy": "recent_memories",
-                }
+            rows = self.session.execute(
+                statement.order_by(desc(model.created_at)).limit(limit // 2)
+            ).fetchall()
+
+            for row in rows:
+                memory_dict = dict(row._mapping)
+                memory_dict["memory_type"] = memory_type
+                memory_dict["search_score"] = 1.0
+                memory_dict["search_strategy"] = "recent_memories"
                 results.append(memory_dict)
 
-        # Get recent long-term memories
-        if search_long_term:
-            long_query = self.session.query(LongTermMemory).filter(
-                LongTermMemory.namespace == namespace
+        return results
+
+    def _fuse_with_vector_results(
+        self,
+        lexical_results: List[Dict[str, Any]],
+        query: str,
+        namespace: str,
+        category_filter: Optional[List[str]],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Merge full-text results with nearest long-term memories using reciprocal rank fusion"""
+        if not self.vector_index or not self.embedder:
+            return lexical_results
+
+        # Every neighbour would earn a rank credit, so drop the unrelated ones
+        vector_hits = [
+            (memory_id, similarity)
+            for memory_id, similarity in self.vector_index.search(
+                namespace,
+                self.embedder.embed_one(query),
+                limit * self.HYBRID_CANDIDATE_MULTIPLIER,
             )
+            if similarity >= self.min_vector_similarity
+        ]
+        if not vector_hits:
+            return lexical_results
 
-            if category_filter:
-                long_query = long_query.filter(
-                    LongTermMemory.category_primary.in_(category_filter)
-                )
+        fused: Dict[str, Dict[str, Any]] = {}
+        for rank, result in enumerate(self._order_by_text_relevance(lexical_results)):
+            entry = dict(result)
+            entry["rrf_score"] = 1.0 / (self.RRF_K + rank + 1)
+            fused[result["memory_id"]] = entry
 
-            long_results = (
-                long_query.order_by(desc(LongTermMemory.created_at))
-                .limit(limit // 2)
-                .all()
-            )
-
-            for result in long_results:
-                memory_dict = {
-                    "memory_id": result.memory_id,
-                    "memory_type": "long_term",
-                    "processed_data": result.processed_data,
-                    "importance_score": result.importance_score,
-                    "created_at": result.created_at,
-                    "summary": result.summary,
-                    "category_primary": result.category_primary,
-                    "search_score": 1.0,
-                    "search_strategy": "recent_memories",
-                }
-                results.append(memory_dict)
+        missing_ids = [
+            memory_id for memory_id, _ in vector_hits if memory_id not in fused
+        ]
+        rows_by_id = self._fetch_long_term_rows(missing_ids, namespace, category_filter)
+
+        for rank, (memory_id, similarity) in enumerate(vector_hits):
+            entry = fused.get(memory_id)
+            if entry is None:
+                row = rows_by_id.get(memory_id)
+                if row is None:
+                    # Filtered out by category, or deleted since the index loaded
+                    continue
+                entry = row
+                entry["memory_type"] = "long_term"
+                entry["rrf_score"] = 0.0
+                fused[memory_id] = entry
+            entry["rrf_score"] += 1.0 / (self.RRF_K + rank + 1)
+            entry["vector_score"] = similarity
+
+        # Best possible fused score is first place in both lists
+        max_score = 2.0 / (self.RRF_K + 1)
+        for entry in fused.values():
+            entry["search_score"] = entry["rrf_score"] / max_score
+            entry["search_strategy"] = "hybrid_rrf"
+
+        return list(fused.values())
+
+    def _order_by_text_relevance(
+        self, results: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Order full-text results best-first by normalized text score"""
+        return sorted(results, key=lambda r: r.get("search_score") or 0.0, reverse=True)
 
-        return results
+    def _fetch_long_term_rows(
+        self,
+        memory_ids: List[str],
+        namespace: str,
+        category_filter: Optional[List[str]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load search result columns for long-term memories by id"""
+        if not memory_ids:
+            return {}
+
+        statement = select(*_memory_columns(LongTermMemory)).where(
+            LongTermMemory.namespace == namespace,
+            LongTermMemory.memory_id.in_(memory_ids),
+        )
+        if category_filter:
+            statement = statement.where(
+                LongTermMemory.category_primary.in_(category_filter)
+            )
+
+        return {
+            row.memory_id: dict(row._mapping) for row in self.session.execute(statement)
+        }
 
+    @traced("rank_results")
     def _rank_and_limit_results(
         self, results: List[Dict[str, Any]], limit: int
     ) -> List[Dict[str, Any]]:
         """Rank and limit search results"""
-        # Calculate composite score
-        for result in results:
-            search_score = result.get("search_score", 0.4)
-            importance_score = result.get("importance_score", 0.5)
-            recency_score = self._calculate_recency_score(result.get("created_at"))
-
-            # Weighted composite score
-            result["composite_score"] = (
-                search_score * 0.5 + importance_score * 0.3 + recency_score * 0.2
-            )
-
-        # Sort by composite score and limit
-        results.sort(key=lambda x: x.get("composite_score", 0), reverse=True)
-        return results[:limit]
+        get_tracer().observe(ROWS, len(results), stage="rank_results")
+        return self.ranking_engine.rank(results, limit)
 
     def _calculate_recency_score(self, created_at) -> float:
         """Calculate recency score (0-1, newer = higher)"""
-        try:
-            if not created_at:
-                return 0.0
-
-            if isinstance(created_at, str):
-                created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-
-            days_old = (datetime.now() - created_at).days
-            return max(0, 1 - (days_old / 30))  # Full score for recent, 0 after 30 days
-        except:
-            return 0.0
+        return self.ranking_engine.recency_score(created_at)
@@ -3,25 +3,36 @@ SQLAlchemy-based database manager for Memori v2.0
 Replaces the existing database.py with cross-database compatibility
 """
 
+import functools
 import importlib.util
 import json
 import ssl
+import threading
 import uuid
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import parse_qs, urlparse
 
 from loguru import logger
-from sqlalchemy import create_engine, func, text
+from sqlalchemy import and_, bindparam, create_engine, func, or_, select, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import scoped_session, sessionmaker
 
+from ..utils.embeddings import embedding_text
 from ..utils.exceptions import DatabaseError
+from ..utils.logging import debug_enabled
 from ..utils.pydantic_models import (
     ProcessedLongTermMemory,
 )
+from ..utils.tracing import ROWS, get_tracer, instrument_engine, traced
+from . import sqlite_fts
+from .access_tracker import AccessTracker
 from .auto_creator import DatabaseAutoCreator
+from .compiled_queries import CompiledQueryRegistry
+from .engine_registry import get_engine_registry
 from .models import (
     Base,
     ChatHistory,
@@ -29,42 +40,267 @@ from .models import (
     ShortTermMemory,
 )
 from .query_translator import QueryParameterTranslator
+from .ranking import RankingEngine
 from .search_service import SearchService
+from .sqlite_tuning import (
+    apply_sqlite_profile,
+    get_sqlite_pragmas,
+    get_write_queue,
+    register_sqlite_functions,
+    stop_write_queue,
+)
+from .write_listeners import WriteListeners, get_write_listeners
+
+
+def _serialized_write(method):
+    """Route a manager method through SQLAlchemyDatabaseManager.run_write"""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return self.run_write(lambda: method(self, *args, **kwargs))
+
+    return wrapper
+
+
+class TranslatingConnection:
+    """Wrapper that adds parameter translation to SQLAlchemy connections"""
+
+    def __init__(self, conn, translator, compiled_queries):
+        self._conn = conn
+        self._translator = translator
+        self._compiled_queries = compiled_queries
+
+    def execute(self, query, parameters=None):
+        """Execute query with automatic parameter translation"""
+        if parameters:
+            # Handle both text() queries and raw strings
+            if hasattr(query, "text"):
+                # SQLAlchemy text() object
+                translated_params = self._translator.translate_parameters(parameters)
+                return self._conn.execute(query, translated_params)
+            else:
+                # Raw string query
+                translated_params = self._translator.translate_parameters(parameters)
+                return self._conn.execute(text(str(query)), translated_params)
+        else:
+            return self._conn.execute(query)
+
+    def execute_compiled(self, name, parameters=None):
+        """Execute a pre-built statement; its typed binds need no translation"""
+        return self._compiled_queries.execute(self._conn, name, parameters)
+
+    def commit(self):
+        """Commit transaction"""
+        return self._conn.commit()
+
+    def rollback(self):
+        """Rollback transaction"""
+        return self._conn.rollback()
+
+    def close(self):
+        """Close connection"""
+        return self._conn.close()
+
+    def fetchall(self):
+        """Compatibility method for cursor-like usage"""
+        # This is for backwards compatibility with code that expects cursor.fetchall()
+        return []
+
+    def scalar(self):
+        """Compatibility method for cursor-like usage"""
+        return None
+
+    def __getattr__(self, name):
+        """Delegate unknown attributes to the underlying connection"""
+        return getattr(self._conn, name)
 
 
 class SQLAlchemyDatabaseManager:
     """SQLAlchemy-based database manager with cross-database support"""
 
+    # Bulk inserts at least this large index FTS in one pass instead of per-row triggers
+    BULK_FTS_SINGLE_PASS_THRESHOLD = 500
+
+    # Rows per transaction when rebuilding search indexes
+    SEARCH_INDEX_BATCH_SIZE = 1000
+
     def __init__(
-        self, database_connect: str, template: str = "basic", schema_init: bool = True
+        self,
+        database_connect: str,
+        template: str = "basic",
+        schema_init: bool = True,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_timeout: Optional[float] = None,
+        pool_recycle: Optional[int] = None,
+        share_engine: bool = True,
+        sqlite_profile: str = "balanced",
+        sqlite_single_writer: bool = True,
+        defer_init: bool = False,
     ):
+        """
+        Args:
+            database_connect: Database connection string
+            template: Memory template to use
+            schema_init: Create tables and search indexes if missing
+            pool_size: Connections kept open in the pool (SQLAlchemy default if None)
+            max_overflow: Extra connections allowed above pool_size
+            pool_timeout: Seconds to wait for a free pooled connection
+            pool_recycle: Seconds after which pooled connections are replaced
+            share_engine: Reuse the process-wide engine (and pool) registered for
+                this URL instead of creating a private one
+            sqlite_profile: SQLite PRAGMA profile applied to every connection
+                ('default', 'balanced', 'performance' or 'durable')
+            sqlite_single_writer: Serialize SQLite writes through one writer
+                thread per engine; reads are not affected
+            defer_init: Do not create the database, engine or (with
+                schema_init) the schema until the first operation needs them
+        """
         self.database_connect = database_connect
         self.template = template
         self.schema_init = schema_init
+        self.pool_options = {
+            key: value
+            for key, value in (
+                ("pool_size", pool_size),
+                ("max_overflow", max_overflow),
+                ("pool_timeout", pool_timeout),
+                ("pool_recycle", pool_recycle),
+            )
+            if value is not None
+        }
 
-        # Initialize database auto-creator
-        self.auto_creator = DatabaseAutoCreator(schema_init)
+        get_sqlite_pragmas(sqlite_profile)  # Fail fast on unknown profiles
+        self.sqlite_profile = sqlite_profile
 
-        # Ensure database exists (create if necessary)
-        self.database_connect = self.auto_creator.ensure_database_exists(
+        # In-memory SQLite databases are private to their engine, never share them
+        self.share_engine = share_engine and not self._is_memory_sqlite(
             database_connect
         )
+        self._engine_registry = get_engine_registry()
+        self._closed = False
+
+        # Initialize database auto-creator
+        self.auto_creator = DatabaseAutoCreator(schema_init)
+        self.sqlite_single_writer = sqlite_single_writer
+
+        # Known from the URL, so nothing below needs a connection to learn it
+        self.database_type = make_url(database_connect).get_backend_name()
 
-        # Parse connection string and create engine
-        self.engine = self._create_engine(self.database_connect)
-        self.database_type = self.engine.dialect.name
+        self._connected = False
+        self._connect_lock = threading.RLock()
+        self._schema_init_on_connect = False
 
-        # Create session factory
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        # Optional vector retrieval, enabled with enable_vector_search()
+        self.embedder = None
+        self.vector_index = None
+        self.min_vector_similarity = SearchService.MIN_VECTOR_SIMILARITY
+
+        # Composite scoring of search results, replaceable with set_ranking()
+        self.ranking_engine = RankingEngine()
+
+        # Optional write-behind read tracking, see enable_access_tracking()
+        self.access_tracker = None
+
+        # Callbacks notified after memory writes, see add_write_listener().
+        # Shared by every manager of the same database so each Memori
+        # instance's caches see writes made through the others
+        self._write_listeners = (
+            WriteListeners()
+            if self._is_memory_sqlite(database_connect)
+            else get_write_listeners(database_connect)
+        )
 
-        # Initialize search service
-        self._search_service = None
+        # Set when the SQLite FTS index was (re)created during schema setup
+        self._fts_needs_indexing = False
 
         # Initialize query parameter translator for cross-database compatibility
         self.query_translator = QueryParameterTranslator(self.database_type)
+        self.compiled_queries = CompiledQueryRegistry(self.database_type)
+
+        if defer_init:
+            # Attributes in _CONNECTION_ATTRIBUTES are created by __getattr__
+            # on first access; initialize_schema() then runs on connect
+            self._schema_init_on_connect = schema_init
+        else:
+            self._connect()
 
         logger.info(f"Initialized SQLAlchemy database manager for {self.database_type}")
 
+    # Attributes created by _connect(); accessing one connects a deferred manager
+    _CONNECTION_ATTRIBUTES = frozenset(
+        ("engine", "SessionLocal", "_search_sessions", "_search_local", "_write_queue")
+    )
+
+    def __getattr__(self, name):
+        # Only reached for missing attributes; __dict__ avoids recursing here
+        # from a half-constructed instance
+        connected = self.__dict__.get("_connected", True)
+        if name in self._CONNECTION_ATTRIBUTES and not connected:
+            self._connect()
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def _connect(self):
+        """Create the database (if needed), the engine and the session factories"""
+        with self._connect_lock:
+            if self._connected:
+                return
+            database_connect = self.database_connect
+            # Ensure database exists (create if necessary); a registered engine
+            # means another instance already did this for the same URL
+            if not (
+                self.share_engine
+                and self._engine_registry.contains(database_connect)
+            ):
+                self.database_connect = self.auto_creator.ensure_database_exists(
+                    database_connect
+                )
+
+            # Parse connection string and create (or reuse) the engine
+            if self.share_engine:
+                self.engine = self._engine_registry.acquire(
+                    self.database_connect,
+                    lambda: self._create_engine(self.database_connect),
+                    self._engine_options(),
+                )
+            else:
+                self.engine = self._create_engine(self.database_connect)
+            instrument_engine(self.engine)
+
+            # One writer thread per SQLite engine. In-memory databases are
+            # skipped: each thread gets its own connection, hence its own database
+            self._write_queue = None
+            if (
+                self.database_type == "sqlite"
+                and self.sqlite_single_writer
+                and not self._is_memory_sqlite(self.database_connect)
+            ):
+                self._write_queue = get_write_queue(self.engine)
+
+            # Create session factory
+            self.SessionLocal = sessionmaker(bind=self.engine)
+
+            # Thread-local search sessions, reused across searches on a thread
+            self._search_sessions = scoped_session(self.SessionLocal)
+            self._search_local = threading.local()
+
+            self._connected = True
+            logger.debug(f"Connected database manager to {self.database_type}")
+            if self._schema_init_on_connect:
+                self._schema_init_on_connect = False
+                self.initialize_schema()
+
+    def _engine_options(self) -> Dict[str, Any]:
+        """Engine settings this manager expects; the registry warns on a mismatch"""
+        options = dict(self.pool_options)
+        if self.database_type == "sqlite":
+            options["sqlite_profile"] = self.sqlite_profile
+            options["sqlite_single_writer"] = self.sqlite_single_writer
+        return options
+
     def _validate_database_dependencies(self, database_connect: str):
         """Validate that required database drivers are installed"""
         if database_connect.startswith("mysql:") or database_connect.startswith(
@@ -119,6 +355,14 @@ class SQLAlchemyDatabaseManager:
                 )
                 raise DatabaseError(error_msg)
 
+    @staticmethod
+    def _is_memory_sqlite(database_connect: str) -> bool:
+        return database_connect.startswith("sqlite:") and (
+            ":memory:" in database_connect
+            or "mode=memory" in database_connect
+            or database_connect.rstrip("/") in ("sqlite:", "sqlite:/", "sqlite://")
+        )
+
     def _create_engine(self, database_connect: str):
         """Create SQLAlchemy engine with appropriate configuration"""
         try:
@@ -132,6 +376,14 @@ class SQLAlchemyDatabaseManager:
                     db_dir = Path(db_path).parent
                     db_dir.mkdir(parents=True, exist_ok=True)
 
+                # In-memory databases use a singleton/static pool that takes no
+                # sizing options
+                pool_options = (
+                    {}
+                    if self._is_memory_sqlite(database_connect)
+                    else self.pool_options
+                )
+
                 # SQLite-specific configuration
                 engine = create_engine(
                     database_connect,
@@ -142,7 +394,10 @@ class SQLAlchemyDatabaseManager:
                     connect_args={
                         "check_same_thread": False,  # Allow multiple threads
                     },
+                    **pool_options,
                 )
+                apply_sqlite_profile(engine, self.sqlite_profile)
+                register_sqlite_functions(engine)
 
             elif database_connect.startswith("mysql:") or database_connect.startswith(
                 "mysql+"
@@ -207,7 +462,7 @@ class SQLAlchemyDatabaseManager:
                     echo=False,
                     connect_args=connect_args,
                     pool_pre_ping=True,  # Validate connections
-                    pool_recycle=3600,  # Recycle connections every hour
+                    **{"pool_recycle": 3600, **self.pool_options},  # Recycle hourly
                 )
 
             elif database_connect.startswith(
@@ -220,7 +475,7 @@ class SQLAlchemyDatabaseManager:
                     json_deserializer=json.loads,
                     echo=False,
                     pool_pre_ping=True,
-                    pool_recycle=3600,
+                    **{"pool_recycle": 3600, **self.pool_options},
                 )
 
             else:
@@ -262,7 +517,24 @@ class SQLAlchemyDatabaseManager:
             raise DatabaseError(f"Failed to create database engine: {e}")
 
     def initialize_schema(self):
-        """Initialize database schema"""
+        """
+        Initialize database schema
+
+        With a shared engine this runs once per URL per process; later
+        instances for the same database skip table creation and search setup.
+        """
+        if self.share_engine:
+            ran = self._engine_registry.initialize_schema_once(
+                self.database_connect, self._initialize_schema
+            )
+            if not ran:
+                logger.debug(
+                    f"Schema already initialized for this {self.database_type} database, skipping"
+                )
+            return
+        self._initialize_schema()
+
+    def _initialize_schema(self):
         try:
             # Create all tables
             Base.metadata.create_all(bind=self.engine)
@@ -270,6 +542,13 @@ class SQLAlchemyDatabaseManager:
             # Setup database-specific features
             self._setup_database_features()
 
+            # Index memories stored before the FTS table existed
+            if self._fts_needs_indexing:
+                self._fts_needs_indexing = False
+                indexed = self._index_sqlite_fts(None, self.SEARCH_INDEX_BATCH_SIZE)
+                if indexed:
+                    logger.info(f"Indexed {indexed} existing memories for FTS5 search")
+
             logger.info(
                 f"Database schema initialized successfully for {self.database_type}"
             )
@@ -295,51 +574,10 @@ class SQLAlchemyDatabaseManager:
             logger.warning(f"Failed to setup database-specific features: {e}")
 
     def _setup_sqlite_fts(self, conn):
-        """Setup SQLite FTS5"""
+        """Setup SQLite FTS5 with insert, update and delete maintenance"""
         try:
-            # Create FTS5 virtual table
-            conn.execute(
-                text(
-                    """
-                CREATE VIRTUAL TABLE IF NOT EXISTS memory_search_fts USING fts5(
-                    memory_id,
-                    memory_type,
-                    namespace,
-                    searchable_content,
-                    summary,
-                    category_primary,
-                    content='',
-                    contentless_delete=1
-                )
-            """
-                )
-            )
-
-            # Create triggers
-            conn.execute(
-                text(
-                    """
-                CREATE TRIGGER IF NOT EXISTS short_term_memory_fts_insert AFTER INSERT ON short_term_memory
-                BEGIN
-                    INSERT INTO memory_search_fts(memory_id, memory_type, namespace, searchable_content, summary, category_primary)
-                    VALUES (NEW.memory_id, 'short_term', NEW.namespace, NEW.searchable_content, NEW.summary, NEW.category_primary);
-                END
-            """
-                )
-            )
-
-            conn.execute(
-                text(
-                    """
-                CREATE TRIGGER IF NOT EXISTS long_term_memory_fts_insert AFTER INSERT ON long_term_memory
-                BEGIN
-                    INSERT INTO memory_search_fts(memory_id, memory_type, namespace, searchable_content, summary, category_primary)
-                    VALUES (NEW.memory_id, 'long_term', NEW.namespace, NEW.searchable_content, NEW.summary, NEW.category_primary);
-                END
-            """
-                )
-            )
-
+            if sqlite_fts.create_fts_schema(conn):
+                self._fts_needs_indexing = True
             logger.info("SQLite FTS5 setup completed")
 
         except Exception as e:
@@ -408,38 +646,72 @@ class SQLAlchemyDatabaseManager:
                 )
             )
 
+            # Access-count updates must not re-tokenize the row
             conn.execute(
                 text(
                     """
                 DROP TRIGGER IF EXISTS update_short_term_search_vector_trigger ON short_term_memory;
                 CREATE TRIGGER update_short_term_search_vector_trigger
-                BEFORE INSERT OR UPDATE ON short_term_memory
+                BEFORE INSERT OR UPDATE OF searchable_content, summary ON short_term_memory
                 FOR EACH ROW EXECUTE FUNCTION update_short_term_search_vector();
             """
                 )
             )
 
+            conn.execute(
+                text(
+                    """
+                CREATE OR REPLACE FUNCTION update_long_term_search_vector() RETURNS trigger AS $$
+                BEGIN
+                    NEW.search_vector := to_tsvector('english', COALESCE(NEW.searchable_content, '') || ' ' || COALESCE(NEW.summary, ''));
+                    RETURN NEW;
+                END
+                $$ LANGUAGE plpgsql;
+            """
+                )
+            )
+
+            # Only recompute the vector when the indexed text changes
+            conn.execute(
+                text(
+                    """
+                DROP TRIGGER IF EXISTS update_long_term_search_vector_trigger ON long_term_memory;
+                CREATE TRIGGER update_long_term_search_vector_trigger
+                BEFORE INSERT OR UPDATE OF searchable_content, summary ON long_term_memory
+                FOR EACH ROW EXECUTE FUNCTION update_long_term_search_vector();
+            """
+                )
+            )
+
             logger.info("PostgreSQL FTS setup completed")
 
         except Exception as e:
             logger.warning(f"PostgreSQL FTS setup failed: {e}")
 
     def _get_search_service(self) -> SearchService:
-        """Get search service instance with fresh session and proper error handling"""
+        """Get the calling thread's search service, creating it on first use"""
         try:
-            if not self.SessionLocal:
-                logger.error("SessionLocal not available for search service")
-                return None
-
-            # Always create a new session to avoid stale connections
-            session = self.SessionLocal()
-            if not session:
-                logger.error("Failed to create database session")
-                return None
-
-            search_service = SearchService(session, self.database_type)
+            search_service = getattr(self._search_local, "search_service", None)
+            if search_service is not None:
+                search_service.embedder = self.embedder
+                search_service.vector_index = self.vector_index
+                search_service.min_vector_similarity = self.min_vector_similarity
+                search_service.ranking_engine = self.ranking_engine
+                return search_service
+
+            # One session per thread; closed after each search so its
+            # connection goes back to the pool between calls
+            search_service = SearchService(
+                self._search_sessions(),
+                self.database_type,
+                embedder=self.embedder,
+                vector_index=self.vector_index,
+                ranking_engine=self.ranking_engine,
+                min_vector_similarity=self.min_vector_similarity,
+            )
+            self._search_local.search_service = search_service
             logger.debug(
-                f"Created new search service instance for database type: {self.database_type}"
+                f"Created search service for thread {threading.get_ident()} ({self.database_type})"
             )
             return search_service
 
@@ -451,6 +723,8 @@ class SQLAlchemyDatabaseManager:
             )
             return None
 
+    @traced("store_chat_history")
+    @_serialized_write
     def store_chat_history(
         self,
         chat_id: str,
@@ -524,72 +798,418 @@ class SQLAlchemyDatabaseManager:
             except SQLAlchemyError as e:
                 raise DatabaseError(f"Failed to get chat history: {e}")
 
+    def _long_term_memory_values(
+        self,
+        memory: ProcessedLongTermMemory,
+        chat_id: str,
+        namespace: str,
+        memory_id: str,
+        created_at: datetime,
+    ) -> Dict[str, Any]:
+        """Map a ProcessedLongTermMemory onto long_term_memory column values"""
+        return {
+            "memory_id": memory_id,
+            "original_chat_id": chat_id,
+            "processed_data": memory.model_dump(mode="json"),
+            "importance_score": memory.importance_score,
+            "category_primary": memory.classification.value,
+            "retention_type": "long_term",
+            "namespace": namespace,
+            "created_at": created_at,
+            "searchable_content": memory.content,
+            "summary": memory.summary,
+            "novelty_score": 0.5,
+            "relevance_score": 0.5,
+            "actionability_score": 0.5,
+            "classification": memory.classification.value,
+            "memory_importance": memory.importance.value,
+            "topic": memory.topic,
+            "entities_json": memory.entities,
+            "keywords_json": memory.keywords,
+            "is_user_context": memory.is_user_context,
+            "is_preference": memory.is_preference,
+            "is_skill_knowledge": memory.is_skill_knowledge,
+            "is_current_project": memory.is_current_project,
+            "promotion_eligible": memory.promotion_eligible,
+            "duplicate_of": memory.duplicate_of,
+            "supersedes_json": memory.supersedes,
+            "related_memories_json": memory.related_memories,
+            "confidence_score": memory.confidence_score,
+            "extraction_timestamp": memory.extraction_timestamp,
+            "classification_reason": memory.classification_reason,
+            "processed_for_duplicates": False,
+            "conscious_processed": False,
+        }
+
     def store_long_term_memory_enhanced(
         self, memory: ProcessedLongTermMemory, chat_id: str, namespace: str = "default"
     ) -> str:
         """Store a ProcessedLongTermMemory with enhanced schema"""
         memory_id = str(uuid.uuid4())
+        # Embed on the caller's thread; only the transaction is serialized
+        vectors = self._embed_memories([memory])
 
-        with self.SessionLocal() as session:
-            try:
-                long_term_memory = LongTermMemory(
-                    memory_id=memory_id,
-                    original_chat_id=chat_id,
-                    processed_data=memory.model_dump(mode="json"),
-                    importance_score=memory.importance_score,
-                    category_primary=memory.classification.value,
-                    retention_type="long_term",
-                    namespace=namespace,
-                    created_at=datetime.now(),
-                    searchable_content=memory.content,
-                    summary=memory.summary,
-                    novelty_score=0.5,
-                    relevance_score=0.5,
-                    actionability_score=0.5,
-                    classification=memory.classification.value,
-                    memory_importance=memory.importance.value,
-                    topic=memory.topic,
-                    entities_json=memory.entities,
-                    keywords_json=memory.keywords,
-                    is_user_context=memory.is_user_context,
-                    is_preference=memory.is_preference,
-                    is_skill_knowledge=memory.is_skill_knowledge,
-                    is_current_project=memory.is_current_project,
-                    promotion_eligible=memory.promotion_eligible,
-                    duplicate_of=memory.duplicate_of,
-                    supersedes_json=memory.supersedes,
-                    related_memories_json=memory.related_memories,
-                    confidence_score=memory.confidence_score,
-                    extraction_timestamp=memory.extraction_timestamp,
-                    classification_reason=memory.classification_reason,
-                    processed_for_duplicates=False,
-                    conscious_processed=False,
-                )
-
-                session.add(long_term_memory)
-                session.commit()
+        def write():
+            with self.SessionLocal() as session:
+                try:
+                    long_term_memory = LongTermMemory(
+                        **self._long_term_memory_values(
+                            memory, chat_id, namespace, memory_id, datetime.now()
+                        )
+                    )
 
-                logger.debug(f"Stored enhanced long-term memory {memory_id}")
-                return memory_id
+                    session.add(long_term_memory)
+                    if vectors:
+                        session.flush()
+                        self.vector_index.add_many(
+                            session.connection(), [(memory_id, namespace, vectors[0])]
+                        )
+                    session.commit()
+
+                except SQLAlchemyError as e:
+                    session.rollback()
+                    logger.error(f"Failed to store enhanced long-term memory: {e}")
+                    raise DatabaseError(
+                        f"Failed to store enhanced long-term memory: {e}"
+                    )
 
-            except SQLAlchemyError as e:
-                session.rollback()
-                logger.error(f"Failed to store enhanced long-term memory: {e}")
-                raise DatabaseError(f"Failed to store enhanced long-term memory: {e}")
+        self.run_write(write)
+        self.notify_write(namespace, "long_term")
+
+        logger.debug(f"Stored enhanced long-term memory {memory_id}")
+        return memory_id
+
+    def store_long_term_memories_bulk(
+        self,
+        memories: List[ProcessedLongTermMemory],
+        chat_ids: Optional[List[str]] = None,
+        namespace: str = "default",
+        chunk_size: int = 1000,
+    ) -> List[str]:
+        """
+        Store many ProcessedLongTermMemory objects in a single transaction
+
+        Rows are written with executemany in chunks of ``chunk_size``. On SQLite,
+        large batches skip the per-row FTS insert trigger and index all new rows
+        with one INSERT ... SELECT at the end of the transaction.
+
+        Args:
+            memories: Processed memories to store
+            chat_ids: Source chat id per memory (defaults to memory.conversation_id)
+            namespace: Memory namespace
+            chunk_size: Number of rows per executemany call
+
+        Returns:
+            Memory ids of the stored rows, in input order
+        """
+        if not memories:
+            return []
+        if chat_ids is not None and len(chat_ids) != len(memories):
+            raise ValueError("chat_ids must have the same length as memories")
+
+        created_at = datetime.now()
+        memory_ids = [str(uuid.uuid4()) for _ in memories]
+        rows = [
+            self._long_term_memory_values(
+                memory,
+                chat_ids[index] if chat_ids is not None else memory.conversation_id,
+                namespace,
+                memory_ids[index],
+                created_at,
+            )
+            for index, memory in enumerate(memories)
+        ]
+
+        vectors = self._embed_memories(memories)
+
+        try:
+            self.run_write(
+                lambda: self._insert_long_term_rows(
+                    rows, memory_ids, namespace, vectors, chunk_size
+                )
+            )
+            self.notify_write(namespace, "long_term")
+            logger.debug(
+                f"Bulk stored {len(rows)} long-term memories in namespace '{namespace}'"
+            )
+            return memory_ids
+
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to bulk store long-term memories: {e}")
+            raise DatabaseError(f"Failed to bulk store long-term memories: {e}")
+
+    def _insert_long_term_rows(
+        self,
+        rows: List[Dict[str, Any]],
+        memory_ids: List[str],
+        namespace: str,
+        vectors: Optional[List[List[float]]],
+        chunk_size: int,
+    ):
+        """Insert prepared long_term_memory rows (and embeddings) in one transaction"""
+        table = LongTermMemory.__table__
+        single_fts_pass = (
+            self.database_type == "sqlite"
+            and len(rows) >= self.BULK_FTS_SINGLE_PASS_THRESHOLD
+        )
+
+        with self.engine.begin() as conn:
+            if single_fts_pass:
+                # pysqlite would only open the transaction at the first INSERT,
+                # committing the DROP on its own and letting another writer add
+                # unindexed rows below start_rowid; take the write lock first
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+                single_fts_pass = self._sqlite_fts_table_exists(conn)
+
+            if single_fts_pass:
+                conn.execute(
+                    text(
+                        f"DROP TRIGGER IF EXISTS {sqlite_fts.trigger_name('long_term', 'insert')}"
+                    )
+                )
+                start_rowid = conn.execute(
+                    text("SELECT COALESCE(MAX(rowid), 0) FROM long_term_memory")
+                ).scalar()
+
+            for start in range(0, len(rows), chunk_size):
+                conn.execute(table.insert(), rows[start : start + chunk_size])
+
+            if single_fts_pass:
+                sqlite_fts.index_rows(conn, "long_term", after_rowid=start_rowid)
+                conn.execute(text(sqlite_fts.trigger_sql("long_term", "insert")))
+
+            if vectors:
+                self.vector_index.add_many(
+                    conn, list(zip(memory_ids, [namespace] * len(rows), vectors))
+                )
+
+    def enable_vector_search(
+        self, embedder, min_vector_similarity: Optional[float] = None
+    ):
+        """
+        Enable embedding-based retrieval for long-term memories
+
+        Adds the optional ``embedding`` column to long_term_memory, picks a vector
+        index (pgvector on PostgreSQL when available, otherwise an in-process flat
+        index) and switches search_memories to hybrid FTS + vector retrieval.
+        New memories are embedded at ingest time; existing rows can be embedded
+        with backfill_embeddings().
+
+        Args:
+            embedder: memori.utils.embeddings.Embedder instance
+            min_vector_similarity: Cosine similarity a nearest neighbour needs
+                to be fused into results (default
+                SearchService.MIN_VECTOR_SIMILARITY)
+        """
+        from .vector_index import create_vector_index
+
+        try:
+            with self.engine.begin() as conn:
+                vector_index = create_vector_index(
+                    self.engine, embedder.dimensions, conn
+                )
+                vector_index.setup(conn)
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to enable vector search: {e}")
+
+        self.embedder = embedder
+        self.vector_index = vector_index
+        if min_vector_similarity is not None:
+            self.min_vector_similarity = min_vector_similarity
+        logger.info(
+            f"Vector search enabled with {embedder.model_name} "
+            f"({embedder.dimensions} dimensions, {vector_index.name} index)"
+        )
+
+    def set_ranking(self, ranking=None, **options) -> RankingEngine:
+        """
+        Configure how search_memories scores and orders results
+
+        Args:
+            ranking: A RankingEngine, or None to build one from ``options``
+            **options: RankingEngine arguments (weights, recency_half_life_days,
+                decay)
+        """
+        if ranking is not None and not isinstance(ranking, RankingEngine):
+            raise ValueError(f"Expected a RankingEngine, got {type(ranking).__name__}")
+        self.ranking_engine = ranking or RankingEngine(**options)
+        logger.debug(f"Search ranking set to {self.ranking_engine.get_config()}")
+        return self.ranking_engine
+
+    def enable_access_tracking(
+        self, flush_interval: float = 5.0, max_pending: int = 1000
+    ) -> AccessTracker:
+        """
+        Count reads of memories returned by search_memories and search_structured
+
+        Reads are buffered in memory and written by an AccessTracker as batched
+        ``access_count`` / ``last_accessed`` updates, so searches never wait
+        on a write.
+
+        Args:
+            flush_interval: Seconds between flushes
+            max_pending: Distinct memories buffered before an early flush
+        """
+        if self.access_tracker is None:
+            # Every thread sees its own in-memory SQLite database, so a
+            # background flush would miss the tables; flush() on close instead
+            self.access_tracker = AccessTracker(
+                self,
+                flush_interval=flush_interval,
+                max_pending=max_pending,
+                background=not self._is_memory_sqlite(self.database_connect),
+            )
+            logger.info(
+                f"Access tracking enabled (flush every {flush_interval:g}s "
+                f"or {max_pending} memories)"
+            )
+        return self.access_tracker
+
+    def update_access_counts(
+        self, accesses: Dict[Tuple[str, str], Tuple[int, datetime]]
+    ) -> int:
+        """
+        Apply buffered reads as one batched UPDATE per memory table
+
+        Args:
+            accesses: ``(memory_type, memory_id) -> (hits, last access time)``
 
+        Returns:
+            Number of rows updated
+        """
+        by_query = {"record_short_term_access": [], "record_long_term_access": []}
+        for (memory_type, memory_id), (hits, accessed_at) in accesses.items():
+            by_query[f"record_{memory_type}_access"].append(
+                {"memory_id": memory_id, "hits": hits, "last_accessed": accessed_at}
+            )
+
+        def write(conn):
+            updated = 0
+            for name, rows in by_query.items():
+                if rows:
+                    updated += self.compiled_queries.execute(conn, name, rows).rowcount
+            return updated
+
+        try:
+            # Counters only; caches built from memory contents stay valid
+            return self.run_write(
+                functools.partial(self._run_in_transaction, write)
+            )
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to update access counts: {e}")
+
+    def backfill_embeddings(
+        self, namespace: str = "default", batch_size: int = 256
+    ) -> int:
+        """Embed long-term memories that do not have an embedding yet"""
+        if not self.vector_index:
+            raise DatabaseError("Vector search is not enabled")
+
+        total = 0
+        while True:
+            with self.engine.connect() as conn:
+                rows = conn.execute(
+                    text(
+                        """SELECT memory_id, summary, searchable_content FROM long_term_memory
+                           WHERE namespace = :namespace AND embedding IS NULL
+                           LIMIT :limit"""
+                    ),
+                    {"namespace": namespace, "limit": batch_size},
+                ).fetchall()
+            if not rows:
+                break
+
+            vectors = self.embedder.embed(
+                [embedding_text(summary, content) for _, summary, content in rows]
+            )
+            items = [(row[0], namespace, vector) for row, vector in zip(rows, vectors)]
+            self.run_write(functools.partial(self._add_embeddings, items))
+            total += len(rows)
+
+        logger.info(f"Backfilled {total} embeddings in namespace '{namespace}'")
+        return total
+
+    def _add_embeddings(self, items: List[tuple]):
+        with self.engine.begin() as conn:
+            self.vector_index.add_many(conn, items)
+
+    def _embed_memories(
+        self, memories: List[ProcessedLongTermMemory]
+    ) -> Optional[List[List[float]]]:
+        """Embed memories before they are written; None when disabled or on failure"""
+        if not self.embedder:
+            return None
+
+        try:
+            vectors = []
+            texts = [embedding_text(m.summary, m.content) for m in memories]
+            for start in range(0, len(texts), 256):
+                vectors.extend(self.embedder.embed(texts[start : start + 256]))
+            return vectors
+        except Exception as e:
+            # A missing embedding only costs recall; never lose the memory itself
+            logger.warning(f"Failed to embed {len(memories)} memories: {e}")
+            return None
+
+    def _sqlite_fts_table_exists(self, conn) -> bool:
+        """Check whether the SQLite FTS5 index (and its rowid map) was created"""
+        return (
+            conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": sqlite_fts.ROWID_TABLE},
+            ).first()
+            is not None
+        )
+
+    @traced("search_structured")
+    def search_structured(
+        self,
+        namespace: str = "default",
+        keywords: Optional[List[str]] = None,
+        categories: Optional[List[str]] = None,
+        importance_threshold: Optional[float] = None,
+        since: Optional[datetime] = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Keyword, category and importance retrieval in one query, see SearchService.search_structured"""
+        search_service = self._get_search_service()
+        if not search_service:
+            return []
+        try:
+            results = search_service.search_structured(
+                namespace, keywords, categories, importance_threshold, since, limit
+            )
+            if self.access_tracker is not None:
+                self.access_tracker.record(results)
+            get_tracer().observe(ROWS, len(results), stage="search_structured")
+            return results
+        except Exception as e:
+            logger.error(f"Structured search failed in namespace '{namespace}': {e}")
+            return []
+        finally:
+            search_service.session.close()
+
+    @traced("search_memories")
     def search_memories(
         self,
         query: str,
         namespace: str = "default",
         category_filter: Optional[List[str]] = None,
         limit: int = 10,
+        search_mode: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Search memories using the cross-database search service"""
+        """Search memories using the cross-database search service
+
+        ``search_mode`` is "lexical" or "hybrid"; by default hybrid retrieval is
+        used when vector search is enabled.
+        """
         search_service = None
+        debug = debug_enabled()
         try:
-            logger.debug(
-                f"Starting memory search for query '{query}' in namespace '{namespace}' with category_filter={category_filter}"
-            )
+            if debug:
+                logger.debug(
+                    f"Starting memory search for query '{query}' in namespace '{namespace}' with category_filter={category_filter}"
+                )
             search_service = self._get_search_service()
 
             if not search_service:
@@ -597,9 +1217,10 @@ class SQLAlchemyDatabaseManager:
                 return []
 
             results = search_service.search_memories(
-                query, namespace, category_filter, limit
+                query, namespace, category_filter, limit, search_mode=search_mode
             )
-            logger.debug(f"Search for '{query}' returned {len(results)} results")
+            if debug:
+                logger.debug(f"Search for '{query}' returned {len(results)} results")
 
             # Validate results structure
             if not isinstance(results, list):
@@ -608,6 +1229,9 @@ class SQLAlchemyDatabaseManager:
                 )
                 results = list(results) if results else []
 
+            if self.access_tracker is not None:
+                self.access_tracker.record(results)
+            get_tracer().observe(ROWS, len(results), stage="search_memories")
             return results
 
         except Exception as e:
@@ -621,12 +1245,10 @@ class SQLAlchemyDatabaseManager:
             return []
 
         finally:
-            # Ensure session is properly closed, even if an exception occurred
-            if search_service and hasattr(search_service, "session"):
+            # Release the connection; the session itself stays bound to this thread
+            if search_service and search_service.session:
                 try:
-                    if search_service.session:
-                        logger.debug("Closing search service session")
-                        search_service.session.close()
+                    search_service.session.close()
                 except Exception as session_e:
                     logger.warning(f"Error closing search service session: {session_e}")
 
@@ -727,6 +1349,7 @@ class SQLAlchemyDatabaseManager:
             except SQLAlchemyError as e:
                 raise DatabaseError(f"Failed to get memory stats: {e}")
 
+    @_serialized_write
     def clear_memory(
         self, namespace: str = "default", memory_type: Optional[str] = None
     ):
@@ -758,10 +1381,322 @@ class SQLAlchemyDatabaseManager:
 
                 session.commit()
 
+                if self.vector_index:
+                    self.vector_index.invalidate(namespace)
+                self.notify_write(namespace, memory_type or "all")
+
             except SQLAlchemyError as e:
                 session.rollback()
                 raise DatabaseError(f"Failed to clear memory: {e}")
 
+    def delete_expired_memories(
+        self,
+        namespace: Optional[str] = None,
+        retention_days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """
+        Delete expired short-term memories and chat history past retention
+
+        Rows are selected by range on the indexed ``expires_at`` / ``timestamp``
+        columns and deleted by primary key, ``batch_size`` rows per transaction,
+        so the sweep never holds write locks for long. Search indexes follow
+        the deletes (SQLite FTS triggers, PostgreSQL/MySQL row-level indexes).
+
+        Deleted:
+        - short-term memories whose ``expires_at`` has passed
+        - when ``retention_days`` is set, non-permanent short-term memories
+          without expiry and chat history older than the retention window
+
+        Args:
+            namespace: Limit the sweep to one namespace (None = all)
+            retention_days: Retention window, None keeps rows without expiry
+            batch_size: Rows per transaction (default SEARCH_INDEX_BATCH_SIZE)
+            now: Reference time (defaults to the current time)
+
+        Returns:
+            Number of deleted rows per table
+        """
+        batch_size = batch_size or self.SEARCH_INDEX_BATCH_SIZE
+        now = now or datetime.now()
+        short_term = ShortTermMemory.__table__
+        chat_history = ChatHistory.__table__
+
+        sweeps = [
+            (
+                "short_term",
+                short_term,
+                short_term.c.memory_id,
+                short_term.c.expires_at,
+                now,
+                None,
+            )
+        ]
+        if retention_days is not None:
+            cutoff = now - timedelta(days=retention_days)
+            sweeps.append(
+                (
+                    "short_term",
+                    short_term,
+                    short_term.c.memory_id,
+                    short_term.c.created_at,
+                    cutoff,
+                    and_(
+                        short_term.c.expires_at.is_(None),
+                        or_(
+                            short_term.c.is_permanent_context.is_(None),
+                            short_term.c.is_permanent_context.is_(False),
+                        ),
+                    ),
+                )
+            )
+            sweeps.append(
+                (
+                    "chat_history",
+                    chat_history,
+                    chat_history.c.chat_id,
+                    chat_history.c.timestamp,
+                    cutoff,
+                    None,
+                )
+            )
+
+        deleted = {"short_term": 0, "chat_history": 0}
+        touched_namespaces = set()
+        try:
+            for memory_type, table, key, time_column, cutoff, condition in sweeps:
+                query = select(key, table.c.namespace).where(time_column < cutoff)
+                if condition is not None:
+                    query = query.where(condition)
+                if namespace is not None:
+                    query = query.where(table.c.namespace == namespace)
+                query = query.order_by(time_column).limit(batch_size)
+
+                while True:
+                    namespaces = self.run_write(
+                        functools.partial(
+                            self._run_in_transaction,
+                            self._delete_batch,
+                            query,
+                            table,
+                            key,
+                        )
+                    )
+                    deleted[memory_type] += len(namespaces)
+                    if memory_type == "short_term":
+                        touched_namespaces.update(namespaces)
+                    if len(namespaces) < batch_size:
+                        break
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to delete expired memories: {e}")
+        finally:
+            for touched in touched_namespaces:
+                self.notify_write(touched, "short_term")
+
+        return deleted
+
+    @staticmethod
+    def _delete_batch(conn, query, table, key) -> List[str]:
+        """Delete the rows selected by ``query``; returns their namespaces"""
+        rows = conn.execute(query).all()
+        if rows:
+            conn.execute(table.delete().where(key.in_([row[0] for row in rows])))
+        return [row[1] for row in rows]
+
+    def rebuild_search_index(
+        self, namespace: Optional[str] = None, batch_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Rebuild the full-text search index incrementally
+
+        Work is split into short transactions of ``batch_size`` rows so
+        ingestion and searches keep running while the index is rebuilt;
+        searches may miss memories of the namespace being rebuilt until it
+        finishes.
+
+        - SQLite: drops the FTS5 postings (of ``namespace`` or of all
+          namespaces), re-indexes the source rows, then merges index segments
+          with incremental FTS5 'merge' steps.
+        - PostgreSQL: recomputes ``search_vector`` for short- and long-term rows.
+        - MySQL: InnoDB maintains FULLTEXT indexes itself; nothing to do.
+
+        Args:
+            namespace: Rebuild only this namespace (None = all namespaces)
+            batch_size: Rows per transaction (default SEARCH_INDEX_BATCH_SIZE)
+
+        Returns:
+            Counts of removed and indexed entries
+        """
+        batch_size = batch_size or self.SEARCH_INDEX_BATCH_SIZE
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        try:
+            if self.database_type == "sqlite":
+                stats = self._rebuild_sqlite_fts(namespace, batch_size)
+            elif self.database_type == "postgresql":
+                stats = self._rebuild_postgresql_search_vectors(namespace, batch_size)
+            else:
+                logger.debug(
+                    f"{self.database_type} maintains its full-text indexes, nothing to rebuild"
+                )
+                return {"removed": 0, "indexed": 0}
+        except SQLAlchemyError as e:
+            raise DatabaseError(f"Failed to rebuild search index: {e}")
+
+        logger.info(
+            f"Rebuilt search index for {namespace or 'all namespaces'}: "
+            f"{stats['removed']} stale entries removed, {stats['indexed']} indexed"
+        )
+        return stats
+
+    def _rebuild_sqlite_fts(self, namespace: Optional[str], batch_size: int):
+        with self.engine.connect() as conn:
+            fts_ready = self._sqlite_fts_table_exists(conn)
+        if not fts_ready:
+            self.run_write(self._create_sqlite_fts_schema)
+
+        removed = 0
+        while True:
+            deleted = self.run_write(
+                functools.partial(
+                    self._run_in_transaction,
+                    sqlite_fts.delete_postings,
+                    namespace,
+                    batch_size,
+                )
+            )
+            removed += deleted
+            if deleted < batch_size:
+                break
+        self.run_write(
+            functools.partial(self._run_in_transaction, sqlite_fts.purge_rowid_map)
+        )
+
+        indexed = self._index_sqlite_fts(namespace, batch_size)
+
+        for _ in range(10000):
+            merged = self.run_write(
+                functools.partial(self._run_in_transaction, sqlite_fts.merge_segments)
+            )
+            if not merged:
+                break
+
+        return {"removed": removed, "indexed": indexed}
+
+    def _create_sqlite_fts_schema(self):
+        with self.engine.begin() as conn:
+            sqlite_fts.create_fts_schema(conn)
+
+    def _index_sqlite_fts(self, namespace: Optional[str], batch_size: int) -> int:
+        """Index unindexed short- and long-term rows, one batch per transaction"""
+        indexed = 0
+        for memory_type in sqlite_fts.SOURCE_TABLES:
+            last_rowid = 0
+            while True:
+                count, last_rowid = self.run_write(
+                    functools.partial(
+                        self._run_in_transaction,
+                        sqlite_fts.index_rows,
+                        memory_type,
+                        last_rowid,
+                        namespace,
+                        batch_size,
+                    )
+                )
+                indexed += count
+                if count < batch_size:
+                    break
+        return indexed
+
+    def _rebuild_postgresql_search_vectors(
+        self, namespace: Optional[str], batch_size: int
+    ):
+        indexed = 0
+        for table in ("short_term_memory", "long_term_memory"):
+            last_id = ""
+            while True:
+                last_ids = self.run_write(
+                    functools.partial(
+                        self._run_in_transaction,
+                        self._update_postgresql_search_vectors,
+                        table,
+                        last_id,
+                        namespace,
+                        batch_size,
+                    )
+                )
+                indexed += len(last_ids)
+                if len(last_ids) < batch_size:
+                    break
+                last_id = last_ids[-1]
+        return {"removed": 0, "indexed": indexed}
+
+    @staticmethod
+    def _update_postgresql_search_vectors(
+        conn, table: str, after_id: str, namespace: Optional[str], limit: int
+    ) -> List[str]:
+        """Recompute search_vector for the next ``limit`` rows ordered by memory_id"""
+        memory_ids = list(
+            conn.execute(
+                text(
+                    f"""SELECT memory_id FROM {table}
+                        WHERE memory_id > :after_id
+                          AND (CAST(:namespace AS TEXT) IS NULL OR namespace = :namespace)
+                        ORDER BY memory_id
+                        LIMIT :limit"""
+                ),
+                {"after_id": after_id, "namespace": namespace, "limit": limit},
+            ).scalars()
+        )
+        if memory_ids:
+            conn.execute(
+                text(
+                    f"""UPDATE {table} SET search_vector = to_tsvector('english',
+                            COALESCE(searchable_content, '') || ' ' || COALESCE(summary, ''))
+                        WHERE memory_id IN :memory_ids"""
+                ).bindparams(bindparam("memory_ids", expanding=True)),
+                {"memory_ids": memory_ids},
+            )
+        return memory_ids
+
+    def _run_in_transaction(self, fn: Callable[..., Any], *args) -> Any:
+        """Call ``fn(conn, *args)`` inside its own transaction"""
+        with self.engine.begin() as conn:
+            return fn(conn, *args)
+
+    def run_write(self, fn: Callable[[], Any]) -> Any:
+        """
+        Run a write transaction, serialized through the SQLite writer thread
+
+        On other backends (or with the single writer disabled) ``fn`` simply
+        runs on the calling thread.
+        """
+        if self._write_queue is None:
+            return fn()
+        return self._write_queue.run(fn)
+
+    def add_write_listener(self, listener: Callable[[str, str], None]):
+        """
+        Register a callback invoked after memories are written or cleared
+
+        Listeners receive ``(namespace, memory_type)`` and are used to
+        invalidate in-process caches derived from memory contents. They are
+        called for writes made through any manager of the same database in
+        this process (not for other processes), until this manager closes.
+        Bound methods are held weakly.
+        """
+        self._write_listeners.add(listener, self)
+
+    def remove_write_listener(self, listener: Callable[[str, str], None]):
+        """Unregister a callback added with add_write_listener()"""
+        self._write_listeners.remove(listener)
+
+    def notify_write(self, namespace: str, memory_type: str):
+        """Tell write listeners that memories in ``namespace`` changed"""
+        self._write_listeners.notify(namespace, memory_type, self)
+
     def execute_with_translation(self, query: str, parameters: Dict[str, Any] = None):
         """
         Execute a query with automatic parameter translation for cross-database compatibility.
@@ -783,6 +1718,7 @@ class SQLAlchemyDatabaseManager:
             conn.commit()
             return result
 
+    @contextmanager
     def _get_connection(self):
         """
         Compatibility method for legacy code that expects raw database connections.
@@ -792,78 +1728,38 @@ class SQLAlchemyDatabaseManager:
 
         This is used by memory.py for direct SQL queries.
         """
-        from contextlib import contextmanager
-
-        @contextmanager
-        def connection_context():
-            class TranslatingConnection:
-                """Wrapper that adds parameter translation to SQLAlchemy connections"""
-
-                def __init__(self, conn, translator):
-                    self._conn = conn
-                    self._translator = translator
-
-                def execute(self, query, parameters=None):
-                    """Execute query with automatic parameter translation"""
-                    if parameters:
-                        # Handle both text() queries and raw strings
-                        if hasattr(query, "text"):
-                            # SQLAlchemy text() object
-                            translated_params = self._translator.translate_parameters(
-                                parameters
-                            )
-                            return self._conn.execute(query, translated_params)
-                        else:
-                            # Raw string query
-                            translated_params = self._translator.translate_parameters(
-                                parameters
-                            )
-                            return self._conn.execute(
-                                text(str(query)), translated_params
-                            )
-                    else:
-                        return self._conn.execute(query)
-
-                def commit(self):
-                    """Commit transaction"""
-                    return self._conn.commit()
-
-                def rollback(self):
-                    """Rollback transaction"""
-                    return self._conn.rollback()
-
-                def close(self):
-                    """Close connection"""
-                    return self._conn.close()
-
-                def fetchall(self):
-                    """Compatibility method for cursor-like usage"""
-                    # This is for backwards compatibility with code that expects cursor.fetchall()
-                    return []
-
-                def scalar(self):
-                    """Compatibility method for cursor-like usage"""
-                    return None
-
-                def __getattr__(self, name):
-                    """Delegate unknown attributes to the underlying connection"""
-                    return getattr(self._conn, name)
-
-            conn = self.engine.connect()
-            try:
-                yield TranslatingConnection(conn, self.query_translator)
-            finally:
-                conn.close()
-
-        return connection_context()
+        conn = self.engine.connect()
+        try:
+            yield TranslatingConnection(
+                conn, self.query_translator, self.compiled_queries
+            )
+        finally:
+            conn.close()
 
     def close(self):
-        """Close database connections"""
-        if self._search_service and hasattr(self._search_service, "session"):
-            self._search_service.session.close()
-
-        if hasattr(self, "engine"):
+        """Close database connections (releases this instance's share of a shared engine)"""
+        self._write_listeners.remove_owner(self)
+        if self.access_tracker is not None and not self._closed:
+            self.access_tracker.stop(flush=self._connected)
+        if not self._connected:
+            self._closed = True
+            return
+        if hasattr(self, "_search_sessions"):
+            self._search_sessions.remove()
+
+        if not hasattr(self, "engine") or self._closed:
+            return
+        self._closed = True
+
+        if self.share_engine:
+            # Disposes the pool only when the last instance using it closes
+            disposed = self._engine_registry.release(self.database_connect)
+        else:
             self.engine.dispose()
+            disposed = True
+
+        if disposed and self._write_queue is not None:
+            stop_write_queue(self.engine)
 
     def get_database_info(self) -> Dict[str, Any]:
         """Get database information and capabilities"""
@@ -0,0 +1,250 @@
+"""
+SQLite FTS5 index for short- and long-term memories
+
+``memory_search_fts`` stores the indexed text together with the identifying
+columns the search query reads back (memory_id, memory_type, namespace,
+category_primary), which are declared UNINDEXED so they are never tokenized.
+Because one FTS table serves two source tables, the FTS rowid of every
+posting is recorded in ``memory_search_fts_rowids``, keyed by
+``(memory_type, memory_id)``. Delete and update triggers use it to touch
+exactly one FTS row instead of scanning the index, which keeps deleted
+memories from lingering as stale postings.
+
+The previous layout (a contentless ``content=''`` table with insert triggers
+only) is detected and replaced by ``create_fts_schema``.
+"""
+
+from typing import Optional, Tuple
+
+from sqlalchemy import text
+
+FTS_TABLE = "memory_search_fts"
+ROWID_TABLE = "memory_search_fts_rowids"
+
+# memory_type -> source table
+SOURCE_TABLES = {
+    "short_term": "short_term_memory",
+    "long_term": "long_term_memory",
+}
+
+CREATE_FTS_TABLE = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+    memory_id UNINDEXED,
+    memory_type UNINDEXED,
+    namespace UNINDEXED,
+    searchable_content,
+    summary,
+    category_primary UNINDEXED
+)
+"""
+
+CREATE_ROWID_TABLE = f"""
+CREATE TABLE IF NOT EXISTS {ROWID_TABLE} (
+    memory_type TEXT NOT NULL,
+    memory_id TEXT NOT NULL,
+    fts_rowid INTEGER NOT NULL,
+    PRIMARY KEY (memory_type, memory_id)
+) WITHOUT ROWID
+"""
+
+_POSTING_ROWID = f"""(SELECT fts_rowid FROM {ROWID_TABLE}
+                        WHERE memory_type = '{{memory_type}}' AND memory_id = {{ref}}.memory_id)"""
+
+
+def trigger_name(memory_type: str, operation: str) -> str:
+    return f"{SOURCE_TABLES[memory_type]}_fts_{operation}"
+
+
+def trigger_sql(memory_type: str, operation: str) -> str:
+    """CREATE TRIGGER statement keeping the FTS index in sync with a source table"""
+    table = SOURCE_TABLES[memory_type]
+    name = trigger_name(memory_type, operation)
+    old_posting = _POSTING_ROWID.format(memory_type=memory_type, ref="OLD")
+    new_posting = _POSTING_ROWID.format(memory_type=memory_type, ref="NEW")
+
+    if operation == "insert":
+        return f"""
+            CREATE TRIGGER IF NOT EXISTS {name} AFTER INSERT ON {table}
+            BEGIN
+                DELETE FROM {FTS_TABLE} WHERE rowid = {new_posting};
+                INSERT INTO {FTS_TABLE}(memory_id, memory_type, namespace, searchable_content, summary, category_primary)
+                VALUES (NEW.memory_id, '{memory_type}', NEW.namespace, NEW.searchable_content, NEW.summary, NEW.category_primary);
+                INSERT OR REPLACE INTO {ROWID_TABLE}(memory_type, memory_id, fts_rowid)
+                VALUES ('{memory_type}', NEW.memory_id, last_insert_rowid());
+            END
+        """
+    if operation == "update":
+        return f"""
+            CREATE TRIGGER IF NOT EXISTS {name}
+            AFTER UPDATE OF memory_id, namespace, searchable_content, summary, category_primary ON {table}
+            BEGIN
+                UPDATE {FTS_TABLE}
+                SET memory_id = NEW.memory_id, namespace = NEW.namespace,
+                    searchable_content = NEW.searchable_content, summary = NEW.summary,
+                    category_primary = NEW.category_primary
+                WHERE rowid = {old_posting};
+                UPDATE {ROWID_TABLE} SET memory_id = NEW.memory_id
+                WHERE memory_type = '{memory_type}' AND memory_id = OLD.memory_id;
+            END
+        """
+    if operation == "delete":
+        return f"""
+            CREATE TRIGGER IF NOT EXISTS {name} AFTER DELETE ON {table}
+            BEGIN
+                DELETE FROM {FTS_TABLE} WHERE rowid = {old_posting};
+                DELETE FROM {ROWID_TABLE}
+                WHERE memory_type = '{memory_type}' AND memory_id = OLD.memory_id;
+            END
+        """
+    raise ValueError(f"Unknown FTS trigger operation '{operation}'")
+
+
+def _fts_table_sql(conn) -> Optional[str]:
+    return conn.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).scalar()
+
+
+def _drop_triggers(conn):
+    for memory_type in SOURCE_TABLES:
+        for operation in ("insert", "update", "delete"):
+            conn.execute(
+                text(f"DROP TRIGGER IF EXISTS {trigger_name(memory_type, operation)}")
+            )
+
+
+def create_fts_schema(conn) -> bool:
+    """
+    Create the FTS table, rowid map and triggers, replacing a legacy index
+
+    Returns:
+        True if the FTS table was (re)created and existing memories still
+        need to be indexed with ``index_rows``
+    """
+    existing = _fts_table_sql(conn)
+    legacy = existing is not None and "content=''" in existing.replace(" ", "")
+    if legacy:
+        # Contentless tables return NULL for every column, so the old index
+        # could not be filtered by namespace or joined back to its rows
+        _drop_triggers(conn)
+        conn.execute(text(f"DROP TABLE {FTS_TABLE}"))
+
+    conn.execute(text(CREATE_FTS_TABLE))
+    conn.execute(text(CREATE_ROWID_TABLE))
+    for memory_type in SOURCE_TABLES:
+        for operation in ("insert", "update", "delete"):
+            conn.execute(text(trigger_sql(memory_type, operation)))
+
+    if legacy:
+        conn.execute(text(f"DELETE FROM {ROWID_TABLE}"))
+    return existing is None or legacy
+
+
+def index_rows(
+    conn,
+    memory_type: str,
+    after_rowid: int = 0,
+    namespace: Optional[str] = None,
+    limit: int = -1,
+) -> Tuple[int, int]:
+    """
+    Index source rows with rowid > ``after_rowid`` that have no FTS posting yet
+
+    Postings get explicit rowids above the current maximum, so the rowid map
+    can be written with a single set-based insert.
+
+    Returns:
+        (rows indexed, highest source rowid indexed)
+    """
+    table = SOURCE_TABLES[memory_type]
+    batch = f"""
+        WITH batch AS (
+            SELECT t.rowid AS source_rowid, t.memory_id, t.namespace,
+                   t.searchable_content, t.summary, t.category_primary
+            FROM {table} t
+            WHERE t.rowid > :after_rowid
+              AND (:namespace IS NULL OR t.namespace = :namespace)
+              AND NOT EXISTS (
+                  SELECT 1 FROM {ROWID_TABLE} m
+                  WHERE m.memory_type = :memory_type AND m.memory_id = t.memory_id
+              )
+            ORDER BY t.rowid
+            LIMIT :limit
+        )
+    """
+    params = {
+        "after_rowid": after_rowid,
+        "namespace": namespace,
+        "memory_type": memory_type,
+        "limit": limit,
+    }
+
+    count, last_rowid = conn.execute(
+        text(batch + "SELECT COUNT(*), MAX(source_rowid) FROM batch"), params
+    ).one()
+    if not count:
+        return 0, after_rowid
+
+    params["base"] = conn.execute(
+        text(f"SELECT COALESCE(MAX(rowid), 0) FROM {FTS_TABLE}")
+    ).scalar()
+    # The rowid map insert must run first: afterwards the NOT EXISTS filter
+    # excludes this batch
+    conn.execute(
+        text(f"""INSERT INTO {ROWID_TABLE}(memory_type, memory_id, fts_rowid)
+                {batch}
+                SELECT :memory_type, memory_id,
+                       :base + ROW_NUMBER() OVER (ORDER BY source_rowid)
+                FROM batch"""),
+        params,
+    )
+    conn.execute(
+        text(
+            f"""INSERT INTO {FTS_TABLE}(rowid, memory_id, memory_type, namespace, searchable_content, summary, category_primary)
+                SELECT m.fts_rowid, t.memory_id, :memory_type, t.namespace,
+                       t.searchable_content, t.summary, t.category_primary
+                FROM {table} t
+                JOIN {ROWID_TABLE} m
+                  ON m.memory_type = :memory_type AND m.memory_id = t.memory_id
+                WHERE m.fts_rowid > :base AND m.fts_rowid <= :base + :count"""
+        ),
+        {**params, "count": count},
+    )
+    return count, last_rowid
+
+
+def delete_postings(conn, namespace: Optional[str] = None, limit: int = 1000) -> int:
+    """Delete up to ``limit`` FTS postings (of one namespace, or of all)"""
+    result = conn.execute(
+        text(f"""DELETE FROM {FTS_TABLE} WHERE rowid IN (
+                    SELECT rowid FROM {FTS_TABLE}
+                    WHERE :namespace IS NULL OR namespace = :namespace
+                    LIMIT :limit
+                )"""),
+        {"namespace": namespace, "limit": limit},
+    )
+    return result.rowcount
+
+
+def purge_rowid_map(conn) -> int:
+    """Drop rowid map entries whose FTS posting no longer exists"""
+    result = conn.execute(text(f"""DELETE FROM {ROWID_TABLE} WHERE NOT EXISTS (
+                    SELECT 1 FROM {FTS_TABLE} WHERE rowid = {ROWID_TABLE}.fts_rowid
+                )"""))
+    return result.rowcount
+
+
+def merge_segments(conn, pages: int = 500) -> bool:
+    """
+    Run one incremental FTS5 'merge' step
+
+    Returns:
+        True if the step did work, i.e. another step may be worthwhile
+    """
+    before = conn.execute(text("SELECT total_changes()")).scalar()
+    conn.execute(
+        text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) VALUES('merge', :pages)"),
+        {"pages": pages},
+    )
+    return conn.execute(text("SELECT total_changes()")).scalar() - before >= 2
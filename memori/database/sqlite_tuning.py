@@ -0,0 +1,224 @@
+"""
+SQLite performance profiles and single-writer queue
+
+SQLite allows many readers but only one writer at a time. With the default
+rollback journal, concurrent ingestion threads and request-path searches
+block each other and fail with "database is locked". This module provides:
+
+- ``SQLITE_PROFILES``: named sets of PRAGMAs (WAL journal, relaxed fsync,
+  busy timeout, page cache and mmap sizing) applied to every new connection
+  through a SQLAlchemy ``connect`` event listener.
+- ``SQLiteWriteQueue``: one writer thread per engine that runs write
+  transactions in submission order, so writers never contend for the lock
+  while reads keep running concurrently on their own connections.
+- ``register_sqlite_functions``: SQL functions the search queries need that
+  SQLite builds without ``SQLITE_ENABLE_MATH_FUNCTIONS`` lack (``power``).
+"""
+
+import math
+import queue
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+from sqlalchemy import event
+
+SQLITE_PROFILES: Dict[str, Dict[str, Any]] = {
+    # SQLite defaults: rollback journal, full fsync, no busy timeout
+    "default": {},
+    # WAL with fsync only at checkpoints; safe against application crashes,
+    # may lose the last transactions on power loss
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,
+        "temp_store": "MEMORY",
+        "cache_size": -16000,  # ~16 MB page cache per connection
+    },
+    # Balanced plus memory-mapped I/O and a larger cache for read-heavy use
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 10000,
+        "temp_store": "MEMORY",
+        "cache_size": -64000,  # ~64 MB page cache per connection
+        "mmap_size": 268435456,  # 256 MB
+        "wal_autocheckpoint": 2000,
+    },
+    # WAL for concurrency but fsync on every commit
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+    },
+}
+
+
+def get_sqlite_pragmas(profile: str) -> Dict[str, Any]:
+    """Return the PRAGMAs of a named profile"""
+    try:
+        return SQLITE_PROFILES[profile]
+    except KeyError:
+        raise ValueError(
+            f"Unknown SQLite profile '{profile}', expected one of "
+            f"{sorted(SQLITE_PROFILES)}"
+        ) from None
+
+
+def apply_sqlite_profile(engine, profile: str):
+    """Register a connect listener that applies ``profile``'s PRAGMAs"""
+    pragmas = get_sqlite_pragmas(profile)
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    logger.debug(f"SQLite profile '{profile}' enabled: {pragmas}")
+
+
+def _sql_power(base, exponent):
+    # NULL in, NULL out, like the built-in; domain errors become NULL too
+    if base is None or exponent is None:
+        return None
+    try:
+        return math.pow(base, exponent)
+    except (ValueError, OverflowError):
+        return None
+
+
+def create_sqlite_functions(dbapi_connection):
+    """Define ``power(x, y)`` on a DB-API SQLite connection"""
+    dbapi_connection.create_function("power", 2, _sql_power, deterministic=True)
+
+
+def register_sqlite_functions(engine):
+    """
+    Register a connect listener that defines the SQL functions ranking needs
+
+    Composite ranking decays recency with ``POWER``, which only exists in
+    SQLite builds compiled with math functions; without it the full-text
+    query fails and search falls back to LIKE. Applied to every engine,
+    whatever the profile.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _create_sqlite_functions(dbapi_connection, connection_record):
+        create_sqlite_functions(dbapi_connection)
+
+
+class SQLiteWriteQueue:
+    """
+    Runs write callables on a single dedicated thread, in order
+
+    ``run`` blocks the caller until its callable has finished on the writer
+    thread and returns its result (or re-raises its exception). Calls made
+    from the writer thread itself run inline, so nested writes cannot
+    deadlock.
+    """
+
+    def __init__(self, name: str = "memori-sqlite-writer"):
+        self.name = name
+        self._queue: queue.Queue[Optional[tuple]] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stopped = False
+        self.writes = 0
+
+    def run(self, fn: Callable[[], Any]) -> Any:
+        if threading.current_thread() is self._thread:
+            return fn()
+
+        future: Future = Future()
+        # Checked and enqueued under the lock so no job lands behind the
+        # sentinel put by stop(); after stop, writes run on the caller
+        with self._lock:
+            queued = not self._stopped
+            if queued:
+                self._ensure_thread()
+                self._queue.put((fn, future))
+        if not queued:
+            return fn()
+        return future.result()
+
+    def _ensure_thread(self):
+        # Caller holds self._lock
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._worker_main, name=self.name, daemon=True
+            )
+            self._thread.start()
+
+    def _worker_main(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            fn, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                self.writes += 1
+        self._fail_pending()
+
+    def _fail_pending(self):
+        """Fail jobs still queued after the worker exits instead of leaving them waiting"""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None and item[1].set_running_or_notify_cancel():
+                item[1].set_exception(RuntimeError(f"{self.name} has stopped"))
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Finish queued writes and stop the writer thread"""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(None)
+        if thread is not None:
+            thread.join(timeout)
+
+
+_write_queues: "weakref.WeakKeyDictionary[Any, SQLiteWriteQueue]" = (
+    weakref.WeakKeyDictionary()
+)
+_write_queues_lock = threading.Lock()
+
+
+def get_write_queue(engine) -> SQLiteWriteQueue:
+    """Return the writer queue of ``engine``, shared by every manager using it"""
+    with _write_queues_lock:
+        write_queue = _write_queues.get(engine)
+        if write_queue is None:
+            write_queue = SQLiteWriteQueue()
+            _write_queues[engine] = write_queue
+        return write_queue
+
+
+def stop_write_queue(engine):
+    """Stop and forget the writer queue of ``engine``, if it has one"""
+    with _write_queues_lock:
+        write_queue = _write_queues.pop(engine, None)
+    if write_queue is not None:
+        write_queue.stop()
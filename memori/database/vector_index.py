@@ -0,0 +1,278 @@
+"""
+Vector indexes over long_term_memory embeddings
+
+Embeddings live in an optional ``embedding`` column on ``long_term_memory``
+that is added by ``SQLAlchemyDatabaseManager.enable_vector_search`` (like the
+PostgreSQL ``search_vector`` column, it is managed outside the ORM models).
+
+- ``FlatVectorIndex``: exact brute-force cosine search over an in-process,
+  per-namespace matrix loaded from the column. Uses NumPy when installed and
+  falls back to pure Python. Works on every backend.
+- ``PgVectorIndex``: delegates nearest-neighbour search to the pgvector
+  extension on PostgreSQL.
+"""
+
+import heapq
+import threading
+import time
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+from sqlalchemy import text
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+def pack_vector(vector: Sequence[float]) -> bytes:
+    """Serialize a vector as little-endian float32 bytes"""
+    return array("f", vector).tobytes()
+
+
+def unpack_vector(data: bytes) -> List[float]:
+    """Deserialize float32 bytes produced by pack_vector"""
+    values = array("f")
+    values.frombytes(bytes(data))
+    return values.tolist()
+
+
+class VectorIndex:
+    """Base class for vector indexes over long-term memories"""
+
+    name = "vector"
+
+    def __init__(self, engine, dimensions: int):
+        self.engine = engine
+        self.dimensions = dimensions
+
+    def setup(self, conn):
+        """Create the embedding column (and any index) if missing"""
+        raise NotImplementedError
+
+    def add_many(self, conn, items: List[Tuple[str, str, List[float]]]):
+        """Persist (memory_id, namespace, vector) tuples inside ``conn``'s transaction"""
+        raise NotImplementedError
+
+    def search(
+        self, namespace: str, vector: List[float], k: int
+    ) -> List[Tuple[str, float]]:
+        """Return up to ``k`` (memory_id, cosine similarity) pairs, best first"""
+        raise NotImplementedError
+
+    def invalidate(self, namespace: Optional[str] = None):
+        """Drop any cached state for a namespace (or all namespaces)"""
+
+
+class FlatVectorIndex(VectorIndex):
+    """Exact cosine search over an in-memory matrix per namespace"""
+
+    name = "flat"
+
+    def __init__(self, engine, dimensions: int, reload_interval: float = 300.0):
+        super().__init__(engine, dimensions)
+        self.reload_interval = reload_interval
+        self._namespaces: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def setup(self, conn):
+        from sqlalchemy import inspect
+
+        columns = {
+            column["name"] for column in inspect(conn).get_columns("long_term_memory")
+        }
+        if "embedding" not in columns:
+            column_type = (
+                "BYTEA" if self.engine.dialect.name == "postgresql" else "BLOB"
+            )
+            conn.execute(
+                text(f"ALTER TABLE long_term_memory ADD COLUMN embedding {column_type}")
+            )
+            logger.info("Added embedding column to long_term_memory")
+
+    def add_many(self, conn, items: List[Tuple[str, str, List[float]]]):
+        if not items:
+            return
+        conn.execute(
+            text(
+                "UPDATE long_term_memory SET embedding = :embedding WHERE memory_id = :memory_id"
+            ),
+            [
+                {"memory_id": memory_id, "embedding": pack_vector(vector)}
+                for memory_id, _, vector in items
+            ],
+        )
+
+        # Keep already-loaded namespaces current without a reload
+        with self._lock:
+            for memory_id, namespace, vector in items:
+                state = self._namespaces.get(namespace)
+                if state is not None:
+                    state["pending"].append((memory_id, vector))
+
+    def search(
+        self, namespace: str, vector: List[float], k: int
+    ) -> List[Tuple[str, float]]:
+        state = self._get_state(namespace)
+        ids = state["ids"]
+        if not ids or k <= 0:
+            return []
+
+        k = min(k, len(ids))
+        if NUMPY_AVAILABLE:
+            scores = state["matrix"] @ np.asarray(vector, dtype=np.float32)
+            if k < len(ids):
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(len(ids))
+            top = top[np.argsort(-scores[top])]
+            return [(ids[i], float(scores[i])) for i in top]
+
+        scored = (
+            (sum(a * b for a, b in zip(row, vector)), index)
+            for index, row in enumerate(state["matrix"])
+        )
+        return [(ids[index], score) for score, index in heapq.nlargest(k, scored)]
+
+    def invalidate(self, namespace: Optional[str] = None):
+        with self._lock:
+            if namespace is None:
+                self._namespaces.clear()
+            else:
+                self._namespaces.pop(namespace, None)
+
+    def _get_state(self, namespace: str) -> dict:
+        with self._lock:
+            state = self._namespaces.get(namespace)
+            if (
+                state is None
+                or time.monotonic() - state["loaded_at"] > self.reload_interval
+            ):
+                state = self._load(namespace)
+                self._namespaces[namespace] = state
+            elif state["pending"]:
+                self._merge_pending(state)
+            return state
+
+    def _load(self, namespace: str) -> dict:
+        ids: List[str] = []
+        rows: List[List[float]] = []
+        with self.engine.connect() as conn:
+            result = conn.execute(
+                text(
+                    "SELECT memory_id, embedding FROM long_term_memory "
+                    "WHERE namespace = :namespace AND embedding IS NOT NULL"
+                ),
+                {"namespace": namespace},
+            )
+            for memory_id, embedding in result:
+                vector = unpack_vector(embedding)
+                if len(vector) == self.dimensions:
+                    ids.append(memory_id)
+                    rows.append(vector)
+
+        logger.debug(f"Loaded {len(ids)} embeddings for namespace '{namespace}'")
+        return {
+            "ids": ids,
+            "matrix": self._to_matrix(rows),
+            "pending": [],
+            "loaded_at": time.monotonic(),
+        }
+
+    def _merge_pending(self, state: dict):
+        pending = state["pending"]
+        state["pending"] = []
+        state["ids"] = state["ids"] + [memory_id for memory_id, _ in pending]
+        new_rows = [vector for _, vector in pending]
+        if NUMPY_AVAILABLE:
+            state["matrix"] = np.vstack([state["matrix"], self._to_matrix(new_rows)])
+        else:
+            state["matrix"] = state["matrix"] + new_rows
+
+    def _to_matrix(self, rows: List[List[float]]):
+        if NUMPY_AVAILABLE:
+            if not rows:
+                return np.zeros((0, self.dimensions), dtype=np.float32)
+            return np.asarray(rows, dtype=np.float32)
+        return rows
+
+
+class PgVectorIndex(VectorIndex):
+    """Nearest-neighbour search with the pgvector extension"""
+
+    name = "pgvector"
+
+    @staticmethod
+    def is_available(conn) -> bool:
+        """Check whether the pgvector extension can be used on this server"""
+        return (
+            conn.execute(
+                text("SELECT 1 FROM pg_available_extensions WHERE name = 'vector'")
+            ).first()
+            is not None
+        )
+
+    def setup(self, conn):
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+        conn.execute(
+            text(
+                f"ALTER TABLE long_term_memory ADD COLUMN IF NOT EXISTS embedding vector({int(self.dimensions)})"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_long_term_embedding ON long_term_memory "
+                "USING hnsw (embedding vector_cosine_ops)"
+            )
+        )
+
+    def add_many(self, conn, items: List[Tuple[str, str, List[float]]]):
+        if not items:
+            return
+        conn.execute(
+            text(
+                "UPDATE long_term_memory SET embedding = CAST(:embedding AS vector) "
+                "WHERE memory_id = :memory_id"
+            ),
+            [
+                {"memory_id": memory_id, "embedding": self._literal(vector)}
+                for memory_id, _, vector in items
+            ],
+        )
+
+    def search(
+        self, namespace: str, vector: List[float], k: int
+    ) -> List[Tuple[str, float]]:
+        with self.engine.connect() as conn:
+            result = conn.execute(
+                text(
+                    """SELECT memory_id, 1 - (embedding <=> CAST(:query AS vector)) AS similarity
+                       FROM long_term_memory
+                       WHERE namespace = :namespace AND embedding IS NOT NULL
+                       ORDER BY embedding <=> CAST(:query AS vector)
+                       LIMIT :k"""
+                ),
+                {"query": self._literal(vector), "namespace": namespace, "k": k},
+            )
+            return [(memory_id, float(similarity)) for memory_id, similarity in result]
+
+    @staticmethod
+    def _literal(vector: Sequence[float]) -> str:
+        return "[" + ",".join(f"{value:.7g}" for value in vector) + "]"
+
+
+def create_vector_index(engine, dimensions: int, conn=None) -> VectorIndex:
+    """Pick pgvector on PostgreSQL when the extension is available, else a flat index"""
+    if engine.dialect.name == "postgresql" and conn is not None:
+        try:
+            if PgVectorIndex.is_available(conn):
+                return PgVectorIndex(engine, dimensions)
+        except Exception as e:
+            logger.debug(f"pgvector availability check failed: {e}")
+        logger.info("pgvector not available, using flat in-process vector index")
+    return FlatVectorIndex(engine, dimensions)
@@ -0,0 +1,97 @@
+"""
+Memory write notifications shared by every manager of a database
+
+Caches derived from memory contents (auto-ingest retrieval results,
+conscious-context snapshots) live on each ``Memori`` instance, while several
+instances in one process often use the same database through their own
+``SQLAlchemyDatabaseManager``. Listeners are therefore kept per database URL,
+so a write through any manager reaches the caches of every instance using
+that database. Bound-method listeners are held weakly and never keep their
+instance alive. Writes from other processes are not seen; they show up when
+cached entries expire.
+"""
+
+import threading
+import weakref
+from typing import Any, Callable, Dict, List
+
+from loguru import logger
+
+# Conscious-agent promotions are merged into the promoting instance's
+# snapshot directly; other instances see them as plain short-term writes
+LOCAL_MERGE_TYPES = ("conscious_context",)
+
+
+class WriteListeners:
+    """Callbacks notified with ``(namespace, memory_type)`` after memory writes"""
+
+    def __init__(self):
+        # [owner ref, listener ref]
+        self._entries: List[list] = []
+        self._lock = threading.Lock()
+
+    def add(self, listener: Callable[[str, str], None], owner: Any):
+        """Register ``listener`` on behalf of ``owner`` (the registering manager)"""
+        with self._lock:
+            if any(ref() == listener for _, ref in self._entries):
+                return
+            self._entries.append([weakref.ref(owner), _listener_ref(listener)])
+
+    def remove(self, listener: Callable[[str, str], None]):
+        with self._lock:
+            self._entries = [entry for entry in self._entries if entry[1]() != listener]
+
+    def remove_owner(self, owner: Any):
+        """Drop every listener registered by ``owner``"""
+        with self._lock:
+            self._entries = [
+                entry for entry in self._entries if entry[0]() is not owner
+            ]
+
+    def notify(self, namespace: str, memory_type: str, owner: Any):
+        """Call every live listener; ``owner`` is the manager that wrote"""
+        with self._lock:
+            entries = list(self._entries)
+
+        dead = False
+        for owner_ref, listener_ref in entries:
+            listener = listener_ref()
+            if listener is None:
+                dead = True
+                continue
+            kind = memory_type
+            if memory_type in LOCAL_MERGE_TYPES and owner_ref() is not owner:
+                kind = "short_term"
+            try:
+                listener(namespace, kind)
+            except Exception as e:
+                logger.warning(f"Memory write listener failed: {e}")
+
+        if dead:
+            with self._lock:
+                self._entries = [
+                    entry for entry in self._entries if entry[1]() is not None
+                ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _listener_ref(listener: Callable) -> Callable[[], Any]:
+    if hasattr(listener, "__self__") and hasattr(listener, "__func__"):
+        return weakref.WeakMethod(listener)
+    # Plain functions and lambdas often have no other reference
+    return lambda: listener
+
+
+_shared_listeners: Dict[str, WriteListeners] = {}
+_shared_listeners_lock = threading.Lock()
+
+
+def get_write_listeners(database_url: str) -> WriteListeners:
+    """Return the listeners shared by every manager of ``database_url``"""
+    with _shared_listeners_lock:
+        listeners = _shared_listeners.get(database_url)
+        if listeners is None:
+            listeners = _shared_listeners[database_url] = WriteListeners()
+        return listeners
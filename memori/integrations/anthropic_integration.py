@@ -18,6 +18,8 @@ from typing import Optional
 
 from loguru import logger
 
+from .streaming import StreamAccumulator, attach_tee
+
 
 class MemoriAnthropic:
     """
@@ -71,10 +73,24 @@ class MemoriAnthropic:
 
                 # Record conversation if memori is enabled
                 if self._memori.is_enabled:
+                    if kwargs.get("stream"):
+                        # Recorded by the tee once the caller consumes the stream
+                        return self._tee_stream(kwargs, response)
                     self._record_conversation(kwargs, response)
 
                 return response
 
+            def _tee_stream(self, kwargs, stream):
+                """Record a streamed response once it has been fully consumed"""
+                accumulator = StreamAccumulator()
+
+                def on_complete():
+                    self._record_conversation(
+                        kwargs, accumulator.as_anthropic_response()
+                    )
+
+                return attach_tee(stream, accumulator.add_anthropic_event, on_complete)
+
             def _inject_context(self, kwargs):
                 """Inject relevant context into messages"""
                 try:
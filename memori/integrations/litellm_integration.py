@@ -171,6 +171,13 @@ class LiteLLMCallbackManager:
                 # This callback is for recording AFTER the response
                 pass
 
+            # Streaming calls are recorded once, from the response LiteLLM
+            # assembles after the final chunk; intermediate chunks are skipped
+            if kwargs.get("stream"):
+                response = kwargs.get("complete_streaming_response")
+                if response is None:
+                    return
+
             # Extract user input
             user_input = ""
             messages = kwargs.get("messages", [])
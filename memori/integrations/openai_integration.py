@@ -26,8 +26,16 @@ Usage:
     # Conversation is automatically recorded to Memori
 """
 
+import asyncio
+import functools
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from loguru import logger
 
+from .streaming import StreamAccumulator, attach_tee
+
 # Global registry of enabled Memori instances
 _enabled_memori_instances = []
 
@@ -41,6 +49,68 @@ class OpenAIInterceptor:
     _original_methods = {}
     _is_patched = False
 
+    # Bounded thread pool used by async clients for blocking memory work
+    # (context retrieval, conversation recording) so it never runs on the loop
+    async_executor_workers = 4
+    _async_executor = None
+    _async_executor_lock = threading.Lock()
+
+    @classmethod
+    def configure_async_executor(cls, max_workers: int):
+        """
+        Set the number of threads async clients use for memory lookups.
+
+        Args:
+            max_workers: Maximum concurrent context retrievals/recordings
+                issued from AsyncOpenAI clients
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        cls.async_executor_workers = max_workers
+        cls._shutdown_async_executor(wait=False)
+
+    @classmethod
+    def _get_async_executor(cls) -> ThreadPoolExecutor:
+        if cls._async_executor is None:
+            with cls._async_executor_lock:
+                if cls._async_executor is None:
+                    cls._async_executor = ThreadPoolExecutor(
+                        max_workers=cls.async_executor_workers,
+                        thread_name_prefix="memori-async-context",
+                    )
+        return cls._async_executor
+
+    @classmethod
+    def _shutdown_async_executor(cls, wait: bool = True):
+        with cls._async_executor_lock:
+            executor, cls._async_executor = cls._async_executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    @classmethod
+    async def _run_in_async_executor(cls, func, *args):
+        """Run a blocking memory operation without stalling the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            cls._get_async_executor(), functools.partial(func, *args)
+        )
+
+    @classmethod
+    def _has_context_injection(cls) -> bool:
+        """Whether any enabled instance would inject context into a request."""
+        return any(
+            memori_instance.is_enabled
+            and (memori_instance.conscious_ingest or memori_instance.auto_ingest)
+            for memori_instance in _enabled_memori_instances
+        )
+
+    @classmethod
+    def _has_recording(cls) -> bool:
+        """Whether any enabled instance would record a response."""
+        return any(
+            memori_instance.is_enabled for memori_instance in _enabled_memori_instances
+        )
+
     @classmethod
     def patch_openai(cls):
         """Patch OpenAI module to intercept API calls."""
@@ -105,7 +175,11 @@ class OpenAIInterceptor:
             )
 
             # Record conversation for enabled Memori instances
-            if not stream:  # Don't record streaming here - handle separately
+            if stream:
+                # Streams are recorded by a tee once the caller has consumed them
+                if cls._has_recording():
+                    result = cls._tee_stream(result, options, client_type)
+            else:
                 cls._record_conversation_for_enabled_instances(
                     options, result, client_type
                 )
@@ -162,10 +236,16 @@ class OpenAIInterceptor:
                 **kwargs,
             )
 
-            # Record conversation for enabled Memori instances
-            if not stream:
-                cls._record_conversation_for_enabled_instances(
-                    options, result, client_type
+            # Record conversation for enabled Memori instances off the event loop
+            if stream:
+                if cls._has_recording():
+                    result = cls._tee_async_stream(result, options, client_type)
+            elif cls._has_recording():
+                await cls._run_in_async_executor(
+                    cls._record_conversation_for_enabled_instances,
+                    options,
+                    result,
+                    client_type,
                 )
 
             return result
@@ -176,19 +256,68 @@ class OpenAIInterceptor:
         if original_prepare_key in cls._original_methods:
             original_prepare = cls._original_methods[original_prepare_key]
 
-            def patched_async_prepare_options(self, options):
-                # Call original method first
+            async def patched_async_prepare_options(self, options):
+                # Call original method first (a coroutine on current clients)
                 options = original_prepare(self, options)
-
-                # Inject context for enabled Memori instances
-                options = cls._inject_context_for_enabled_instances(
-                    options, client_type
-                )
+                if inspect.isawaitable(options):
+                    options = await options
+
+                # Inject context on the bounded executor; the database searches
+                # behind it are blocking and would otherwise stall the loop
+                if cls._has_context_injection():
+                    options = await cls._run_in_async_executor(
+                        cls._inject_context_for_enabled_instances,
+                        options,
+                        client_type,
+                    )
 
                 return options
 
             client_class._prepare_options = patched_async_prepare_options
 
+    @classmethod
+    def _should_record_stream(cls, options) -> bool:
+        """Whether a streamed request is a user conversation worth teeing."""
+        json_data = getattr(options, "json_data", None) or {}
+        if "messages" in json_data:
+            return not cls._is_internal_agent_call(json_data)
+        return "prompt" in json_data
+
+    @classmethod
+    def _tee_stream(cls, stream, options, client_type):
+        """Record a sync Stream once it has been fully consumed."""
+        if not cls._should_record_stream(options):
+            return stream
+
+        accumulator = StreamAccumulator()
+
+        def on_complete():
+            cls._record_conversation_for_enabled_instances(
+                options, accumulator.as_openai_response(), client_type
+            )
+
+        return attach_tee(stream, accumulator.add_openai_chunk, on_complete)
+
+    @classmethod
+    def _tee_async_stream(cls, stream, options, client_type):
+        """Record an AsyncStream once it has been fully consumed."""
+        if not cls._should_record_stream(options):
+            return stream
+
+        accumulator = StreamAccumulator()
+
+        async def on_complete():
+            await cls._run_in_async_executor(
+                cls._record_conversation_for_enabled_instances,
+                options,
+                accumulator.as_openai_response(),
+                client_type,
+            )
+
+        return attach_tee(
+            stream, accumulator.add_openai_chunk, on_complete, is_async=True
+        )
+
     @classmethod
     def _inject_context_for_enabled_instances(cls, options, client_type):
         """Inject context for all enabled Memori instances with conscious/auto ingest."""
@@ -400,6 +529,7 @@ class OpenAIInterceptor:
 
             cls._is_patched = False
             cls._original_methods.clear()
+            cls._shutdown_async_executor(wait=False)
             logger.debug("OpenAI module patches removed")
 
         except ImportError:
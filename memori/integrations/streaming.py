@@ -0,0 +1,236 @@
+"""
+Stream tee for recording streamed completions
+
+Streamed responses are passed through to the caller untouched while a
+``StreamAccumulator`` collects only the text fragments (and tool-call
+fragments) of each chunk. Once the stream is exhausted the accumulated
+response is rebuilt as a lightweight object shaped like the non-streaming
+response, so the existing recording code can ingest it unchanged.
+
+Each chunk is handed to the caller before it is inspected, so the tee adds
+nothing to time-to-first-token; recording runs once, after the final chunk.
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator
+
+from loguru import logger
+
+
+class StreamAccumulator:
+    """Incrementally collects the content of a streamed completion"""
+
+    __slots__ = (
+        "text_parts",
+        "tool_calls",
+        "finish_reason",
+        "model",
+        "usage",
+        "input_tokens",
+        "output_tokens",
+        "chunks",
+    )
+
+    def __init__(self):
+        self.text_parts = []
+        self.tool_calls = {}  # index -> {"name": str, "arguments": [str]}
+        self.finish_reason = None
+        self.model = None
+        self.usage = None
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.chunks = 0
+
+    @property
+    def text(self) -> str:
+        return "".join(self.text_parts)
+
+    # ------------------------------------------------------------------
+    # OpenAI (and OpenAI-compatible) chunks
+    # ------------------------------------------------------------------
+
+    def add_openai_chunk(self, chunk: Any):
+        """Accumulate a ChatCompletionChunk (or legacy Completion chunk)"""
+        self.chunks += 1
+        if self.model is None:
+            self.model = getattr(chunk, "model", None)
+        if getattr(chunk, "usage", None):
+            self.usage = chunk.usage
+
+        choices = getattr(chunk, "choices", None)
+        if not choices:
+            return
+        choice = choices[0]
+        if getattr(choice, "finish_reason", None):
+            self.finish_reason = choice.finish_reason
+
+        delta = getattr(choice, "delta", None)
+        if delta is None:
+            # Legacy completions stream text on the choice itself
+            text = getattr(choice, "text", None)
+            if text:
+                self.text_parts.append(text)
+            return
+
+        if getattr(delta, "content", None):
+            self.text_parts.append(delta.content)
+
+        for tool_call in getattr(delta, "tool_calls", None) or []:
+            entry = self.tool_calls.setdefault(
+                getattr(tool_call, "index", 0), {"name": "", "arguments": []}
+            )
+            function = getattr(tool_call, "function", None)
+            if function is not None:
+                if getattr(function, "name", None):
+                    entry["name"] += function.name
+                if getattr(function, "arguments", None):
+                    entry["arguments"].append(function.arguments)
+
+    def as_openai_response(self) -> SimpleNamespace:
+        """Build an object shaped like a ChatCompletion from the accumulated stream"""
+        tool_calls = [
+            SimpleNamespace(
+                function=SimpleNamespace(
+                    name=entry["name"], arguments="".join(entry["arguments"])
+                )
+            )
+            for _, entry in sorted(self.tool_calls.items())
+        ]
+        text = self.text
+        message = SimpleNamespace(
+            role="assistant",
+            content=text or None,
+            tool_calls=tool_calls or None,
+            function_call=None,
+        )
+        choice = SimpleNamespace(
+            index=0, message=message, text=text, finish_reason=self.finish_reason
+        )
+        return SimpleNamespace(choices=[choice], usage=self.usage, model=self.model)
+
+    # ------------------------------------------------------------------
+    # Anthropic events
+    # ------------------------------------------------------------------
+
+    def add_anthropic_event(self, event: Any):
+        """Accumulate an Anthropic MessageStreamEvent"""
+        self.chunks += 1
+        event_type = getattr(event, "type", None)
+
+        if event_type == "content_block_delta":
+            delta = event.delta
+            delta_type = getattr(delta, "type", None)
+            if delta_type == "text_delta":
+                self.text_parts.append(delta.text)
+            elif delta_type == "input_json_delta":
+                entry = self.tool_calls.get(event.index)
+                if entry is not None:
+                    entry["arguments"].append(delta.partial_json)
+
+        elif event_type == "content_block_start":
+            block = event.content_block
+            if getattr(block, "type", None) == "tool_use":
+                self.tool_calls[event.index] = {"name": block.name, "arguments": []}
+
+        elif event_type == "message_start":
+            message = event.message
+            self.model = getattr(message, "model", None)
+            usage = getattr(message, "usage", None)
+            if usage is not None:
+                self.input_tokens = getattr(usage, "input_tokens", 0) or 0
+                self.output_tokens = getattr(usage, "output_tokens", 0) or 0
+
+        elif event_type == "message_delta":
+            stop_reason = getattr(event.delta, "stop_reason", None)
+            if stop_reason:
+                self.finish_reason = stop_reason
+            usage = getattr(event, "usage", None)
+            if usage is not None:
+                self.output_tokens = getattr(usage, "output_tokens", 0) or 0
+
+    def as_anthropic_response(self) -> SimpleNamespace:
+        """Build an object shaped like an Anthropic Message from the accumulated stream"""
+        content = []
+        if self.text_parts:
+            content.append(SimpleNamespace(type="text", text=self.text))
+        for _, entry in sorted(self.tool_calls.items()):
+            arguments = "".join(entry["arguments"])
+            try:
+                tool_input = json.loads(arguments) if arguments else {}
+            except ValueError:
+                tool_input = arguments
+            content.append(
+                SimpleNamespace(type="tool_use", name=entry["name"], input=tool_input)
+            )
+        return SimpleNamespace(
+            content=content,
+            model=self.model,
+            stop_reason=self.finish_reason,
+            usage=SimpleNamespace(
+                input_tokens=self.input_tokens, output_tokens=self.output_tokens
+            ),
+        )
+
+
+def tee_stream(
+    iterator: Iterator[Any],
+    accumulate: Callable[[Any], None],
+    on_complete: Callable[[], None],
+) -> Iterator[Any]:
+    """
+    Yield every item of ``iterator`` unchanged, feeding it to ``accumulate``
+    after the consumer has received it, and call ``on_complete`` once the
+    stream is exhausted. Streams closed early are not recorded.
+    """
+    for item in iterator:
+        yield item
+        try:
+            accumulate(item)
+        except Exception as e:
+            logger.debug(f"Stream tee: failed to accumulate chunk: {e}")
+
+    try:
+        on_complete()
+    except Exception as e:
+        logger.error(f"Stream tee: failed to record streamed response: {e}")
+
+
+async def atee_stream(
+    iterator: AsyncIterator[Any],
+    accumulate: Callable[[Any], None],
+    on_complete: Callable[[], Awaitable[None]],
+) -> AsyncIterator[Any]:
+    """Async counterpart of tee_stream; ``on_complete`` is awaited"""
+    async for item in iterator:
+        yield item
+        try:
+            accumulate(item)
+        except Exception as e:
+            logger.debug(f"Stream tee: failed to accumulate chunk: {e}")
+
+    try:
+        await on_complete()
+    except Exception as e:
+        logger.error(f"Stream tee: failed to record streamed response: {e}")
+
+
+def attach_tee(stream: Any, accumulate, on_complete, is_async: bool = False):
+    """
+    Install a tee on an SDK stream object in place
+
+    OpenAI and Anthropic ``Stream``/``AsyncStream`` objects read items from
+    their ``_iterator`` attribute, so replacing it keeps the object (and its
+    context-manager and ``close()`` behaviour) intact. Other iterables are
+    wrapped in a generator instead.
+
+    Returns:
+        The stream object to hand back to the caller
+    """
+    tee = atee_stream if is_async else tee_stream
+    if hasattr(stream, "_iterator"):
+        stream._iterator = tee(stream._iterator, accumulate, on_complete)
+        return stream
+    if is_async:
+        return tee(stream.__aiter__(), accumulate, on_complete)
+    return tee(iter(stream), accumulate, on_complete)
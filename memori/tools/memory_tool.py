@@ -82,15 +82,21 @@ class MemoryTool:
 
             # Create search engine if not already initialized
             if not hasattr(self, "_search_engine"):
+                planner_mode = getattr(
+                    getattr(self.memori, "search_engine", None),
+                    "planner_mode",
+                    "hybrid",
+                )
                 if (
                     hasattr(self.memori, "provider_config")
                     and self.memori.provider_config
                 ):
                     self._search_engine = MemorySearchEngine(
-                        provider_config=self.memori.provider_config
+                        provider_config=self.memori.provider_config,
+                        planner_mode=planner_mode,
                     )
                 else:
-                    self._search_engine = MemorySearchEngine()
+                    self._search_engine = MemorySearchEngine(planner_mode=planner_mode)
 
             # Execute search using retrieval agent
             results = self._search_engine.execute_search(
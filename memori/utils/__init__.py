@@ -31,7 +31,7 @@ from .helpers import (
 )
 
 # Logging utilities
-from .logging import LoggingManager, get_logger
+from .logging import LoggingManager, debug_enabled, get_logger
 
 # Core Pydantic models
 from .pydantic_models import (
@@ -45,6 +45,9 @@ from .pydantic_models import (
     RetentionType,
 )
 
+# Tracing and metrics hooks
+from .tracing import RecordingTracer, Tracer, get_tracer, set_tracer
+
 # Validation utilities
 from .validators import DataValidator, MemoryValidator
 
@@ -86,4 +89,10 @@ __all__ = [
     # Logging
     "LoggingManager",
     "get_logger",
+    "debug_enabled",
+    # Tracing
+    "Tracer",
+    "RecordingTracer",
+    "get_tracer",
+    "set_tracer",
 ]
@@ -0,0 +1,166 @@
+"""
+In-process caching utilities
+
+``TTLLRUCache`` is a small thread-safe mapping with a size bound, least
+recently used eviction and a per-entry time to live. It backs the auto-ingest
+retrieval cache in ``Memori`` and other short-lived lookups that are safe to
+serve slightly stale for a few seconds. ``get_shared_cache`` hands out named
+process-wide instances so several objects can share one cache.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s.!?,;:]+$")
+_EDGE_PUNCTUATION = ".,!?;:'\"()[]{}<>"
+
+
+def normalize_cache_text(text: str) -> str:
+    """
+    Normalize free text for use in a cache key
+
+    Case, surrounding whitespace, repeated whitespace and trailing punctuation
+    are ignored, so retries such as "What do I like?" and "what do i like"
+    share one entry.
+    """
+    text = _WHITESPACE.sub(" ", (text or "").strip().casefold())
+    return _TRAILING_PUNCTUATION.sub("", text)
+
+
+def normalize_query_key(text: str, hashed: bool = False) -> str:
+    """
+    Normalize a query for use as a cache key
+
+    Like ``normalize_cache_text`` but punctuation around every word is folded
+    too, so "What's my *favorite* editor?" and "whats my favorite editor"
+    differ only where it matters. Punctuation inside words is kept ("next.js",
+    "c++" and "c#" stay distinct). With ``hashed`` the key is a fixed-size
+    digest, which keeps memory bounded for long prompts.
+    """
+    words = (
+        word.strip(_EDGE_PUNCTUATION + "*_`~").replace("'", "")
+        for word in (text or "").casefold().split()
+    )
+    key = " ".join(word for word in words if word)
+    if hashed:
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return key
+
+
+class TTLLRUCache:
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after insertion"""
+
+    _MISSING = object()
+
+    def __init__(self, max_size: int = 256, ttl: float = 60.0):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` (refreshing its LRU position) or ``default``"""
+        with self._lock:
+            entry = self._entries.get(key, self._MISSING)
+            if entry is self._MISSING:
+                self.misses += 1
+                return default
+
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Insert or replace ``key``, evicting the least recently used entry if full"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = (value, expires_at)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Remove a single key, returning True if it was cached"""
+        with self._lock:
+            if self._entries.pop(key, self._MISSING) is self._MISSING:
+                return False
+            self.invalidations += 1
+            return True
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove every key for which ``predicate(key)`` is true"""
+        with self._lock:
+            stale = [key for key in self._entries if predicate(key)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self):
+        """Remove all entries (counters are kept)"""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return size, hit/miss counters and hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+_shared_caches: Dict[str, TTLLRUCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_cache(name: str, max_size: int = 256, ttl: float = 60.0) -> TTLLRUCache:
+    """
+    Return the process-wide cache registered under ``name``
+
+    The first caller creates it with ``max_size`` and ``ttl``; later callers get
+    the same instance regardless of the sizes they pass.
+    """
+    with _shared_caches_lock:
+        cache = _shared_caches.get(name)
+        if cache is None:
+            cache = TTLLRUCache(max_size=max_size, ttl=ttl)
+            _shared_caches[name] = cache
+        return cache
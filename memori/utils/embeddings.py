@@ -0,0 +1,163 @@
+"""
+Text embedders for vector-based memory retrieval
+
+Embedders turn memory text into unit-length float vectors. ``HashingEmbedder``
+runs fully offline (feature hashing of words and character trigrams) and is the
+default for tests and local deployments; ``OpenAIEmbedder`` calls the embeddings
+endpoint of the configured OpenAI-compatible provider.
+"""
+
+import hashlib
+import math
+import re
+from typing import TYPE_CHECKING, List, Optional, Union
+
+if TYPE_CHECKING:
+    from ..core.providers import ProviderConfig
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def normalize_vector(vector: List[float]) -> List[float]:
+    """Scale a vector to unit length (zero vectors are returned unchanged)"""
+    norm = math.sqrt(sum(value * value for value in vector))
+    if norm == 0:
+        return list(vector)
+    return [value / norm for value in vector]
+
+
+class Embedder:
+    """Base class for text embedders"""
+
+    model_name: str = "embedder"
+    dimensions: int = 0
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts into unit-length vectors"""
+        raise NotImplementedError
+
+    def embed_one(self, text: str) -> List[float]:
+        """Embed a single text"""
+        return self.embed([text])[0]
+
+
+class HashingEmbedder(Embedder):
+    """
+    Offline embedder based on signed feature hashing
+
+    Words and character trigrams are hashed into a fixed number of buckets,
+    so texts that share vocabulary or word stems land close together without
+    any model download or network access.
+    """
+
+    def __init__(self, dimensions: int = 256, use_char_ngrams: bool = True):
+        if dimensions < 8:
+            raise ValueError("dimensions must be at least 8")
+        self.dimensions = dimensions
+        self.use_char_ngrams = use_char_ngrams
+        self.model_name = f"hashing-{dimensions}"
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed_text(text or "") for text in texts]
+
+    def _embed_text(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        for feature, weight in self._features(text.lower()):
+            digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dimensions
+            sign = 1.0 if digest[4] & 1 else -1.0
+            vector[bucket] += sign * weight
+        return normalize_vector(vector)
+
+    def _features(self, text: str):
+        for token in _TOKEN_PATTERN.findall(text):
+            yield f"w:{token}", 1.0
+            if self.use_char_ngrams and len(token) > 3:
+                padded = f"<{token}>"
+                for i in range(len(padded) - 2):
+                    yield f"c:{padded[i:i + 3]}", 0.5
+
+
+class OpenAIEmbedder(Embedder):
+    """Embedder backed by an OpenAI-compatible embeddings endpoint"""
+
+    DEFAULT_DIMENSIONS = {
+        "text-embedding-3-small": 1536,
+        "text-embedding-3-large": 3072,
+        "text-embedding-ada-002": 1536,
+    }
+
+    def __init__(
+        self,
+        model: str = "text-embedding-3-small",
+        api_key: Optional[str] = None,
+        provider_config: Optional["ProviderConfig"] = None,
+        dimensions: Optional[int] = None,
+    ):
+        if provider_config:
+            self.client = provider_config.create_client()
+        else:
+            import openai
+
+            self.client = openai.OpenAI(api_key=api_key)
+
+        self.model_name = model
+        self.requested_dimensions = dimensions
+        self.dimensions = dimensions or self.DEFAULT_DIMENSIONS.get(model, 1536)
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        kwargs = {"model": self.model_name, "input": [text or " " for text in texts]}
+        if self.requested_dimensions:
+            kwargs["dimensions"] = self.requested_dimensions
+
+        response = self.client.embeddings.create(**kwargs)
+        vectors = [
+            normalize_vector(item.embedding)
+            for item in sorted(response.data, key=lambda item: item.index)
+        ]
+        if vectors:
+            self.dimensions = len(vectors[0])
+        return vectors
+
+
+def create_embedder(
+    spec: Union[str, Embedder, None],
+    api_key: Optional[str] = None,
+    provider_config: Optional["ProviderConfig"] = None,
+) -> Optional[Embedder]:
+    """
+    Build an embedder from a Memori configuration value
+
+    Args:
+        spec: None (embeddings disabled), "local"/"hashing", "openai",
+            "openai:<model>", or an Embedder instance
+        api_key: API key for remote embedders
+        provider_config: Provider configuration for remote embedders
+
+    Returns:
+        Embedder instance or None
+    """
+    if spec is None or isinstance(spec, Embedder):
+        return spec
+
+    if not isinstance(spec, str):
+        raise ValueError(f"Unsupported embedder specification: {spec!r}")
+
+    name, _, option = spec.partition(":")
+    name = name.strip().lower()
+
+    if name in ("local", "hashing"):
+        return HashingEmbedder(dimensions=int(option) if option else 256)
+    if name == "openai":
+        return OpenAIEmbedder(
+            model=option or "text-embedding-3-small",
+            api_key=api_key,
+            provider_config=provider_config,
+        )
+
+    raise ValueError(f"Unknown embedder '{spec}', expected 'local' or 'openai'")
+
+
+def embedding_text(summary: Optional[str], content: Optional[str]) -> str:
+    """Text that represents a memory for embedding purposes"""
+    return "\n".join(part for part in (summary, content) if part)
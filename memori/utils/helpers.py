@@ -180,6 +180,54 @@ class DateTimeUtils:
         else:
             return "just now"
 
+    _TIME_RANGE_UNITS = {
+        "hour": timedelta(hours=1),
+        "day": timedelta(days=1),
+        "week": timedelta(weeks=1),
+        "month": timedelta(days=30),
+        "year": timedelta(days=365),
+    }
+
+    @staticmethod
+    def parse_time_range(
+        time_range: Optional[str], now: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        """
+        Convert a relative time range into its start datetime
+
+        Understands 'today', 'yesterday', 'recent', 'last_week',
+        'this_month', 'past 3 days', 'last_2_weeks' and similar phrases.
+        Returns None for empty or unrecognized ranges (no time filter).
+        """
+        if not time_range:
+            return None
+        now = now or datetime.now()
+        words = time_range.strip().lower().replace("_", " ").replace("-", " ").split()
+        if not words:
+            return None
+
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if words == ["today"]:
+            return midnight
+        if words == ["yesterday"]:
+            return midnight - timedelta(days=1)
+        if words in (["recent"], ["recently"]):
+            return now - timedelta(days=7)
+
+        if words[0] in ("last", "past", "this", "previous"):
+            words = words[1:]
+        count = 1
+        if words and words[0].isdigit():
+            count = int(words[0])
+            words = words[1:]
+        if len(words) != 1:
+            return None
+
+        unit = DateTimeUtils._TIME_RANGE_UNITS.get(words[0].rstrip("s"))
+        if unit is None:
+            return None
+        return now - unit * count
+
 
 class JsonUtils:
     """JSON handling utilities"""
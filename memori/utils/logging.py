@@ -202,3 +202,21 @@ class LoggingManager:
 def get_logger(name: str = "memori") -> "logger":
     """Convenience function to get a logger"""
     return LoggingManager.get_logger(name)
+
+
+_DEBUG_LEVEL_NO = logger.level("DEBUG").no
+
+
+def debug_enabled() -> bool:
+    """
+    Whether any handler accepts DEBUG records
+
+    Hot paths check this once per call and skip building debug messages
+    (f-strings, result key listings, parameter dumps) that loguru would only
+    discard at INFO and above. Reads loguru's private core state; if a
+    release moves it, debug messages are emitted as before.
+    """
+    min_level = getattr(getattr(logger, "_core", None), "min_level", None)
+    if not isinstance(min_level, (int, float)):
+        return True
+    return min_level <= _DEBUG_LEVEL_NO
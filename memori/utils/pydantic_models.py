@@ -304,6 +304,14 @@ class ProcessedLongTermMemory(BaseModel):
         )
 
 
+class ProcessedLongTermMemoryBatch(BaseModel):
+    """Several processed memories returned by a single batched agent call"""
+
+    memories: List[ProcessedLongTermMemory] = Field(
+        description="One processed memory per input conversation, with conversation_id copied from the input"
+    )
+
+
 class UserContextProfile(BaseModel):
     """Permanent user context for conscious ingestion"""
 
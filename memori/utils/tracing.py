@@ -0,0 +1,444 @@
+"""
+Pluggable tracing and metrics for the hot paths
+
+Stages of an intercepted call (context injection, auto-ingest retrieval,
+search, ranking, conversation recording, background memory processing and
+the LLM calls made by the agents) are wrapped in spans, and database round
+trips, row counts and cache hits are recorded as histograms and counters.
+The process-wide tracer is a no-op by default, so instrumented code pays
+one attribute check per stage. ``RecordingTracer`` keeps in-process
+histograms; ``OpenTelemetryTracer`` and ``PrometheusTracer`` export through
+the optional ``opentelemetry-api`` and ``prometheus-client`` packages.
+
+Metrics:
+    memori.stage.duration   seconds per span, label ``stage``
+    memori.db.duration      seconds per database round trip, label ``operation``
+    memori.rows             rows handled by a stage, label ``stage``
+    memori.context_cache    auto-ingest cache lookups, label ``result``
+"""
+
+import contextvars
+import functools
+import inspect
+import threading
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Optional, Union
+
+from loguru import logger
+
+STAGE_DURATION = "memori.stage.duration"
+DB_DURATION = "memori.db.duration"
+ROWS = "memori.rows"
+CONTEXT_CACHE = "memori.context_cache"
+
+
+class _NoOpSpan:
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_SPAN = _NoOpSpan()
+
+
+class Tracer:
+    """
+    No-op tracer and base class for exporters
+
+    ``span()`` returns a context manager whose value supports
+    ``set_attribute(key, value)``; ``observe()`` records a histogram value
+    and ``increment()`` adds to a counter. Exporters set ``enabled``.
+    """
+
+    enabled = False
+
+    def span(self, name: str, **attributes):
+        return _NOOP_SPAN
+
+    def observe(self, name: str, value: float, **labels):
+        pass
+
+    def increment(self, name: str, value: int = 1, **labels):
+        pass
+
+
+class RecordedSpan:
+    """A finished (or running) span kept by RecordingTracer"""
+
+    __slots__ = ("name", "parent", "attributes", "duration", "error")
+
+    def __init__(self, name: str, parent: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.parent = parent
+        self.attributes = attributes
+        self.duration = 0.0
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "parent": self.parent,
+            "duration_ms": self.duration * 1000,
+            "attributes": dict(self.attributes),
+            "error": self.error,
+        }
+
+
+class RecordingTracer(Tracer):
+    """
+    Keeps spans and histograms in memory
+
+    Histograms retain the last ``max_samples`` values per metric and label
+    set for percentiles; counts and totals cover every observation.
+
+    Args:
+        max_spans: Finished spans kept for inspection
+        max_samples: Values kept per histogram for percentiles
+    """
+
+    enabled = True
+
+    def __init__(self, max_spans: int = 1000, max_samples: int = 10000):
+        self.max_samples = max_samples
+        self.spans = deque(maxlen=max_spans)
+        self._histograms: Dict[tuple, list] = {}
+        self._counters: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+        self._current = contextvars.ContextVar("memori_span", default=None)
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        span = RecordedSpan(name, self._current.get(), attributes)
+        token = self._current.set(name)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.duration = time.perf_counter() - start
+            self._current.reset(token)
+            self.spans.append(span)
+            self.observe(STAGE_DURATION, span.duration, stage=name)
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                # [count, total, recent values]
+                histogram = self._histograms[key] = [
+                    0,
+                    0.0,
+                    deque(maxlen=self.max_samples),
+                ]
+            histogram[0] += 1
+            histogram[1] += value
+            histogram[2].append(value)
+
+    def increment(self, name: str, value: int = 1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Histogram summaries and counters keyed by metric and label values"""
+        with self._lock:
+            histograms = {
+                key: (count, total, sorted(values))
+                for key, (count, total, values) in self._histograms.items()
+            }
+            counters = dict(self._counters)
+
+        stats: Dict[str, Any] = {}
+        for (name, labels), (count, total, values) in histograms.items():
+            stats.setdefault(name, {})[self._label_key(labels)] = {
+                "count": count,
+                "mean": total / count,
+                "p50": values[int(0.50 * (len(values) - 1))],
+                "p95": values[int(0.95 * (len(values) - 1))],
+                "p99": values[int(0.99 * (len(values) - 1))],
+                "max": values[-1],
+            }
+        for (name, labels), count in counters.items():
+            stats.setdefault(name, {})[self._label_key(labels)] = count
+        return stats
+
+    @staticmethod
+    def _label_key(labels: tuple) -> str:
+        return ",".join(f"{key}={value}" for key, value in labels) or "total"
+
+    def reset(self):
+        with self._lock:
+            self.spans.clear()
+            self._histograms.clear()
+            self._counters.clear()
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Exports spans and metrics through the OpenTelemetry API
+
+    Uses the globally configured providers unless others are passed, so the
+    application's OpenTelemetry SDK setup decides where data goes.
+    """
+
+    enabled = True
+
+    def __init__(self, tracer_provider=None, meter_provider=None):
+        try:
+            from opentelemetry import metrics, trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetry tracing requires opentelemetry-api: "
+                "pip install memorisdk[opentelemetry]"
+            ) from e
+
+        self._tracer = trace.get_tracer("memori", tracer_provider=tracer_provider)
+        self._meter = metrics.get_meter("memori", meter_provider=meter_provider)
+        self._instruments: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        start = time.perf_counter()
+        with self._tracer.start_as_current_span(
+            name, attributes=self._attributes(attributes)
+        ) as span:
+            try:
+                yield span
+            finally:
+                self.observe(STAGE_DURATION, time.perf_counter() - start, stage=name)
+
+    def observe(self, name: str, value: float, **labels):
+        self._instrument(name, "histogram").record(
+            value, attributes=self._attributes(labels)
+        )
+
+    def increment(self, name: str, value: int = 1, **labels):
+        self._instrument(name, "counter").add(
+            value, attributes=self._attributes(labels)
+        )
+
+    def _instrument(self, name: str, kind: str):
+        instrument = self._instruments.get(name)
+        if instrument is None:
+            with self._lock:
+                instrument = self._instruments.get(name)
+                if instrument is None:
+                    if kind == "histogram":
+                        instrument = self._meter.create_histogram(
+                            name, unit="s" if name.endswith("duration") else "1"
+                        )
+                    else:
+                        instrument = self._meter.create_counter(name)
+                    self._instruments[name] = instrument
+        return instrument
+
+    @staticmethod
+    def _attributes(values: Dict[str, Any]) -> Dict[str, Any]:
+        # OpenTelemetry only accepts primitive attribute values
+        return {
+            key: value if isinstance(value, (str, bool, int, float)) else str(value)
+            for key, value in values.items()
+            if value is not None
+        }
+
+
+# Prometheus collectors per registry and metric name. A registry rejects a
+# second collector with the same name, so every PrometheusTracer on one
+# registry shares these.
+_prometheus_metrics: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_prometheus_lock = threading.Lock()
+
+
+class PrometheusTracer(Tracer):
+    """
+    Exposes stage timings and counters as Prometheus metrics
+
+    Spans become observations of ``memori_stage_duration_seconds``; no trace
+    trees are kept. Metrics are registered on ``registry`` (the default
+    prometheus_client registry if None) once per process and shared by every
+    tracer using it, and are served by the application's existing exporter,
+    e.g. ``prometheus_client.start_http_server``. Recording failures are
+    logged at debug level and never reach the instrumented code.
+    """
+
+    enabled = True
+
+    def __init__(self, registry=None):
+        try:
+            import prometheus_client
+        except ImportError as e:
+            raise ImportError(
+                "Prometheus metrics require prometheus-client: "
+                "pip install memorisdk[prometheus]"
+            ) from e
+
+        self._prometheus = prometheus_client
+        self._registry = registry or prometheus_client.REGISTRY
+        with _prometheus_lock:
+            self._metrics = _prometheus_metrics.setdefault(self._registry, {})
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        start = time.perf_counter()
+        try:
+            yield _NOOP_SPAN
+        finally:
+            self.observe(STAGE_DURATION, time.perf_counter() - start, stage=name)
+
+    def observe(self, name: str, value: float, **labels):
+        try:
+            self._metric(name, "histogram", labels).observe(value)
+        except Exception as e:
+            logger.debug(f"Prometheus observation of {name} failed: {e}")
+
+    def increment(self, name: str, value: int = 1, **labels):
+        try:
+            self._metric(name, "counter", labels).inc(value)
+        except Exception as e:
+            logger.debug(f"Prometheus increment of {name} failed: {e}")
+
+    def _metric(self, name: str, kind: str, labels: Dict[str, Any]):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with _prometheus_lock:
+                metric = self._metrics.get(name)
+                if metric is None:
+                    metric = self._metrics[name] = self._register(name, kind, labels)
+        return metric.labels(**{key: str(value) for key, value in labels.items()})
+
+    def _register(self, name: str, kind: str, labels: Dict[str, Any]):
+        metric_name = name.replace(".", "_")
+        if kind == "histogram" and name.endswith("duration"):
+            metric_name += "_seconds"
+        factory = (
+            self._prometheus.Histogram
+            if kind == "histogram"
+            else self._prometheus.Counter
+        )
+        try:
+            return factory(
+                metric_name, f"Memori {name}", sorted(labels), registry=self._registry
+            )
+        except ValueError:
+            # Registered outside this module (e.g. after a reload): reuse it
+            existing = getattr(self._registry, "_names_to_collectors", {}).get(
+                metric_name
+            )
+            if existing is None:
+                raise
+            return existing
+
+
+_tracer: Tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer"""
+    return _tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> Tracer:
+    """Install ``tracer`` process-wide (None restores the no-op tracer); returns the previous one"""
+    global _tracer
+    previous = _tracer
+    _tracer = tracer or Tracer()
+    if _tracer.enabled:
+        logger.info(f"Tracing enabled with {type(_tracer).__name__}")
+    return previous
+
+
+def create_tracer(spec: Union[str, Tracer, None]) -> Tracer:
+    """
+    Build a tracer from a Memori configuration value
+
+    Args:
+        spec: None or "none" (no-op), "recording", "opentelemetry"/"otel",
+            "prometheus", or a Tracer instance
+    """
+    if spec is None or isinstance(spec, Tracer):
+        return spec or Tracer()
+    if not isinstance(spec, str):
+        raise ValueError(f"Unsupported tracer specification: {spec!r}")
+
+    name = spec.strip().lower()
+    if name == "none":
+        return Tracer()
+    if name == "recording":
+        return RecordingTracer()
+    if name in ("opentelemetry", "otel"):
+        return OpenTelemetryTracer()
+    if name == "prometheus":
+        return PrometheusTracer()
+    raise ValueError(
+        f"Unknown tracer {spec!r}, expected 'recording', 'opentelemetry' or 'prometheus'"
+    )
+
+
+def traced(name: str, **attributes):
+    """Decorator running a function (sync or async) inside a span"""
+
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                tracer = _tracer
+                if not tracer.enabled:
+                    return await fn(*args, **kwargs)
+                with tracer.span(name, **attributes):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            with tracer.span(name, **attributes):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_engine(engine):
+    """Time every database round trip on ``engine`` while a tracer is enabled"""
+    from sqlalchemy import event
+
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _tracer.enabled and context is not None:
+        context._memori_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_memori_started", None)
+    if started is None:
+        return
+    operation = statement.lstrip().split(None, 1)[0].upper() if statement else "?"
+    _tracer.observe(DB_DURATION, time.perf_counter() - started, operation=operation)
@@ -0,0 +1,177 @@
+"""
+Heuristic search planner
+
+Table-driven checks of the categories, time ranges, importance and
+confidence ``LocalSearchPlanner`` assigns, and of which queries the hybrid
+``MemorySearchEngine`` answers locally and which it escalates to the LLM.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from memori.agents.local_planner import LocalSearchPlanner
+from memori.agents.retrieval_agent import MemorySearchEngine
+from memori.utils.pydantic_models import MemorySearchQuery
+
+THRESHOLD = 0.6
+
+# query: (categories, time_range)
+CLASSIFICATION_CASES = {
+    "What are my favorite editors?": (["preference"], None),
+    "what skills do I have?": (["skill"], None),
+    "what projects am I working on currently": (["context"], None),
+    "Which rules apply to code review?": (["rule"], None),
+    "what is my phone number": (["fact"], None),
+    # Generic verbs are not category words
+    "what do I know about postgres?": ([], None),
+    "what is the office like": (["fact"], None),
+    "what happened recently": ([], "recent"),
+    "notes from yesterday": ([], "yesterday"),
+    "What did we discuss about Kubernetes last week?": ([], "last_week"),
+    "decisions from the past 3 days": ([], "last_3_days"),
+    "what did I learn this month": (["skill"], "last_month"),
+}
+
+# query: (entity filters, confidence)
+CONFIDENCE_CASES = {
+    "tell me something": ([], 0.1),
+    "what skills do I have?": ([], 0.5),
+    "what do I know about postgres?": (["postgres"], 0.55),
+    "what happened recently": (["happened"], 0.6),
+    "What are my favorite editors?": (["editors"], 0.7),
+    "show important deadlines": (["deadlines", "show"], 0.65),
+    "Which rules apply to code review?": (["review", "apply", "code"], 0.7),
+    "What did we discuss about Kubernetes last week?": (
+        ["Kubernetes", "discuss"],
+        0.75,
+    ),
+    "Is Next.js my favorite framework?": (["Next.js", "framework"], 0.85),
+}
+
+
+@pytest.fixture
+def planner():
+    return LocalSearchPlanner()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query", CLASSIFICATION_CASES)
+def test_categories_and_time_range(planner, query):
+    categories, time_range = CLASSIFICATION_CASES[query]
+    plan, _ = planner.plan(query)
+
+    assert [c.value for c in plan.category_filters] == categories
+    assert plan.time_range == time_range
+    assert ("category_filter" in plan.search_strategy) == bool(categories)
+    assert ("temporal_filter" in plan.search_strategy) == bool(time_range)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "query, min_importance",
+    [
+        ("show important deadlines", 0.7),
+        ("anything critical about the launch", 0.7),
+        ("what is the key to the shed", 0.7),
+        ("show deadlines", 0.0),
+        ("importantly, the launch", 0.0),
+    ],
+)
+def test_importance(planner, query, min_importance):
+    plan, _ = planner.plan(query)
+
+    assert plan.min_importance == min_importance
+    assert ("importance_filter" in plan.search_strategy) == bool(min_importance)
+    assert "important" not in plan.entity_filters
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query", CONFIDENCE_CASES)
+def test_entities_and_confidence(planner, query):
+    entities, confidence = CONFIDENCE_CASES[query]
+    plan, score = planner.plan(query)
+
+    assert plan.entity_filters == entities
+    assert score == pytest.approx(confidence)
+
+
+@pytest.mark.unit
+def test_long_and_ambiguous_queries_lose_confidence(planner):
+    _, short = planner.plan("What are my favorite editors?")
+    _, long = planner.plan(
+        "What are my favorite editors and the plugins I set up for them back "
+        "when we were configuring the laptops for the whole team?"
+    )
+    _, ambiguous = planner.plan("my favorite skill rules for the current project")
+
+    assert short >= THRESHOLD
+    assert long < short
+    assert ambiguous < THRESHOLD
+
+
+class CountingPlanner:
+    """Stand-in for the OpenAI client recording which queries reach it"""
+
+    def __init__(self):
+        self.queries = []
+        self.beta = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(parse=self._parse))
+        )
+
+    def _parse(self, model, messages, response_format, **kwargs):
+        self.queries.append(messages[-1]["content"])
+        plan = MemorySearchQuery(query_text=messages[-1]["content"], intent="llm")
+        message = SimpleNamespace(refusal=None, parsed=plan)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _engine():
+    engine = MemorySearchEngine(
+        api_key="sk-test",
+        planner_mode="hybrid",
+        local_confidence_threshold=THRESHOLD,
+        share_plan_cache=False,
+    )
+    engine.client = CountingPlanner()
+    engine._supports_structured_outputs = True
+    return engine
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("query", CONFIDENCE_CASES)
+def test_hybrid_engine_escalates_below_threshold(query):
+    engine = _engine()
+    _, confidence = LocalSearchPlanner().plan(query)
+
+    plan = engine.plan_search(query)
+
+    escalated = confidence < THRESHOLD
+    assert (plan.intent == "llm") == escalated
+    assert len(engine.client.queries) == int(escalated)
+    stats = engine.get_planner_stats()
+    assert (stats["llm"], stats["local"]) == (int(escalated), int(not escalated))
+
+
+@pytest.mark.unit
+def test_planner_stats_are_exact_under_concurrency():
+    engine = _engine()
+    queries = [f"What are my favorite editors for Project{i}?" for i in range(20)]
+    barrier = threading.Barrier(8)
+
+    def plan_all():
+        barrier.wait()
+        for query in queries:
+            engine.plan_search(query)
+
+    threads = [threading.Thread(target=plan_all) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = engine.get_planner_stats()
+    assert stats["local"] + stats["cached"] == 8 * len(queries)
+    assert stats["llm"] == 0
+    assert stats["local"] >= len(queries)
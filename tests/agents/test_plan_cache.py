@@ -0,0 +1,106 @@
+"""
+Search plan cache of MemorySearchEngine
+
+Plans are cached on the normalized query and context, and separately per
+model and planner mode so engines sharing the process-wide cache never
+receive each other's plans. The LLM client is replaced by a counting stub.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from memori.agents.retrieval_agent import MemorySearchEngine
+from memori.utils.pydantic_models import MemorySearchQuery
+
+
+class CountingPlanner:
+    """Stand-in for the OpenAI client returning one plan per call"""
+
+    def __init__(self):
+        self.calls = 0
+        self.beta = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(parse=self._parse))
+        )
+
+    def _parse(self, model, messages, response_format, **kwargs):
+        self.calls += 1
+        plan = MemorySearchQuery(
+            query_text=messages[-1]["content"],
+            intent=f"plan {self.calls} from {model}",
+        )
+        message = SimpleNamespace(refusal=None, parsed=plan)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _engine(model="gpt-4o", planner_mode="llm", **options):
+    engine = MemorySearchEngine(
+        api_key="sk-test", model=model, planner_mode=planner_mode, **options
+    )
+    engine.client = CountingPlanner()
+    engine._supports_structured_outputs = True
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_plans():
+    _engine().clear_plan_cache()
+    yield
+    _engine().clear_plan_cache()
+
+
+@pytest.mark.unit
+def test_equivalent_queries_share_a_plan():
+    engine = _engine(share_plan_cache=False)
+    first = engine.plan_search("What's my favorite editor?")
+    assert engine.plan_search("  whats my FAVORITE editor ") is first
+    assert engine.client.calls == 1
+    assert engine.get_planner_stats()["cached"] == 1
+
+
+@pytest.mark.unit
+def test_context_is_part_of_the_key():
+    engine = _engine(share_plan_cache=False)
+    engine.plan_search("deadlines", context="work project")
+    engine.plan_search("deadlines", context="Work project.")
+    engine.plan_search("deadlines", context="personal")
+    engine.plan_search("deadlines")
+    assert engine.client.calls == 3
+
+
+@pytest.mark.unit
+def test_shared_cache_is_keyed_by_model_and_mode():
+    first = _engine(model="gpt-4o")
+    second = _engine(model="gpt-4o-mini")
+    local = _engine(model="gpt-4o", planner_mode="local")
+
+    plan = first.plan_search("favorite editor")
+    assert second.plan_search("favorite editor") is not plan
+    assert second.client.calls == 1
+    assert local.plan_search("favorite editor") is not plan
+    # Another engine with the same model and mode reuses the shared plan
+    same = _engine(model="gpt-4o")
+    assert same.plan_search("Favorite editor?") is plan
+    assert same.client.calls == 0
+
+
+@pytest.mark.unit
+def test_plans_expire(monkeypatch):
+    from memori.utils import cache as cache_module
+
+    now = [0.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    engine = _engine(share_plan_cache=False, plan_cache_ttl=60)
+    engine.plan_search("favorite editor")
+    now[0] += 61
+    engine.plan_search("favorite editor")
+    assert engine.client.calls == 2
+
+
+@pytest.mark.unit
+def test_hashed_keys_still_match_equivalent_queries():
+    engine = _engine(share_plan_cache=False, hash_cache_keys=True)
+    plan = engine.plan_search("Favorite editor?")
+    assert engine.plan_search("favorite editor") is plan
+    key = engine._plan_cache_key("favorite editor", None)
+    assert len(key[2]) == 32
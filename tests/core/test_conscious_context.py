@@ -0,0 +1,69 @@
+"""
+Conscious-context snapshots merge new rows in query order
+
+The short-term query orders by importance, then creation time, newest
+first. Rows arrive with creation times as datetimes or ISO strings in
+different formats, which must compare by time, not as text.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from memori.core.conscious_context import ConsciousContextSnapshots
+
+
+def _memory(memory_id, created_at, importance=0.5):
+    return {
+        "memory_id": memory_id,
+        "importance_score": importance,
+        "created_at": created_at,
+    }
+
+
+def _merged_order(loaded, added):
+    snapshots = ConsciousContextSnapshots()
+    snapshots.get("default", lambda: loaded)
+    for memory in added:
+        snapshots.add("default", memory)
+    return [memory["memory_id"] for memory in snapshots.get("default", list).memories]
+
+
+@pytest.mark.unit
+def test_mixed_timestamp_formats_merge_by_time():
+    loaded = [
+        _memory("noon", datetime(2025, 1, 2, 12, 0)),
+        _memory("morning", "2025-01-02 08:00:00.123456"),
+    ]
+    added = [
+        # "T" sorts after " ", so as text this would rank before noon
+        _memory("late-morning", "2025-01-02T10:30:00"),
+        _memory("evening", "2025-01-02 18:00:00"),
+    ]
+    assert _merged_order(loaded, added) == [
+        "evening",
+        "noon",
+        "late-morning",
+        "morning",
+    ]
+
+
+@pytest.mark.unit
+def test_importance_wins_and_missing_times_sort_last():
+    loaded = [
+        _memory("important", "2025-01-01 00:00:00", importance=0.9),
+        _memory("dated", "2025-01-01 00:00:00"),
+    ]
+    added = [
+        _memory("undated", None),
+        _memory("new", datetime(2025, 3, 1)),
+    ]
+    assert _merged_order(loaded, added) == ["important", "new", "dated", "undated"]
+
+
+@pytest.mark.unit
+def test_offset_timestamps_compare_with_naive_ones():
+    later = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    loaded = [_memory("naive", datetime(2020, 1, 1))]
+    added = [_memory("aware", later.isoformat())]
+    assert _merged_order(loaded, added) == ["aware", "naive"]
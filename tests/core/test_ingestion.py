@@ -0,0 +1,90 @@
+"""
+IngestionExecutor must not stall its callers
+
+Conversations are recorded from inside async LLM calls, so ``submit`` may run
+on an event loop thread, and ``Memori.__del__`` shuts the executor down
+without waiting.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from memori.core.ingestion import IngestionExecutor
+
+
+def _blocked_executor(release: threading.Event, **options) -> IngestionExecutor:
+    """An executor whose only worker is stuck until ``release`` is set"""
+    started = threading.Event()
+
+    async def hold():
+        started.set()
+        while not release.is_set():
+            await asyncio.sleep(0.01)
+
+    executor = IngestionExecutor(max_workers=1, max_queue_size=1, **options)
+    executor.submit(hold, name="hold")
+    assert started.wait(5)
+    return executor
+
+
+async def _noop():
+    pass
+
+
+@pytest.mark.unit
+def test_submit_from_event_loop_does_not_block():
+    release = threading.Event()
+    executor = _blocked_executor(release, block_timeout=5.0)
+    try:
+        assert executor.submit(_noop, name="queued")
+
+        async def submit_on_loop():
+            start = time.perf_counter()
+            queued = executor.submit(_noop, name="from loop")
+            return queued, time.perf_counter() - start
+
+        queued, elapsed = asyncio.run(submit_on_loop())
+        assert queued
+        assert elapsed < 1.0
+        # The queued job was evicted to make room
+        assert executor.get_stats()["dropped"] == 1
+    finally:
+        release.set()
+        executor.shutdown(wait=True, timeout=5)
+
+
+@pytest.mark.unit
+def test_submit_outside_event_loop_blocks_up_to_timeout():
+    release = threading.Event()
+    executor = _blocked_executor(release, block_timeout=0.2)
+    try:
+        assert executor.submit(_noop, name="queued")
+        start = time.perf_counter()
+        assert not executor.submit(_noop, name="overflow")
+        assert time.perf_counter() - start >= 0.2
+    finally:
+        release.set()
+        executor.shutdown(wait=True, timeout=5)
+
+
+@pytest.mark.unit
+def test_shutdown_without_wait_returns_immediately():
+    release = threading.Event()
+    executor = _blocked_executor(release)
+    executor.submit(_noop, name="queued")
+
+    start = time.perf_counter()
+    executor.shutdown(wait=False, timeout=30)
+    assert time.perf_counter() - start < 1.0
+    assert executor.is_shutdown
+
+    release.set()
+    for worker in executor._workers:
+        worker.join(5)
+        assert not worker.is_alive()
+    stats = executor.get_stats()
+    assert stats["completed"] == 1
+    assert stats["dropped"] == 1
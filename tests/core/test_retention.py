@@ -0,0 +1,136 @@
+"""
+RetentionSweeper deletes only expired and out-of-retention rows
+
+Runs one sweep against a temporary SQLite database with small batches, so
+every table needs several delete transactions.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from memori.core.retention import RetentionSweeper
+from memori.database.models import ChatHistory, ShortTermMemory
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{tmp_path / 'retention.db'}", share_engine=False
+    )
+    manager.initialize_schema()
+    yield manager
+    manager.close()
+
+
+def _short_term(memory_id, created_at, expires_at=None, permanent=False, ns="default"):
+    return {
+        "memory_id": memory_id,
+        "processed_data": {},
+        "importance_score": 0.5,
+        "category_primary": "fact",
+        "namespace": ns,
+        "created_at": created_at,
+        "expires_at": expires_at,
+        "searchable_content": memory_id,
+        "summary": memory_id,
+        "is_permanent_context": permanent,
+    }
+
+
+def _chat(chat_id, timestamp, ns="default"):
+    return {
+        "chat_id": chat_id,
+        "user_input": "hi",
+        "ai_output": "hello",
+        "model": "test",
+        "timestamp": timestamp,
+        "session_id": "session",
+        "namespace": ns,
+    }
+
+
+def _ids(manager, column):
+    with manager.engine.connect() as conn:
+        return sorted(conn.execute(select(column)).scalars())
+
+
+@pytest.mark.unit
+def test_sweep_deletes_expired_rows_in_batches(manager, monkeypatch):
+    now = datetime.now()
+    old = now - timedelta(days=45)
+    short_term_rows = [
+        _short_term(f"expired-{i}", now, expires_at=now - timedelta(hours=i + 1))
+        for i in range(5)
+    ] + [
+        _short_term("expires-later", old, expires_at=now + timedelta(days=1)),
+        _short_term("old-no-expiry", old),
+        _short_term("old-permanent", old, permanent=True),
+        _short_term("recent", now - timedelta(days=1)),
+        _short_term(
+            "other-namespace", now, expires_at=now - timedelta(hours=1), ns="other"
+        ),
+    ]
+    chat_rows = [_chat(f"old-chat-{i}", old) for i in range(3)] + [
+        _chat("recent-chat", now - timedelta(days=2)),
+        _chat("other-chat", old, ns="other"),
+    ]
+    with manager.engine.begin() as conn:
+        conn.execute(ChatHistory.__table__.insert(), chat_rows)
+        conn.execute(ShortTermMemory.__table__.insert(), short_term_rows)
+
+    batches = []
+    delete_batch = manager._delete_batch
+
+    def counting_delete_batch(conn, query, table, key):
+        namespaces = delete_batch(conn, query, table, key)
+        batches.append((table.name, len(namespaces)))
+        return namespaces
+
+    monkeypatch.setattr(manager, "_delete_batch", counting_delete_batch)
+
+    sweeper = RetentionSweeper(
+        manager, namespace="default", retention_policy="30_days", batch_size=2
+    )
+    result = sweeper.sweep()
+
+    assert result["short_term"] == 6
+    assert result["chat_history"] == 3
+    assert _ids(manager, ShortTermMemory.memory_id) == [
+        "expires-later",
+        "old-permanent",
+        "other-namespace",
+        "recent",
+    ]
+    assert _ids(manager, ChatHistory.chat_id) == ["other-chat", "recent-chat"]
+    # No transaction deletes more than batch_size rows
+    assert all(count <= 2 for _, count in batches)
+    assert [count for table, count in batches if table == "chat_history"] == [2, 1]
+
+    # A second sweep finds nothing left to delete
+    assert sum(sweeper.sweep()[key] for key in ("short_term", "chat_history")) == 0
+    assert sweeper.get_stats()["rows_deleted"] == 9
+
+
+@pytest.mark.unit
+def test_permanent_policy_only_deletes_expired_rows(manager):
+    now = datetime.now()
+    old = now - timedelta(days=400)
+    with manager.engine.begin() as conn:
+        conn.execute(ChatHistory.__table__.insert(), [_chat("old-chat", old)])
+        conn.execute(
+            ShortTermMemory.__table__.insert(),
+            [
+                _short_term("expired", now, expires_at=now - timedelta(minutes=1)),
+                _short_term("old-no-expiry", old),
+            ],
+        )
+
+    result = RetentionSweeper(manager, retention_policy="permanent").sweep()
+
+    assert result["short_term"] == 1
+    assert result["chat_history"] == 0
+    assert _ids(manager, ShortTermMemory.memory_id) == ["old-no-expiry"]
+    assert _ids(manager, ChatHistory.chat_id) == ["old-chat"]
@@ -0,0 +1,156 @@
+"""
+AccessTracker buffering, coalescing and flushing
+
+Most tests use a fake database manager that records every
+``update_access_counts`` call; the last one applies a flush to a temporary
+SQLite database.
+"""
+
+import threading
+
+import pytest
+from sqlalchemy import select
+
+from memori.database.access_tracker import AccessTracker
+from memori.database.models import LongTermMemory
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+
+class RecordingManager:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+        self.flushed = threading.Event()
+
+    def update_access_counts(self, accesses):
+        if self.fail:
+            raise RuntimeError("database is locked")
+        self.batches.append(accesses)
+        self.flushed.set()
+        return len(accesses)
+
+
+def _results(*ids, memory_type="long_term"):
+    return [{"memory_id": memory_id, "memory_type": memory_type} for memory_id in ids]
+
+
+@pytest.mark.unit
+def test_repeated_reads_coalesce_into_one_row_update():
+    manager = RecordingManager()
+    tracker = AccessTracker(manager, background=False)
+
+    assert tracker.record(_results("a", "b")) == 2
+    tracker.record(_results("a"))
+    tracker.record(_results("a", memory_type="short_term"))
+    # Rows without an id or of untracked types are ignored
+    assert tracker.record([{"memory_id": "c"}, "not a dict", {"memory_type": "x"}]) == 0
+
+    assert tracker.pending == 3
+    assert manager.batches == []
+    assert tracker.flush() == 3
+
+    (batch,) = manager.batches
+    hits = {key: count for key, (count, _) in batch.items()}
+    assert hits == {
+        ("long_term", "a"): 2,
+        ("long_term", "b"): 1,
+        ("short_term", "a"): 1,
+    }
+    assert batch[("long_term", "a")][1] >= batch[("long_term", "b")][1]
+    assert tracker.pending == 0
+    assert tracker.flush() == 0
+    stats = tracker.get_stats()
+    assert stats["reads_recorded"] == 4
+    assert stats["rows_flushed"] == 3
+    assert stats["flushes"] == 1
+
+
+@pytest.mark.unit
+def test_failed_flush_keeps_reads_for_the_next_flush():
+    manager = RecordingManager(fail=True)
+    tracker = AccessTracker(manager, background=False)
+    tracker.record(_results("a", "b"))
+
+    assert tracker.flush() == 0
+    assert tracker.get_stats()["failed_flushes"] == 1
+    tracker.record(_results("a"))
+
+    manager.fail = False
+    tracker.flush()
+    (batch,) = manager.batches
+    assert {key: count for key, (count, _) in batch.items()} == {
+        ("long_term", "a"): 2,
+        ("long_term", "b"): 1,
+    }
+
+
+@pytest.mark.unit
+def test_background_flush_when_buffer_is_full():
+    manager = RecordingManager()
+    tracker = AccessTracker(manager, flush_interval=60, max_pending=3)
+    try:
+        tracker.record(_results("a", "b"))
+        assert not manager.flushed.wait(0.2)
+        tracker.record(_results("c"))
+        assert manager.flushed.wait(5)
+        assert set(manager.batches[0]) == {
+            ("long_term", "a"),
+            ("long_term", "b"),
+            ("long_term", "c"),
+        }
+    finally:
+        tracker.stop()
+
+
+@pytest.mark.unit
+def test_stop_flushes_pending_reads():
+    manager = RecordingManager()
+    tracker = AccessTracker(manager, flush_interval=60)
+    tracker.record(_results("a"))
+    tracker.stop()
+    assert len(manager.batches) == 1
+    assert not tracker.get_stats()["running"]
+
+    tracker = AccessTracker(manager, background=False)
+    tracker.record(_results("b"))
+    tracker.stop(flush=False)
+    assert len(manager.batches) == 1
+
+
+@pytest.mark.unit
+def test_flush_updates_access_counts(tmp_path):
+    manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{tmp_path / 'access.db'}", share_engine=False
+    )
+    try:
+        manager.initialize_schema()
+        memory_ids = manager.store_long_term_memories_bulk(
+            [
+                ProcessedLongTermMemory(
+                    content=f"note {i}",
+                    summary=f"note {i}",
+                    classification="reference",
+                    importance="medium",
+                    conversation_id=f"chat-{i}",
+                    classification_reason="test",
+                )
+                for i in range(2)
+            ]
+        )
+        tracker = AccessTracker(manager, background=False)
+        tracker.record(_results(memory_ids[0], memory_ids[0], memory_ids[1]))
+        tracker.record(_results(memory_ids[0]))
+        assert tracker.flush() == 2
+
+        with manager.engine.connect() as conn:
+            rows = dict(
+                conn.execute(
+                    select(LongTermMemory.memory_id, LongTermMemory.access_count)
+                ).all()
+            )
+            accessed = conn.execute(select(LongTermMemory.last_accessed)).scalars()
+            assert all(value is not None for value in accessed)
+        assert rows == {memory_ids[0]: 3, memory_ids[1]: 1}
+    finally:
+        manager.close()
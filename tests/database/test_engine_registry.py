@@ -0,0 +1,135 @@
+"""
+EngineRegistry sharing and concurrent engine creation
+
+Engines are stand-in objects so the tests control how long creation takes.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+from loguru import logger
+
+from memori.database.engine_registry import EngineRegistry
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+
+
+class FakeEngine:
+    def __init__(self):
+        self.disposed = False
+        self.pool = SimpleNamespace(status=lambda: "fake pool")
+
+    def dispose(self):
+        self.disposed = True
+
+
+@pytest.fixture
+def warnings():
+    messages = []
+    handler = logger.add(messages.append, level="WARNING", format="{message}")
+    yield messages
+    logger.remove(handler)
+
+
+@pytest.mark.unit
+def test_one_engine_per_url_with_refcounts():
+    registry = EngineRegistry()
+    first = registry.acquire("sqlite:///a.db", FakeEngine)
+    second = registry.acquire("sqlite:///a.db", FakeEngine)
+    other = registry.acquire("sqlite:///b.db", FakeEngine)
+
+    assert first is second
+    assert other is not first
+    assert registry.get_stats()["engines"] == 2
+    assert not registry.release("sqlite:///a.db")
+    assert registry.release("sqlite:///a.db")
+    assert first.disposed
+    assert not registry.contains("sqlite:///a.db")
+    assert not registry.release("sqlite:///a.db")
+
+
+@pytest.mark.unit
+def test_slow_factory_does_not_block_other_urls():
+    registry = EngineRegistry()
+    started = threading.Event()
+    release = threading.Event()
+    slow_engine = FakeEngine()
+
+    def slow_factory():
+        started.set()
+        assert release.wait(5)
+        return slow_engine
+
+    results = {}
+
+    def acquire(key, url, factory):
+        results[key] = registry.acquire(url, factory)
+
+    creator = threading.Thread(
+        target=acquire, args=("slow", "sqlite:///slow.db", slow_factory)
+    )
+    creator.start()
+    assert started.wait(5)
+
+    # Same URL: waits for the engine being built instead of building another
+    waiter = threading.Thread(
+        target=acquire, args=("waiter", "sqlite:///slow.db", FakeEngine)
+    )
+    waiter.start()
+
+    fast = threading.Thread(
+        target=acquire, args=("fast", "sqlite:///fast.db", FakeEngine)
+    )
+    fast.start()
+    fast.join(2)
+    assert not fast.is_alive()
+    assert "slow" not in results
+    assert registry.get_stats()["engines"] == 1
+
+    release.set()
+    creator.join(5)
+    waiter.join(5)
+    assert results["slow"] is slow_engine
+    assert results["waiter"] is slow_engine
+    assert registry.get_stats()["entries"]["sqlite:///slow.db"]["refcount"] == 2
+
+
+@pytest.mark.unit
+def test_failed_factory_lets_the_next_caller_retry():
+    registry = EngineRegistry()
+
+    def broken():
+        raise RuntimeError("cannot connect")
+
+    with pytest.raises(RuntimeError):
+        registry.acquire("sqlite:///a.db", broken)
+    assert not registry.contains("sqlite:///a.db")
+    assert isinstance(registry.acquire("sqlite:///a.db", FakeEngine), FakeEngine)
+
+
+@pytest.mark.unit
+def test_option_mismatch_is_logged(warnings):
+    registry = EngineRegistry()
+    registry.acquire("sqlite:///a.db", FakeEngine, {"sqlite_profile": "balanced"})
+    registry.acquire("sqlite:///a.db", FakeEngine, {"sqlite_profile": "balanced"})
+    assert warnings == []
+    registry.acquire("sqlite:///a.db", FakeEngine, {"sqlite_profile": "durable"})
+    assert len(warnings) == 1
+    assert "durable" in warnings[0]
+
+
+@pytest.mark.unit
+def test_manager_reports_sqlite_settings(tmp_path, warnings):
+    url = f"sqlite:///{tmp_path / 'shared.db'}"
+    first = SQLAlchemyDatabaseManager(url, schema_init=False)
+    second = SQLAlchemyDatabaseManager(
+        url, schema_init=False, sqlite_profile="durable", sqlite_single_writer=False
+    )
+    try:
+        assert first.engine is second.engine
+        assert any(
+            "sqlite_profile" in message and "durable" in message for message in warnings
+        )
+    finally:
+        second.close()
+        first.close()
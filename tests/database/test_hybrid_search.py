@@ -0,0 +1,92 @@
+"""
+Hybrid full-text + vector retrieval
+
+Runs ``search_memories`` on a temporary SQLite database with the offline
+hashing embedder: reciprocal rank fusion order, and the similarity floor that
+keeps unrelated nearest neighbours out of the results.
+"""
+
+import pytest
+
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.utils.embeddings import HashingEmbedder
+from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+SUMMARIES = [
+    "User runs a kubernetes deployment for the billing service",
+    "User migrated the billing app to kubernetes clusters with helm",
+    "User deployment checklist mentions a kubernetes deployment review",
+    "User prefers dark roast coffee in the morning",
+    "User is learning the Rust programming language",
+    "User enjoys hiking in the alps during summer",
+    "Meeting with Alice about the quarterly budget",
+]
+
+
+def _memory(summary):
+    return ProcessedLongTermMemory(
+        content=summary,
+        summary=summary,
+        classification="reference",
+        importance="medium",
+        conversation_id="chat-1",
+        classification_reason="test",
+    )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{tmp_path / 'hybrid.db'}", share_engine=False
+    )
+    manager.initialize_schema()
+    manager.enable_vector_search(HashingEmbedder())
+    ids = manager.store_long_term_memories_bulk([_memory(s) for s in SUMMARIES])
+    manager.ids_by_summary = dict(zip(SUMMARIES, ids))
+    yield manager
+    manager.close()
+
+
+@pytest.mark.unit
+def test_unrelated_query_returns_no_vector_only_rows(manager):
+    for query in ("zebra migration patterns", "orbital mechanics"):
+        assert manager.search_memories(query, search_mode="lexical") == []
+        assert manager.search_memories(query, search_mode="hybrid") == []
+
+
+@pytest.mark.unit
+def test_similarity_floor_is_configurable(manager):
+    manager.enable_vector_search(HashingEmbedder(), min_vector_similarity=-1.0)
+
+    results = manager.search_memories("zebra migration patterns", limit=3)
+
+    assert len(results) == 3
+    assert {r["search_strategy"] for r in results} == {"hybrid_rrf"}
+
+
+@pytest.mark.unit
+def test_fusion_ranks_lexical_and_vector_matches_first(manager):
+    results = manager.search_memories("kubernetes deployment", limit=5)
+    ids = [r["memory_id"] for r in results]
+    lexical = {
+        r["memory_id"]
+        for r in manager.search_memories("kubernetes deployment", search_mode="lexical")
+    }
+
+    assert lexical == {
+        manager.ids_by_summary[SUMMARIES[0]],
+        manager.ids_by_summary[SUMMARIES[2]],
+    }
+    # The related memory without the exact phrase is found by similarity alone
+    vector_only = manager.ids_by_summary[SUMMARIES[1]]
+    assert vector_only in ids
+    assert vector_only not in lexical
+    # Rows credited by both rankings outrank the vector-only row
+    assert set(ids[:2]) == lexical
+    assert ids.index(vector_only) == 2
+    assert all(r["vector_score"] >= manager.min_vector_similarity for r in results)
+    assert [r["search_score"] for r in results] == sorted(
+        (r["search_score"] for r in results), reverse=True
+    )
+    # Unrelated memories stay out even though the limit leaves room
+    assert manager.ids_by_summary[SUMMARIES[3]] not in ids
@@ -0,0 +1,184 @@
+"""
+Bulk long-term memory inserts
+
+``store_long_term_memories_bulk`` on a temporary SQLite database: chunked
+executemany, id order, chat ids, FTS visibility on both sides of
+``BULK_FTS_SINGLE_PASS_THRESHOLD``, and the single-pass path being atomic
+(the insert trigger is never missing outside the bulk transaction).
+"""
+
+import pytest
+from sqlalchemy import event, text
+
+from memori.database import sqlite_fts
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+THRESHOLD = 5
+INSERT_TRIGGER = sqlite_fts.trigger_name("long_term", "insert")
+
+
+def _memories(count, word="orchard"):
+    return [
+        ProcessedLongTermMemory(
+            content=f"{word} planting plan {i}",
+            summary=f"{word} plan {i}",
+            classification="reference",
+            importance="medium",
+            conversation_id=f"chat-{i}",
+            classification_reason="test",
+        )
+        for i in range(count)
+    ]
+
+
+def _count(conn, sql, **params):
+    return conn.execute(text(sql), params).scalar()
+
+
+def _fts_ids(manager, term):
+    with manager.engine.connect() as conn:
+        return {
+            row[0]
+            for row in conn.execute(
+                text(
+                    f"SELECT memory_id FROM {sqlite_fts.FTS_TABLE} "
+                    f"WHERE {sqlite_fts.FTS_TABLE} MATCH :term"
+                ),
+                {"term": term},
+            )
+        }
+
+
+def _trigger_exists(conn):
+    return (
+        _count(
+            conn,
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name = :name",
+            name=INSERT_TRIGGER,
+        )
+        == 1
+    )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{tmp_path / 'bulk.db'}", share_engine=False
+    )
+    manager.initialize_schema()
+    manager.BULK_FTS_SINGLE_PASS_THRESHOLD = THRESHOLD
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def long_term_inserts(manager):
+    """Row counts of each executemany INSERT into long_term_memory"""
+    batches = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO long_term_memory"):
+            batches.append(len(parameters) if executemany else 1)
+
+    event.listen(manager.engine, "before_cursor_execute", record)
+    yield batches
+    event.remove(manager.engine, "before_cursor_execute", record)
+
+
+@pytest.mark.unit
+def test_rows_are_chunked_and_ids_returned_in_input_order(manager, long_term_inserts):
+    memories = _memories(7)
+    memory_ids = manager.store_long_term_memories_bulk(
+        memories, chat_ids=[f"source-{i}" for i in range(7)], chunk_size=3
+    )
+
+    assert long_term_inserts == [3, 3, 1]
+    assert len(set(memory_ids)) == 7
+    with manager.engine.connect() as conn:
+        stored = dict(
+            conn.execute(text("SELECT memory_id, summary FROM long_term_memory")).all()
+        )
+        chat_ids = dict(
+            conn.execute(
+                text("SELECT memory_id, original_chat_id FROM long_term_memory")
+            ).all()
+        )
+    assert [stored[memory_id] for memory_id in memory_ids] == [
+        memory.summary for memory in memories
+    ]
+    assert [chat_ids[memory_id] for memory_id in memory_ids] == [
+        f"source-{i}" for i in range(7)
+    ]
+
+
+@pytest.mark.unit
+def test_chat_ids_must_match_memories(manager):
+    with pytest.raises(ValueError):
+        manager.store_long_term_memories_bulk(_memories(3), chat_ids=["only-one"])
+    assert manager.store_long_term_memories_bulk([]) == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("count", [THRESHOLD - 1, THRESHOLD, 3 * THRESHOLD])
+def test_rows_are_searchable_on_both_sides_of_threshold(manager, count):
+    existing = set(manager.store_long_term_memories_bulk(_memories(2, "meadow")))
+
+    memory_ids = manager.store_long_term_memories_bulk(_memories(count), chunk_size=4)
+
+    assert _fts_ids(manager, "orchard") == set(memory_ids)
+    assert _fts_ids(manager, "meadow") == existing
+    with manager.engine.connect() as conn:
+        assert _trigger_exists(conn)
+    # Later single-row writes still go through the trigger
+    later = manager.store_long_term_memories_bulk(_memories(1, "vineyard"))
+    assert _fts_ids(manager, "vineyard") == set(later)
+
+
+@pytest.mark.unit
+def test_insert_trigger_is_never_dropped_outside_the_transaction(manager, monkeypatch):
+    index_rows = sqlite_fts.index_rows
+    seen_from_other_connection = []
+
+    def index_and_look(conn, *args, **kwargs):
+        with manager.engine.connect() as other:
+            seen_from_other_connection.append(_trigger_exists(other))
+        return index_rows(conn, *args, **kwargs)
+
+    monkeypatch.setattr(sqlite_fts, "index_rows", index_and_look)
+    manager.store_long_term_memories_bulk(_memories(THRESHOLD))
+
+    assert seen_from_other_connection == [True]
+
+
+@pytest.mark.unit
+def test_failure_mid_insert_rolls_back_rows_and_trigger_drop(
+    manager, long_term_inserts
+):
+    manager.store_long_term_memories_bulk(_memories(2, "meadow"))
+    with manager.engine.connect() as conn:
+        fts_rows = _count(conn, f"SELECT COUNT(*) FROM {sqlite_fts.FTS_TABLE}")
+    # Registered after long_term_inserts, which has already counted this chunk
+    second_chunk = len(long_term_inserts) + 2
+
+    def fail_second_chunk(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO long_term_memory") and (
+            len(long_term_inserts) == second_chunk
+        ):
+            raise RuntimeError("disk full")
+
+    event.listen(manager.engine, "before_cursor_execute", fail_second_chunk)
+    try:
+        with pytest.raises(RuntimeError):
+            manager.store_long_term_memories_bulk(
+                _memories(3 * THRESHOLD), chunk_size=THRESHOLD
+            )
+    finally:
+        event.remove(manager.engine, "before_cursor_execute", fail_second_chunk)
+
+    with manager.engine.connect() as conn:
+        assert _trigger_exists(conn)
+        assert _count(conn, "SELECT COUNT(*) FROM long_term_memory") == 2
+        assert _count(conn, f"SELECT COUNT(*) FROM {sqlite_fts.FTS_TABLE}") == fts_rows
+    assert _fts_ids(manager, "orchard") == set()
+    assert long_term_inserts[-2:] == [THRESHOLD, THRESHOLD]
@@ -0,0 +1,174 @@
+"""
+RankingEngine selection and scoring
+
+``rank`` selects the top ``limit`` results with a partial sort (heapq or
+NumPy argpartition) and must agree with a full sort of ``score``;
+``sql_composite`` must order rows as the Python score does.
+"""
+
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from memori.database import ranking as ranking_module
+from memori.database.ranking import RankingEngine
+from memori.database.sqlite_tuning import create_sqlite_functions
+
+NOW = datetime(2025, 6, 1, 12, 0, 0)
+
+
+def _results(count, seed=3):
+    rng = random.Random(seed)
+    return [
+        {
+            "memory_id": f"m{i}",
+            "search_score": round(rng.random(), 3),
+            "importance_score": round(rng.random(), 3),
+            "created_at": (NOW - timedelta(days=rng.random() * 90)).isoformat(sep=" "),
+        }
+        for i in range(count)
+    ]
+
+
+def _full_sort(engine, results):
+    scores = engine.score([dict(result) for result in results], NOW.timestamp())
+    order = sorted(range(len(results)), key=lambda i: (-scores[i], i))
+    return [results[i]["memory_id"] for i in order]
+
+
+def _ids(results):
+    return [result["memory_id"] for result in results]
+
+
+@pytest.fixture(params=["python", "numpy"])
+def engine(request):
+    if request.param == "numpy" and not ranking_module.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    threshold = 1 if request.param == "numpy" else 10**9
+    return RankingEngine(vectorize_threshold=threshold)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("limit", [1, 5, 37])
+def test_top_k_matches_full_sort(engine, limit):
+    results = _results(300)
+    expected = _full_sort(engine, results)[:limit]
+    ranked = engine.rank(results, limit, now=NOW.timestamp())
+    assert _ids(ranked) == expected
+    assert all("composite_score" in result for result in results)
+
+
+@pytest.mark.unit
+def test_ties_keep_input_order(engine):
+    results = [
+        {"memory_id": f"m{i}", "search_score": 0.5, "importance_score": 0.5}
+        for i in range(200)
+    ]
+    assert _ids(engine.rank(results, 10, now=NOW.timestamp())) == [
+        f"m{i}" for i in range(10)
+    ]
+    assert _ids(engine.rank(results, 500, now=NOW.timestamp())) == _ids(results)
+
+
+@pytest.mark.unit
+def test_limit_larger_than_input_returns_everything_sorted(engine):
+    results = _results(7)
+    ranked = engine.rank(results, 50, now=NOW.timestamp())
+    assert _ids(ranked) == _full_sort(engine, results)
+    assert engine.rank(results, 0) == []
+    assert engine.rank([], 5) == []
+
+
+@pytest.mark.unit
+def test_python_and_numpy_scores_agree():
+    if not ranking_module.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    results = _results(150) + [{"memory_id": "bare"}]
+    for decay in ("exponential", "linear"):
+        python_scores = RankingEngine(decay=decay, vectorize_threshold=10**9).score(
+            [dict(result) for result in results], NOW.timestamp()
+        )
+        numpy_scores = RankingEngine(decay=decay, vectorize_threshold=1).score(
+            [dict(result) for result in results], NOW.timestamp()
+        )
+        assert numpy_scores == pytest.approx(python_scores)
+
+
+@pytest.mark.unit
+def test_exponential_decay_halves_every_half_life():
+    engine = RankingEngine(recency_half_life_days=10)
+    now = NOW.timestamp()
+    assert engine.recency_score(NOW, now) == pytest.approx(1.0)
+    assert engine.recency_score(NOW - timedelta(days=10), now) == pytest.approx(0.5)
+    assert engine.recency_score(NOW - timedelta(days=30), now) == pytest.approx(0.125)
+    assert engine.recency_score(NOW + timedelta(days=1), now) == pytest.approx(1.0)
+    assert engine.recency_score(None, now) == 0.0
+
+
+@pytest.mark.unit
+def test_linear_decay_reaches_zero_at_twice_the_half_life():
+    engine = RankingEngine(recency_half_life_days=15, decay="linear")
+    now = NOW.timestamp()
+    assert engine.recency_score(NOW - timedelta(days=15), now) == pytest.approx(0.5)
+    assert engine.recency_score(NOW - timedelta(days=30), now) == pytest.approx(0.0)
+    assert engine.recency_score(NOW - timedelta(days=90), now) == 0.0
+
+
+@pytest.mark.unit
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        RankingEngine(decay="cubic")
+    with pytest.raises(ValueError):
+        RankingEngine(recency_half_life_days=0)
+    with pytest.raises(ValueError):
+        RankingEngine().sql_composite("oracle", "s", "i", "c")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("decay", ["exponential", "linear"])
+def test_sql_composite_orders_like_python_score(decay):
+    engine = RankingEngine(decay=decay)
+    results = _results(60, seed=11)
+    results.append({"memory_id": "defaults", "created_at": NOW.isoformat(sep=" ")})
+
+    connection = sqlite3.connect(":memory:")
+    create_sqlite_functions(connection)
+    connection.execute(
+        "CREATE TABLE memories (memory_id TEXT, search_score REAL, "
+        "importance_score REAL, created_at TIMESTAMP)"
+    )
+    connection.executemany(
+        "INSERT INTO memories VALUES "
+        "(:memory_id, :search_score, :importance_score, :created_at)",
+        [
+            {
+                "search_score": None,
+                "importance_score": None,
+                **result,
+            }
+            for result in results
+        ],
+    )
+    composite = engine.sql_composite(
+        "sqlite", "search_score", "importance_score", "created_at"
+    )
+    rows = connection.execute(
+        f"SELECT memory_id, {composite} AS composite_score FROM memories "
+        "ORDER BY composite_score DESC",
+        engine.sql_params("sqlite", now=NOW),
+    ).fetchall()
+    connection.close()
+
+    expected = dict(
+        zip(
+            _ids(results),
+            engine.score([dict(result) for result in results], NOW.timestamp()),
+        )
+    )
+    assert [memory_id for memory_id, _ in rows] == sorted(
+        expected, key=expected.get, reverse=True
+    )
+    for memory_id, score in rows:
+        assert score == pytest.approx(expected[memory_id])
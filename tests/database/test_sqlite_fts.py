@@ -0,0 +1,278 @@
+"""
+SQLite FTS5 index maintenance
+
+Runs against a temporary database file: replacing the legacy contentless
+index, keeping the rowid map and postings in sync through the triggers,
+batched indexing with ``index_rows`` and the bulk-insert path that drops the
+insert trigger for one set-based indexing pass.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from memori.database import sqlite_fts
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.utils.pydantic_models import ProcessedLongTermMemory
+
+SOURCE_TABLE_SQL = """
+CREATE TABLE {table} (
+    memory_id TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    searchable_content TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    category_primary TEXT NOT NULL
+)
+"""
+
+LEGACY_FTS_SQL = f"""
+CREATE VIRTUAL TABLE {sqlite_fts.FTS_TABLE} USING fts5(
+    memory_id, memory_type, namespace, searchable_content, summary,
+    category_primary, content=''
+)
+"""
+
+LEGACY_INSERT_TRIGGER_SQL = f"""
+CREATE TRIGGER {sqlite_fts.trigger_name("long_term", "insert")}
+AFTER INSERT ON long_term_memory
+BEGIN
+    INSERT INTO {sqlite_fts.FTS_TABLE}(memory_id, memory_type, namespace,
+        searchable_content, summary, category_primary)
+    VALUES (NEW.memory_id, 'long_term', NEW.namespace, NEW.searchable_content,
+        NEW.summary, NEW.category_primary);
+END
+"""
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fts.db'}")
+    with engine.begin() as conn:
+        for table in sqlite_fts.SOURCE_TABLES.values():
+            conn.execute(text(SOURCE_TABLE_SQL.format(table=table)))
+    yield engine
+    engine.dispose()
+
+
+def _insert(conn, memory_type, memory_id, summary, namespace="default"):
+    conn.execute(
+        text(
+            f"INSERT INTO {sqlite_fts.SOURCE_TABLES[memory_type]} "
+            "VALUES (:memory_id, :namespace, :content, :summary, 'fact')"
+        ),
+        {
+            "memory_id": memory_id,
+            "namespace": namespace,
+            "content": f"{summary} content",
+            "summary": summary,
+        },
+    )
+
+
+def _matches(conn, term, namespace="default"):
+    return sorted(
+        conn.execute(
+            text(
+                f"SELECT memory_type, memory_id FROM {sqlite_fts.FTS_TABLE} "
+                f"WHERE {sqlite_fts.FTS_TABLE} MATCH :term AND namespace = :namespace"
+            ),
+            {"term": term, "namespace": namespace},
+        ).all()
+    )
+
+
+def _count(conn, table):
+    return conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+
+
+def _assert_map_consistent(conn):
+    """Every posting has exactly one rowid map entry pointing at it"""
+    orphans = conn.execute(
+        text(
+            f"SELECT COUNT(*) FROM {sqlite_fts.ROWID_TABLE} m "
+            f"LEFT JOIN {sqlite_fts.FTS_TABLE} f ON f.rowid = m.fts_rowid "
+            "WHERE f.rowid IS NULL OR f.memory_id != m.memory_id "
+            "OR f.memory_type != m.memory_type"
+        )
+    ).scalar()
+    assert orphans == 0
+    assert _count(conn, sqlite_fts.ROWID_TABLE) == _count(conn, sqlite_fts.FTS_TABLE)
+
+
+@pytest.mark.unit
+def test_legacy_contentless_index_is_replaced(engine):
+    with engine.begin() as conn:
+        conn.execute(text(LEGACY_FTS_SQL))
+        conn.execute(text(LEGACY_INSERT_TRIGGER_SQL))
+        _insert(conn, "long_term", "lt-1", "espresso machine")
+        _insert(conn, "short_term", "st-1", "espresso grinder")
+
+    with engine.begin() as conn:
+        assert sqlite_fts.create_fts_schema(conn)
+        assert "content=''" not in sqlite_fts._fts_table_sql(conn).replace(" ", "")
+        for memory_type in sqlite_fts.SOURCE_TABLES:
+            assert sqlite_fts.index_rows(conn, memory_type)[0] == 1
+
+    with engine.begin() as conn:
+        assert _matches(conn, "espresso") == [
+            ("long_term", "lt-1"),
+            ("short_term", "st-1"),
+        ]
+        _assert_map_consistent(conn)
+        # An up-to-date schema is left alone
+        assert not sqlite_fts.create_fts_schema(conn)
+        assert _count(conn, sqlite_fts.FTS_TABLE) == 2
+
+
+@pytest.mark.unit
+def test_triggers_keep_rowid_map_and_postings_in_sync(engine):
+    with engine.begin() as conn:
+        sqlite_fts.create_fts_schema(conn)
+        _insert(conn, "long_term", "lt-1", "alpine hiking")
+        _insert(conn, "long_term", "lt-2", "alpine skiing")
+        # Same memory_id in the other source table gets its own posting
+        _insert(conn, "short_term", "lt-1", "alpine climbing")
+
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "UPDATE long_term_memory SET summary = 'coastal sailing', "
+                "searchable_content = 'coastal sailing' WHERE memory_id = 'lt-1'"
+            )
+        )
+        conn.execute(
+            text(
+                "UPDATE long_term_memory SET memory_id = 'lt-9' WHERE memory_id = 'lt-2'"
+            )
+        )
+
+    with engine.begin() as conn:
+        assert _matches(conn, "hiking") == []
+        assert _matches(conn, "sailing") == [("long_term", "lt-1")]
+        assert _matches(conn, "alpine") == [
+            ("long_term", "lt-9"),
+            ("short_term", "lt-1"),
+        ]
+        _assert_map_consistent(conn)
+
+        conn.execute(text("DELETE FROM long_term_memory WHERE memory_id = 'lt-1'"))
+        conn.execute(text("DELETE FROM long_term_memory WHERE memory_id = 'lt-9'"))
+
+    with engine.begin() as conn:
+        assert _matches(conn, "sailing") == []
+        assert _matches(conn, "alpine") == [("short_term", "lt-1")]
+        assert _count(conn, sqlite_fts.FTS_TABLE) == 1
+        _assert_map_consistent(conn)
+
+
+@pytest.mark.unit
+def test_index_rows_in_batches(engine):
+    with engine.begin() as conn:
+        for i in range(7):
+            _insert(conn, "long_term", f"lt-{i}", f"garden note{i}")
+        _insert(conn, "long_term", "other", "garden elsewhere", namespace="other")
+        assert sqlite_fts.create_fts_schema(conn)
+
+    batches = []
+    last_rowid = 0
+    while True:
+        with engine.begin() as conn:
+            count, last_rowid = sqlite_fts.index_rows(
+                conn, "long_term", last_rowid, namespace="default", limit=3
+            )
+        batches.append(count)
+        if count < 3:
+            break
+
+    assert batches == [3, 3, 1]
+    with engine.begin() as conn:
+        assert len(_matches(conn, "garden")) == 7
+        assert _matches(conn, "garden", namespace="other") == []
+        assert (
+            len(
+                {
+                    row[0]
+                    for row in conn.execute(
+                        text(f"SELECT fts_rowid FROM {sqlite_fts.ROWID_TABLE}")
+                    )
+                }
+            )
+            == 7
+        )
+        _assert_map_consistent(conn)
+        # Indexed rows are skipped on the next pass
+        assert sqlite_fts.index_rows(conn, "long_term") == (1, 8)
+        assert sqlite_fts.index_rows(conn, "long_term") == (0, 0)
+
+
+def _memories(count):
+    return [
+        ProcessedLongTermMemory(
+            content=f"orchard planting plan {i}",
+            summary=f"orchard plan {i}",
+            classification="reference",
+            importance="medium",
+            conversation_id=f"chat-{i}",
+            classification_reason="test",
+        )
+        for i in range(count)
+    ]
+
+
+def _insert_trigger_exists(manager):
+    with manager.engine.connect() as conn:
+        return (
+            conn.execute(
+                text(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name = :name"
+                ),
+                {"name": sqlite_fts.trigger_name("long_term", "insert")},
+            ).scalar()
+            == 1
+        )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{tmp_path / 'bulk.db'}", share_engine=False
+    )
+    manager.initialize_schema()
+    manager.BULK_FTS_SINGLE_PASS_THRESHOLD = 5
+    yield manager
+    manager.close()
+
+
+@pytest.mark.unit
+def test_bulk_insert_indexes_in_one_pass_and_restores_trigger(manager):
+    manager.store_long_term_memories_bulk(_memories(2), namespace="small")
+    memory_ids = manager.store_long_term_memories_bulk(
+        _memories(12), namespace="bulk", chunk_size=5
+    )
+
+    assert _insert_trigger_exists(manager)
+    with manager.engine.connect() as conn:
+        assert sorted(
+            memory_id for _, memory_id in _matches(conn, "orchard", "bulk")
+        ) == sorted(memory_ids)
+        assert len(_matches(conn, "orchard", "small")) == 2
+        _assert_map_consistent(conn)
+
+    # Rows written after the bulk load go through the restored trigger
+    manager.store_long_term_memories_bulk(_memories(1), namespace="later")
+    with manager.engine.connect() as conn:
+        assert len(_matches(conn, "orchard", "later")) == 1
+
+
+@pytest.mark.unit
+def test_failed_bulk_insert_keeps_trigger(manager, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError("indexing failed")
+
+    monkeypatch.setattr(sqlite_fts, "index_rows", fail)
+    with pytest.raises(RuntimeError):
+        manager.store_long_term_memories_bulk(_memories(8), namespace="bulk")
+
+    assert _insert_trigger_exists(manager)
+    with manager.engine.connect() as conn:
+        assert _count(conn, "long_term_memory") == 0
+        assert _count(conn, sqlite_fts.FTS_TABLE) == 0
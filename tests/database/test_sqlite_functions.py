@@ -0,0 +1,127 @@
+"""
+SQL functions registered on every SQLite connection
+
+Composite full-text ranking decays recency with ``POWER``, which SQLite only
+ships when compiled with ``SQLITE_ENABLE_MATH_FUNCTIONS``. These tests run
+the composite score on connections where ``power`` is unavailable and check
+that ``register_sqlite_functions`` makes it work on any engine.
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event, text
+
+from memori.database.ranking import RankingEngine
+from memori.database.sqlite_tuning import (
+    create_sqlite_functions,
+    register_sqlite_functions,
+)
+
+NOW = datetime(2025, 6, 1, 12, 0, 0)
+
+ROWS = [
+    ("a", 0.9, 0.2, NOW - timedelta(days=40)),
+    ("b", 0.5, 0.9, NOW - timedelta(days=1)),
+    ("c", 0.1, 0.5, NOW - timedelta(days=10)),
+    ("d", None, None, NOW - timedelta(hours=3)),
+    ("e", 0.7, 0.7, None),
+]
+
+
+def _without_power(connection):
+    # Stand-in for a build without math functions
+    def missing(base, exponent):
+        raise sqlite3.OperationalError("no such function: POWER")
+
+    connection.create_function("power", 2, missing)
+
+
+def _composite_query(ranking):
+    composite = ranking.sql_composite(
+        "sqlite", "search_score", "importance_score", "created_at"
+    )
+    return (
+        f"SELECT memory_id, {composite} AS composite_score FROM memories "
+        "ORDER BY composite_score DESC, memory_id"
+    )
+
+
+def _seed(connection):
+    connection.execute(
+        "CREATE TABLE memories (memory_id TEXT, search_score REAL, "
+        "importance_score REAL, created_at TIMESTAMP)"
+    )
+    connection.executemany(
+        "INSERT INTO memories VALUES (?, ?, ?, ?)",
+        [
+            (memory_id, search, importance, created and created.isoformat(sep=" "))
+            for memory_id, search, importance, created in ROWS
+        ],
+    )
+
+
+def _python_scores(ranking):
+    results = [
+        {
+            "memory_id": memory_id,
+            "search_score": search,
+            "importance_score": importance,
+            "created_at": created,
+        }
+        for memory_id, search, importance, created in ROWS
+    ]
+    scores = ranking.score(results, now=NOW.timestamp())
+    return {result["memory_id"]: score for result, score in zip(results, scores)}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("decay", ["exponential", "linear"])
+def test_composite_score_without_builtin_power(decay):
+    ranking = RankingEngine(decay=decay)
+    connection = sqlite3.connect(":memory:")
+    _without_power(connection)
+    _seed(connection)
+    params = ranking.sql_params("sqlite", now=NOW)
+
+    if decay == "exponential":
+        with pytest.raises(sqlite3.OperationalError):
+            connection.execute(_composite_query(ranking), params).fetchall()
+
+    create_sqlite_functions(connection)
+    rows = connection.execute(_composite_query(ranking), params).fetchall()
+    connection.close()
+
+    expected = _python_scores(ranking)
+    assert [memory_id for memory_id, _ in rows] == sorted(
+        expected, key=lambda memory_id: (-expected[memory_id], memory_id)
+    )
+    for memory_id, score in rows:
+        assert score == pytest.approx(expected[memory_id])
+
+
+@pytest.mark.unit
+def test_power_propagates_null_and_domain_errors():
+    connection = sqlite3.connect(":memory:")
+    _without_power(connection)
+    create_sqlite_functions(connection)
+    row = connection.execute(
+        "SELECT power(0.5, 2), power(0.5, NULL), power(-8, 0.5), power(10, 1000)"
+    ).fetchone()
+    connection.close()
+    assert row == (0.25, None, None, None)
+
+
+@pytest.mark.unit
+def test_engine_listener_defines_power(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'functions.db'}")
+
+    @event.listens_for(engine, "connect")
+    def _drop_power(dbapi_connection, connection_record):
+        _without_power(dbapi_connection)
+
+    register_sqlite_functions(engine)
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT POWER(2, 10)")).scalar() == 1024.0
+    engine.dispose()
@@ -0,0 +1,165 @@
+"""
+SQLite single-writer queue
+
+Concurrent writers funnelled through ``run_write`` on a WAL database, and
+``SQLiteWriteQueue.stop`` racing with submitting threads: every submitted
+write either runs or fails, none is left waiting forever.
+"""
+
+import functools
+import queue
+import threading
+from concurrent.futures import Future
+
+import pytest
+from sqlalchemy import text
+
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.database.sqlite_tuning import SQLiteWriteQueue
+
+THREADS = 8
+WRITES_PER_THREAD = 25
+
+
+def _run_threads(target, count=THREADS, timeout=30.0):
+    threads = [threading.Thread(target=target, daemon=True) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout)
+    assert not any(thread.is_alive() for thread in threads)
+
+
+@pytest.mark.unit
+def test_concurrent_run_write_on_wal(tmp_path):
+    manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{tmp_path / 'writers.db'}",
+        share_engine=False,
+        sqlite_profile="balanced",
+    )
+    try:
+        with manager.engine.begin() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            conn.execute(text("CREATE TABLE writes (thread TEXT, n INTEGER)"))
+
+        errors = []
+        barrier = threading.Barrier(THREADS)
+
+        def insert(n):
+            with manager.engine.begin() as conn:
+                conn.execute(
+                    text("INSERT INTO writes VALUES (:thread, :n)"),
+                    {"thread": threading.current_thread().name, "n": n},
+                )
+
+        def writer():
+            barrier.wait()
+            for n in range(WRITES_PER_THREAD):
+                try:
+                    manager.run_write(functools.partial(insert, n))
+                except Exception as e:
+                    errors.append(e)
+
+        _run_threads(writer)
+
+        assert errors == []
+        with manager.engine.connect() as conn:
+            assert (
+                conn.execute(text("SELECT COUNT(*) FROM writes")).scalar()
+                == THREADS * WRITES_PER_THREAD
+            )
+        assert manager._write_queue.writes == THREADS * WRITES_PER_THREAD
+    finally:
+        manager.close()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("attempt", range(5))
+def test_stop_racing_with_submit_never_hangs(attempt):
+    write_queue = SQLiteWriteQueue(name=f"test-writer-{attempt}")
+    ran = []
+    ran_lock = threading.Lock()
+    barrier = threading.Barrier(THREADS + 1)
+
+    def write(n):
+        with ran_lock:
+            ran.append(n)
+        return n
+
+    def submitter():
+        barrier.wait()
+        for n in range(WRITES_PER_THREAD):
+            assert write_queue.run(functools.partial(write, n)) == n
+
+    threads = [threading.Thread(target=submitter, daemon=True) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    write_queue.stop()
+    for thread in threads:
+        thread.join(10.0)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert len(ran) == THREADS * WRITES_PER_THREAD
+    # After stop, writes run on the calling thread
+    assert write_queue.run(lambda: threading.current_thread()) is (
+        threading.current_thread()
+    )
+    write_queue.stop()
+
+
+class StopDuringPut(queue.Queue):
+    """Queue that calls ``stop`` from another thread while a job is being put"""
+
+    def __init__(self, write_queue):
+        super().__init__()
+        self.write_queue = write_queue
+        self.stopper = None
+
+    def put(self, item, *args, **kwargs):
+        if item is not None and self.stopper is None:
+            self.stopper = threading.Thread(target=self.write_queue.stop, daemon=True)
+            self.stopper.start()
+            # Give stop() the chance to put its sentinel ahead of this job
+            self.stopper.join(0.2)
+        super().put(item, *args, **kwargs)
+
+
+@pytest.mark.unit
+def test_stop_cannot_overtake_a_submitted_job():
+    write_queue = SQLiteWriteQueue(name="test-writer-overtake")
+    write_queue._queue = StopDuringPut(write_queue)
+    results = []
+
+    submitter = threading.Thread(
+        target=lambda: results.append(write_queue.run(lambda: "written")),
+        daemon=True,
+    )
+    submitter.start()
+    submitter.join(5.0)
+    write_queue._queue.stopper.join(5.0)
+
+    assert not submitter.is_alive()
+    assert results == ["written"]
+    assert not write_queue._thread.is_alive()
+
+
+@pytest.mark.unit
+def test_jobs_left_behind_the_sentinel_are_failed():
+    write_queue = SQLiteWriteQueue(name="test-writer-drain")
+    assert write_queue.run(lambda: "first") == "first"
+    worker = write_queue._thread
+
+    # Keep the worker busy while a job lands behind the stop sentinel
+    release = threading.Event()
+    straggler: Future = Future()
+    write_queue._queue.put((release.wait, Future()))
+    write_queue._queue.put(None)
+    write_queue._queue.put((lambda: "never", straggler))
+    release.set()
+    worker.join(5.0)
+
+    assert not worker.is_alive()
+    with pytest.raises(RuntimeError, match="stopped"):
+        straggler.result(timeout=1.0)
+    assert write_queue.pending == 0
@@ -0,0 +1,197 @@
+"""
+Multi-strategy structured search
+
+``search_structured`` and the retrieval agent's planned search on a temporary
+SQLite database: each strategy on its own, strategy ranking and dedup across
+short- and long-term memories, the ``since`` filter applied before the
+limit, and the LIKE retry when the FTS5 index is missing.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from memori.agents.retrieval_agent import MemorySearchEngine
+from memori.database import sqlite_fts
+from memori.database.models import LongTermMemory, ShortTermMemory
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.utils.pydantic_models import MemorySearchQuery
+
+NOW = datetime.now()
+
+# memory_id: (memory type, summary, category, importance, age in days, flags)
+MEMORIES = {
+    "st-espresso": ("short_term", "Espresso grinder settings", "fact", 0.4, 1, {}),
+    "st-tabs": ("short_term", "Editor uses tabs", "preference", 0.5, 2, {}),
+    "st-deadline": ("short_term", "Release deadline friday", "context", 0.9, 3, {}),
+    "lt-espresso": ("long_term", "Espresso beans origin", "fact", 0.6, 5, {}),
+    "lt-theme": (
+        "long_term",
+        "Prefers a dark theme",
+        "fact",
+        0.3,
+        6,
+        {"is_preference": True},
+    ),
+    "lt-rust": ("long_term", "Knows Rust well", "skill", 0.85, 40, {}),
+    "lt-old-pref": ("long_term", "Espresso without sugar", "preference", 0.95, 60, {}),
+}
+
+
+def _row(memory_id, summary, category, importance, age, flags, namespace):
+    return dict(
+        memory_id=memory_id,
+        processed_data={},
+        importance_score=importance,
+        category_primary=category,
+        namespace=namespace,
+        created_at=NOW - timedelta(days=age),
+        searchable_content=f"{summary} notes",
+        summary=summary,
+        **flags,
+    )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = SQLAlchemyDatabaseManager(
+        f"sqlite:///{tmp_path / 'structured.db'}", share_engine=False
+    )
+    manager.initialize_schema()
+    tables = {
+        "short_term": ShortTermMemory.__table__,
+        "long_term": LongTermMemory.__table__,
+    }
+    with manager.engine.begin() as conn:
+        for memory_id, (memory_type, *values) in MEMORIES.items():
+            conn.execute(
+                tables[memory_type].insert(), _row(memory_id, *values, "default")
+            )
+        conn.execute(
+            tables["long_term"].insert(),
+            _row("other-espresso", "Espresso elsewhere", "fact", 0.9, 1, {}, "other"),
+        )
+    yield manager
+    manager.close()
+
+
+def _ids(results):
+    return [r["memory_id"] for r in results]
+
+
+@pytest.mark.unit
+def test_keyword_only(manager):
+    results = manager.search_structured(keywords=["espres"])
+
+    assert set(_ids(results)) == {"st-espresso", "lt-espresso", "lt-old-pref"}
+    assert {r["search_strategy"] for r in results} == {"keyword_search"}
+    assert {r["memory_type"] for r in results} == {"short_term", "long_term"}
+    # Within a strategy, higher importance first
+    assert _ids(results) == ["lt-old-pref", "lt-espresso", "st-espresso"]
+
+
+@pytest.mark.unit
+def test_category_only_includes_long_term_flags(manager):
+    results = manager.search_structured(categories=["preference"])
+
+    assert set(_ids(results)) == {"st-tabs", "lt-theme", "lt-old-pref"}
+    assert {r["search_strategy"] for r in results} == {"category_filter"}
+
+
+@pytest.mark.unit
+def test_importance_only(manager):
+    results = manager.search_structured(importance_threshold=0.85)
+
+    assert _ids(results) == ["lt-old-pref", "st-deadline", "lt-rust"]
+    assert {r["search_strategy"] for r in results} == {"importance_filter"}
+
+
+@pytest.mark.unit
+def test_strategies_are_ranked_and_deduplicated(manager):
+    # Same memory promoted into short-term memory under its long-term id
+    with manager.engine.begin() as conn:
+        conn.execute(
+            ShortTermMemory.__table__.insert(),
+            _row("lt-rust", "Knows Rust well", "skill", 0.85, 1, {}, "default"),
+        )
+
+    results = manager.search_structured(
+        keywords=["espresso"], categories=["skill"], importance_threshold=0.8
+    )
+
+    assert [(r["memory_id"], r["search_strategy"]) for r in results] == [
+        # Also a preference above the threshold, but keywords rank first
+        ("lt-old-pref", "keyword_search"),
+        ("lt-espresso", "keyword_search"),
+        ("st-espresso", "keyword_search"),
+        ("lt-rust", "category_filter"),
+        ("st-deadline", "importance_filter"),
+    ]
+    assert (
+        manager.search_structured(
+            keywords=["espresso"],
+            categories=["skill"],
+            importance_threshold=0.8,
+            limit=2,
+        )
+        == results[:2]
+    )
+
+
+@pytest.mark.unit
+def test_since_is_applied_before_the_limit(manager):
+    since = NOW - timedelta(days=10)
+
+    results = manager.search_structured(
+        keywords=["espresso"], importance_threshold=0.8, since=since, limit=2
+    )
+
+    # The older, more important matches would otherwise take both slots
+    assert _ids(results) == ["lt-espresso", "st-espresso"]
+    assert all(r["created_at"] >= since for r in results)
+    assert _ids(manager.search_structured(importance_threshold=0.8, since=since)) == [
+        "st-deadline"
+    ]
+
+
+@pytest.mark.unit
+def test_time_range_alone_selects_nothing(manager):
+    assert manager.search_structured(since=NOW - timedelta(days=365)) == []
+    assert manager.search_structured(keywords=[" "], categories=[""]) == []
+
+
+@pytest.mark.unit
+def test_like_fallback_when_fts_table_is_missing(manager):
+    with manager.engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE {sqlite_fts.FTS_TABLE}"))
+
+    results = manager.search_structured(keywords=["espresso"], categories=["skill"])
+
+    assert _ids(results) == ["lt-old-pref", "lt-espresso", "st-espresso", "lt-rust"]
+    assert [r["search_strategy"] for r in results] == ["keyword_search"] * 3 + [
+        "category_filter"
+    ]
+
+
+@pytest.mark.unit
+def test_planned_search_runs_every_strategy(manager):
+    engine = MemorySearchEngine(api_key="sk-test", planner_mode="llm")
+    plan = MemorySearchQuery(
+        query_text="espresso",
+        intent="coffee preferences",
+        entity_filters=["espresso"],
+        category_filters=["skill"],
+        time_range="last_2_weeks",
+    )
+
+    results = engine._execute_planned_search(plan, manager, "default", 10)
+
+    # lt-rust matches the category and lt-old-pref the keyword, both are too old
+    assert _ids(results) == ["lt-espresso", "st-espresso"]
+    assert results[0]["search_reasoning"] == "Keyword match for: espresso"
+
+    time_only = MemorySearchQuery(
+        query_text="anything", intent="recent", time_range="last_week"
+    )
+    assert engine._execute_planned_search(time_only, manager, "default", 10) == []
@@ -0,0 +1,140 @@
+"""
+Flat vector index over long_term_memory embeddings
+
+Vector serialization, exact top-k cosine search with NumPy and with the
+pure-Python heapq fallback, and pending vectors added after the namespace
+matrix was loaded.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from memori.database import vector_index
+from memori.database.vector_index import FlatVectorIndex, pack_vector, unpack_vector
+from memori.utils.embeddings import normalize_vector
+
+VECTORS = {
+    "north": [1.0, 0.0, 0.0],
+    "north-east": normalize_vector([1.0, 1.0, 0.0]),
+    "east": [0.0, 1.0, 0.0],
+    "south": [-1.0, 0.0, 0.0],
+    "up": [0.0, 0.0, 1.0],
+}
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'vectors.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE long_term_memory "
+                "(memory_id TEXT PRIMARY KEY, namespace TEXT NOT NULL)"
+            )
+        )
+        for memory_id in VECTORS:
+            conn.execute(
+                text("INSERT INTO long_term_memory VALUES (:memory_id, 'default')"),
+                {"memory_id": memory_id},
+            )
+        conn.execute(text("INSERT INTO long_term_memory VALUES ('elsewhere', 'other')"))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def index(engine):
+    index = FlatVectorIndex(engine, dimensions=3)
+    with engine.begin() as conn:
+        index.setup(conn)
+        index.add_many(
+            conn,
+            [(memory_id, "default", vector) for memory_id, vector in VECTORS.items()]
+            + [("elsewhere", "other", [1.0, 0.0, 0.0])],
+        )
+    return index
+
+
+@pytest.mark.unit
+def test_pack_vector_round_trip():
+    vector = [0.5, -0.25, 1.0, 0.0, 3.0e-8]
+    data = pack_vector(vector)
+
+    assert len(data) == 4 * len(vector)
+    assert unpack_vector(data) == pytest.approx(vector)
+    # Database drivers may hand back memoryview or bytearray
+    assert unpack_vector(memoryview(data)) == pytest.approx(vector)
+    assert unpack_vector(pack_vector([])) == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_search_returns_top_k_best_first(index, monkeypatch, use_numpy):
+    if use_numpy and not vector_index.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(vector_index, "NUMPY_AVAILABLE", use_numpy)
+    index.invalidate()
+
+    query = normalize_vector([1.0, 0.2, 0.0])
+    hits = index.search("default", query, 3)
+
+    assert [memory_id for memory_id, _ in hits] == ["north", "north-east", "east"]
+    assert [score for _, score in hits] == sorted(
+        (score for _, score in hits), reverse=True
+    )
+    assert hits[0][1] == pytest.approx(
+        sum(a * b for a, b in zip(query, VECTORS["north"]))
+    )
+
+    # k larger than the namespace returns every vector, still ordered
+    everything = index.search("default", query, 50)
+    assert [memory_id for memory_id, _ in everything][-1] == "south"
+    assert len(everything) == len(VECTORS)
+    assert index.search("default", query, 0) == []
+    assert [memory_id for memory_id, _ in index.search("other", query, 5)] == [
+        "elsewhere"
+    ]
+
+
+@pytest.mark.unit
+def test_numpy_and_fallback_agree(index, monkeypatch):
+    if not vector_index.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    query = normalize_vector([0.3, -0.4, 0.8])
+    with_numpy = index.search("default", query, 4)
+
+    monkeypatch.setattr(vector_index, "NUMPY_AVAILABLE", False)
+    index.invalidate()
+    fallback = index.search("default", query, 4)
+
+    assert [memory_id for memory_id, _ in fallback] == [
+        memory_id for memory_id, _ in with_numpy
+    ]
+    assert [score for _, score in fallback] == pytest.approx(
+        [score for _, score in with_numpy], abs=1e-6
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_vectors_added_after_load_are_searchable(engine, index, monkeypatch, use_numpy):
+    if use_numpy and not vector_index.NUMPY_AVAILABLE:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(vector_index, "NUMPY_AVAILABLE", use_numpy)
+    index.invalidate()
+    assert index.search("default", [0.0, -1.0, 0.0], 1)[0][0] != "west"
+
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO long_term_memory (memory_id, namespace) VALUES ('west', 'default')"
+            )
+        )
+        index.add_many(conn, [("west", "default", [0.0, -1.0, 0.0])])
+
+    assert index.search("default", [0.0, -1.0, 0.0], 1) == [
+        ("west", pytest.approx(1.0))
+    ]
+    # Also persisted, so a reload finds it
+    index.invalidate("default")
+    assert index.search("default", [0.0, -1.0, 0.0], 1)[0][0] == "west"
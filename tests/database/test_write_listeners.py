@@ -0,0 +1,114 @@
+"""
+Write listeners shared by every manager of one database
+
+Each Memori instance registers a cache-invalidation listener on its own
+manager; a write through any manager of the same database must reach all
+of them.
+"""
+
+import gc
+
+import pytest
+
+from memori.database.sqlalchemy_manager import SQLAlchemyDatabaseManager
+from memori.database.write_listeners import WriteListeners
+
+
+class CacheOwner:
+    def __init__(self):
+        self.writes = []
+
+    def on_write(self, namespace, memory_type):
+        self.writes.append((namespace, memory_type))
+
+
+@pytest.fixture
+def managers(tmp_path):
+    url = f"sqlite:///{tmp_path / 'listeners.db'}"
+    first = SQLAlchemyDatabaseManager(url, schema_init=False)
+    second = SQLAlchemyDatabaseManager(url, schema_init=False, share_engine=False)
+    other = SQLAlchemyDatabaseManager(
+        f"sqlite:///{tmp_path / 'other.db'}", schema_init=False
+    )
+    yield first, second, other
+    for manager in (first, second, other):
+        manager.close()
+
+
+@pytest.mark.unit
+def test_writes_reach_listeners_of_every_manager(managers):
+    first, second, other = managers
+    owners = [CacheOwner() for _ in managers]
+    for manager, owner in zip(managers, owners):
+        manager.add_write_listener(owner.on_write)
+
+    first.notify_write("alice", "long_term")
+
+    assert owners[0].writes == [("alice", "long_term")]
+    assert owners[1].writes == [("alice", "long_term")]
+    assert owners[2].writes == []
+
+
+@pytest.mark.unit
+def test_conscious_promotions_are_short_term_writes_elsewhere(managers):
+    first, second, _ = managers
+    owners = [CacheOwner(), CacheOwner()]
+    first.add_write_listener(owners[0].on_write)
+    second.add_write_listener(owners[1].on_write)
+
+    first.notify_write("alice", "conscious_context")
+
+    # The promoting instance merged the rows itself; the other must reload
+    assert owners[0].writes == [("alice", "conscious_context")]
+    assert owners[1].writes == [("alice", "short_term")]
+
+
+@pytest.mark.unit
+def test_closed_managers_and_collected_owners_stop_listening(managers):
+    first, second, _ = managers
+    closed_owner, collected_owner, live_owner = CacheOwner(), CacheOwner(), CacheOwner()
+    second.add_write_listener(closed_owner.on_write)
+    first.add_write_listener(collected_owner.on_write)
+    first.add_write_listener(live_owner.on_write)
+    first.add_write_listener(live_owner.on_write)
+
+    second.close()
+    del collected_owner
+    gc.collect()
+    first.notify_write("alice", "short_term")
+
+    assert closed_owner.writes == []
+    assert live_owner.writes == [("alice", "short_term")]
+    assert len(first._write_listeners) == 1
+
+    first.remove_write_listener(live_owner.on_write)
+    first.notify_write("alice", "short_term")
+    assert len(live_owner.writes) == 1
+
+
+@pytest.mark.unit
+def test_failing_listener_does_not_stop_the_others():
+    listeners = WriteListeners()
+    owner = CacheOwner()
+
+    def broken(namespace, memory_type):
+        raise RuntimeError("cache gone")
+
+    listeners.add(broken, owner)
+    listeners.add(owner.on_write, owner)
+    listeners.notify("alice", "long_term", owner)
+    assert owner.writes == [("alice", "long_term")]
+
+
+@pytest.mark.unit
+def test_in_memory_databases_do_not_share_listeners():
+    first = SQLAlchemyDatabaseManager("sqlite:///:memory:", schema_init=False)
+    second = SQLAlchemyDatabaseManager("sqlite:///:memory:", schema_init=False)
+    owner = CacheOwner()
+    try:
+        second.add_write_listener(owner.on_write)
+        first.notify_write("alice", "long_term")
+        assert owner.writes == []
+    finally:
+        first.close()
+        second.close()
@@ -0,0 +1,76 @@
+"""
+Import-time budget for the memori package
+
+Runs ``python -X importtime`` in a fresh interpreter so earlier imports in the
+test session cannot hide a regression. ``import memori`` must stay lazy: no
+LLM SDKs, no SQLAlchemy, and a cumulative import time well below what eager
+loading costs (more than a second with the OpenAI SDK).
+
+    pytest tests/performance/test_import_time.py -s
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative microseconds allowed for ``import memori``; override for slow CI
+IMPORT_BUDGET_US = int(os.environ.get("MEMORI_IMPORT_BUDGET_US", "300000"))
+
+# Modules that must only load once the feature using them is touched
+HEAVY_MODULES = ("openai", "litellm", "anthropic", "sqlalchemy")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def importtime(statement: str):
+    """Return {module: cumulative microseconds} for ``statement`` in a new interpreter"""
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            timings[match.group(4)] = int(match.group(2))
+    return timings
+
+
+@pytest.mark.unit
+def test_import_memori_is_lazy():
+    timings = importtime("import memori")
+
+    loaded = [module for module in timings if module.split(".")[0] in HEAVY_MODULES]
+    assert not loaded, f"'import memori' eagerly imported {sorted(set(loaded))}"
+
+    print(f"\nimport memori: {timings['memori']} us (budget {IMPORT_BUDGET_US} us)")
+    assert timings["memori"] < IMPORT_BUDGET_US
+
+
+@pytest.mark.unit
+def test_memori_class_import_skips_llm_sdks():
+    timings = importtime("from memori import Memori")
+
+    print(f"\nfrom memori import Memori: {sum(timings.values())} us (all modules)")
+    for sdk in ("openai", "litellm", "anthropic"):
+        assert sdk not in timings, f"'from memori import Memori' imported {sdk}"
+
+
+@pytest.mark.unit
+def test_lazy_attributes_resolve():
+    import memori
+
+    for name in memori.__all__:
+        if name in ("MemoryAgent", "MemorySearchEngine"):
+            continue  # Optional; None when their dependencies are missing
+        assert getattr(memori, name) is not None, name
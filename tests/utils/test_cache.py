@@ -0,0 +1,112 @@
+"""
+TTLLRUCache expiry and eviction, and query key normalization
+
+Expiry is checked against a fake monotonic clock so the tests never sleep.
+"""
+
+import pytest
+
+from memori.utils import cache as cache_module
+from memori.utils.cache import TTLLRUCache, normalize_cache_text, normalize_query_key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+def test_entries_expire_after_ttl(clock):
+    cache = TTLLRUCache(max_size=4, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30)
+
+    clock[0] += 9.9
+    assert cache.get("a") == 1
+    clock[0] += 0.1
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    clock[0] += 20
+    assert cache.get("b", "gone") == "gone"
+
+    stats = cache.get_stats()
+    assert stats["expirations"] == 2
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_overwrite_restarts_ttl(clock):
+    cache = TTLLRUCache(ttl=10)
+    cache.set("a", 1)
+    clock[0] += 8
+    cache.set("a", 2)
+    clock[0] += 8
+    assert cache.get("a") == 2
+
+
+@pytest.mark.unit
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = TTLLRUCache(max_size=3, ttl=60)
+    for key in "abc":
+        cache.set(key, key.upper())
+
+    assert cache.get("a") == "A"  # "b" is now least recently used
+    cache.set("d", "D")
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["A", "C", "D"]
+
+    cache.set("c", "C2")  # Overwriting refreshes the position too
+    cache.set("e", "E")
+    assert cache.get("a") is None
+    assert cache.get("c") == "C2"
+    assert cache.get_stats()["evictions"] == 2
+    assert len(cache) == 3
+
+
+@pytest.mark.unit
+def test_invalidation():
+    cache = TTLLRUCache(max_size=8, ttl=60)
+    for key in [("ns1", "q1"), ("ns1", "q2"), ("ns2", "q1")]:
+        cache.set(key, True)
+
+    assert cache.invalidate(("ns2", "q1"))
+    assert not cache.invalidate(("ns2", "q1"))
+    assert cache.invalidate_where(lambda key: key[0] == "ns1") == 2
+    assert len(cache) == 0
+    assert cache.get_stats()["invalidations"] == 3
+
+
+@pytest.mark.unit
+def test_invalid_sizes():
+    with pytest.raises(ValueError):
+        TTLLRUCache(max_size=0)
+    with pytest.raises(ValueError):
+        TTLLRUCache(ttl=0)
+
+
+@pytest.mark.unit
+def test_query_keys_fold_case_whitespace_and_edge_punctuation():
+    assert normalize_query_key("What's my *favorite*   editor?") == normalize_query_key(
+        "whats my favorite editor"
+    )
+    assert normalize_cache_text("  What do I like?! ") == "what do i like"
+
+
+@pytest.mark.unit
+def test_query_keys_keep_punctuation_inside_words():
+    keys = {
+        normalize_query_key(query) for query in ("next.js", "nextjs", "c++", "c#", "c")
+    }
+    assert len(keys) == 5
+
+
+@pytest.mark.unit
+def test_hashed_query_keys():
+    hashed = normalize_query_key("Favorite Editor?", hashed=True)
+    assert hashed == normalize_query_key("favorite editor", hashed=True)
+    assert len(hashed) == 32
+    assert hashed != normalize_query_key("favorite editors", hashed=True)
@@ -0,0 +1,71 @@
+"""
+Prometheus export of stage timings and counters
+
+Every ``Memori(tracer="prometheus")`` builds its own PrometheusTracer; they
+must share one set of collectors per registry, and a failed observation must
+never reach the instrumented code.
+"""
+
+import pytest
+
+from memori.utils.tracing import CONTEXT_CACHE, STAGE_DURATION, PrometheusTracer
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+
+@pytest.mark.unit
+def test_tracers_share_collectors_per_registry():
+    registry = prometheus_client.CollectorRegistry()
+    first = PrometheusTracer(registry=registry)
+    second = PrometheusTracer(registry=registry)
+
+    with first.span("search"):
+        pass
+    with second.span("search"):
+        pass
+    first.increment(CONTEXT_CACHE, result="hit")
+    second.increment(CONTEXT_CACHE, result="hit")
+
+    assert (
+        registry.get_sample_value(
+            "memori_stage_duration_seconds_count", {"stage": "search"}
+        )
+        == 2
+    )
+    assert (
+        registry.get_sample_value("memori_context_cache_total", {"result": "hit"}) == 2
+    )
+
+
+@pytest.mark.unit
+def test_registries_are_independent():
+    first_registry = prometheus_client.CollectorRegistry()
+    second_registry = prometheus_client.CollectorRegistry()
+    PrometheusTracer(registry=first_registry).increment(CONTEXT_CACHE, result="miss")
+    PrometheusTracer(registry=second_registry).increment(CONTEXT_CACHE, result="miss")
+
+    for registry in (first_registry, second_registry):
+        assert (
+            registry.get_sample_value("memori_context_cache_total", {"result": "miss"})
+            == 1
+        )
+
+
+@pytest.mark.unit
+def test_recording_failures_do_not_raise():
+    registry = prometheus_client.CollectorRegistry()
+    tracer = PrometheusTracer(registry=registry)
+    tracer.observe(STAGE_DURATION, 0.1, stage="search")
+
+    # Label names differ from the registered histogram's
+    tracer.observe(STAGE_DURATION, 0.1, stage="search", extra="label")
+    with pytest.raises(RuntimeError):
+        with tracer.span("search"):
+            raise RuntimeError("instrumented code failed")
+
+    assert (
+        registry.get_sample_value(
+            "memori_stage_duration_seconds_count", {"stage": "search"}
+        )
+        == 2
+    )